@@ -24,6 +24,7 @@ from app.backend.models import (
     WalletFilter,
 )
 from app.config import config
+from app.lib.dao_context import dao_context
 from app.lib.logger import configure_logger
 from app.services.ai.simple_workflows import (
     generate_proposal_metadata,
@@ -311,6 +312,7 @@ async def _create_proposal_from_tool_result(
         )
 
         proposal = backend.create_proposal(proposal_content)
+        dao_context.upsert(proposal)
         logger.info(f"Created proposal record {proposal.id} for transaction {tx_id}")
 
         # Update airdrop record with proposal ID if applicable
@@ -3,9 +3,13 @@ from typing import Any, Dict
 from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Response
 
 from app.api.dependencies import verify_webhook_auth
+from app.config import config
 from app.lib.logger import configure_logger
 from app.services.integrations.webhooks.base import WebhookResponse
 from app.services.integrations.webhooks.chainhook import ChainhookService
+from app.services.integrations.webhooks.chainhook.ingest_log import (
+    chainhook_ingest_log,
+)
 from app.services.integrations.webhooks.dao import DAOService
 
 # Configure logger
@@ -26,6 +30,10 @@ async def chainhook(
     This endpoint requires Bearer token authentication via the Authorization header.
     The token must match the one configured in AIBTC_WEBHOOK_AUTH_TOKEN.
 
+    The payload's blocks are appended to the durable ingest log and handled by
+    the chainhook_ingest job. If the log cannot be written, or the job is
+    disabled, the payload is processed in a background task instead.
+
     Always returns 204 No Content status regardless of processing outcome.
 
     Args:
@@ -37,14 +45,32 @@ async def chainhook(
     Raises:
         HTTPException: If authentication fails
     """
-    service = ChainhookService()
+    logger.debug(
+        "Chainhook webhook received", extra={"event_type": "chainhook_webhook"}
+    )
+
+    if config.scheduler.chainhook_ingest_enabled:
+        try:
+            result = await chainhook_ingest_log.append(data)
+            logger.debug(
+                "Chainhook payload logged",
+                extra={
+                    "event_type": "chainhook_webhook",
+                    "appended": result.appended,
+                    "duplicates": result.duplicates,
+                },
+            )
+            return Response(status_code=204)
+        except Exception as e:
+            logger.error(
+                "Chainhook ingest log write failed, processing in background",
+                extra={"error": str(e)},
+                exc_info=True,
+            )
 
     try:
-        logger.debug(
-            "Chainhook webhook received", extra={"event_type": "chainhook_webhook"}
-        )
         # offload processing to background task
-        background_tasks.add_task(service.process, data)
+        background_tasks.add_task(ChainhookService().process, data)
     except Exception as e:
         logger.error(
             "Chainhook processing failed", extra={"error": str(e)}, exc_info=True
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, TypeVar
 
 from app.backend.models import (
     Airdrop,
@@ -16,6 +16,7 @@ from app.backend.models import (
     ChainStateBase,
     ChainStateCreate,
     ChainStateFilter,
+    CustomBaseModel,
     DAO,
     DAOBase,
     DAOCreate,
@@ -41,6 +42,7 @@ from app.backend.models import (
     LotteryResultBase,
     LotteryResultCreate,
     LotteryResultFilter,
+    OwnedAddress,
     Profile,
     ProfileBase,
     ProfileCreate,
@@ -58,6 +60,7 @@ from app.backend.models import (
     QueueMessageBase,
     QueueMessageCreate,
     QueueMessageFilter,
+    QueueMessageType,
     Secret,
     SecretFilter,
     Task,
@@ -100,6 +103,8 @@ from app.backend.models import (
     XUserFilter,
 )
 
+ModelT = TypeVar("ModelT", bound=CustomBaseModel)
+
 
 class AbstractBackend(ABC):
     # ----------- HELPERS -----------
@@ -111,6 +116,43 @@ class AbstractBackend(ABC):
     def upload_file(self, file_path: str, file: bytes) -> str:
         pass
 
+    # ----------- BULK WRITES -----------
+    @abstractmethod
+    def insert_many(
+        self, table: str, rows: Sequence[CustomBaseModel], model: Type[ModelT]
+    ) -> List[ModelT]:
+        """Insert ``rows`` into ``table`` in a single request.
+
+        Fields left unset on a row take their column default. Returns the
+        created rows as ``model``.
+        """
+        pass
+
+    @abstractmethod
+    def upsert_many(
+        self,
+        table: str,
+        rows: Sequence[CustomBaseModel],
+        model: Type[ModelT],
+        on_conflict: str = "id",
+    ) -> List[ModelT]:
+        """Insert ``rows`` or overwrite the rows matching on ``on_conflict``."""
+        pass
+
+    @abstractmethod
+    def update_many(
+        self,
+        table: str,
+        updates: Sequence[Tuple[UUID, CustomBaseModel]],
+        model: Type[ModelT],
+    ) -> List[ModelT]:
+        """Apply a partial update to each row id, writing only the set fields.
+
+        Updates that set the same fields go in a single request. The ids must
+        belong to existing rows. Returns the updated rows as ``model``.
+        """
+        pass
+
     # ----------- VECTOR STORE -----------
     @abstractmethod
     def get_vector_collection(self, collection_name: str) -> Any:
@@ -158,7 +200,11 @@ class AbstractBackend(ABC):
 
     @abstractmethod
     async def query_vectors(
-        self, collection_name: str, query_text: str, limit: int = 4
+        self,
+        collection_name: str,
+        query_text: str,
+        limit: int = 4,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Dict[str, Any]]:
         """Query vectors in a collection by similarity.
 
@@ -166,6 +212,7 @@ class AbstractBackend(ABC):
             collection_name: The name of the vector collection
             query_text: The text to find similar vectors for
             limit: Maximum number of results to return
+            query_embedding: Precomputed embedding of query_text, if any
 
         Returns:
             List of documents with their metadata
@@ -307,6 +354,17 @@ class AbstractBackend(ABC):
     ) -> List[QueueMessage]:
         pass
 
+    @abstractmethod
+    def create_queue_messages(
+        self, new_queue_messages: List[QueueMessageCreate]
+    ) -> List[QueueMessage]:
+        """Create queue messages in a single request, skipping duplicates.
+
+        Returns one message per input, in order: the new message or the
+        unprocessed message with the same type, DAO, wallet and content.
+        """
+        pass
+
     @abstractmethod
     def update_queue_message(
         self, queue_message_id: UUID, update_data: QueueMessageBase
@@ -317,6 +375,70 @@ class AbstractBackend(ABC):
     def delete_queue_message(self, queue_message_id: UUID) -> bool:
         pass
 
+    @abstractmethod
+    def has_claimable_queue_messages(self, queue_type: QueueMessageType) -> bool:
+        """Whether any unprocessed message of a type is not leased right now.
+
+        Read-only: unlike ``claim_queue_messages`` it never touches leases.
+        """
+        pass
+
+    @abstractmethod
+    def claim_queue_messages(
+        self,
+        queue_type: QueueMessageType,
+        worker_id: str,
+        limit: int = 100,
+        lease_seconds: int = 300,
+    ) -> List[QueueMessage]:
+        """Lease up to ``limit`` unprocessed messages of a type to ``worker_id``.
+
+        Concurrent callers receive disjoint rows. Messages already leased to
+        the same worker are returned again with a renewed lease.
+        """
+        pass
+
+    @abstractmethod
+    def extend_queue_message_leases(
+        self, queue_message_ids: List[UUID], worker_id: str, lease_seconds: int = 300
+    ) -> List[UUID]:
+        """Renew leases still held by ``worker_id``; returns the renewed ids."""
+        pass
+
+    @abstractmethod
+    def release_queue_messages(
+        self, queue_message_ids: List[UUID], worker_id: str
+    ) -> int:
+        """Drop leases on unprocessed messages so other workers can claim them."""
+        pass
+
+    @abstractmethod
+    def ingest_chainhook_block(
+        self,
+        chainhook_uuid: str,
+        block_hash: str,
+        block_height: int,
+        payload: Dict[str, Any],
+    ) -> Optional[UUID]:
+        """Append a block to the chainhook ingest log.
+
+        Returns the new entry id, or ``None`` if the block was already logged
+        for this chainhook.
+        """
+        pass
+
+    @abstractmethod
+    def replay_chainhook_blocks(
+        self, from_height: int, to_height: Optional[int] = None
+    ) -> int:
+        """Mark logged blocks from ``from_height`` unprocessed; returns the count."""
+        pass
+
+    @abstractmethod
+    def prune_chainhook_blocks(self, older_than_seconds: int) -> int:
+        """Delete processed ingest log entries older than this; returns the count."""
+        pass
+
     # ----------- WALLETS ----------
     @abstractmethod
     def create_wallet(self, new_wallet: WalletCreate) -> Wallet:
@@ -560,6 +682,26 @@ class AbstractBackend(ABC):
     def delete_token(self, token_id: UUID) -> bool:
         pass
 
+    @abstractmethod
+    def record_token_activity(
+        self, contract_principals: List[str], block_height: int
+    ) -> int:
+        """Raise the holders activity height of the given tokens to ``block_height``.
+
+        Returns the number of tokens whose activity height moved.
+        """
+        pass
+
+    @abstractmethod
+    def list_owned_addresses(
+        self, updated_after: Optional[datetime] = None
+    ) -> List[OwnedAddress]:
+        """Wallet addresses, agent account contracts and token contracts of ours.
+
+        With ``updated_after``, only addresses whose row changed at or after it.
+        """
+        pass
+
     # ----------- VOTES -----------
     @abstractmethod
     def create_vote(self, new_vote: VoteCreate) -> Vote:
@@ -577,6 +719,16 @@ class AbstractBackend(ABC):
     def update_vote(self, vote_id: UUID, update_data: VoteBase) -> Optional[Vote]:
         pass
 
+    @abstractmethod
+    def create_votes(self, new_votes: List[VoteCreate]) -> List[Vote]:
+        """Create vote records in a single request."""
+        pass
+
+    @abstractmethod
+    def update_votes(self, updates: List[Tuple[UUID, VoteBase]]) -> List[Vote]:
+        """Update vote records in bulk; returns the updated votes."""
+        pass
+
     @abstractmethod
     def delete_vote(self, vote_id: UUID) -> bool:
         pass
@@ -669,6 +821,11 @@ class AbstractBackend(ABC):
     def delete_x_tweet(self, x_tweet_id: UUID) -> bool:
         pass
 
+    @abstractmethod
+    def create_x_tweets(self, new_xts: List[XTweetCreate]) -> List[XTweet]:
+        """Create tweet records in a single request."""
+        pass
+
     # ----------- AGENT PROMPTS -----------
     @abstractmethod
     def create_prompt(self, new_prompt: PromptCreate) -> Prompt:
@@ -724,6 +881,21 @@ class AbstractBackend(ABC):
         """Delete a holder record."""
         pass
 
+    @abstractmethod
+    def create_holders(self, new_holders: List[HolderCreate]) -> List[Holder]:
+        """Create holder records in a single request."""
+        pass
+
+    @abstractmethod
+    def upsert_holders(self, holders: List[Holder]) -> List[Holder]:
+        """Write complete holder records in bulk, matched by id."""
+        pass
+
+    @abstractmethod
+    def delete_holders(self, holder_ids: List[UUID]) -> int:
+        """Delete holder records in bulk; returns the number deleted."""
+        pass
+
     # ----------- FEEDBACK -----------
     @abstractmethod
     def create_feedback(self, new_feedback: FeedbackCreate) -> Feedback:
@@ -760,6 +932,13 @@ class AbstractBackend(ABC):
         """Create a new lottery result record."""
         pass
 
+    @abstractmethod
+    def create_lottery_results(
+        self, new_lottery_results: List[LotteryResultCreate]
+    ) -> List[LotteryResult]:
+        """Create lottery result records in a single request."""
+        pass
+
     @abstractmethod
     def get_lottery_result(self, lottery_result_id: UUID) -> Optional[LotteryResult]:
         """Get a lottery result by ID."""
@@ -0,0 +1,254 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from app.backend.models import (
+    Agent,
+    AgentFilter,
+    AgentWithWalletTokenDTO,
+    ChainState,
+    ChainStateBase,
+    ChainStateCreate,
+    DAO,
+    DAOFilter,
+    Extension,
+    ExtensionFilter,
+    Holder,
+    HolderBase,
+    HolderCreate,
+    HolderFilter,
+    LotteryResult,
+    LotteryResultCreate,
+    Proposal,
+    ProposalBase,
+    ProposalCreate,
+    ProposalFilter,
+    QueueMessage,
+    QueueMessageBase,
+    QueueMessageCreate,
+    QueueMessageFilter,
+    QueueMessageType,
+    Token,
+    TokenFilter,
+    UUID,
+    Vote,
+    VoteBase,
+    VoteCreate,
+    VoteFilter,
+    Wallet,
+    WalletFilter,
+    WalletFilterN,
+)
+
+
+class AsyncAbstractBackend(ABC):
+    """Async counterpart of AbstractBackend for the hot request/worker paths.
+
+    Only the tables touched from event-loop code (webhook handlers, job tasks
+    and API routes) are covered here. Method names and signatures mirror
+    AbstractBackend so call sites can migrate by adding ``await``.
+    """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release pooled connections held by the backend."""
+        pass
+
+    # ----------- CHAIN STATE -----------
+    @abstractmethod
+    async def create_chain_state(self, new_chain_state: ChainStateCreate) -> ChainState:
+        """Create a new chain state record."""
+        pass
+
+    @abstractmethod
+    async def update_chain_state(
+        self, chain_state_id: UUID, update_data: ChainStateBase
+    ) -> Optional[ChainState]:
+        """Update a chain state record."""
+        pass
+
+    @abstractmethod
+    async def get_latest_chain_state(
+        self, network: str = "mainnet"
+    ) -> Optional[ChainState]:
+        """Get the latest chain state for a given network."""
+        pass
+
+    # ----------- QUEUE MESSAGES -----------
+    @abstractmethod
+    async def create_queue_message(
+        self, new_queue_message: QueueMessageCreate
+    ) -> QueueMessage:
+        pass
+
+    @abstractmethod
+    async def get_queue_message(self, queue_message_id: UUID) -> Optional[QueueMessage]:
+        pass
+
+    @abstractmethod
+    async def list_queue_messages(
+        self, filters: Optional[QueueMessageFilter] = None
+    ) -> List[QueueMessage]:
+        pass
+
+    @abstractmethod
+    async def update_queue_message(
+        self, queue_message_id: UUID, update_data: QueueMessageBase
+    ) -> Optional[QueueMessage]:
+        pass
+
+    @abstractmethod
+    async def claim_queue_messages(
+        self,
+        queue_type: QueueMessageType,
+        worker_id: str,
+        limit: int = 100,
+        lease_seconds: int = 300,
+    ) -> List[QueueMessage]:
+        """Lease up to ``limit`` unprocessed messages of a type to ``worker_id``."""
+        pass
+
+    @abstractmethod
+    async def extend_queue_message_leases(
+        self, queue_message_ids: List[UUID], worker_id: str, lease_seconds: int = 300
+    ) -> List[UUID]:
+        """Renew leases still held by ``worker_id``; returns the renewed ids."""
+        pass
+
+    @abstractmethod
+    async def release_queue_messages(
+        self, queue_message_ids: List[UUID], worker_id: str
+    ) -> int:
+        """Drop leases on unprocessed messages so other workers can claim them."""
+        pass
+
+    # ----------- WALLETS ----------
+    @abstractmethod
+    async def get_wallet(self, wallet_id: UUID) -> Optional[Wallet]:
+        pass
+
+    @abstractmethod
+    async def list_wallets(
+        self, filters: Optional[WalletFilter] = None
+    ) -> List[Wallet]:
+        pass
+
+    @abstractmethod
+    async def list_wallets_n(
+        self, filters: Optional[WalletFilterN] = None
+    ) -> List[Wallet]:
+        """Enhanced wallets listing with support for batch operations."""
+        pass
+
+    @abstractmethod
+    async def get_agents_with_dao_tokens(
+        self, dao_id: UUID
+    ) -> List[AgentWithWalletTokenDTO]:
+        """Get all agents with wallets that hold tokens for a specific DAO."""
+        pass
+
+    # ----------- AGENTS -----------
+    @abstractmethod
+    async def get_agent(self, agent_id: UUID) -> Optional[Agent]:
+        pass
+
+    @abstractmethod
+    async def list_agents(self, filters: Optional[AgentFilter] = None) -> List[Agent]:
+        pass
+
+    # ----------- EXTENSIONS -----------
+    @abstractmethod
+    async def list_extensions(
+        self, filters: Optional[ExtensionFilter] = None
+    ) -> List[Extension]:
+        pass
+
+    # ----------- DAOS -----------
+    @abstractmethod
+    async def get_dao(self, dao_id: UUID) -> Optional[DAO]:
+        pass
+
+    @abstractmethod
+    async def list_daos(self, filters: Optional[DAOFilter] = None) -> List[DAO]:
+        pass
+
+    # ----------- PROPOSALS -----------
+    @abstractmethod
+    async def create_proposal(self, new_proposal: ProposalCreate) -> Proposal:
+        pass
+
+    @abstractmethod
+    async def get_proposal(self, proposal_id: UUID) -> Optional[Proposal]:
+        pass
+
+    @abstractmethod
+    async def list_proposals(
+        self, filters: Optional[ProposalFilter] = None
+    ) -> List[Proposal]:
+        pass
+
+    @abstractmethod
+    async def update_proposal(
+        self, proposal_id: UUID, update_data: ProposalBase
+    ) -> Optional[Proposal]:
+        pass
+
+    # ----------- TOKENS -----------
+    @abstractmethod
+    async def get_token(self, token_id: UUID) -> Optional[Token]:
+        pass
+
+    @abstractmethod
+    async def list_tokens(self, filters: Optional[TokenFilter] = None) -> List[Token]:
+        pass
+
+    # ----------- VOTES -----------
+    @abstractmethod
+    async def create_vote(self, new_vote: VoteCreate) -> Vote:
+        pass
+
+    @abstractmethod
+    async def get_vote(self, vote_id: UUID) -> Optional[Vote]:
+        pass
+
+    @abstractmethod
+    async def list_votes(self, filters: Optional[VoteFilter] = None) -> List[Vote]:
+        pass
+
+    @abstractmethod
+    async def update_vote(self, vote_id: UUID, update_data: VoteBase) -> Optional[Vote]:
+        pass
+
+    # ----------- HOLDERS -----------
+    @abstractmethod
+    async def create_holder(self, new_holder: HolderCreate) -> Holder:
+        """Create a new holder record."""
+        pass
+
+    @abstractmethod
+    async def list_holders(
+        self, filters: Optional[HolderFilter] = None
+    ) -> List[Holder]:
+        """List holder records with optional filters."""
+        pass
+
+    @abstractmethod
+    async def update_holder(
+        self, holder_id: UUID, update_data: HolderBase
+    ) -> Optional[Holder]:
+        """Update a holder record."""
+        pass
+
+    # ----------- LOTTERY RESULTS -----------
+    @abstractmethod
+    async def create_lottery_result(
+        self, new_lottery_result: LotteryResultCreate
+    ) -> LotteryResult:
+        """Create a new lottery result record."""
+        pass
+
+    @abstractmethod
+    async def get_lottery_result_by_proposal(
+        self, proposal_id: UUID
+    ) -> Optional[LotteryResult]:
+        """Get a lottery result by proposal ID."""
+        pass
@@ -0,0 +1,114 @@
+import abc
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Optional
+
+from app.backend.abstract import AbstractBackend
+from app.backend.async_abstract import AsyncAbstractBackend
+from app.lib.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+# Methods of the async interface that delegate to an equivalent sync method.
+ASYNC_BACKEND_METHODS = frozenset(
+    name for name in AsyncAbstractBackend.__abstractmethods__ if name != "close"
+)
+
+
+class ThreadedAsyncBackend(AsyncAbstractBackend):
+    """Expose a sync AbstractBackend through the async interface.
+
+    Each call runs on a bounded thread pool so the event loop stays free while
+    the blocking client waits on the network. Useful for backends that have no
+    native async implementation yet, and as a drop-in for tests.
+    """
+
+    def __init__(self, backend: AbstractBackend, max_workers: int = 10):
+        self.backend = backend
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="backend"
+        )
+
+    async def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    async def _run(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        method = getattr(self.backend, name)
+        return await loop.run_in_executor(
+            self._executor, functools.partial(method, *args, **kwargs)
+        )
+
+
+def _make_threaded_method(name: str) -> Callable[..., Awaitable[Any]]:
+    async def method(self: ThreadedAsyncBackend, *args: Any, **kwargs: Any) -> Any:
+        return await self._run(name, *args, **kwargs)
+
+    method.__name__ = name
+    method.__doc__ = getattr(AsyncAbstractBackend, name).__doc__
+    return method
+
+
+for _name in ASYNC_BACKEND_METHODS:
+    setattr(ThreadedAsyncBackend, _name, _make_threaded_method(_name))
+abc.update_abstractmethods(ThreadedAsyncBackend)
+
+
+class SyncBackendAdapter:
+    """Present an AsyncAbstractBackend to existing synchronous call sites.
+
+    Coroutines are executed on a dedicated event loop running in a background
+    thread, so the adapter is safe to call from plain functions as well as from
+    code already running inside another event loop. Methods that the async
+    interface does not cover are forwarded to ``fallback``.
+    """
+
+    def __init__(
+        self,
+        async_backend_factory: Callable[[], Awaitable[AsyncAbstractBackend]],
+        fallback: Optional[AbstractBackend] = None,
+        timeout: Optional[float] = None,
+    ):
+        self._factory = async_backend_factory
+        self._fallback = fallback
+        self._timeout = timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="sync-backend-adapter", daemon=True
+        )
+        self._thread.start()
+        self._async_backend = self._submit(self._factory())
+
+    def _submit(self, coro: Awaitable[Any]) -> Any:
+        if threading.current_thread() is self._thread:
+            raise RuntimeError(
+                "SyncBackendAdapter cannot be called from its own event loop"
+            )
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        return future.result(timeout=self._timeout)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in ASYNC_BACKEND_METHODS:
+            async_method = getattr(self._async_backend, name)
+
+            @functools.wraps(async_method)
+            def call(*args: Any, **kwargs: Any) -> Any:
+                return self._submit(async_method(*args, **kwargs))
+
+            return call
+        if self._fallback is None:
+            raise AttributeError(
+                f"{type(self).__name__} has no attribute {name!r} and no fallback"
+            )
+        return getattr(self._fallback, name)
+
+    def close(self) -> None:
+        """Close the async backend and stop the background loop."""
+        try:
+            self._submit(self._async_backend.close())
+        except Exception as e:
+            logger.warning(f"Error closing async backend: {str(e)}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
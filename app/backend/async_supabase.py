@@ -0,0 +1,568 @@
+from typing import Any, Dict, List, Optional
+
+import httpx
+from supabase import AsyncClient
+
+from app.backend.async_abstract import AsyncAbstractBackend
+from app.backend.models import (
+    Agent,
+    AgentFilter,
+    AgentWithWalletTokenDTO,
+    ChainState,
+    ChainStateBase,
+    ChainStateCreate,
+    DAO,
+    DAOFilter,
+    Extension,
+    ExtensionFilter,
+    Holder,
+    HolderBase,
+    HolderCreate,
+    HolderFilter,
+    LotteryResult,
+    LotteryResultCreate,
+    Proposal,
+    ProposalBase,
+    ProposalCreate,
+    ProposalFilter,
+    QueueMessage,
+    QueueMessageBase,
+    QueueMessageCreate,
+    QueueMessageFilter,
+    QueueMessageType,
+    Token,
+    TokenFilter,
+    UUID,
+    Vote,
+    VoteBase,
+    VoteCreate,
+    VoteFilter,
+    Wallet,
+    WalletFilter,
+    WalletFilterN,
+)
+from app.backend.supabase import (
+    AGENT_TOKEN_HOLDER_SELECT,
+    HOLDER_PAGE_SIZE,
+    agent_token_dtos_from_rows,
+)
+from app.lib.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+
+class AsyncSupabaseBackend(AsyncAbstractBackend):
+    """Supabase backend built on the async PostgREST client.
+
+    All requests share a single pooled ``httpx.AsyncClient`` so concurrent
+    coroutines reuse keep-alive connections instead of blocking the event loop
+    on a synchronous round trip.
+    """
+
+    def __init__(self, client: AsyncClient, http_client: httpx.AsyncClient):
+        self.client = client
+        self.http_client = http_client
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client."""
+        await self.http_client.aclose()
+
+    async def _get_row(self, table: str, row_id: Any) -> Optional[Dict[str, Any]]:
+        """Fetch a single row by primary key, returning None when missing."""
+        response = (
+            await self.client.table(table)
+            .select("*")
+            .eq("id", str(row_id))
+            .maybe_single()
+            .execute()
+        )
+        if response is None or not response.data:
+            return None
+        return response.data
+
+    async def _insert_row(self, table: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        response = await self.client.table(table).insert(payload).execute()
+        data = response.data or []
+        if not data:
+            raise ValueError(f"No data returned from {table} insert.")
+        return data[0]
+
+    async def _update_row(
+        self, table: str, row_id: Any, payload: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        response = (
+            await self.client.table(table)
+            .update(payload)
+            .eq("id", str(row_id))
+            .execute()
+        )
+        updated = response.data or []
+        if not updated:
+            return None
+        return updated[0]
+
+    # ----------------------------------------------------------------
+    # CHAIN STATE
+    # ----------------------------------------------------------------
+    async def create_chain_state(self, new_chain_state: ChainStateCreate) -> ChainState:
+        """Create a new chain state record."""
+        payload = new_chain_state.model_dump(exclude_unset=True, mode="json")
+        return ChainState(**await self._insert_row("chain_states", payload))
+
+    async def update_chain_state(
+        self, chain_state_id: UUID, update_data: ChainStateBase
+    ) -> Optional[ChainState]:
+        """Update a chain state record."""
+        payload = update_data.model_dump(exclude_unset=True, mode="json")
+        if not payload:
+            row = await self._get_row("chain_states", chain_state_id)
+        else:
+            row = await self._update_row("chain_states", chain_state_id, payload)
+        return ChainState(**row) if row else None
+
+    async def get_latest_chain_state(
+        self, network: str = "mainnet"
+    ) -> Optional[ChainState]:
+        """Get the latest chain state for a given network."""
+        try:
+            response = (
+                await self.client.table("chain_states")
+                .select("*")
+                .eq("network", network)
+                .order("block_height", desc=True)
+                .limit(1)
+                .execute()
+            )
+            if not response.data:
+                return None
+            return ChainState(**response.data[0])
+        except Exception as e:
+            logger.error(
+                f"Error getting latest chain state for network {network}: {str(e)}"
+            )
+            return None
+
+    # ----------------------------------------------------------------
+    # QUEUE MESSAGES
+    # ----------------------------------------------------------------
+    async def create_queue_message(
+        self, new_queue_message: QueueMessageCreate
+    ) -> QueueMessage:
+        """Create a new queue message, returning an identical pending one if present.
+
+        Deduplication happens in the enqueue_queue_messages database function,
+        in the same round trip as the insert.
+        """
+        payload = new_queue_message.model_dump(exclude_unset=True, mode="json")
+        response = await self.client.rpc(
+            "enqueue_queue_messages", {"p_messages": [payload]}
+        ).execute()
+        if not response.data:
+            raise ValueError("No data returned from enqueue_queue_messages.")
+        return QueueMessage(**response.data[0])
+
+    async def get_queue_message(self, queue_message_id: UUID) -> Optional[QueueMessage]:
+        row = await self._get_row("queue", queue_message_id)
+        return QueueMessage(**row) if row else None
+
+    async def list_queue_messages(
+        self, filters: Optional[QueueMessageFilter] = None
+    ) -> List[QueueMessage]:
+        query = self.client.table("queue").select("*")
+        if filters:
+            if filters.type is not None:
+                query = query.eq("type", filters.type)
+            if filters.is_processed is not None:
+                query = query.eq("is_processed", filters.is_processed)
+            if filters.wallet_id is not None:
+                query = query.eq("wallet_id", filters.wallet_id)
+            if filters.dao_id is not None:
+                query = query.eq("dao_id", str(filters.dao_id))
+            if filters.proposal_id is not None:
+                query = query.eq("message->>proposal_id", str(filters.proposal_id))
+            if filters.proposal_status is not None:
+                query = query.eq("message->>proposal_status", filters.proposal_status)
+        response = await query.execute()
+        return [QueueMessage(**row) for row in response.data or []]
+
+    async def update_queue_message(
+        self, queue_message_id: UUID, update_data: QueueMessageBase
+    ) -> Optional[QueueMessage]:
+        payload = update_data.model_dump(exclude_unset=True, mode="json")
+        if not payload:
+            return await self.get_queue_message(queue_message_id)
+        row = await self._update_row("queue", queue_message_id, payload)
+        return QueueMessage(**row) if row else None
+
+    async def claim_queue_messages(
+        self,
+        queue_type: QueueMessageType,
+        worker_id: str,
+        limit: int = 100,
+        lease_seconds: int = 300,
+    ) -> List[QueueMessage]:
+        response = await self.client.rpc(
+            "claim_queue_messages",
+            {
+                "p_type": str(queue_type),
+                "p_worker_id": worker_id,
+                "p_limit": limit,
+                "p_lease_seconds": lease_seconds,
+            },
+        ).execute()
+        return [QueueMessage(**row) for row in response.data or []]
+
+    async def extend_queue_message_leases(
+        self, queue_message_ids: List[UUID], worker_id: str, lease_seconds: int = 300
+    ) -> List[UUID]:
+        if not queue_message_ids:
+            return []
+        response = await self.client.rpc(
+            "extend_queue_message_leases",
+            {
+                "p_ids": [str(message_id) for message_id in queue_message_ids],
+                "p_worker_id": worker_id,
+                "p_lease_seconds": lease_seconds,
+            },
+        ).execute()
+        return [UUID(row["id"]) for row in response.data or []]
+
+    async def release_queue_messages(
+        self, queue_message_ids: List[UUID], worker_id: str
+    ) -> int:
+        if not queue_message_ids:
+            return 0
+        response = await self.client.rpc(
+            "release_queue_messages",
+            {
+                "p_ids": [str(message_id) for message_id in queue_message_ids],
+                "p_worker_id": worker_id,
+            },
+        ).execute()
+        return response.data or 0
+
+    # ----------------------------------------------------------------
+    # WALLETS
+    # ----------------------------------------------------------------
+    async def get_wallet(self, wallet_id: UUID) -> Optional[Wallet]:
+        row = await self._get_row("wallets", wallet_id)
+        return Wallet(**row) if row else None
+
+    async def list_wallets(
+        self, filters: Optional[WalletFilter] = None
+    ) -> List[Wallet]:
+        query = self.client.table("wallets").select("*")
+        if filters:
+            if filters.profile_id:
+                query = query.eq("profile_id", str(filters.profile_id))
+            if filters.agent_id:
+                query = query.eq("agent_id", str(filters.agent_id))
+            if filters.mainnet_address:
+                query = query.eq("mainnet_address", filters.mainnet_address)
+            if filters.testnet_address:
+                query = query.eq("testnet_address", filters.testnet_address)
+        response = await query.execute()
+        return [Wallet(**row) for row in response.data or []]
+
+    async def list_wallets_n(
+        self, filters: Optional[WalletFilterN] = None
+    ) -> List[Wallet]:
+        """Enhanced wallets listing with support for batch operations."""
+        query = self.client.table("wallets").select("*")
+        if filters:
+            if filters.agent_id is not None:
+                query = query.eq("agent_id", str(filters.agent_id))
+            if filters.profile_id is not None:
+                query = query.eq("profile_id", str(filters.profile_id))
+            if filters.mainnet_address is not None:
+                query = query.eq("mainnet_address", filters.mainnet_address)
+            if filters.testnet_address is not None:
+                query = query.eq("testnet_address", filters.testnet_address)
+            if filters.ids:
+                query = query.in_("id", [str(wallet_id) for wallet_id in filters.ids])
+            if filters.agent_ids:
+                query = query.in_(
+                    "agent_id", [str(agent_id) for agent_id in filters.agent_ids]
+                )
+            if filters.profile_ids:
+                query = query.in_(
+                    "profile_id",
+                    [str(profile_id) for profile_id in filters.profile_ids],
+                )
+            if filters.mainnet_addresses:
+                query = query.in_("mainnet_address", filters.mainnet_addresses)
+            if filters.testnet_addresses:
+                query = query.in_("testnet_address", filters.testnet_addresses)
+        response = await query.execute()
+        return [Wallet(**row) for row in response.data or []]
+
+    async def get_agents_with_dao_tokens(
+        self, dao_id: UUID
+    ) -> List[AgentWithWalletTokenDTO]:
+        """Get all agents with wallets that hold tokens for a specific DAO."""
+        result = []
+        offset = 0
+        while True:
+            response = (
+                await self.client.table("holders")
+                .select(AGENT_TOKEN_HOLDER_SELECT)
+                .eq("dao_id", str(dao_id))
+                .order("created_at")
+                .order("id")
+                .range(offset, offset + HOLDER_PAGE_SIZE - 1)
+                .execute()
+            )
+            rows = response.data or []
+            result.extend(agent_token_dtos_from_rows(rows, dao_id))
+            if len(rows) < HOLDER_PAGE_SIZE:
+                break
+            offset += HOLDER_PAGE_SIZE
+
+        return result
+
+    # ----------------------------------------------------------------
+    # AGENTS
+    # ----------------------------------------------------------------
+    async def get_agent(self, agent_id: UUID) -> Optional[Agent]:
+        row = await self._get_row("agents", agent_id)
+        return Agent(**row) if row else None
+
+    async def list_agents(self, filters: Optional[AgentFilter] = None) -> List[Agent]:
+        query = self.client.table("agents").select("*")
+        if filters:
+            if filters.profile_id is not None:
+                query = query.eq("profile_id", str(filters.profile_id))
+            if filters.account_contract is not None:
+                query = query.eq("account_contract", filters.account_contract)
+            if filters.account_contracts:
+                query = query.in_("account_contract", filters.account_contracts)
+        response = await query.execute()
+        return [Agent(**row) for row in response.data or []]
+
+    # ----------------------------------------------------------------
+    # EXTENSIONS
+    # ----------------------------------------------------------------
+    async def list_extensions(
+        self, filters: Optional[ExtensionFilter] = None
+    ) -> List[Extension]:
+        query = self.client.table("extensions").select("*")
+        if filters:
+            if filters.dao_id is not None:
+                query = query.eq("dao_id", str(filters.dao_id))
+            if filters.type is not None:
+                query = query.eq("type", filters.type)
+            if filters.status is not None:
+                query = query.eq("status", str(filters.status))
+            if filters.subtype is not None:
+                query = query.eq("subtype", filters.subtype)
+            if filters.contract_principal is not None:
+                query = query.eq("contract_principal", filters.contract_principal)
+        response = await query.execute()
+        return [Extension(**row) for row in response.data or []]
+
+    # ----------------------------------------------------------------
+    # DAOS
+    # ----------------------------------------------------------------
+    async def get_dao(self, dao_id: UUID) -> Optional[DAO]:
+        row = await self._get_row("daos", dao_id)
+        return DAO(**row) if row else None
+
+    async def list_daos(self, filters: Optional[DAOFilter] = None) -> List[DAO]:
+        query = self.client.table("daos").select("*")
+        if filters:
+            if filters.name is not None:
+                query = query.eq("name", filters.name)
+            if filters.is_deployed is not None:
+                query = query.eq("is_deployed", filters.is_deployed)
+            if filters.is_broadcasted is not None:
+                query = query.eq("is_broadcasted", filters.is_broadcasted)
+        response = await query.execute()
+        return [DAO(**row) for row in response.data or []]
+
+    # ----------------------------------------------------------------
+    # PROPOSALS
+    # ----------------------------------------------------------------
+    async def create_proposal(self, new_proposal: ProposalCreate) -> Proposal:
+        payload = new_proposal.model_dump(exclude_unset=True, mode="json")
+        return Proposal(**await self._insert_row("proposals", payload))
+
+    async def get_proposal(self, proposal_id: UUID) -> Optional[Proposal]:
+        row = await self._get_row("proposals", proposal_id)
+        return Proposal(**row) if row else None
+
+    async def list_proposals(
+        self, filters: Optional[ProposalFilter] = None
+    ) -> List[Proposal]:
+        query = self.client.table("proposals").select("*")
+        if filters:
+            if filters.dao_id is not None:
+                query = query.eq("dao_id", str(filters.dao_id))
+            if filters.status is not None:
+                query = query.eq("status", str(filters.status))
+            if filters.contract_principal is not None:
+                query = query.eq("contract_principal", filters.contract_principal)
+            if filters.proposal_id is not None:
+                query = query.eq("proposal_id", filters.proposal_id)
+            if filters.executed is not None:
+                query = query.eq("executed", filters.executed)
+            if filters.passed is not None:
+                query = query.eq("passed", filters.passed)
+            if filters.met_quorum is not None:
+                query = query.eq("met_quorum", filters.met_quorum)
+            if filters.met_threshold is not None:
+                query = query.eq("met_threshold", filters.met_threshold)
+            if filters.type is not None:
+                query = query.eq("type", filters.type)
+            if filters.tx_id is not None:
+                query = query.eq("tx_id", filters.tx_id)
+            if filters.has_embedding is not None:
+                query = query.eq("has_embedding", filters.has_embedding)
+        response = await query.execute()
+        return [Proposal(**row) for row in response.data or []]
+
+    async def update_proposal(
+        self, proposal_id: UUID, update_data: ProposalBase
+    ) -> Optional[Proposal]:
+        payload = update_data.model_dump(exclude_unset=True, mode="json")
+        if not payload:
+            return await self.get_proposal(proposal_id)
+        row = await self._update_row("proposals", proposal_id, payload)
+        return Proposal(**row) if row else None
+
+    # ----------------------------------------------------------------
+    # TOKENS
+    # ----------------------------------------------------------------
+    async def get_token(self, token_id: UUID) -> Optional[Token]:
+        row = await self._get_row("tokens", token_id)
+        return Token(**row) if row else None
+
+    async def list_tokens(self, filters: Optional[TokenFilter] = None) -> List[Token]:
+        query = self.client.table("tokens").select("*")
+        if filters:
+            if filters.dao_id is not None:
+                query = query.eq("dao_id", str(filters.dao_id))
+            if filters.name is not None:
+                query = query.eq("name", filters.name)
+            if filters.symbol is not None:
+                query = query.eq("symbol", filters.symbol)
+            if filters.status is not None:
+                query = query.eq("status", str(filters.status))
+            if filters.contract_principal is not None:
+                query = query.eq("contract_principal", filters.contract_principal)
+        response = await query.execute()
+        return [Token(**row) for row in response.data or []]
+
+    # ----------------------------------------------------------------
+    # VOTES
+    # ----------------------------------------------------------------
+    async def create_vote(self, new_vote: VoteCreate) -> Vote:
+        payload = new_vote.model_dump(exclude_unset=True, mode="json")
+        return Vote(**await self._insert_row("votes", payload))
+
+    async def get_vote(self, vote_id: UUID) -> Optional[Vote]:
+        row = await self._get_row("votes", vote_id)
+        return Vote(**row) if row else None
+
+    async def list_votes(self, filters: Optional[VoteFilter] = None) -> List[Vote]:
+        query = self.client.table("votes").select("*")
+        if filters:
+            if filters.wallet_id is not None:
+                query = query.eq("wallet_id", str(filters.wallet_id))
+            if filters.dao_id is not None:
+                query = query.eq("dao_id", str(filters.dao_id))
+            if filters.agent_id is not None:
+                query = query.eq("agent_id", str(filters.agent_id))
+            if filters.proposal_id is not None:
+                query = query.eq("proposal_id", str(filters.proposal_id))
+            if filters.answer is not None:
+                query = query.eq("answer", filters.answer)
+            if filters.address is not None:
+                query = query.eq("address", filters.address)
+            if filters.voted is not None:
+                query = query.eq("voted", filters.voted)
+            if filters.model is not None:
+                query = query.eq("model", filters.model)
+            if filters.tx_id is not None:
+                query = query.eq("tx_id", filters.tx_id)
+            if filters.profile_id is not None:
+                query = query.eq("profile_id", str(filters.profile_id))
+            if filters.evaluation_score is not None:
+                query = query.eq("evaluation_score", filters.evaluation_score)
+            if filters.flags is not None:
+                query = query.eq("flags", filters.flags)
+            if filters.wallet_ids:
+                query = query.in_(
+                    "wallet_id", [str(wallet_id) for wallet_id in filters.wallet_ids]
+                )
+            if filters.proposal_ids:
+                query = query.in_(
+                    "proposal_id",
+                    [str(proposal_id) for proposal_id in filters.proposal_ids],
+                )
+        response = await query.execute()
+        return [Vote(**row) for row in response.data or []]
+
+    async def update_vote(self, vote_id: UUID, update_data: VoteBase) -> Optional[Vote]:
+        payload = update_data.model_dump(exclude_unset=True, mode="json")
+        if not payload:
+            return await self.get_vote(vote_id)
+        row = await self._update_row("votes", vote_id, payload)
+        return Vote(**row) if row else None
+
+    # ----------------------------------------------------------------
+    # HOLDERS
+    # ----------------------------------------------------------------
+    async def create_holder(self, new_holder: HolderCreate) -> Holder:
+        """Create a new holder record."""
+        payload = new_holder.model_dump(exclude_unset=True, mode="json")
+        return Holder(**await self._insert_row("holders", payload))
+
+    async def list_holders(
+        self, filters: Optional[HolderFilter] = None
+    ) -> List[Holder]:
+        """List holder records with optional filters."""
+        query = self.client.table("holders").select("*")
+        if filters:
+            if filters.wallet_id is not None:
+                query = query.eq("wallet_id", str(filters.wallet_id))
+            if filters.token_id is not None:
+                query = query.eq("token_id", str(filters.token_id))
+            if filters.dao_id is not None:
+                query = query.eq("dao_id", str(filters.dao_id))
+        response = await query.execute()
+        return [Holder(**row) for row in response.data or []]
+
+    async def update_holder(
+        self, holder_id: UUID, update_data: HolderBase
+    ) -> Optional[Holder]:
+        """Update a holder record."""
+        payload = update_data.model_dump(exclude_unset=True, mode="json")
+        if not payload:
+            row = await self._get_row("holders", holder_id)
+        else:
+            row = await self._update_row("holders", holder_id, payload)
+        return Holder(**row) if row else None
+
+    # ----------------------------------------------------------------
+    # LOTTERY RESULTS
+    # ----------------------------------------------------------------
+    async def create_lottery_result(
+        self, new_lottery_result: LotteryResultCreate
+    ) -> LotteryResult:
+        """Create a new lottery result record."""
+        payload = new_lottery_result.model_dump(exclude_unset=True, mode="json")
+        return LotteryResult(**await self._insert_row("lottery_results", payload))
+
+    async def get_lottery_result_by_proposal(
+        self, proposal_id: UUID
+    ) -> Optional[LotteryResult]:
+        """Get a lottery result by proposal ID."""
+        response = (
+            await self.client.table("lottery_results")
+            .select("*")
+            .eq("proposal_id", str(proposal_id))
+            .execute()
+        )
+        if not response.data:
+            return None
+        return LotteryResult(**response.data[0])
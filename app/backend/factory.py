@@ -1,8 +1,14 @@
+import asyncio
+import weakref
+
+import httpx
 from sqlalchemy import create_engine
 from sqlalchemy.pool import NullPool
-from supabase import Client, create_client
+from supabase import AsyncClientOptions, Client, acreate_client, create_client
 
 from app.backend.abstract import AbstractBackend
+from app.backend.async_abstract import AsyncAbstractBackend
+from app.backend.async_supabase import AsyncSupabaseBackend
 from app.backend.supabase import SupabaseBackend
 from app.config import config
 
@@ -33,5 +39,43 @@ def _get_supabase_backend() -> SupabaseBackend:
     )
 
 
+async def _create_async_supabase_backend() -> AsyncSupabaseBackend:
+    """Create an async Supabase backend with a pooled HTTP client."""
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=config.db.async_pool_max_connections,
+            max_keepalive_connections=config.db.async_pool_max_keepalive,
+        ),
+        timeout=config.db.async_request_timeout_seconds,
+        follow_redirects=True,
+    )
+    client = await acreate_client(
+        config.db.url,
+        config.db.service_key,
+        options=AsyncClientOptions(httpx_client=http_client),
+    )
+    return AsyncSupabaseBackend(client=client, http_client=http_client)
+
+
+# Pooled HTTP connections are bound to the loop that opened them, so keep one
+# async backend per running event loop (web server, worker, telegram bot...).
+_async_backends: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncAbstractBackend]" = weakref.WeakKeyDictionary()
+
+
+async def get_async_backend() -> AsyncAbstractBackend:
+    """Get the async backend bound to the current event loop."""
+    loop = asyncio.get_running_loop()
+    async_backend = _async_backends.get(loop)
+    if async_backend is None:
+        if config.db.backend != "supabase":
+            raise ValueError(f"Unsupported backend: {config.db.backend}")
+        created = await _create_async_supabase_backend()
+        # Another coroutine may have finished creating one while we awaited
+        async_backend = _async_backends.setdefault(loop, created)
+        if async_backend is not created:
+            await created.close()
+    return async_backend
+
+
 # Create an instance
 backend = get_backend()
@@ -196,6 +196,10 @@ class QueueMessage(QueueMessageBase):
     id: UUID
     created_at: datetime
     updated_at: Optional[datetime] = None
+    # Lease held by a worker that claimed the message (see claim_queue_messages)
+    claimed_by: Optional[str] = None
+    claimed_until: Optional[datetime] = None
+    claim_count: Optional[int] = None
 
 
 #
@@ -240,6 +244,7 @@ class WalletCreate(WalletBase):
 class Wallet(WalletBase):
     id: UUID
     created_at: datetime
+    updated_at: Optional[datetime] = None
 
 
 #
@@ -496,6 +501,10 @@ class TokenBase(CustomBaseModel):
     telegram_url: Optional[str] = None
     website_url: Optional[str] = None
     status: Optional[ContractStatus] = ContractStatus.DRAFT
+    # Highest block with an FT event of the token, and the chain height the
+    # holders were last synced at
+    holders_activity_height: Optional[int] = None
+    holders_synced_height: Optional[int] = None
 
 
 class TokenCreate(TokenBase):
@@ -505,6 +514,20 @@ class TokenCreate(TokenBase):
 class Token(TokenBase):
     id: UUID
     created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
+class OwnedAddress(CustomBaseModel):
+    """A row of the owned_addresses view.
+
+    kind is "wallet" (mainnet or testnet address), "agent" (account contract)
+    or "token" (contract principal); owner_id is the id of that row.
+    """
+
+    kind: str
+    address: str
+    owner_id: UUID
+    updated_at: Optional[datetime] = None
 
 
 #
@@ -632,6 +655,9 @@ class QueueMessageFilter(CustomBaseModel):
     is_processed: Optional[bool] = None
     wallet_id: Optional[UUID] = None
     dao_id: Optional[UUID] = None
+    # Keys inside the message body (indexed by idx_queue_proposal_messages)
+    proposal_id: Optional[UUID] = None
+    proposal_status: Optional[str] = None
 
 
 class AgentFilter(CustomBaseModel):
@@ -755,6 +781,7 @@ class XUserFilter(CustomBaseModel):
 class XTweetFilter(CustomBaseModel):
     author_id: Optional[UUID] = None
     tweet_id: Optional[str] = None
+    tweet_ids: Optional[List[str]] = None  # Batch filter for multiple tweet IDs
     conversation_id: Optional[str] = None
     is_worthy: Optional[bool] = None
     tweet_type: Optional[TweetType] = None
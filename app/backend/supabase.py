@@ -1,6 +1,6 @@
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
 import uuid
 
 import vecs
@@ -10,7 +10,7 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from supabase import Client
 
-from app.backend.abstract import AbstractBackend
+from app.backend.abstract import AbstractBackend, ModelT
 from app.backend.models import (
     Airdrop,
     AirdropBase,
@@ -25,6 +25,7 @@ from app.backend.models import (
     ChainStateBase,
     ChainStateCreate,
     ChainStateFilter,
+    CustomBaseModel,
     DAO,
     DAOBase,
     DAOCreate,
@@ -50,6 +51,7 @@ from app.backend.models import (
     LotteryResultBase,
     LotteryResultCreate,
     LotteryResultFilter,
+    OwnedAddress,
     Profile,
     ProfileBase,
     ProfileCreate,
@@ -67,6 +69,7 @@ from app.backend.models import (
     QueueMessageBase,
     QueueMessageCreate,
     QueueMessageFilter,
+    QueueMessageType,
     Secret,
     SecretCreate,
     SecretFilter,
@@ -157,6 +160,57 @@ def pydantic_to_sqlalchemy(secret_pydantic: SecretCreate) -> SecretSQL:
     )
 
 
+# Holders joined to wallet, token and DAO via their foreign keys. Inner joins
+# drop holders whose wallet, token or DAO no longer exists.
+AGENT_TOKEN_HOLDER_SELECT = (
+    "id, amount, "
+    "wallets!inner(id, agent_id, mainnet_address, testnet_address), "
+    "tokens!inner(id), "
+    "daos!inner(name)"
+)
+
+# PostgREST caps responses at 1000 rows by default
+HOLDER_PAGE_SIZE = 1000
+
+
+def agent_token_dtos_from_rows(
+    rows: List[Dict[str, Any]], dao_id: UUID
+) -> List[AgentWithWalletTokenDTO]:
+    """Build AgentWithWalletTokenDTOs from embedded holder rows.
+
+    Args:
+        rows: Holder rows selected with AGENT_TOKEN_HOLDER_SELECT
+        dao_id: The DAO the holders belong to
+
+    Returns:
+        DTOs for holders whose wallet belongs to an agent and has an address
+    """
+    result = []
+    for row in rows:
+        wallet = row["wallets"]
+        # Skip wallets not associated with agents
+        if not wallet.get("agent_id"):
+            continue
+
+        wallet_address = wallet.get("mainnet_address") or wallet.get("testnet_address")
+        if not wallet_address:
+            logger.warning(f"Wallet {wallet['id']} has no address")
+            continue
+
+        result.append(
+            AgentWithWalletTokenDTO(
+                agent_id=wallet["agent_id"],
+                wallet_id=wallet["id"],
+                wallet_address=wallet_address,
+                token_id=row["tokens"]["id"],
+                token_amount=row["amount"],
+                dao_id=dao_id,
+                dao_name=row["daos"]["name"],
+            )
+        )
+    return result
+
+
 class SupabaseBackend(AbstractBackend):
     # Upload configuration
     MAX_UPLOAD_RETRIES = 3
@@ -182,6 +236,62 @@ class SupabaseBackend(AbstractBackend):
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}")
 
+    # ---------------------------------------------------------------
+    # BULK WRITES
+    # ---------------------------------------------------------------
+    def insert_many(
+        self, table: str, rows: Sequence["CustomBaseModel"], model: Type[ModelT]
+    ) -> List[ModelT]:
+        if not rows:
+            return []
+        payload = [row.model_dump(exclude_unset=True, mode="json") for row in rows]
+        # Columns a row leaves out take their default rather than NULL
+        response = (
+            self.client.table(table).insert(payload, default_to_null=False).execute()
+        )
+        return [model(**row) for row in response.data or []]
+
+    def upsert_many(
+        self,
+        table: str,
+        rows: Sequence["CustomBaseModel"],
+        model: Type[ModelT],
+        on_conflict: str = "id",
+    ) -> List[ModelT]:
+        if not rows:
+            return []
+        payload = [row.model_dump(exclude_unset=True, mode="json") for row in rows]
+        response = (
+            self.client.table(table)
+            .upsert(payload, on_conflict=on_conflict, default_to_null=False)
+            .execute()
+        )
+        return [model(**row) for row in response.data or []]
+
+    def update_many(
+        self,
+        table: str,
+        updates: Sequence[Tuple[UUID, "CustomBaseModel"]],
+        model: Type[ModelT],
+    ) -> List[ModelT]:
+        # PostgREST has no multi-row PATCH, so each group of updates setting
+        # the same columns is an upsert on id that only writes those columns
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for row_id, update_data in updates:
+            payload = update_data.model_dump(exclude_unset=True, mode="json")
+            if not payload:
+                continue
+            payload["id"] = str(row_id)
+            groups.setdefault(tuple(sorted(payload)), []).append(payload)
+
+        updated: List[ModelT] = []
+        for payload in groups.values():
+            response = (
+                self.client.table(table).upsert(payload, on_conflict="id").execute()
+            )
+            updated.extend(model(**row) for row in response.data or [])
+        return updated
+
     # ---------------------------------------------------------------
     # VECTOR STORE OPERATIONS
     # ---------------------------------------------------------------
@@ -274,7 +384,12 @@ class SupabaseBackend(AbstractBackend):
             raise
 
     async def query_vectors(
-        self, collection_name: str, query_text: str, limit: int = 4, embeddings=None
+        self,
+        collection_name: str,
+        query_text: str,
+        limit: int = 4,
+        embeddings=None,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Dict[str, Any]]:
         """Query vectors in a collection by similarity.
 
@@ -283,18 +398,21 @@ class SupabaseBackend(AbstractBackend):
             query_text: Text to search for
             limit: Maximum number of results to return
             embeddings: Embeddings model to use for encoding the query
+            query_embedding: Precomputed embedding of query_text; when given,
+                embeddings is not needed
 
         Returns:
             List of matching documents with metadata
         """
-        if embeddings is None:
+        if embeddings is None and query_embedding is None:
             raise ValueError("Embeddings model must be provided to query vector store")
 
         collection = self.get_vector_collection(collection_name)
 
         try:
             # Generate embedding for the query text
-            query_embedding = embeddings.embed_query(query_text)
+            if query_embedding is None:
+                query_embedding = embeddings.embed_query(query_text)
 
             # Query similar vectors using the embedding
             results = collection.query(
@@ -667,66 +785,51 @@ class SupabaseBackend(AbstractBackend):
     def create_queue_message(
         self, new_queue_message: "QueueMessageCreate"
     ) -> "QueueMessage":
-        """Create a new queue message with deduplication logic to prevent 5x message multiplication."""
+        """Create a new queue message, or return the unprocessed duplicate.
 
-        # Check for existing unprocessed messages with same content to prevent duplicates
-        if new_queue_message.dao_id and new_queue_message.message:
-            try:
-                # Use Supabase query to find existing unprocessed messages
-                query = (
-                    self.client.table("queue")
-                    .select("*")
-                    .eq("type", new_queue_message.type)
-                    .eq("dao_id", str(new_queue_message.dao_id))
-                    .eq("is_processed", False)
-                )
-
-                # Add wallet_id filter if present
-                if new_queue_message.wallet_id:
-                    query = query.eq("wallet_id", str(new_queue_message.wallet_id))
-
-                response = query.execute()
-                existing_data = response.data or []
-
-                # Check for duplicate content in existing messages
-                new_message_str = (
-                    str(new_queue_message.message) if new_queue_message.message else ""
-                )
-                for existing_row in existing_data:
-                    existing_message_str = str(existing_row.get("message", ""))
-                    if existing_message_str == new_message_str:
-                        existing_message = QueueMessage(**existing_row)
-                        logger.debug(
-                            f"Duplicate queue message detected for DAO {new_queue_message.dao_id}, "
-                            f"type {new_queue_message.type}, returning existing message {existing_message.id}"
-                        )
-                        return existing_message
+        A message with the same type, DAO, wallet and content as an
+        unprocessed message is not inserted again; see create_queue_messages.
+        """
+        return self.create_queue_messages([new_queue_message])[0]
 
-            except Exception as e:
-                # If deduplication check fails, log warning but continue with creation
-                logger.warning(
-                    f"Deduplication check failed: {str(e)}, proceeding with message creation"
-                )
+    def create_queue_messages(
+        self, new_queue_messages: List["QueueMessageCreate"]
+    ) -> List["QueueMessage"]:
+        """Create queue messages in one round trip, skipping duplicates.
 
-        # No duplicate found or deduplication skipped, create new message using Supabase
+        The enqueue_queue_messages function inserts with ON CONFLICT DO
+        NOTHING on the unique index over (type, dao_id, wallet_id,
+        message_hash) of unprocessed messages, where message_hash is the hash
+        of the canonical message content. For every input message, in order,
+        it returns the new row or the unprocessed message it duplicates.
+        """
+        if not new_queue_messages:
+            return []
+        payload = [
+            message.model_dump(exclude_unset=True, mode="json")
+            for message in new_queue_messages
+        ]
         try:
-            payload = new_queue_message.model_dump(exclude_unset=True, mode="json")
-            response = self.client.table("queue").insert(payload).execute()
-            data = response.data or []
-            if not data:
-                raise ValueError(
-                    "No data returned from Supabase insert for queue message."
-                )
+            response = self.client.rpc(
+                "enqueue_queue_messages", {"p_messages": payload}
+            ).execute()
+        except Exception as e:
+            logger.error(f"Failed to create queue messages in Supabase: {str(e)}")
+            raise
+        data = response.data or []
+        if len(data) != len(new_queue_messages):
+            raise ValueError(
+                f"Expected {len(new_queue_messages)} queue messages from "
+                f"enqueue_queue_messages, got {len(data)}."
+            )
 
-            created_message = QueueMessage(**data[0])
+        queued = [QueueMessage(**row) for row in data]
+        for message, new_message in zip(queued, new_queue_messages):
             logger.debug(
-                f"Created new queue message {created_message.id} for DAO {new_queue_message.dao_id}, type {new_queue_message.type}"
+                f"Queued message {message.id} for DAO {new_message.dao_id}, "
+                f"type {new_message.type}"
             )
-            return created_message
-
-        except Exception as e:
-            logger.error(f"Failed to create queue message in Supabase: {str(e)}")
-            raise
+        return queued
 
     def get_queue_message(self, queue_message_id: UUID) -> Optional["QueueMessage"]:
         response = (
@@ -753,6 +856,10 @@ class SupabaseBackend(AbstractBackend):
                 query = query.eq("wallet_id", filters.wallet_id)
             if filters.dao_id is not None:
                 query = query.eq("dao_id", str(filters.dao_id))
+            if filters.proposal_id is not None:
+                query = query.eq("message->>proposal_id", str(filters.proposal_id))
+            if filters.proposal_status is not None:
+                query = query.eq("message->>proposal_status", filters.proposal_status)
         response = query.execute()
         data = response.data or []
         return [QueueMessage(**row) for row in data]
@@ -785,6 +892,101 @@ class SupabaseBackend(AbstractBackend):
         deleted = response.data or []
         return len(deleted) > 0
 
+    def has_claimable_queue_messages(self, queue_type: "QueueMessageType") -> bool:
+        now = datetime.now(timezone.utc).isoformat()
+        response = (
+            self.client.table("queue")
+            .select("id")
+            .eq("type", str(queue_type))
+            .eq("is_processed", False)
+            .or_(f"claimed_until.is.null,claimed_until.lt.{now}")
+            .limit(1)
+            .execute()
+        )
+        return bool(response.data)
+
+    def claim_queue_messages(
+        self,
+        queue_type: "QueueMessageType",
+        worker_id: str,
+        limit: int = 100,
+        lease_seconds: int = 300,
+    ) -> List["QueueMessage"]:
+        response = self.client.rpc(
+            "claim_queue_messages",
+            {
+                "p_type": str(queue_type),
+                "p_worker_id": worker_id,
+                "p_limit": limit,
+                "p_lease_seconds": lease_seconds,
+            },
+        ).execute()
+        data = response.data or []
+        return [QueueMessage(**row) for row in data]
+
+    def extend_queue_message_leases(
+        self, queue_message_ids: List[UUID], worker_id: str, lease_seconds: int = 300
+    ) -> List[UUID]:
+        if not queue_message_ids:
+            return []
+        response = self.client.rpc(
+            "extend_queue_message_leases",
+            {
+                "p_ids": [str(message_id) for message_id in queue_message_ids],
+                "p_worker_id": worker_id,
+                "p_lease_seconds": lease_seconds,
+            },
+        ).execute()
+        data = response.data or []
+        return [UUID(row["id"]) for row in data]
+
+    def release_queue_messages(
+        self, queue_message_ids: List[UUID], worker_id: str
+    ) -> int:
+        if not queue_message_ids:
+            return 0
+        response = self.client.rpc(
+            "release_queue_messages",
+            {
+                "p_ids": [str(message_id) for message_id in queue_message_ids],
+                "p_worker_id": worker_id,
+            },
+        ).execute()
+        return response.data or 0
+
+    def ingest_chainhook_block(
+        self,
+        chainhook_uuid: str,
+        block_hash: str,
+        block_height: int,
+        payload: Dict[str, Any],
+    ) -> Optional[UUID]:
+        response = self.client.rpc(
+            "ingest_chainhook_block",
+            {
+                "p_chainhook_uuid": chainhook_uuid,
+                "p_block_hash": block_hash,
+                "p_block_height": block_height,
+                "p_payload": payload,
+            },
+        ).execute()
+        return UUID(response.data) if response.data else None
+
+    def replay_chainhook_blocks(
+        self, from_height: int, to_height: Optional[int] = None
+    ) -> int:
+        response = self.client.rpc(
+            "replay_chainhook_blocks",
+            {"p_from_height": from_height, "p_to_height": to_height},
+        ).execute()
+        return response.data or 0
+
+    def prune_chainhook_blocks(self, older_than_seconds: int) -> int:
+        response = self.client.rpc(
+            "prune_chainhook_blocks", {"p_older_than_seconds": older_than_seconds}
+        ).execute()
+        return response.data or 0
+
     # ----------------------------------------------------------------
     # 0. WALLETS
     # ----------------------------------------------------------------
@@ -911,73 +1113,29 @@ class SupabaseBackend(AbstractBackend):
     def get_agents_with_dao_tokens(
         self, dao_id: UUID
     ) -> List["AgentWithWalletTokenDTO"]:
-        """Get all agents with wallets that hold tokens for a specific DAO using models."""
-        result = []
-
-        # Step 1: Find all holders for this DAO
-        holders = self.list_holders(HolderFilter(dao_id=dao_id))
-
-        if not holders:
-            return []
-
-        # Get the DAO information once
-        dao = self.get_dao(dao_id)
-        if not dao:
-            logger.warning(f"DAO with ID {dao_id} not found")
-            return []
-
-        # Process each holder
-        for holder in holders:
-            # Skip holders with no wallet_id
-            if not holder.wallet_id:
-                logger.warning(f"Holder {holder.id} has no wallet_id, skipping")
-                continue
-
-            # Step 2: Get the wallet
-            wallet = self.get_wallet(holder.wallet_id)
-            if not wallet:
-                logger.warning(f"Wallet with ID {holder.wallet_id} not found")
-                continue
-
-            # Skip wallets not associated with agents
-            if not wallet.agent_id:
-                continue
+        """Get all agents with wallets that hold tokens for a specific DAO.
 
-            # Step 3: Get the agent
-            agent = self.get_agent(wallet.agent_id)
-            if not agent:
-                logger.warning(f"Agent with ID {wallet.agent_id} not found")
-                continue
-
-            # Skip holders with no token_id
-            if not holder.token_id:
-                logger.warning(f"Holder {holder.id} has no token_id, skipping")
-                continue
-
-            # Step 4: Get the token
-            token = self.get_token(holder.token_id)
-            if not token:
-                logger.warning(f"Token with ID {holder.token_id} not found")
-                continue
-
-            # Step 5: Create the DTO
-            wallet_address = wallet.mainnet_address or wallet.testnet_address
-            if not wallet_address:
-                logger.warning(f"Wallet {wallet.id} has no address")
-                continue
-
-            # Add to results
-            result.append(
-                AgentWithWalletTokenDTO(
-                    agent_id=agent.id,
-                    wallet_id=wallet.id,
-                    wallet_address=wallet_address,
-                    token_id=token.id,
-                    token_amount=holder.amount,
-                    dao_id=dao_id,
-                    dao_name=dao.name,
-                )
+        Holders are joined to their wallet, token and DAO server-side through
+        PostgREST resource embedding, so each page of holders costs a single
+        request instead of one wallet/agent/token lookup per holder.
+        """
+        result = []
+        offset = 0
+        while True:
+            response = (
+                self.client.table("holders")
+                .select(AGENT_TOKEN_HOLDER_SELECT)
+                .eq("dao_id", str(dao_id))
+                .order("created_at")
+                .order("id")
+                .range(offset, offset + HOLDER_PAGE_SIZE - 1)
+                .execute()
             )
+            rows = response.data or []
+            result.extend(agent_token_dtos_from_rows(rows, dao_id))
+            if len(rows) < HOLDER_PAGE_SIZE:
+                break
+            offset += HOLDER_PAGE_SIZE
 
         return result
 
@@ -1543,6 +1701,41 @@ class SupabaseBackend(AbstractBackend):
         deleted = response.data or []
         return len(deleted) > 0
 
+    def record_token_activity(
+        self, contract_principals: List[str], block_height: int
+    ) -> int:
+        if not contract_principals:
+            return 0
+        response = self.client.rpc(
+            "record_token_activity",
+            {
+                "p_contract_principals": list(contract_principals),
+                "p_block_height": block_height,
+            },
+        ).execute()
+        return response.data or 0
+
+    def list_owned_addresses(
+        self, updated_after: Optional[datetime] = None
+    ) -> List["OwnedAddress"]:
+        page_size = 1000  # PostgREST caps responses at max-rows
+        addresses: List[OwnedAddress] = []
+        while True:
+            query = self.client.table("owned_addresses").select("*")
+            if updated_after is not None:
+                query = query.gte("updated_at", updated_after.isoformat())
+            response = (
+                query.order("updated_at")
+                .order("kind")
+                .order("address")
+                .range(len(addresses), len(addresses) + page_size - 1)
+                .execute()
+            )
+            rows = response.data or []
+            addresses.extend(OwnedAddress(**row) for row in rows)
+            if len(rows) < page_size:
+                return addresses
+
     # ----------------------------------------------------------------
     # 15. VOTES
     # ----------------------------------------------------------------
@@ -1657,6 +1850,12 @@ class SupabaseBackend(AbstractBackend):
             return None
         return Vote(**updated[0])
 
+    def create_votes(self, new_votes: List["VoteCreate"]) -> List["Vote"]:
+        return self.insert_many("votes", new_votes, Vote)
+
+    def update_votes(self, updates: List[Tuple[UUID, "VoteBase"]]) -> List["Vote"]:
+        return self.update_many("votes", updates, Vote)
+
     def delete_vote(self, vote_id: UUID) -> bool:
         response = self.client.table("votes").delete().eq("id", str(vote_id)).execute()
         deleted = response.data or []
@@ -1869,6 +2068,9 @@ class SupabaseBackend(AbstractBackend):
             raise ValueError("No data returned from x_tweets insert.")
         return XTweet(**data[0])
 
+    def create_x_tweets(self, new_xts: List["XTweetCreate"]) -> List["XTweet"]:
+        return self.insert_many("x_tweets", new_xts, XTweet)
+
     def get_x_tweet(self, x_tweet_id: UUID) -> Optional["XTweet"]:
         response = (
             self.client.table("x_tweets").select("*").eq("id", x_tweet_id).execute()
@@ -1888,6 +2090,8 @@ class SupabaseBackend(AbstractBackend):
                 query = query.eq("conversation_id", filters.conversation_id)
             if filters.tweet_id is not None:
                 query = query.eq("tweet_id", filters.tweet_id)
+            if filters.tweet_ids is not None and len(filters.tweet_ids) > 0:
+                query = query.in_("tweet_id", filters.tweet_ids)
             if filters.is_worthy is not None:
                 query = query.eq("is_worthy", filters.is_worthy)
             if filters.tweet_type is not None:
@@ -2028,6 +2232,24 @@ class SupabaseBackend(AbstractBackend):
         deleted = response.data or []
         return len(deleted) > 0
 
+    def create_holders(self, new_holders: List["HolderCreate"]) -> List["Holder"]:
+        """Create holder records in a single request."""
+        return self.insert_many("holders", new_holders, Holder)
+
+    def upsert_holders(self, holders: List["Holder"]) -> List["Holder"]:
+        """Write complete holder records in bulk, matched by id."""
+        return self.upsert_many("holders", holders, Holder)
+
+    def delete_holders(self, holder_ids: List[UUID]) -> int:
+        """Delete holder records in bulk; returns the number deleted."""
+        deleted = 0
+        # Ids go in the query string, so delete in chunks
+        for start in range(0, len(holder_ids), 100):
+            chunk = [str(holder_id) for holder_id in holder_ids[start : start + 100]]
+            response = self.client.table("holders").delete().in_("id", chunk).execute()
+            deleted += len(response.data or [])
+        return deleted
+
     # ----------------------------------------------------------------
     # 18. FEEDBACK
     # ----------------------------------------------------------------
@@ -2306,6 +2528,12 @@ class SupabaseBackend(AbstractBackend):
             raise ValueError("No data returned from lottery_results insert.")
         return LotteryResult(**data[0])
 
+    def create_lottery_results(
+        self, new_lottery_results: List["LotteryResultCreate"]
+    ) -> List["LotteryResult"]:
+        """Create lottery result records in a single request."""
+        return self.insert_many("lottery_results", new_lottery_results, LotteryResult)
+
     def get_lottery_result(self, lottery_result_id: UUID) -> Optional["LotteryResult"]:
         """Get a lottery result by ID."""
         response = (
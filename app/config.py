@@ -22,6 +22,16 @@ class DatabaseConfig:
     url: str = os.getenv("AIBTC_SUPABASE_URL", "")
     service_key: str = os.getenv("AIBTC_SUPABASE_SERVICE_KEY", "")
     bucket_name: str = os.getenv("AIBTC_SUPABASE_BUCKET_NAME", "")
+    # Connection pool for the async backend (shared per event loop)
+    async_pool_max_connections: int = int(
+        os.getenv("AIBTC_SUPABASE_ASYNC_POOL_MAX_CONNECTIONS", "20")
+    )
+    async_pool_max_keepalive: int = int(
+        os.getenv("AIBTC_SUPABASE_ASYNC_POOL_MAX_KEEPALIVE", "10")
+    )
+    async_request_timeout_seconds: float = float(
+        os.getenv("AIBTC_SUPABASE_ASYNC_REQUEST_TIMEOUT_SECONDS", "30")
+    )
 
 
 @dataclass
@@ -40,6 +50,18 @@ class TwitterConfig:
     whitelisted_authors: List[str] = field(
         default_factory=lambda: os.getenv("AIBTC_TWITTER_WHITELISTED", "").split(",")
     )
+    # Async transport (app/services/communication/twitter_transport.py)
+    api_base_url: str = os.getenv(
+        "AIBTC_TWITTER_API_BASE_URL", "https://api.twitter.com"
+    )
+    upload_base_url: str = os.getenv(
+        "AIBTC_TWITTER_UPLOAD_BASE_URL", "https://upload.twitter.com"
+    )
+    timeout_seconds: float = float(os.getenv("AIBTC_TWITTER_TIMEOUT_SECONDS", "30"))
+    max_connections: int = int(os.getenv("AIBTC_TWITTER_MAX_CONNECTIONS", "20"))
+    max_rate_limit_wait_seconds: float = float(
+        os.getenv("AIBTC_TWITTER_MAX_RATE_LIMIT_WAIT_SECONDS", "60")
+    )
 
 
 @dataclass
@@ -93,6 +115,13 @@ class ChatLLMConfig:
     reasoning_temperature: float = float(
         os.getenv("AIBTC_CHAT_REASONING_TEMPERATURE", "0.9")
     )
+    # Proposal evaluations with identical requests share one call: seconds a
+    # successful result is reused (0 only shares in-flight calls), and
+    # results kept
+    evaluation_cache_ttl_seconds: int = int(
+        os.getenv("AIBTC_EVALUATION_CACHE_TTL_SECONDS", "600")
+    )
+    evaluation_cache_size: int = int(os.getenv("AIBTC_EVALUATION_CACHE_SIZE", "256"))
 
 
 @dataclass
@@ -105,6 +134,31 @@ class EmbeddingConfig:
     api_base: str = os.getenv("AIBTC_EMBEDDING_API_BASE", "")
     api_key: str = os.getenv("AIBTC_EMBEDDING_API_KEY", "")
     dimensions: int = int(os.getenv("AIBTC_EMBEDDING_DIMENSIONS", "1536"))
+    # Embedding cache: entries kept in memory, and a directory for the
+    # on-disk tier (empty disables it)
+    cache_size: int = int(os.getenv("AIBTC_EMBEDDING_CACHE_SIZE", "2048"))
+    cache_dir: str = os.getenv("AIBTC_EMBEDDING_CACHE_DIR", "")
+
+
+@dataclass
+class LLMTransportConfig:
+    """Shared HTTP transport for chat and embedding API calls."""
+
+    max_connections: int = int(os.getenv("AIBTC_LLM_MAX_CONNECTIONS", "100"))
+    max_keepalive: int = int(os.getenv("AIBTC_LLM_MAX_KEEPALIVE", "20"))
+    http2: bool = os.getenv("AIBTC_LLM_HTTP2", "true").lower() == "true"
+    timeout_seconds: float = float(os.getenv("AIBTC_LLM_TIMEOUT_SECONDS", "120"))
+    # In-flight requests per model; override per model with "model=limit,..."
+    max_concurrency_per_model: int = int(
+        os.getenv("AIBTC_LLM_MAX_CONCURRENCY_PER_MODEL", "8")
+    )
+    model_concurrency: str = os.getenv("AIBTC_LLM_MODEL_CONCURRENCY", "")
+    # Retries on 429/5xx and connection errors, with jittered exponential backoff
+    max_retries: int = int(os.getenv("AIBTC_LLM_MAX_RETRIES", "3"))
+    backoff_base_seconds: float = float(
+        os.getenv("AIBTC_LLM_BACKOFF_BASE_SECONDS", "1.0")
+    )
+    backoff_max_seconds: float = float(os.getenv("AIBTC_LLM_BACKOFF_MAX_SECONDS", "30"))
 
 
 @dataclass
@@ -137,6 +191,9 @@ class SchedulerConfig:
     job_stacking_prevention_enabled: bool = (
         os.getenv("AIBTC_JOB_STACKING_PREVENTION_ENABLED", "true").lower() == "true"
     )
+    # Queue claiming: how many messages a worker leases per claim, and for how long
+    queue_claim_limit: int = int(os.getenv("AIBTC_QUEUE_CLAIM_LIMIT", "100"))
+    queue_lease_seconds: int = int(os.getenv("AIBTC_QUEUE_LEASE_SECONDS", "300"))
     # Monitoring jobs that should have aggressive deduplication
     monitoring_job_types: List[str] = field(
         default_factory=lambda: [
@@ -182,6 +239,57 @@ class SchedulerConfig:
     chain_state_monitor_interval_seconds: int = int(
         os.getenv("AIBTC_CHAIN_STATE_MONITOR_INTERVAL_SECONDS", "90")
     )
+    # Blocks fetched ahead while backfilling, and the most blocks applied per run
+    chain_state_monitor_backfill_prefetch: int = int(
+        os.getenv("AIBTC_CHAIN_STATE_MONITOR_BACKFILL_PREFETCH", "8")
+    )
+    chain_state_monitor_max_blocks_per_run: int = int(
+        os.getenv("AIBTC_CHAIN_STATE_MONITOR_MAX_BLOCKS_PER_RUN", "250")
+    )
+    # Directory for finalized blocks fetched by the adapter; empty disables it
+    chain_state_monitor_cache_dir: str = os.getenv(
+        "AIBTC_CHAIN_STATE_MONITOR_CACHE_DIR", ""
+    )
+
+    # chainhook_ingest job: drains the webhook ingest log. When disabled the
+    # webhook endpoint processes payloads in the web process instead.
+    chainhook_ingest_enabled: bool = (
+        os.getenv("AIBTC_CHAINHOOK_INGEST_ENABLED", "true").lower() == "true"
+    )
+    chainhook_ingest_interval_seconds: int = int(
+        os.getenv("AIBTC_CHAINHOOK_INGEST_INTERVAL_SECONDS", "10")
+    )
+    # Attempts before an entry is given up on. Blocks are always handled one
+    # at a time: the chainhook handlers share per-block state and
+    # BlockStateHandler expects heights in order
+    chainhook_ingest_max_attempts: int = int(
+        os.getenv("AIBTC_CHAINHOOK_INGEST_MAX_ATTEMPTS", "5")
+    )
+    # Days processed blocks stay in the log (and can be replayed); 0 keeps them
+    chainhook_ingest_retention_days: int = int(
+        os.getenv("AIBTC_CHAINHOOK_INGEST_RETENTION_DAYS", "7")
+    )
+    # Owned-address index used by the chainhook handlers: seconds between
+    # delta refreshes by updated_at, and between full reloads (which also
+    # drop deleted rows)
+    owned_address_refresh_seconds: int = int(
+        os.getenv("AIBTC_OWNED_ADDRESS_REFRESH_SECONDS", "60")
+    )
+    owned_address_full_reload_seconds: int = int(
+        os.getenv("AIBTC_OWNED_ADDRESS_FULL_RELOAD_SECONDS", "3600")
+    )
+    # Proposal timeline used by the burn height handler: seconds between
+    # reloads of the deployed proposals (hooks keep it in sync in between)
+    proposal_timeline_reload_seconds: int = int(
+        os.getenv("AIBTC_PROPOSAL_TIMELINE_RELOAD_SECONDS", "3600")
+    )
+    # DAO context snapshots used by evaluations: seconds before a DAO's
+    # proposals are listed again (hooks keep them in sync in between), and
+    # DAOs kept in memory
+    dao_context_ttl_seconds: int = int(
+        os.getenv("AIBTC_DAO_CONTEXT_TTL_SECONDS", "300")
+    )
+    dao_context_max_daos: int = int(os.getenv("AIBTC_DAO_CONTEXT_MAX_DAOS", "256"))
 
     # chainhook_monitor job
     chainhook_monitor_enabled: bool = (
@@ -239,6 +347,15 @@ class SchedulerConfig:
         os.getenv("AIBTC_DAO_PROPOSAL_VOTE_INTERVAL_SECONDS", "60")
     )
 
+    # dao_token_holders_monitor job: tokens synced at once, and how often a
+    # token is resynced even without chainhook activity
+    dao_token_holders_monitor_concurrency: int = int(
+        os.getenv("AIBTC_DAO_TOKEN_HOLDERS_MONITOR_CONCURRENCY", "4")
+    )
+    dao_token_holders_monitor_full_resync_seconds: int = int(
+        os.getenv("AIBTC_DAO_TOKEN_HOLDERS_MONITOR_FULL_RESYNC_SECONDS", "3600")
+    )
+
     # discord job
     discord_enabled: bool = os.getenv("AIBTC_DISCORD_ENABLED", "true").lower() == "true"
     discord_interval_seconds: int = int(
@@ -289,6 +406,23 @@ class NetworkConfig:
     network: str = os.getenv("NETWORK", "testnet")
 
 
+@dataclass
+class BunConfig:
+    # Persistent worker pool for agent-tools-ts scripts (see app/tools/bun_pool.py)
+    worker_pool_enabled: bool = (
+        os.getenv("AIBTC_BUN_WORKER_POOL_ENABLED", "true").lower() == "true"
+    )
+    worker_pool_size: int = int(os.getenv("AIBTC_BUN_WORKER_POOL_SIZE", "4"))
+    worker_max_calls: int = int(os.getenv("AIBTC_BUN_WORKER_MAX_CALLS", "100"))
+    worker_max_rss_mb: int = int(os.getenv("AIBTC_BUN_WORKER_MAX_RSS_MB", "512"))
+    worker_idle_seconds: float = float(
+        os.getenv("AIBTC_BUN_WORKER_IDLE_SECONDS", "300")
+    )
+    call_timeout_seconds: float = float(
+        os.getenv("AIBTC_BUN_CALL_TIMEOUT_SECONDS", "120")
+    )
+
+
 @dataclass
 class AutoVotingApprovalConfig:
     auto_approve_voting_contract: bool = (
@@ -305,6 +439,7 @@ class Config:
     scheduler: SchedulerConfig = field(default_factory=SchedulerConfig)
     api: APIConfig = field(default_factory=APIConfig)
     network: NetworkConfig = field(default_factory=NetworkConfig)
+    bun: BunConfig = field(default_factory=BunConfig)
     discord: DiscordConfig = field(default_factory=DiscordConfig)
     backend_wallet: BackendWalletConfig = field(default_factory=BackendWalletConfig)
     stx_transfer_wallet: STXTransferWalletConfig = field(
@@ -312,6 +447,7 @@ class Config:
     )
     chat_llm: ChatLLMConfig = field(default_factory=ChatLLMConfig)
     embedding: EmbeddingConfig = field(default_factory=EmbeddingConfig)
+    llm_transport: LLMTransportConfig = field(default_factory=LLMTransportConfig)
     huggingface: HuggingFaceConfig = field(default_factory=HuggingFaceConfig)
     auto_voting_approval: AutoVotingApprovalConfig = field(
         default_factory=AutoVotingApprovalConfig
@@ -0,0 +1,237 @@
+"""Process-wide index of the addresses that belong to us.
+
+The chainhook handlers ask "is this address one of ours?" for every sender
+and recipient of every transfer event. OwnedAddressIndex answers that from
+memory: it loads the owned_addresses view (wallet mainnet/testnet addresses,
+agent account contracts and token contract principals) once, then keeps it
+fresh with
+
+- hooks called where the app itself creates or updates those rows,
+- a delta refresh of rows whose updated_at moved past the last one seen,
+  run lazily on lookup every ``refresh_seconds``, and
+- a full reload every ``full_reload_seconds``, which also drops deleted rows.
+
+Until the first load succeeds every lookup answers True, so handlers fall
+back to querying the database rather than missing events.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from app.backend.abstract import AbstractBackend
+from app.backend.factory import backend as default_backend
+from app.backend.models import Agent, OwnedAddress, Token, Wallet
+from app.config import config
+from app.lib.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+WALLET = "wallet"
+AGENT = "agent"
+TOKEN = "token"
+KINDS = (WALLET, AGENT, TOKEN)
+
+# Rows committed by transactions that started before the last refresh can
+# carry an updated_at older than the watermark, so deltas look back this far
+WATERMARK_OVERLAP = timedelta(seconds=60)
+
+OwnerKey = Tuple[str, UUID]
+
+
+class OwnedAddressIndex:
+    """In-memory sets of owned addresses with incremental refresh."""
+
+    def __init__(
+        self,
+        backend: Optional[AbstractBackend] = None,
+        refresh_seconds: Optional[float] = None,
+        full_reload_seconds: Optional[float] = None,
+    ):
+        self.backend = backend or default_backend
+        self.refresh_seconds = (
+            config.scheduler.owned_address_refresh_seconds
+            if refresh_seconds is None
+            else refresh_seconds
+        )
+        self.full_reload_seconds = (
+            config.scheduler.owned_address_full_reload_seconds
+            if full_reload_seconds is None
+            else full_reload_seconds
+        )
+        self._lock = threading.Lock()
+        self._addresses: Dict[str, Set[str]] = {kind: set() for kind in KINDS}
+        # Addresses per owner, so a delta can drop an owner's old addresses
+        self._owners: Dict[OwnerKey, Set[str]] = {}
+        self._watermark: Optional[datetime] = None
+        self._loaded = False
+        self._last_refresh: Optional[float] = None
+        self._last_full_load = 0.0
+        self.loads = 0
+        self.refreshes = 0
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    # ----------- LOOKUPS -----------
+
+    def contains(self, kind: str, address: Optional[str]) -> bool:
+        """Whether address is one of ours of the given kind.
+
+        Answers True while the index has never loaded, so callers confirm
+        against the database instead.
+        """
+        if not address:
+            return False
+        self._ensure_fresh()
+        if not self._loaded:
+            return True
+        return address in self._addresses[kind]
+
+    def is_wallet_address(self, address: Optional[str]) -> bool:
+        return self.contains(WALLET, address)
+
+    def is_agent_account(self, address: Optional[str]) -> bool:
+        return self.contains(AGENT, address)
+
+    def is_token_contract(self, address: Optional[str]) -> bool:
+        return self.contains(TOKEN, address)
+
+    def filter_owned(self, kind: str, addresses: Iterable[str]) -> List[str]:
+        """The addresses (deduplicated, in order) that may be ours."""
+        return [
+            address
+            for address in dict.fromkeys(addresses)
+            if self.contains(kind, address)
+        ]
+
+    # ----------- HOOKS -----------
+
+    def add(self, kind: str, address: Optional[str], owner_id: UUID) -> None:
+        """Record an address the app has just created or assigned."""
+        if not address:
+            return
+        with self._lock:
+            self._addresses[kind].add(address)
+            self._owners.setdefault((kind, owner_id), set()).add(address)
+
+    def add_wallet(self, wallet: Optional[Wallet]) -> None:
+        if wallet is None:
+            return
+        self.add(WALLET, wallet.mainnet_address, wallet.id)
+        self.add(WALLET, wallet.testnet_address, wallet.id)
+
+    def add_agent(self, agent: Optional[Agent]) -> None:
+        if agent is not None:
+            self.add(AGENT, agent.account_contract, agent.id)
+
+    def add_token(self, token: Optional[Token]) -> None:
+        if token is not None:
+            self.add(TOKEN, token.contract_principal, token.id)
+
+    # ----------- REFRESH -----------
+
+    def _ensure_fresh(self) -> None:
+        now = time.monotonic()
+        last = self._last_refresh
+        if last is not None and now - last < self.refresh_seconds:
+            return
+        if not self._loaded:
+            # Callers wait for the first load; a failed load is retried after
+            # refresh_seconds and meanwhile every lookup answers True
+            with self._lock:
+                last = self._last_refresh
+                if not self._loaded and (
+                    last is None or now - last >= self.refresh_seconds
+                ):
+                    self._refresh(now, full=True)
+            return
+        # Later refreshes run in one caller; the others use the current sets
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if now - self._last_refresh >= self.refresh_seconds:
+                full = now - self._last_full_load >= self.full_reload_seconds
+                self._refresh(now, full=full)
+        finally:
+            self._lock.release()
+
+    def refresh(self, full: bool = False) -> None:
+        """Refresh now: a delta since the watermark, or a full reload."""
+        with self._lock:
+            self._refresh(time.monotonic(), full=full or not self._loaded)
+
+    def _refresh(self, now: float, full: bool) -> None:
+        """Load rows from the backend. Must be called with the lock held."""
+        self._last_refresh = now
+        updated_after = (
+            None
+            if full or self._watermark is None
+            else self._watermark - WATERMARK_OVERLAP
+        )
+        try:
+            rows = self.backend.list_owned_addresses(updated_after=updated_after)
+        except Exception as e:
+            logger.error(
+                f"Failed to {'load' if full else 'refresh'} owned addresses: {e}",
+                exc_info=True,
+            )
+            return
+
+        if full:
+            self._replace(rows)
+            self._last_full_load = now
+            self._loaded = True
+            self.loads += 1
+            logger.info(
+                "Loaded owned-address index: "
+                + ", ".join(f"{len(self._addresses[k])} {k}s" for k in KINDS)
+            )
+        else:
+            self._apply(rows)
+            self.refreshes += 1
+            if rows:
+                logger.debug(f"Refreshed {len(rows)} owned addresses")
+        self._advance_watermark(rows)
+
+    def _replace(self, rows: List[OwnedAddress]) -> None:
+        addresses: Dict[str, Set[str]] = {kind: set() for kind in KINDS}
+        owners: Dict[OwnerKey, Set[str]] = {}
+        for row in rows:
+            if row.kind not in addresses:
+                continue
+            addresses[row.kind].add(row.address)
+            owners.setdefault((row.kind, row.owner_id), set()).add(row.address)
+        self._addresses = addresses
+        self._owners = owners
+
+    def _apply(self, rows: List[OwnedAddress]) -> None:
+        """Replace the addresses of every owner present in a delta.
+
+        An updated row brings all of its owner's addresses (a wallet's
+        mainnet and testnet rows share updated_at), so addresses the owner
+        no longer has are dropped.
+        """
+        changed: Dict[OwnerKey, Set[str]] = {}
+        for row in rows:
+            if row.kind in self._addresses:
+                changed.setdefault((row.kind, row.owner_id), set()).add(row.address)
+        for key, current in changed.items():
+            kind = key[0]
+            previous = self._owners.get(key, set())
+            self._addresses[kind].difference_update(previous - current)
+            self._addresses[kind].update(current)
+            self._owners[key] = current
+
+    def _advance_watermark(self, rows: List[OwnedAddress]) -> None:
+        stamps = [row.updated_at for row in rows if row.updated_at is not None]
+        if stamps:
+            latest = max(stamps)
+            if self._watermark is None or latest > self._watermark:
+                self._watermark = latest
+
+
+address_index = OwnedAddressIndex()
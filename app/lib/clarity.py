@@ -0,0 +1,294 @@
+"""Clarity value serialization.
+
+Encodes and decodes the consensus serialization of Clarity values, as found
+in contract call arguments, print event payloads and read-only call results.
+
+``decode_clarity_value`` turns serialized bytes straight into plain Python
+values in a single pass:
+
+- int and uint become int, true and false become bool
+- buff becomes a ``0x``-prefixed hex string
+- principals become their address (``SP...`` or ``SP....contract-name``)
+- string-ascii and string-utf8 become str
+- none becomes None; (some v), (ok v) and (err v) become v
+- lists become lists and tuples become dicts
+"""
+
+import hashlib
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Callable, Tuple, Union
+
+C32_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_C32_INDEX = {char: index for index, char in enumerate(C32_ALPHABET)}
+
+# Deeper values are rejected rather than recursed into
+MAX_DEPTH = 64
+
+
+class ClarityType(IntEnum):
+    """Type prefixes of serialized Clarity values."""
+
+    INT = 0x00
+    UINT = 0x01
+    BUFFER = 0x02
+    BOOL_TRUE = 0x03
+    BOOL_FALSE = 0x04
+    PRINCIPAL_STANDARD = 0x05
+    PRINCIPAL_CONTRACT = 0x06
+    RESPONSE_OK = 0x07
+    RESPONSE_ERR = 0x08
+    OPTIONAL_NONE = 0x09
+    OPTIONAL_SOME = 0x0A
+    LIST = 0x0B
+    TUPLE = 0x0C
+    STRING_ASCII = 0x0D
+    STRING_UTF8 = 0x0E
+
+
+class ClarityDecodeError(ValueError):
+    """Raised for data that is not a serialized Clarity value."""
+
+
+@dataclass
+class ClarityValue:
+    """A typed Clarity value.
+
+    ``value`` holds an int for int/uint, bytes for buff, a bool for true and
+    false, the address for principals, the inner ClarityValue for ok, err and
+    some, None for none, a list of ClarityValue for lists, a dict of field name
+    to ClarityValue for tuples and a str for strings.
+    """
+
+    type: ClarityType
+    value: Any = None
+
+
+def c32_encode(data: bytes) -> str:
+    """Crockford base32 encode ``data``, one ``0`` per leading zero byte."""
+    number = int.from_bytes(data, "big")
+    digits = []
+    while number:
+        number, digit = divmod(number, 32)
+        digits.append(C32_ALPHABET[digit])
+    leading_zeros = len(data) - len(data.lstrip(b"\0"))
+    return "0" * leading_zeros + "".join(reversed(digits))
+
+
+def c32_decode(text: str) -> bytes:
+    """Inverse of ``c32_encode``."""
+    text = text.upper()
+    leading_zeros = len(text) - len(text.lstrip("0"))
+    number = 0
+    for char in text[leading_zeros:]:
+        index = _C32_INDEX.get(char)
+        if index is None:
+            raise ClarityDecodeError(f"Invalid c32 character: {char!r}")
+        number = number * 32 + index
+    body = number.to_bytes((number.bit_length() + 7) // 8, "big")
+    return b"\0" * leading_zeros + body
+
+
+def _c32_checksum(version: int, data: bytes) -> bytes:
+    inner = hashlib.sha256(bytes([version]) + data).digest()
+    return hashlib.sha256(inner).digest()[:4]
+
+
+def c32_address(version: int, hash160: bytes) -> str:
+    """Stacks address for an address version and hash160."""
+    if not 0 <= version < 32:
+        raise ClarityDecodeError(f"Invalid address version: {version}")
+    payload = hash160 + _c32_checksum(version, hash160)
+    return "S" + C32_ALPHABET[version] + c32_encode(payload)
+
+
+def c32_address_decode(address: str) -> Tuple[int, bytes]:
+    """Address version and hash160 of a Stacks address.
+
+    Raises:
+        ClarityDecodeError: If the address or its checksum is invalid
+    """
+    if len(address) < 3 or address[0] != "S":
+        raise ClarityDecodeError(f"Invalid Stacks address: {address}")
+    version = _C32_INDEX.get(address[1].upper())
+    if version is None:
+        raise ClarityDecodeError(f"Invalid Stacks address: {address}")
+    payload = c32_decode(address[2:])
+    hash160, checksum = payload[:-4], payload[-4:]
+    if len(hash160) != 20 or checksum != _c32_checksum(version, hash160):
+        raise ClarityDecodeError(f"Invalid Stacks address checksum: {address}")
+    return version, hash160
+
+
+def _to_bytes(data: Union[bytes, str]) -> bytes:
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return bytes(data)
+    if data.startswith(("0x", "0X")):
+        data = data[2:]
+    try:
+        return bytes.fromhex(data)
+    except ValueError as e:
+        raise ClarityDecodeError(f"Invalid hex: {e}") from e
+
+
+class _Reader:
+    """Reads one serialized value, as plain values or as ClarityValue."""
+
+    __slots__ = ("data", "pos", "plain")
+
+    def __init__(self, data: bytes, plain: bool) -> None:
+        self.data = data
+        self.pos = 0
+        self.plain = plain
+
+    def take(self, size: int) -> bytes:
+        end = self.pos + size
+        if end > len(self.data):
+            raise ClarityDecodeError(f"Truncated Clarity value at byte {self.pos}")
+        chunk = self.data[self.pos : end]
+        self.pos = end
+        return chunk
+
+    def length(self) -> int:
+        return int.from_bytes(self.take(4), "big")
+
+    def name(self) -> str:
+        raw = self.take(self.take(1)[0])
+        try:
+            return raw.decode("ascii")
+        except UnicodeDecodeError as e:
+            raise ClarityDecodeError(f"Invalid Clarity name: {raw!r}") from e
+
+    def text(self, encoding: str) -> str:
+        raw = self.take(self.length())
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError as e:
+            raise ClarityDecodeError(f"Invalid {encoding} string") from e
+
+    def value(self, depth: int = 0) -> Any:
+        if depth > MAX_DEPTH:
+            raise ClarityDecodeError("Clarity value nested too deeply")
+        type_id = self.take(1)[0]
+
+        if type_id == ClarityType.UINT:
+            value = int.from_bytes(self.take(16), "big")
+        elif type_id == ClarityType.INT:
+            value = int.from_bytes(self.take(16), "big", signed=True)
+        elif type_id == ClarityType.BUFFER:
+            raw = self.take(self.length())
+            value = "0x" + raw.hex() if self.plain else raw
+        elif type_id == ClarityType.BOOL_TRUE:
+            value = True
+        elif type_id == ClarityType.BOOL_FALSE:
+            value = False
+        elif type_id == ClarityType.PRINCIPAL_STANDARD:
+            value = c32_address(self.take(1)[0], self.take(20))
+        elif type_id == ClarityType.PRINCIPAL_CONTRACT:
+            address = c32_address(self.take(1)[0], self.take(20))
+            value = f"{address}.{self.name()}"
+        elif type_id in (
+            ClarityType.RESPONSE_OK,
+            ClarityType.RESPONSE_ERR,
+            ClarityType.OPTIONAL_SOME,
+        ):
+            value = self.value(depth + 1)
+            if self.plain:
+                return value
+        elif type_id == ClarityType.OPTIONAL_NONE:
+            value = None
+        elif type_id == ClarityType.LIST:
+            value = [self.value(depth + 1) for _ in range(self.length())]
+        elif type_id == ClarityType.TUPLE:
+            value = {}
+            for _ in range(self.length()):
+                key = self.name()
+                value[key] = self.value(depth + 1)
+        elif type_id == ClarityType.STRING_ASCII:
+            value = self.text("ascii")
+        elif type_id == ClarityType.STRING_UTF8:
+            value = self.text("utf-8")
+        else:
+            raise ClarityDecodeError(f"Unknown Clarity type prefix: 0x{type_id:02x}")
+
+        return value if self.plain else ClarityValue(ClarityType(type_id), value)
+
+
+def _read(data: Union[bytes, str], plain: bool) -> Any:
+    reader = _Reader(_to_bytes(data), plain)
+    value = reader.value()
+    if reader.pos != len(reader.data):
+        raise ClarityDecodeError(
+            f"{len(reader.data) - reader.pos} trailing bytes after Clarity value"
+        )
+    return value
+
+
+def decode_clarity_value(data: Union[bytes, str]) -> Any:
+    """Decode a serialized Clarity value (bytes or hex) to plain values.
+
+    Raises:
+        ClarityDecodeError: If the data is not exactly one Clarity value
+    """
+    return _read(data, plain=True)
+
+
+def deserialize(data: Union[bytes, str]) -> ClarityValue:
+    """Decode a serialized Clarity value (bytes or hex), keeping its types.
+
+    Raises:
+        ClarityDecodeError: If the data is not exactly one Clarity value
+    """
+    return _read(data, plain=False)
+
+
+def _write(clarity_value: ClarityValue, out: Callable[[bytes], Any]) -> None:
+    value_type = ClarityType(clarity_value.type)
+    value = clarity_value.value
+    out(bytes([value_type]))
+
+    if value_type == ClarityType.UINT:
+        out(value.to_bytes(16, "big"))
+    elif value_type == ClarityType.INT:
+        out(value.to_bytes(16, "big", signed=True))
+    elif value_type == ClarityType.BUFFER:
+        out(len(value).to_bytes(4, "big"))
+        out(bytes(value))
+    elif value_type == ClarityType.PRINCIPAL_STANDARD:
+        version, hash160 = c32_address_decode(value)
+        out(bytes([version]) + hash160)
+    elif value_type == ClarityType.PRINCIPAL_CONTRACT:
+        address, contract_name = value.split(".", 1)
+        version, hash160 = c32_address_decode(address)
+        name = contract_name.encode("ascii")
+        out(bytes([version]) + hash160 + bytes([len(name)]) + name)
+    elif value_type in (
+        ClarityType.RESPONSE_OK,
+        ClarityType.RESPONSE_ERR,
+        ClarityType.OPTIONAL_SOME,
+    ):
+        _write(value, out)
+    elif value_type == ClarityType.LIST:
+        out(len(value).to_bytes(4, "big"))
+        for item in value:
+            _write(item, out)
+    elif value_type == ClarityType.TUPLE:
+        # Tuple fields are serialized in name order
+        out(len(value).to_bytes(4, "big"))
+        for key in sorted(value):
+            name = key.encode("ascii")
+            out(bytes([len(name)]) + name)
+            _write(value[key], out)
+    elif value_type in (ClarityType.STRING_ASCII, ClarityType.STRING_UTF8):
+        raw = value.encode(
+            "ascii" if value_type == ClarityType.STRING_ASCII else "utf-8"
+        )
+        out(len(raw).to_bytes(4, "big"))
+        out(raw)
+
+
+def serialize(clarity_value: ClarityValue) -> bytes:
+    """Consensus serialization of a ClarityValue."""
+    parts = []
+    _write(clarity_value, parts.append)
+    return b"".join(parts)
@@ -0,0 +1,196 @@
+"""Per-DAO snapshots of past proposals for evaluation prompts.
+
+Every evaluation puts the DAO's past proposals into its prompt: the
+sender's own proposals, counts per status, the latest drafts and the latest
+deployed proposals. Building that context used to list every proposal of
+the DAO, then filter, sort and render it again for each evaluation, and
+ten agents evaluating the same proposal did it ten times.
+
+DAOContextStore keeps one immutable snapshot per DAO with the proposals
+sorted newest first. A snapshot hands out views (the proposals as one
+evaluation sees them: without the evaluated proposal, split by sender and
+status), and each view memoizes the prompt fragments rendered from it, so
+concurrent evaluations of the same proposal share them.
+
+Hooks where proposals are created or updated replace the DAO's snapshot
+with one including the change. Snapshots also expire after
+``ttl_seconds`` to pick up changes made elsewhere.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.backend.abstract import AbstractBackend
+from app.backend.factory import backend as default_backend
+from app.backend.models import ContractStatus, Proposal, ProposalFilter
+from app.config import config
+from app.lib.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+# Views kept per snapshot; one per proposal being evaluated
+MAX_VIEWS = 64
+
+ViewKey = Tuple[Optional[str], Optional[str]]
+
+
+def _newest_first(proposals: List[Proposal]) -> List[Proposal]:
+    return sorted(
+        proposals,
+        key=lambda p: getattr(p, "created_at", datetime.min),
+        reverse=True,
+    )
+
+
+@dataclass
+class DAOContextView:
+    """A DAO's proposals as one evaluation sees them, newest first."""
+
+    # The sender's own proposals, if the evaluated proposal has a sender
+    user_past: List[Proposal]
+    # Everyone else's proposals, or all of them if the sender has no others
+    dao_past: List[Proposal]
+    by_status: Dict[ContractStatus, List[Proposal]]
+    _fragments: Dict[str, str] = field(default_factory=dict, repr=False)
+
+    def status(self, status: ContractStatus) -> List[Proposal]:
+        return self.by_status.get(status, [])
+
+    def fragment(self, name: str, render: Callable[[], str]) -> str:
+        """Render a prompt fragment once per view."""
+        text = self._fragments.get(name)
+        if text is None:
+            text = self._fragments[name] = render()
+        return text
+
+
+class DAOContextSnapshot:
+    """Immutable list of a DAO's proposals, sorted newest first."""
+
+    def __init__(self, dao_id: UUID, proposals: List[Proposal]):
+        self.dao_id = dao_id
+        self.proposals: Tuple[Proposal, ...] = tuple(_newest_first(proposals))
+        self.loaded_at = time.monotonic()
+        self._views: "OrderedDict[ViewKey, DAOContextView]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.proposals)
+
+    def view(
+        self,
+        exclude_id: Optional[UUID | str] = None,
+        tx_sender: Optional[str] = None,
+    ) -> DAOContextView:
+        """The proposals without exclude_id, split by sender and status."""
+        key = (
+            str(exclude_id) if exclude_id is not None else None,
+            tx_sender or None,
+        )
+        with self._lock:
+            view = self._views.get(key)
+            if view is not None:
+                self._views.move_to_end(key)
+                return view
+
+        proposals = [p for p in self.proposals if str(p.id) != key[0]]
+        user_past = [p for p in proposals if tx_sender and p.tx_sender == tx_sender]
+        dao_past = [p for p in proposals if not user_past or p.tx_sender != tx_sender]
+        if not dao_past:
+            dao_past = proposals
+        by_status: Dict[ContractStatus, List[Proposal]] = {}
+        for proposal in dao_past:
+            by_status.setdefault(proposal.status, []).append(proposal)
+        view = DAOContextView(user_past, dao_past, by_status)
+
+        with self._lock:
+            view = self._views.setdefault(key, view)
+            while len(self._views) > MAX_VIEWS:
+                self._views.popitem(last=False)
+        return view
+
+    def replace(self, proposal: Proposal) -> "DAOContextSnapshot":
+        """A new snapshot with the proposal added or replaced."""
+        proposals = [p for p in self.proposals if p.id != proposal.id]
+        proposals.append(proposal)
+        snapshot = DAOContextSnapshot(self.dao_id, proposals)
+        snapshot.loaded_at = self.loaded_at
+        return snapshot
+
+
+class DAOContextStore:
+    """Process-wide DAO context snapshots, loaded on demand."""
+
+    def __init__(
+        self,
+        backend: Optional[AbstractBackend] = None,
+        ttl_seconds: Optional[float] = None,
+        max_daos: Optional[int] = None,
+    ):
+        self.backend = backend or default_backend
+        self.ttl_seconds = (
+            config.scheduler.dao_context_ttl_seconds
+            if ttl_seconds is None
+            else ttl_seconds
+        )
+        self.max_daos = (
+            config.scheduler.dao_context_max_daos if max_daos is None else max_daos
+        )
+        self._lock = threading.Lock()
+        self._snapshots: "OrderedDict[UUID, DAOContextSnapshot]" = OrderedDict()
+        self.loads = 0
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    # ----------- LOOKUPS -----------
+
+    def get(self, dao_id: UUID | str) -> DAOContextSnapshot:
+        """The DAO's current snapshot, loading it if missing or expired."""
+        dao_id = UUID(str(dao_id))
+        with self._lock:
+            snapshot = self._snapshots.get(dao_id)
+            if (
+                snapshot is not None
+                and time.monotonic() - snapshot.loaded_at < self.ttl_seconds
+            ):
+                self._snapshots.move_to_end(dao_id)
+                return snapshot
+
+        proposals = self.backend.list_proposals(ProposalFilter(dao_id=dao_id))
+        snapshot = DAOContextSnapshot(dao_id, proposals)
+        with self._lock:
+            self._snapshots[dao_id] = snapshot
+            self._snapshots.move_to_end(dao_id)
+            while len(self._snapshots) > self.max_daos:
+                self._snapshots.popitem(last=False)
+            self.loads += 1
+        logger.debug(f"Loaded DAO context for {dao_id}: {len(snapshot)} proposals")
+        return snapshot
+
+    # ----------- HOOKS -----------
+
+    def upsert(self, proposal: Optional[Proposal]) -> None:
+        """Record a proposal the app has just created or updated."""
+        if proposal is None or proposal.dao_id is None:
+            return
+        with self._lock:
+            snapshot = self._snapshots.get(proposal.dao_id)
+            if snapshot is not None:
+                self._snapshots[proposal.dao_id] = snapshot.replace(proposal)
+
+    def invalidate(self, dao_id: Optional[UUID | str] = None) -> None:
+        """Drop one DAO's snapshot, or all of them."""
+        with self._lock:
+            if dao_id is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(UUID(str(dao_id)), None)
+
+
+dao_context = DAOContextStore()
@@ -0,0 +1,195 @@
+"""Burn-height timeline of deployed proposals.
+
+DAOProposalBurnHeightHandler needs, for every burn block, the proposals whose
+voting opens (vote_start), voting closes and veto window opens (vote_end),
+and veto window closes and execution opens (exec_start) at that height.
+ProposalTimeline keeps one min-heap per boundary, keyed by height, so each
+block pops only the proposals whose boundary it crosses in O(k log n)
+instead of listing and scanning every deployed proposal.
+
+The timeline loads the DEPLOYED proposals on the first block, is kept in sync
+by hooks where chainhook handlers create or update proposals, and reloads
+every ``reload_seconds`` to pick up changes made elsewhere. Heap entries are
+never removed in place: an entry is checked against the proposal's current
+snapshot when popped and dropped if the boundary moved or the proposal is
+no longer deployed.
+"""
+
+import heapq
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.backend.abstract import AbstractBackend
+from app.backend.factory import backend as default_backend
+from app.backend.models import ContractStatus, Proposal, ProposalFilter
+from app.config import config
+from app.lib.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+VOTE_START = "vote_start"
+VOTE_END = "vote_end"
+EXEC_START = "exec_start"
+BOUNDARIES = (VOTE_START, VOTE_END, EXEC_START)
+
+HeapEntry = Tuple[int, UUID]
+
+
+@dataclass
+class TimelineCrossings:
+    """Proposals whose boundaries a burn block crossed, per boundary."""
+
+    from_height: int
+    to_height: int
+    vote_start: List[Proposal] = field(default_factory=list)
+    vote_end: List[Proposal] = field(default_factory=list)
+    exec_start: List[Proposal] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.vote_start or self.vote_end or self.exec_start)
+
+
+def is_tracked(proposal: Proposal) -> bool:
+    """Whether the timeline follows the proposal at all."""
+    return proposal.status == ContractStatus.DEPLOYED and proposal.content is not None
+
+
+class ProposalTimeline:
+    """Min-heaps of deployed proposals keyed by their boundary heights."""
+
+    def __init__(
+        self,
+        backend: Optional[AbstractBackend] = None,
+        reload_seconds: Optional[float] = None,
+    ):
+        self.backend = backend or default_backend
+        self.reload_seconds = (
+            config.scheduler.proposal_timeline_reload_seconds
+            if reload_seconds is None
+            else reload_seconds
+        )
+        self._lock = threading.Lock()
+        self._heaps: Dict[str, List[HeapEntry]] = {b: [] for b in BOUNDARIES}
+        self._proposals: Dict[UUID, Proposal] = {}
+        # Highest burn height advanced to; boundaries at or below it are done
+        self._height: Optional[int] = None
+        self._loaded_at: Optional[float] = None
+        self.loads = 0
+
+    @property
+    def height(self) -> Optional[int]:
+        return self._height
+
+    def __len__(self) -> int:
+        return len(self._proposals)
+
+    # ----------- HOOKS -----------
+
+    def upsert(self, proposal: Optional[Proposal]) -> None:
+        """Record a proposal the app has just created or updated."""
+        if proposal is None:
+            return
+        with self._lock:
+            self._track(proposal)
+
+    # ----------- BLOCKS -----------
+
+    def advance(self, burn_height: int) -> TimelineCrossings:
+        """Pop the proposals whose boundaries lie in (previous height, burn_height].
+
+        The first call loads the timeline and only returns boundaries at
+        burn_height itself. Heights at or below the previous one return
+        nothing. Raises if the timeline has never loaded.
+        """
+        with self._lock:
+            if self._height is None:
+                self._height = burn_height - 1
+            if (
+                self._loaded_at is None
+                or time.monotonic() - self._loaded_at >= self.reload_seconds
+            ):
+                try:
+                    self._reload()
+                except Exception as e:
+                    if self._loaded_at is None:
+                        raise
+                    logger.error(
+                        f"Failed to reload proposal timeline: {e}", exc_info=True
+                    )
+
+            crossings = TimelineCrossings(self._height, burn_height)
+            if burn_height <= self._height:
+                crossings.to_height = self._height
+                return crossings
+            for boundary in BOUNDARIES:
+                popped = getattr(crossings, boundary)
+                heap = self._heaps[boundary]
+                seen = set()
+                while heap and heap[0][0] <= burn_height:
+                    height, proposal_id = heapq.heappop(heap)
+                    proposal = self._proposals.get(proposal_id)
+                    if (
+                        proposal is not None
+                        and proposal_id not in seen
+                        and getattr(proposal, boundary) == height
+                    ):
+                        seen.add(proposal_id)
+                        popped.append(proposal)
+            self._height = burn_height
+            return crossings
+
+    def rewind(self, crossings: TimelineCrossings) -> None:
+        """Undo an advance whose crossings could not be processed.
+
+        Puts the popped proposals back so the same block can be retried.
+        """
+        with self._lock:
+            if self._height != crossings.to_height:
+                return
+            self._height = crossings.from_height
+            for boundary in BOUNDARIES:
+                for proposal in getattr(crossings, boundary):
+                    height = getattr(proposal, boundary)
+                    heapq.heappush(self._heaps[boundary], (height, proposal.id))
+
+    # ----------- INTERNALS -----------
+
+    def _track(self, proposal: Proposal) -> None:
+        """Store a proposal snapshot and push its upcoming boundaries."""
+        upcoming = {
+            boundary: getattr(proposal, boundary)
+            for boundary in BOUNDARIES
+            if getattr(proposal, boundary) is not None
+            and (self._height is None or getattr(proposal, boundary) > self._height)
+        }
+        if not is_tracked(proposal) or not upcoming:
+            self._proposals.pop(proposal.id, None)
+            return
+        previous = self._proposals.get(proposal.id)
+        self._proposals[proposal.id] = proposal
+        for boundary, height in upcoming.items():
+            if previous is not None and getattr(previous, boundary) == height:
+                continue  # already queued at this height
+            heapq.heappush(self._heaps[boundary], (height, proposal.id))
+
+    def _reload(self) -> None:
+        """Rebuild the heaps from the deployed proposals in the database."""
+        proposals = self.backend.list_proposals(
+            filters=ProposalFilter(status=ContractStatus.DEPLOYED)
+        )
+        self._heaps = {b: [] for b in BOUNDARIES}
+        self._proposals = {}
+        for proposal in proposals:
+            self._track(proposal)
+        self._loaded_at = time.monotonic()
+        self.loads += 1
+        logger.info(
+            f"Loaded proposal timeline: {len(self._proposals)} proposals with "
+            f"boundaries after burn height {self._height}"
+        )
+
+
+proposal_timeline = ProposalTimeline()
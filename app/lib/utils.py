@@ -4,11 +4,11 @@ import binascii
 import httpx
 import json
 import re
-import struct
 from typing import Any, Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field, ValidationError
 
 
+from app.lib.clarity import ClarityDecodeError, decode_clarity_value
 from app.lib.logger import configure_logger
 
 logger = configure_logger(__name__)
@@ -423,19 +423,13 @@ def decode_hex_parameters(hex_string: Optional[str]) -> Optional[str]:
     try:
         decoded_bytes = binascii.unhexlify(hex_string)
 
-        # Check for Clarity string types
-        if len(decoded_bytes) > 5:
-            type_tag = decoded_bytes[0]
-
-            if type_tag == 0x0D or type_tag == 0x0E:  # ASCII or UTF-8 string
-                # Read length from bytes 1-4 (big-endian)
-                length = struct.unpack(">I", decoded_bytes[1:5])[0]
-
-                # Extract content starting from byte 5
-                if len(decoded_bytes) >= 5 + length:
-                    content = decoded_bytes[5 : 5 + length]
-                    encoding = "ascii" if type_tag == 0x0D else "utf-8"
-                    return content.decode(encoding, errors="ignore")
+        # Clarity string-ascii or string-utf8 value
+        try:
+            decoded = decode_clarity_value(decoded_bytes)
+            if isinstance(decoded, str):
+                return decoded
+        except ClarityDecodeError:
+            pass
 
         # Fallback for non-Clarity format
         return decoded_bytes.decode("utf-8", errors="ignore")
@@ -821,17 +815,25 @@ async def validate_wallet_recipients(recipients: List[str]) -> Dict[str, bool]:
     from app.config import config
     from app.backend.factory import backend
     from app.backend.models import WalletFilterN
+    from app.lib.address_index import WALLET, address_index
 
     # Determine which network to check based on config
     use_mainnet = config.network.network == "mainnet"
 
-    # Query wallets table for all recipients at once, filtering by the appropriate network
-    if use_mainnet:
-        wallet_filter = WalletFilterN(mainnet_addresses=recipients)
-    else:
-        wallet_filter = WalletFilterN(testnet_addresses=recipients)
+    # Only recipients the owned-address index knows need a database lookup
+    candidates = address_index.filter_owned(WALLET, recipients)
 
-    wallets = backend.list_wallets_n(filters=wallet_filter)
+    # Query wallets table for all candidates at once, filtering by the appropriate network
+    if not candidates:
+        wallets = []
+    elif use_mainnet:
+        wallets = backend.list_wallets_n(
+            filters=WalletFilterN(mainnet_addresses=candidates)
+        )
+    else:
+        wallets = backend.list_wallets_n(
+            filters=WalletFilterN(testnet_addresses=candidates)
+        )
 
     # Create set of valid addresses for efficient lookup
     if use_mainnet:
@@ -6,6 +6,8 @@ from langchain_openai import OpenAIEmbeddings
 
 from app.config import config
 from app.lib.logger import configure_logger
+from app.services.ai.embeddings.embedding_cache import EmbeddingCache, embedding_cache
+from app.services.ai.llm_transport import llm_transport
 
 logger = configure_logger(__name__)
 
@@ -13,19 +15,31 @@ logger = configure_logger(__name__)
 class EmbedService:
     """Service for generating text embeddings using OpenAI."""
 
-    def __init__(self, model_name: Optional[str] = None):
+    def __init__(
+        self, model_name: Optional[str] = None, cache: Optional[EmbeddingCache] = None
+    ):
         """Initialize the embedding service.
 
         Args:
             model_name: The OpenAI embedding model to use. If None, uses configured default.
+            cache: Embedding cache to use. If None, uses the shared process cache.
         """
         self.model_name = model_name or config.embedding.default_model
+        self.cache = embedding_cache if cache is None else cache
         self._embeddings_client: Optional[OpenAIEmbeddings] = None
 
     @property
     def embeddings_client(self) -> OpenAIEmbeddings:
-        """Get or create the OpenAI embeddings client."""
-        if self._embeddings_client is None:
+        """Get or create the OpenAI embeddings client.
+
+        Inside an event loop the client sends through the shared LLM transport
+        (which does the retrying); it is rebuilt if used from another loop.
+        """
+        http_async_client = llm_transport.client_if_running()
+        if (
+            self._embeddings_client is None
+            or self._embeddings_client.http_async_client is not http_async_client
+        ):
             if not config.embedding.api_key:
                 raise ValueError("Embedding API key not configured")
 
@@ -38,6 +52,10 @@ class EmbedService:
             if config.embedding.api_base:
                 embedding_config["base_url"] = config.embedding.api_base
 
+            if http_async_client is not None:
+                embedding_config["http_async_client"] = http_async_client
+                embedding_config["max_retries"] = 0
+
             self._embeddings_client = OpenAIEmbeddings(**embedding_config)
         return self._embeddings_client
 
@@ -56,7 +74,7 @@ class EmbedService:
 
         try:
             logger.debug(f"Generating embedding for text (length: {len(text)})")
-            embedding = await self.embeddings_client.aembed_query(text)
+            embedding = (await self._embed([text]))[0]
             logger.debug(f"Generated embedding with dimension: {len(embedding)}")
             return embedding
         except Exception as e:
@@ -84,13 +102,19 @@ class EmbedService:
 
         try:
             logger.debug(f"Generating embeddings for {len(valid_texts)} texts")
-            embeddings = await self.embeddings_client.aembed_documents(valid_texts)
+            embeddings = await self._embed(valid_texts)
             logger.debug(f"Generated {len(embeddings)} embeddings")
             return embeddings
         except Exception as e:
             logger.error(f"Failed to generate embeddings: {str(e)}", exc_info=True)
             return None
 
+    async def _embed(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts through the cache; only uncached texts reach the provider."""
+        return await self.cache.aembed(
+            self.model_name, texts, self.embeddings_client.aembed_documents
+        )
+
     def is_available(self) -> bool:
         """Check if the embedding service is available.
 
@@ -110,7 +134,8 @@ class EmbedService:
             True if the service is working correctly
         """
         try:
-            test_embedding = await self.embed_text("test")
+            # Bypasses the cache so the provider is actually called
+            test_embedding = await self.embeddings_client.aembed_query("test")
             return test_embedding is not None and len(test_embedding) > 0
         except Exception as e:
             logger.error(f"Embedding service test failed: {str(e)}")
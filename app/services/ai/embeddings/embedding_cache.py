@@ -0,0 +1,261 @@
+"""Content-addressed cache of text embeddings.
+
+Embeddings are keyed by ``(model, sha256(normalized text))``, so the same
+proposal text is embedded once no matter whether it comes from the embedder
+task, an evaluation's vector store query or another agent evaluating the same
+proposal. The cache has two tiers:
+
+- an in-memory LRU of ``maxsize`` entries, shared by the whole process;
+- an optional directory of JSON files (one per embedding, written
+  atomically), so embeddings survive restarts and can be shared by processes
+  on the same host.
+
+``aembed`` takes a batch of texts, serves what it can from the cache and
+sends only the distinct uncached texts to the provider in one call. Texts
+already being embedded by another caller are awaited instead of requested
+again.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import unicodedata
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from app.config import config
+from app.lib.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+Embedding = List[float]
+EmbedFn = Callable[[List[str]], Awaitable[List[Embedding]]]
+
+
+def normalize_text(text: str) -> str:
+    """Unicode-normalize text and collapse whitespace runs."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def cache_key(model: str, text: str) -> str:
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"{model}:{digest}"
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Counters for the embedding cache."""
+
+    hits: int = 0
+    misses: int = 0
+    disk_hits: int = 0
+    disk_writes: int = 0
+    shared: int = 0  # misses served by another caller's in-flight request
+    provider_calls: int = 0
+    provider_texts: int = 0
+
+
+class EmbeddingCache:
+    """Two-tier embedding cache keyed by model and normalized text."""
+
+    def __init__(
+        self, maxsize: Optional[int] = None, directory: Optional[str] = None
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Entries kept in memory; 0 disables the in-memory tier
+            directory: Directory for the on-disk tier; None disables it
+        """
+        self.maxsize = config.embedding.cache_size if maxsize is None else maxsize
+        self.directory = directory
+        self.stats = EmbeddingCacheStats()
+        self._entries: "OrderedDict[str, Embedding]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ----------- MEMORY -----------
+
+    def get(self, model: str, text: str) -> Optional[Embedding]:
+        """Look an embedding up in memory; None on a miss."""
+        return self._get(cache_key(model, text))
+
+    def set(self, model: str, text: str, embedding: Embedding) -> None:
+        self._set(cache_key(model, text), embedding)
+
+    def _get(self, key: str) -> Optional[Embedding]:
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+            return embedding
+
+    def _set(self, key: str, embedding: Embedding) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Empty the in-memory tier; the on-disk tier is kept."""
+        with self._lock:
+            self._entries.clear()
+
+    # ----------- DISK -----------
+
+    def _path(self, key: str) -> str:
+        model, digest = key.rsplit(":", 1)
+        model_dir = hashlib.sha256(model.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.directory, model_dir, digest[:2], f"{digest}.json")
+
+    def _load(self, keys: List[str]) -> Dict[str, Embedding]:
+        """Read embeddings from disk. Blocking."""
+        found: Dict[str, Embedding] = {}
+        for key in keys:
+            path = self._path(key)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    found[key] = json.load(f)
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable embedding cache file {path}: {e}")
+        return found
+
+    def _store(self, entries: Dict[str, Embedding]) -> None:
+        """Write embeddings to disk atomically. Blocking."""
+        for key, embedding in entries.items():
+            path = self._path(key)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=os.path.dirname(path), suffix=".tmp"
+                )
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(embedding, f, separators=(",", ":"))
+                    os.replace(tmp_path, path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning(f"Could not write embedding cache file {path}: {e}")
+                continue
+            self.stats.disk_writes += 1
+
+    # ----------- BATCHES -----------
+
+    async def aembed(
+        self, model: str, texts: List[str], embed: EmbedFn
+    ) -> List[Embedding]:
+        """Embed texts, sending only the distinct uncached ones to ``embed``.
+
+        Args:
+            model: Embedding model name (part of the cache key)
+            texts: Texts to embed
+            embed: Provider call embedding a list of texts, in order
+
+        Returns:
+            One embedding per input text, in order. Raises what ``embed``
+            raises; nothing is cached for a failed batch.
+        """
+        keys = [cache_key(model, text) for text in texts]
+        results: Dict[str, Embedding] = {}
+        missing: Dict[str, str] = {}  # key -> first text with that key
+        for key, text in zip(keys, texts):
+            if key in results or key in missing:
+                continue
+            embedding = self._get(key)
+            if embedding is not None:
+                results[key] = embedding
+                self.stats.hits += 1
+            else:
+                missing[key] = text
+
+        if missing and self.directory:
+            loaded = await asyncio.to_thread(self._load, list(missing))
+            for key, embedding in loaded.items():
+                self._set(key, embedding)
+                results[key] = embedding
+                del missing[key]
+            self.stats.disk_hits += len(loaded)
+
+        if missing:
+            results.update(await self._embed_missing(missing, embed))
+
+        return [results[key] for key in keys]
+
+    async def _embed_missing(
+        self, missing: Dict[str, str], embed: EmbedFn
+    ) -> Dict[str, Embedding]:
+        """Embed the missing texts, sharing requests already in flight."""
+        loop = asyncio.get_running_loop()
+        waiting: Dict[str, asyncio.Future] = {}
+        owned: Dict[str, asyncio.Future] = {}
+        for key in missing:
+            future = self._inflight.get(key)
+            if future is not None and future.get_loop() is loop:
+                waiting[key] = future
+            else:
+                owned[key] = self._inflight[key] = loop.create_future()
+        self.stats.misses += len(owned)
+        self.stats.shared += len(waiting)
+
+        results: Dict[str, Embedding] = {}
+        try:
+            if owned:
+                batch = [missing[key] for key in owned]
+                self.stats.provider_calls += 1
+                self.stats.provider_texts += len(batch)
+                embeddings = await embed(batch)
+                if len(embeddings) != len(batch):
+                    raise ValueError(
+                        f"Embedding provider returned {len(embeddings)} "
+                        f"embeddings for {len(batch)} texts"
+                    )
+                for key, embedding in zip(owned, embeddings):
+                    self._set(key, embedding)
+                    results[key] = embedding
+                    owned[key].set_result(embedding)
+                if self.directory:
+                    await asyncio.to_thread(self._store, dict(zip(owned, embeddings)))
+        except BaseException as e:
+            for future in owned.values():
+                if future.done():
+                    continue
+                if isinstance(e, Exception):
+                    future.set_exception(e)
+                    future.exception()  # raised here; waiters may never look
+                else:
+                    future.cancel()  # waiters embed the text themselves
+            raise
+        finally:
+            for key, future in owned.items():
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+        for key, future in waiting.items():
+            try:
+                results[key] = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                results.update(await self._embed_missing({key: missing[key]}, embed))
+        return results
+
+    def get_stats(self) -> Dict[str, int]:
+        """Counters and current in-memory size."""
+        return {**asdict(self.stats), "size": len(self)}
+
+
+embedding_cache = EmbeddingCache(directory=config.embedding.cache_dir or None)
@@ -0,0 +1,346 @@
+"""Shared HTTP transport for LLM API calls.
+
+Every chat, evaluation and embedding request goes through one pooled
+``httpx.AsyncClient`` per event loop, so concurrent evaluations reuse
+keep-alive (and, where available, HTTP/2) connections instead of opening a new
+TCP/TLS session per call. The transport underneath the client:
+
+- limits in-flight requests per model (``AIBTC_LLM_MAX_CONCURRENCY_PER_MODEL``
+  with per-model overrides in ``AIBTC_LLM_MODEL_CONCURRENCY``),
+- retries 429/5xx responses and connection errors with jittered exponential
+  backoff, honouring ``Retry-After``, and
+- records per-model request counts, latency and token usage.
+
+Callers that go through the OpenAI SDK (``ChatOpenAI``, ``OpenAIEmbeddings``)
+pass ``llm_transport.client()`` as their ``http_async_client`` and should turn
+their own retries off.
+"""
+
+import asyncio
+import importlib.util
+import json
+import random
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+import httpx
+
+from app.config import config
+from app.lib.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+UNKNOWN_MODEL = "unknown"
+
+
+@dataclass
+class ModelMetrics:
+    """Counters for one model."""
+
+    requests: int = 0
+    failures: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    in_flight: int = 0
+    waiting: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        completed = self.requests - self.in_flight
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "avg_latency": self.total_latency / completed if completed else 0.0,
+            "max_latency": self.max_latency,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+        }
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body that runs a callback once it has been closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close: Optional[Callable[[], None]] = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            on_close, self._on_close = self._on_close, None
+            if on_close is not None:
+                on_close()
+
+
+class _LLMHTTPTransport(httpx.AsyncBaseTransport):
+    """Connection pool with per-model concurrency limits, retries and metrics."""
+
+    def __init__(self, owner: "LLMTransport", transport: httpx.AsyncBaseTransport):
+        self._owner = owner
+        self._transport = transport
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        model = _request_model(request)
+        metrics = self._owner.metrics_for(model)
+        semaphore = self._semaphores.get(model)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._owner.concurrency_limit(model))
+            self._semaphores[model] = semaphore
+
+        metrics.waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            metrics.waiting -= 1
+        metrics.requests += 1
+        metrics.in_flight += 1
+        started = time.monotonic()
+        released = False
+
+        def release(failed: bool = False) -> None:
+            nonlocal released
+            if released:
+                return
+            released = True
+            semaphore.release()
+            latency = time.monotonic() - started
+            metrics.in_flight -= 1
+            metrics.total_latency += latency
+            metrics.max_latency = max(metrics.max_latency, latency)
+            if failed:
+                metrics.failures += 1
+
+        try:
+            response = await self._send_with_retries(request, model, metrics)
+        except BaseException:
+            release(failed=True)
+            raise
+        if response.status_code >= 400:
+            metrics.failures += 1
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, release),
+            extensions=response.extensions,
+            request=request,
+        )
+
+    async def _send_with_retries(
+        self, request: httpx.Request, model: str, metrics: ModelMetrics
+    ) -> httpx.Response:
+        settings = config.llm_transport
+        attempt = 0
+        while True:
+            try:
+                response = await self._transport.handle_async_request(request)
+            except (
+                httpx.ConnectError,
+                httpx.ReadError,
+                httpx.RemoteProtocolError,
+            ) as e:
+                if attempt >= settings.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(
+                    f"LLM request to {request.url.path} failed ({type(e).__name__}), "
+                    f"retrying in {delay:.1f}s",
+                    extra={"model": model, "attempt": attempt + 1},
+                )
+            else:
+                if response.status_code == 429:
+                    metrics.rate_limited += 1
+                if (
+                    response.status_code not in RETRY_STATUS_CODES
+                    or attempt >= settings.max_retries
+                ):
+                    return response
+                delay = self._backoff(attempt, response.headers.get("retry-after"))
+                await response.aclose()
+                logger.warning(
+                    f"LLM request to {request.url.path} returned "
+                    f"{response.status_code}, retrying in {delay:.1f}s",
+                    extra={"model": model, "attempt": attempt + 1},
+                )
+            attempt += 1
+            metrics.retries += 1
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _backoff(attempt: int, retry_after: Optional[str] = None) -> float:
+        settings = config.llm_transport
+        ceiling = min(
+            settings.backoff_max_seconds, settings.backoff_base_seconds * 2**attempt
+        )
+        delay = random.uniform(ceiling / 2, ceiling)
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                pass
+        return min(delay, settings.backoff_max_seconds)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _request_model(request: httpx.Request) -> str:
+    if request.method != "POST" or not request.content:
+        return UNKNOWN_MODEL
+    try:
+        model = json.loads(request.content).get("model")
+    except (ValueError, AttributeError):
+        return UNKNOWN_MODEL
+    return model if isinstance(model, str) and model else UNKNOWN_MODEL
+
+
+class LLMTransport:
+    """Process-wide pooled client and metrics for LLM calls."""
+
+    def __init__(self):
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+        self._metrics: Dict[str, ModelMetrics] = {}
+        self._concurrency_overrides = self._parse_overrides(
+            config.llm_transport.model_concurrency
+        )
+
+    def client(self) -> httpx.AsyncClient:
+        """Pooled client for the running event loop.
+
+        Connections belong to the loop that opened them, so each loop gets its
+        own client; within the server process that means exactly one.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = self._create_client()
+            self._clients[loop] = client
+        return client
+
+    def client_if_running(self) -> Optional[httpx.AsyncClient]:
+        """Like ``client()``, but ``None`` when called outside an event loop."""
+        try:
+            return self.client()
+        except RuntimeError:
+            return None
+
+    async def post_json(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """POST a JSON payload and return the decoded response.
+
+        Records the ``usage`` block of the response against the payload's model.
+        Raises ``httpx.HTTPStatusError`` once retries are exhausted.
+        """
+        response = await self.client().post(
+            url,
+            json=payload,
+            headers=headers,
+            timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+        )
+        if response.status_code == 429:
+            logger.warning(
+                "LLM rate limit exceeded",
+                extra={
+                    "status_code": response.status_code,
+                    "response_text": response.text,
+                },
+            )
+        response.raise_for_status()
+        data = response.json()
+        if isinstance(data, dict):
+            self.record_usage(payload.get("model"), data.get("usage"))
+        return data
+
+    def record_usage(
+        self, model: Optional[str], usage: Optional[Dict[str, Any]]
+    ) -> None:
+        """Add token counts from an OpenAI-style ``usage`` block."""
+        if not usage:
+            return
+        metrics = self.metrics_for(model or UNKNOWN_MODEL)
+        metrics.prompt_tokens += int(
+            usage.get("prompt_tokens") or usage.get("input_tokens") or 0
+        )
+        metrics.completion_tokens += int(
+            usage.get("completion_tokens") or usage.get("output_tokens") or 0
+        )
+
+    def metrics_for(self, model: str) -> ModelMetrics:
+        metrics = self._metrics.get(model)
+        if metrics is None:
+            metrics = self._metrics[model] = ModelMetrics()
+        return metrics
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-model request, latency and token counters."""
+        return {model: m.as_dict() for model, m in self._metrics.items()}
+
+    def reset_metrics(self) -> None:
+        self._metrics.clear()
+
+    def concurrency_limit(self, model: str) -> int:
+        limit = self._concurrency_overrides.get(
+            model, config.llm_transport.max_concurrency_per_model
+        )
+        return max(1, limit)
+
+    async def aclose(self) -> None:
+        """Close the client for the running loop."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def _create_client(self) -> httpx.AsyncClient:
+        settings = config.llm_transport
+        http2 = settings.http2 and importlib.util.find_spec("h2") is not None
+        if settings.http2 and not http2:
+            logger.info("h2 is not installed; LLM transport will use HTTP/1.1")
+        pool = httpx.AsyncHTTPTransport(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive,
+            ),
+        )
+        return httpx.AsyncClient(
+            transport=_LLMHTTPTransport(self, pool),
+            timeout=settings.timeout_seconds,
+        )
+
+    @staticmethod
+    def _parse_overrides(value: str) -> Dict[str, int]:
+        overrides: Dict[str, int] = {}
+        for item in value.split(","):
+            model, _, limit = item.strip().rpartition("=")
+            if not model:
+                continue
+            try:
+                overrides[model] = int(limit)
+            except ValueError:
+                logger.warning(f"Ignoring invalid LLM concurrency override: {item}")
+        return overrides
+
+
+# Global transport instance
+llm_transport = LLMTransport()
@@ -14,9 +14,11 @@ from langchain_core.prompts.chat import ChatPromptTemplate
 from langchain_openai import OpenAIEmbeddings
 
 from app.backend.factory import backend
-from app.backend.models import Proposal, ProposalFilter
+from app.backend.models import Proposal
 from app.config import config
+from app.lib.dao_context import dao_context
 from app.lib.logger import configure_logger
+from app.services.ai.embeddings.embedding_cache import embedding_cache
 from app.services.ai.simple_workflows.llm import invoke_structured
 from app.services.ai.simple_workflows.models import (
     ComprehensiveEvaluatorAgentProcessOutput,
@@ -67,25 +69,21 @@ def create_embedding_model() -> OpenAIEmbeddings:
 async def fetch_dao_proposals(
     dao_id: UUID, exclude_proposal_id: Optional[str] = None
 ) -> List[Proposal]:
-    """Fetch all proposals for a specific DAO from database, excluding the current proposal.
+    """Fetch all proposals for a specific DAO, excluding the current proposal.
+
+    Reads the DAO's shared context snapshot rather than the database.
 
     Args:
         dao_id: The UUID of the DAO
         exclude_proposal_id: Optional proposal ID to exclude from results
 
     Returns:
-        List of Proposal objects (excluding the current proposal if specified)
+        List of Proposal objects, newest first (excluding the current proposal if specified)
     """
     try:
-        # Create filter to get all proposals for this DAO
-        filters = ProposalFilter(dao_id=dao_id)
-
-        # Fetch proposals
-        proposals = backend.list_proposals(filters)
-
-        # Filter out the current proposal if specified
+        view = dao_context.get(dao_id).view(exclude_id=exclude_proposal_id)
+        proposals = list(view.dao_past)
         if exclude_proposal_id:
-            proposals = [p for p in proposals if str(p.id) != exclude_proposal_id]
             logger.debug(
                 f"Excluded current proposal {exclude_proposal_id} from historical context"
             )
@@ -352,20 +350,26 @@ async def retrieve_from_vector_store(
         query: The query to search for
         collection_name: Name of the vector collection
         limit: Number of documents to retrieve
-        embeddings: Optional embeddings model
+        embeddings: Optional embeddings model; without one the query is
+            embedded through the shared embedding cache
 
     Returns:
         List of retrieved documents
     """
     try:
+        query_embedding = None
         if embeddings is None:
             embeddings = create_embedding_model()
+            (query_embedding,) = await embedding_cache.aembed(
+                embeddings.model, [query], embeddings.aembed_documents
+            )
 
         vector_results = await backend.query_vectors(
             collection_name=collection_name,
             query_text=query,
             limit=limit,
             embeddings=embeddings,
+            query_embedding=query_embedding,
         )
 
         documents = [
@@ -654,15 +658,16 @@ Governance Participation: Moderate
 Recent Community Sentiment: Positive
 """
 
-    # Retrieve all proposals for this DAO from database (excluding current proposal)
-    dao_proposals = []
+    # Retrieve all proposals for this DAO (excluding current proposal)
     past_proposals_db_text = ""
     try:
         if dao_id:
-            dao_proposals = await fetch_dao_proposals(
-                dao_id, exclude_proposal_id=proposal_id_str
+            # Rendered once per proposal and shared with concurrent evaluations
+            view = dao_context.get(dao_id).view(exclude_id=proposal_id_str)
+            past_proposals_db_text = view.fragment(
+                "past_proposals_v2",
+                lambda: format_proposals_for_context_v2(view.dao_past),
             )
-            past_proposals_db_text = format_proposals_for_context_v2(dao_proposals)
     except Exception as e:
         logger.error(
             f"[EvaluationProcessor:{proposal_id_str}] Error fetching/formatting DAO proposals: {str(e)}"
@@ -0,0 +1,147 @@
+"""Single-flight coalescing of proposal evaluation calls.
+
+When a proposal is put to a vote, one dao_proposal_evaluation message is
+queued per lottery-selected wallet, and each used to make its own LLM call
+with the same model, prompt and inputs. EvaluationFlights keys each call by
+the proposal and a hash of the exact request (model, temperature,
+reasoning and the rendered messages, so a prompt change or new context is
+a new key) and:
+
+- shares one in-flight call between concurrent evaluations with that key;
+- keeps successful results for ``ttl_seconds``, so evaluations processed
+  in later batches reuse them.
+
+Failed calls (None or an exception) are not kept; callers that were
+waiting on one make their own call, as they would have without coalescing.
+Votes are still recorded per wallet by the caller.
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+from app.config import config
+from app.lib.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+T = TypeVar("T")
+
+
+def evaluation_key(proposal_id: Any, **request: Any) -> str:
+    """Key for an evaluation request: the proposal and a hash of the request."""
+    payload = json.dumps(request, sort_keys=True, default=str)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"{proposal_id}:{digest}"
+
+
+@dataclass
+class EvaluationFlightStats:
+    """Counters for coalesced evaluation calls."""
+
+    calls: int = 0  # calls actually made
+    hits: int = 0  # served from a kept result
+    shared: int = 0  # served by another caller's in-flight call
+    fallbacks: int = 0  # shared call failed; the waiter made its own
+
+
+class EvaluationFlights(Generic[T]):
+    """In-flight sharing and a TTL cache of evaluation results."""
+
+    def __init__(
+        self, ttl_seconds: Optional[float] = None, maxsize: Optional[int] = None
+    ):
+        self.ttl_seconds = (
+            config.chat_llm.evaluation_cache_ttl_seconds
+            if ttl_seconds is None
+            else ttl_seconds
+        )
+        self.maxsize = (
+            config.chat_llm.evaluation_cache_size if maxsize is None else maxsize
+        )
+        self.stats = EvaluationFlightStats()
+        self._results: "OrderedDict[str, Tuple[float, T]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    async def run(
+        self, key: str, call: Callable[[], Awaitable[Optional[T]]]
+    ) -> Optional[T]:
+        """Return the result for key, making ``call`` only if nobody else is."""
+        result = self._get(key)
+        if result is not None:
+            self.stats.hits += 1
+            logger.debug(f"Reusing evaluation result for {key}")
+            return result
+
+        loop = asyncio.get_running_loop()
+        future = self._inflight.get(key)
+        if future is not None and future.get_loop() is loop:
+            self.stats.shared += 1
+            result = await asyncio.shield(future)
+            if result is not None:
+                return result
+            # The shared call failed: make our own, in parallel with the
+            # other waiters rather than queueing behind a new owner
+            self.stats.fallbacks += 1
+            return await self._call(key, call)
+
+        future = self._inflight[key] = loop.create_future()
+        result = None
+        try:
+            result = await self._call(key, call)
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            # None on failure: waiters make their own call
+            future.set_result(result)
+        return result
+
+    async def _call(
+        self, key: str, call: Callable[[], Awaitable[Optional[T]]]
+    ) -> Optional[T]:
+        self.stats.calls += 1
+        result = await call()
+        if result is not None:
+            self._set(key, result)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Counters and the number of kept results."""
+        return {**asdict(self.stats), "size": len(self)}
+
+    def _get(self, key: str) -> Optional[T]:
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at <= time.monotonic():
+                del self._results[key]
+                return None
+            self._results.move_to_end(key)
+            return result
+
+    def _set(self, key: str, result: T) -> None:
+        if self.ttl_seconds <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._results[key] = (time.monotonic() + self.ttl_seconds, result)
+            self._results.move_to_end(key)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+
+evaluation_flights: EvaluationFlights = EvaluationFlights()
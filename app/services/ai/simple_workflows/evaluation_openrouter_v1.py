@@ -4,7 +4,6 @@ This module provides a functional approach to proposal evaluation using OpenRout
 with direct HTTP calls and the standard comprehensive evaluation output model.
 """
 
-import httpx
 import json
 import os
 from datetime import datetime
@@ -18,6 +17,7 @@ from app.backend.factory import backend
 from app.backend.models import Proposal, ProposalFilter
 from app.config import config
 from app.lib.logger import configure_logger
+from app.services.ai.llm_transport import llm_transport
 from app.services.ai.simple_workflows.processors.twitter import (
     fetch_tweet,
     format_tweet,
@@ -244,14 +244,12 @@ async def call_openrouter(
 
     logger.debug(f"Making OpenRouter API call to model: {model_name}")
 
-    async with httpx.AsyncClient(timeout=300.0) as client:
-        response = await client.post(
-            f"{openrouter_config['base_url']}/chat/completions",
-            headers=headers,
-            json=payload,
-        )
-        response.raise_for_status()
-        return response.json()
+    return await llm_transport.post_json(
+        f"{openrouter_config['base_url']}/chat/completions",
+        payload,
+        headers=headers,
+        timeout=300.0,
+    )
 
 
 async def fetch_dao_proposals(dao_id: UUID, exclude_proposal_id: str) -> List[Proposal]:
@@ -1,6 +1,5 @@
 """Proposal evaluation with OpenRouter and Grok prompts."""
 
-import httpx
 import json
 
 from datetime import datetime
@@ -10,9 +9,15 @@ from uuid import UUID
 from urllib.parse import urlparse
 
 from app.backend.factory import backend
-from app.backend.models import ContractStatus, ProposalFilter, Proposal
+from app.backend.models import ContractStatus, Proposal
 from app.config import config
+from app.lib.dao_context import dao_context
 from app.lib.logger import configure_logger
+from app.services.ai.llm_transport import llm_transport
+from app.services.ai.simple_workflows.evaluation_flights import (
+    evaluation_flights,
+    evaluation_key,
+)
 from app.services.ai.simple_workflows.prompts.evaluation_grok import (
     EVALUATION_GROK_SYSTEM_PROMPT,
     EVALUATION_GROK_USER_PROMPT_TEMPLATE,
@@ -114,6 +119,14 @@ class EvaluationOutput(BaseModel):
     usage_est_cost: Optional[str]
 
 
+# Usage on outputs that did not make their own call
+SHARED_USAGE = {
+    "usage_input_tokens": "0",
+    "usage_output_tokens": "0",
+    "usage_est_cost": "0",
+}
+
+
 ###############################
 # OpenRouter Helpers         ##
 ###############################
@@ -182,20 +195,9 @@ async def call_openrouter(
         },
     )
 
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        response = await client.post(
-            f"{config_data['base_url']}/chat/completions", json=payload, headers=headers
-        )
-        if response.status_code == 429:
-            logger.warning(
-                "OpenRouter rate limit exceeded",
-                extra={
-                    "status_code": response.status_code,
-                    "response_text": response.text,
-                },
-            )
-        response.raise_for_status()
-        return response.json()
+    return await llm_transport.post_json(
+        f"{config_data['base_url']}/chat/completions", payload, headers=headers
+    )
 
 
 ###############################
@@ -420,67 +422,42 @@ def _fetch_and_format_linked_tweet_info(
 def _fetch_past_proposals_context(
     proposal: Proposal,
 ) -> tuple[Optional[str], Dict[str, int], Optional[str], Optional[str]]:
-    """Fetch and format past proposals for evaluation context."""
-    dao_proposals = backend.list_proposals(ProposalFilter(dao_id=proposal.dao_id))
-    dao_proposals = [p for p in dao_proposals if p.id != proposal.id]
+    """Fetch and format past proposals for evaluation context.
+
+    Reads the DAO's shared context snapshot; evaluations of the same
+    proposal share the view and its rendered fragments.
+    """
+    view = dao_context.get(proposal.dao_id).view(
+        exclude_id=proposal.id, tx_sender=proposal.tx_sender
+    )
 
     # User past proposals
-    user_past_proposals = []
     user_past_proposals_for_evaluation = None
     if proposal.tx_sender:
-        user_past_proposals = [
-            p for p in dao_proposals if p.tx_sender == proposal.tx_sender
-        ]
-        user_past_proposals_for_evaluation = _format_proposals_for_context(
-            user_past_proposals
+        user_past_proposals_for_evaluation = view.fragment(
+            "user_past", lambda: _format_proposals_for_context(view.user_past)
         )
 
     # DAO past proposals
-    dao_past_proposals = [
-        p
-        for p in dao_proposals
-        if not user_past_proposals or p not in user_past_proposals
-    ] or dao_proposals
-
-    sorted_dao_past_proposals = sorted(
-        dao_past_proposals,
-        key=lambda p: getattr(p, "created_at", datetime.min),
-        reverse=True,
-    )
-
-    dao_past_proposals_categorized = {
-        "ALL": sorted_dao_past_proposals,
-        "DRAFT": [
-            p for p in sorted_dao_past_proposals if p.status == ContractStatus.DRAFT
-        ],
-        "PENDING": [
-            p for p in sorted_dao_past_proposals if p.status == ContractStatus.PENDING
-        ],
-        "DEPLOYED": [
-            p for p in sorted_dao_past_proposals if p.status == ContractStatus.DEPLOYED
-        ],
-        "FAILED": [
-            p for p in sorted_dao_past_proposals if p.status == ContractStatus.FAILED
-        ],
-    }
-
     dao_past_proposals_stats_for_evaluation = {
-        "TOTAL_ALL_TIME": len(sorted_dao_past_proposals),
-        "NOT_SUBMITTED_ONCHAIN": len(dao_past_proposals_categorized["DRAFT"]),
-        "TRANSACTION_FAILED": len(dao_past_proposals_categorized["FAILED"]),
-        "SUBMITTED_ONCHAIN_FOR_EVAL": len(dao_past_proposals_categorized["DEPLOYED"]),
+        "TOTAL_ALL_TIME": len(view.dao_past),
+        "NOT_SUBMITTED_ONCHAIN": len(view.status(ContractStatus.DRAFT)),
+        "TRANSACTION_FAILED": len(view.status(ContractStatus.FAILED)),
+        "SUBMITTED_ONCHAIN_FOR_EVAL": len(view.status(ContractStatus.DEPLOYED)),
     }
 
     # Limit drafts to last 20
-    dao_draft_proposals = dao_past_proposals_categorized["DRAFT"][:20]
-    dao_draft_proposals_for_evaluation = _format_proposals_for_context(
-        dao_draft_proposals
+    dao_draft_proposals_for_evaluation = view.fragment(
+        "drafts",
+        lambda: _format_proposals_for_context(view.status(ContractStatus.DRAFT)[:20]),
     )
 
     # Limit deployed to last 100
-    dao_deployed_proposals = dao_past_proposals_categorized["DEPLOYED"][:100]
-    dao_deployed_proposals_for_evaluation = _format_proposals_for_context(
-        dao_deployed_proposals
+    dao_deployed_proposals_for_evaluation = view.fragment(
+        "deployed",
+        lambda: _format_proposals_for_context(
+            view.status(ContractStatus.DEPLOYED)[:100]
+        ),
     )
 
     return (
@@ -517,6 +494,77 @@ def _prepare_media_for_evaluation(
     return media
 
 
+async def _request_evaluation(
+    proposal_id: str | UUID,
+    messages: List[Dict[str, Any]],
+    model: Optional[str],
+    temperature: Optional[float],
+    reasoning: Optional[bool],
+) -> Optional[EvaluationOutput]:
+    """Call OpenRouter with the evaluation messages and parse its output."""
+    # call openrouter passing x tools and message
+    # disabled x_ai_tools 2025-11-29 after 400 errors
+    # x_ai_tools = [{"type": "web_search"}, {"type": "x_search"}]
+    openrouter_response = await call_openrouter(
+        messages=messages,
+        model=model,
+        temperature=temperature,
+        reasoning=reasoning,
+        tools=None,  # x_ai_tools,
+    )
+
+    # parse usage information
+    usage = openrouter_response.get("usage")
+    logger.debug(f"OpenRouter usage for proposal {proposal_id}: {usage}")
+
+    usage_input_tokens = usage.get("prompt_tokens") if usage else None
+    usage_output_tokens = usage.get("completion_tokens") if usage else None
+    usage_est_cost = None
+    if usage_input_tokens and usage_output_tokens:
+        usage_est_cost = estimate_usage_cost(
+            usage_input_tokens,
+            usage_output_tokens,
+            model or config.chat_llm.default_model,
+        )
+    usage_data = {
+        "usage_input_tokens": str(usage_input_tokens),
+        "usage_output_tokens": str(usage_output_tokens),
+        "usage_est_cost": str(usage_est_cost),
+    }
+
+    # parse first choice for requested json
+    choices = openrouter_response.get("choices", [])
+    if not choices:
+        logger.error("No choices in OpenRouter response")
+        return None
+
+    first_choice = choices[0]
+    choice_message = first_choice.get("message")
+    if not choice_message or not isinstance(choice_message.get("content"), str):
+        logger.error("Invalid message content in response")
+        return None
+
+    try:
+        # load the json
+        evaluation_json = json.loads(choice_message["content"])
+        # validate with pydantic
+        evaluation_output = EvaluationOutput(
+            **evaluation_json,
+            **usage_data,
+        )
+
+        logger.info(f"Successfully evaluated proposal {proposal_id}")
+
+        return evaluation_output
+
+    except json.JSONDecodeError as e:
+        logger.error(f"JSON decode error: {e}")
+        return None
+    except ValueError as e:
+        logger.error(f"Pydantic validation error: {e}")
+        return None
+
+
 ###############################
 ## Main Evaluation Function  ##
 ###############################
@@ -653,67 +701,32 @@ async def evaluate_proposal_openrouter(
         # add user message alongside system message
         messages.append({"role": "user", "content": user_content})
 
-        # call openrouter passing x tools and message
-        # disabled x_ai_tools 2025-11-29 after 400 errors
-        # x_ai_tools = [{"type": "web_search"}, {"type": "x_search"}]
-        openrouter_response = await call_openrouter(
-            messages=messages,
-            model=model,
+        # evaluations with the same request (one per selected agent) share a
+        # single call and its result
+        key = evaluation_key(
+            proposal.id,
+            model=model or config.chat_llm.default_model,
             temperature=temperature,
             reasoning=reasoning,
-            tools=None,  # x_ai_tools,
+            messages=messages,
         )
+        made_call = False
 
-        # parse usage information
-        usage = openrouter_response.get("usage")
-        logger.debug(f"OpenRouter usage for proposal {proposal_id}: {usage}")
-
-        usage_input_tokens = usage.get("prompt_tokens") if usage else None
-        usage_output_tokens = usage.get("completion_tokens") if usage else None
-        usage_est_cost = None
-        if usage_input_tokens and usage_output_tokens:
-            usage_est_cost = estimate_usage_cost(
-                usage_input_tokens,
-                usage_output_tokens,
-                model or config.chat_llm.default_model,
-            )
-        usage_data = {
-            "usage_input_tokens": str(usage_input_tokens),
-            "usage_output_tokens": str(usage_output_tokens),
-            "usage_est_cost": str(usage_est_cost),
-        }
-
-        # parse first choice for requested json
-        choices = openrouter_response.get("choices", [])
-        if not choices:
-            logger.error("No choices in OpenRouter response")
-            return None
-
-        first_choice = choices[0]
-        choice_message = first_choice.get("message")
-        if not choice_message or not isinstance(choice_message.get("content"), str):
-            logger.error("Invalid message content in response")
-            return None
-
-        try:
-            # load the json
-            evaluation_json = json.loads(choice_message["content"])
-            # validate with pydantic
-            evaluation_output = EvaluationOutput(
-                **evaluation_json,
-                **usage_data,
+        async def request() -> Optional[EvaluationOutput]:
+            nonlocal made_call
+            made_call = True
+            return await _request_evaluation(
+                proposal_id, messages, model, temperature, reasoning
             )
 
-            logger.info(f"Successfully evaluated proposal {proposal_id}")
-
-            return evaluation_output
-
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error: {e}")
-            return None
-        except ValueError as e:
-            logger.error(f"Pydantic validation error: {e}")
+        evaluation_output = await evaluation_flights.run(key, request)
+        if evaluation_output is None:
             return None
+        if made_call:
+            return evaluation_output.model_copy(deep=True)
+        # Served from another evaluation's call or a kept result: the usage
+        # is reported by the evaluation that made the call
+        return evaluation_output.model_copy(deep=True, update=SHARED_USAGE)
 
     except Exception as e:
         logger.error(f"Error during evaluation of proposal {proposal_id}: {e}")
@@ -6,17 +6,43 @@ of the mixin system. It contains all necessary model factory functions.
 
 from typing import Any, Dict, List, Optional, Union
 
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
 from langchain_core.prompts.chat import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
 
 from app.config import config
 from app.lib.logger import configure_logger
+from app.services.ai.llm_transport import llm_transport
 
 logger = configure_logger(__name__)
 
 
+class LLMUsageCallback(BaseCallbackHandler):
+    """Records token usage of ChatOpenAI calls in the shared transport metrics."""
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        llm_output = response.llm_output or {}
+        recorded = False
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                usage = getattr(message, "usage_metadata", None)
+                if not usage:
+                    continue
+                model = (message.response_metadata or {}).get(
+                    "model_name"
+                ) or llm_output.get("model_name")
+                llm_transport.record_usage(model, usage)
+                recorded = True
+        if not recorded:
+            llm_transport.record_usage(
+                llm_output.get("model_name"), llm_output.get("token_usage")
+            )
+
+
 def get_default_model() -> str:
     """Get the default model name from configuration."""
     return config.chat_llm.default_model or "gpt-5"
@@ -80,6 +106,11 @@ def create_chat_openai(
     Returns:
         Configured ChatOpenAI instance
     """
+    # Share the pooled LLM transport when called from an event loop; it retries
+    # 429/5xx itself, so the SDK's own retries are off unless asked for
+    http_async_client = llm_transport.client_if_running()
+    default_retries = 0 if http_async_client is not None else 3
+
     config_dict = {
         "model": model or get_default_model(),
         "temperature": temperature
@@ -87,11 +118,13 @@ def create_chat_openai(
         else get_default_temperature(),
         "streaming": streaming if streaming is not None else True,
         "stream_usage": stream_usage if stream_usage is not None else True,
-        "callbacks": callbacks or [],
+        "callbacks": [*(callbacks or []), LLMUsageCallback()],
         "timeout": kwargs.get("timeout", 300),  # 5 minutes total timeout
-        "max_retries": kwargs.get("max_retries", 3),
+        "max_retries": kwargs.get("max_retries", default_retries),
         **kwargs,
     }
+    if http_async_client is not None:
+        config_dict.setdefault("http_async_client", http_async_client)
 
     # Add base_url if specified or if default is set
     default_base_url = base_url or get_default_base_url()
@@ -109,7 +142,8 @@ def create_chat_openai(
         "X-Title": "AIBTC",
     }
 
-    logger.info(f"Creating ChatOpenAI with config: {config_dict}")
+    logged = {k: v for k, v in config_dict.items() if k != "http_async_client"}
+    logger.info(f"Creating ChatOpenAI with config: {logged}")
     return ChatOpenAI(**config_dict)
 
 
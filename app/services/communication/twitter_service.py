@@ -1,9 +1,8 @@
+import asyncio
 import re
-from io import BytesIO
 from typing import Any, Dict, List, Optional, TypedDict
 from urllib.parse import urlparse
 
-import requests
 import tweepy
 from pydantic import BaseModel
 
@@ -18,6 +17,12 @@ from app.backend.models import (
 )
 from app.config import config
 from app.lib.logger import configure_logger
+from app.services.communication.twitter_transport import (
+    PLACE_FIELDS,
+    POLL_FIELDS,
+    TWEET_LOOKUP_PARAMS,
+    TwitterTransport,
+)
 
 logger = configure_logger(__name__)
 
@@ -43,14 +48,24 @@ class TwitterService:
         self.bearer_token = bearer_token
         self.client = None
         self.api = None
+        self.transport: Optional[TwitterTransport] = None
 
     async def _ainitialize(self) -> None:
         self.initialize()
 
     def initialize(self) -> None:
-        """Initialize the Twitter client and API."""
+        """Initialize the Twitter transport, client and API."""
         try:
-            # Initialize OAuth1 handler for API v1.1 (needed for media upload)
+            # Async transport used by the methods of this service
+            self.transport = TwitterTransport(
+                self.consumer_key,
+                self.consumer_secret,
+                self.access_token,
+                self.access_secret,
+                self.bearer_token,
+            )
+
+            # Initialize OAuth1 handler for API v1.1 (get_status_by_id)
             auth = tweepy.OAuth1UserHandler(
                 self.consumer_key,
                 self.consumer_secret,
@@ -59,7 +74,7 @@ class TwitterService:
             )
             self.api = tweepy.API(auth, wait_on_rate_limit=False)
 
-            # Initialize Client for API v2 (used for tweet creation)
+            # Synchronous v2 client, kept for callers that use it directly
             self.client = tweepy.Client(
                 consumer_key=self.consumer_key,
                 consumer_secret=self.consumer_secret,
@@ -73,6 +88,11 @@ class TwitterService:
             logger.error(f"Failed to initialize Twitter client: {str(e)}")
             raise
 
+    async def aclose(self) -> None:
+        """Close the transport's connections for the running event loop."""
+        if self.transport is not None:
+            await self.transport.aclose()
+
     def _get_extension(self, url: str) -> str:
         """Extract file extension from URL."""
         path = urlparse(url).path.lower()
@@ -105,12 +125,11 @@ class TwitterService:
     ) -> Optional[tweepy.Response]:
         """Post a tweet with media attachment."""
         try:
-            if self.api is None or self.client is None:
+            if self.transport is None:
                 raise Exception("Twitter client is not initialized")
 
             headers = {"User-Agent": "Mozilla/5.0 (compatible; AIBTC Bot/1.0)"}
-            response = requests.get(image_url, headers=headers, timeout=30)
-            response.raise_for_status()
+            response = await self.transport.download(image_url, headers=headers)
 
             # Validate content type and size
             content_type = response.headers.get("content-type", "").lower()
@@ -127,15 +146,15 @@ class TwitterService:
 
             # Upload media using API v1.1
             extension = self._get_extension(image_url)
-            media = self.api.media_upload(
+            media_id = await self.transport.media_upload(
                 filename=f"image{extension}",
-                file=BytesIO(response.content),
+                content=response.content,
             )
 
             # Create tweet with media using API v2
-            result = self.client.create_tweet(
+            result = await self.transport.create_tweet(
                 text=text,
-                media_ids=[media.media_id_string],
+                media_ids=[media_id],
                 in_reply_to_tweet_id=reply_id,
             )
 
@@ -164,7 +183,7 @@ class TwitterService:
     ) -> Optional[List[tweepy.Response]]:
         """Post a tweet, splitting into chunks if necessary and handling media."""
         try:
-            if self.client is None:
+            if self.transport is None:
                 raise Exception("Twitter client is not initialized")
 
             # Process image URL if present
@@ -245,10 +264,10 @@ class TwitterService:
             Tweet response if successful, None if failed
         """
         try:
-            if self.client is None:
+            if self.transport is None:
                 raise Exception("Twitter client is not initialized")
 
-            response = self.client.create_tweet(
+            response = await self.transport.create_tweet(
                 text=text, in_reply_to_tweet_id=reply_in_reply_to_tweet_id
             )
 
@@ -279,10 +298,10 @@ class TwitterService:
             User data if found, None if not found or error
         """
         try:
-            if self.client is None:
+            if self.transport is None:
                 raise Exception("Twitter client is not initialized")
 
-            response = self.client.get_user(username=username)
+            response = await self.transport.get_user(username=username)
             if response and response.data:
                 return response.data
             return None
@@ -302,10 +321,10 @@ class TwitterService:
             User data if found, None if not found or error
         """
         try:
-            if self.client is None:
+            if self.transport is None:
                 raise Exception("Twitter client is not initialized")
 
-            response = self.client.get_user(id=user_id)
+            response = await self.transport.get_user(id=user_id)
             if response and response.data:
                 return response.data
             return None
@@ -314,6 +333,27 @@ class TwitterService:
             logger.error(f"Failed to get user info for {user_id}: {str(e)}")
             return None
 
+    async def get_users_by_ids(self, user_ids: List[str]) -> List[tweepy.User]:
+        """
+        Get several users by ID, up to 100 per API request.
+
+        Args:
+            user_ids: Twitter user IDs
+
+        Returns:
+            The users found, or an empty list on error
+        """
+        try:
+            if self.transport is None:
+                raise Exception("Twitter client is not initialized")
+
+            response = await self.transport.get_users(ids=user_ids)
+            return response.data or []
+
+        except Exception as e:
+            logger.error(f"Failed to get info for {len(user_ids)} users: {str(e)}")
+            return []
+
     async def get_mentions_by_user_id(
         self, user_id: str, max_results: int = 100
     ) -> List[tweepy.Tweet]:
@@ -328,82 +368,15 @@ class TwitterService:
             List of mention data
         """
         try:
-            if self.client is None:
+            if self.transport is None:
                 raise Exception("Twitter client is not initialized")
 
-            response = self.client.get_mentions(
+            response = await self.transport.get_users_mentions(
                 id=user_id,
                 max_results=min(max_results, 100),  # API limit
-                tweet_fields=[
-                    "id",
-                    "text",
-                    "created_at",
-                    "author_id",
-                    "conversation_id",
-                    "in_reply_to_user_id",
-                    "referenced_tweets",
-                    "public_metrics",
-                    "entities",
-                    "attachments",
-                    "context_annotations",
-                    "withheld",
-                    "reply_settings",
-                    "lang",
-                ],
-                expansions=[
-                    "author_id",
-                    "referenced_tweets.id",
-                    "referenced_tweets.id.author_id",
-                    "entities.mentions.username",
-                    "attachments.media_keys",
-                    "attachments.poll_ids",
-                    "in_reply_to_user_id",
-                    "geo.place_id",
-                ],
-                user_fields=[
-                    "id",
-                    "name",
-                    "username",
-                    "created_at",
-                    "description",
-                    "entities",
-                    "location",
-                    "pinned_tweet_id",
-                    "profile_image_url",
-                    "protected",
-                    "public_metrics",
-                    "url",
-                    "verified",
-                    "withheld",
-                ],
-                media_fields=[
-                    "duration_ms",
-                    "height",
-                    "media_key",
-                    "preview_image_url",
-                    "type",
-                    "url",
-                    "width",
-                    "public_metrics",
-                    "alt_text",
-                ],
-                place_fields=[
-                    "contained_within",
-                    "country",
-                    "country_code",
-                    "full_name",
-                    "geo",
-                    "id",
-                    "name",
-                    "place_type",
-                ],
-                poll_fields=[
-                    "duration_minutes",
-                    "end_datetime",
-                    "id",
-                    "options",
-                    "voting_status",
-                ],
+                **TWEET_LOOKUP_PARAMS,
+                place_fields=PLACE_FIELDS,
+                poll_fields=POLL_FIELDS,
             )
 
             if response and response.data:
@@ -425,10 +398,10 @@ class TwitterService:
             User data if successful, None if failed
         """
         try:
-            if self.client is None:
+            if self.transport is None:
                 raise Exception("Twitter client is not initialized")
 
-            response = self.client.get_me()
+            response = await self.transport.get_me()
             if response and response.data:
                 return response.data
             return None
@@ -448,7 +421,7 @@ class TwitterService:
             True if successful, False if failed
         """
         try:
-            if self.client is None:
+            if self.transport is None:
                 raise Exception("Twitter client is not initialized")
 
             # Get target user's ID
@@ -457,7 +430,7 @@ class TwitterService:
                 raise Exception(f"Failed to get user info for {target_username}")
 
             # Follow the user
-            response = self.client.follow_user(target_user_id=target_user.id)
+            response = await self.transport.follow_user(target_user_id=target_user.id)
             if response:
                 logger.info(f"Successfully followed user: {target_username}")
                 return True
@@ -478,7 +451,7 @@ class TwitterService:
             True if successful, False if failed
         """
         try:
-            if self.client is None:
+            if self.transport is None:
                 raise Exception("Twitter client is not initialized")
 
             # Get target user's ID
@@ -487,7 +460,7 @@ class TwitterService:
                 raise Exception(f"Failed to get user info for {target_username}")
 
             # Unfollow the user
-            response = self.client.unfollow_user(target_user_id=target_user.id)
+            response = await self.transport.unfollow_user(target_user_id=target_user.id)
             if response:
                 logger.info(f"Successfully unfollowed user: {target_username}")
                 return True
@@ -508,65 +481,12 @@ class TwitterService:
             Full response object if found, None if not found or error
         """
         try:
-            if self.client is None:
+            if self.transport is None:
                 raise Exception("Twitter client is not initialized")
 
-            response = self.client.get_tweet(
+            response = await self.transport.get_tweet(
                 id=tweet_id,
-                tweet_fields=[
-                    "id",
-                    "text",
-                    "created_at",
-                    "author_id",
-                    "conversation_id",
-                    "in_reply_to_user_id",
-                    "referenced_tweets",
-                    "public_metrics",
-                    "entities",
-                    "attachments",
-                    "context_annotations",
-                    "withheld",
-                    "reply_settings",
-                    "lang",
-                ],
-                expansions=[
-                    "author_id",
-                    "referenced_tweets.id",
-                    "referenced_tweets.id.author_id",
-                    "entities.mentions.username",
-                    "attachments.media_keys",
-                    "attachments.poll_ids",
-                    "in_reply_to_user_id",
-                    "geo.place_id",
-                ],
-                user_fields=[
-                    "id",
-                    "name",
-                    "username",
-                    "created_at",
-                    "description",
-                    "entities",
-                    "location",
-                    "pinned_tweet_id",
-                    "profile_image_url",
-                    "protected",
-                    "public_metrics",
-                    "url",
-                    "verified",
-                    "withheld",
-                ],
-                media_fields=[
-                    "duration_ms",
-                    "height",
-                    "media_key",
-                    "preview_image_url",
-                    "type",
-                    "url",
-                    "width",
-                    "public_metrics",
-                    "alt_text",
-                    "variants",
-                ],
+                **TWEET_LOOKUP_PARAMS,
             )
 
             if response and response.data:
@@ -580,6 +500,34 @@ class TwitterService:
             logger.error(f"Failed to get tweet {tweet_id}: {str(e)}")
             return None
 
+    async def get_tweets_by_ids(
+        self, tweet_ids: List[str]
+    ) -> Optional[tweepy.Response]:
+        """
+        Get several tweets by ID using the v2 batch lookup, up to 100 per request.
+
+        Args:
+            tweet_ids: The IDs of the tweets to retrieve
+
+        Returns:
+            One response with the tweets found and their includes, None on error
+        """
+        try:
+            if self.transport is None:
+                raise Exception("Twitter client is not initialized")
+
+            response = await self.transport.get_tweets(
+                ids=tweet_ids, **TWEET_LOOKUP_PARAMS
+            )
+            logger.info(
+                f"Retrieved {len(response.data or [])} of {len(tweet_ids)} tweets"
+            )
+            return response
+
+        except Exception as e:
+            logger.error(f"Failed to get {len(tweet_ids)} tweets: {str(e)}")
+            return None
+
     async def get_status_by_id(
         self, tweet_id: str, tweet_mode: str = "extended"
     ) -> Optional[tweepy.models.Status]:
@@ -597,7 +545,9 @@ class TwitterService:
             if self.api is None:
                 raise Exception("Twitter API is not initialized")
 
-            status = self.api.get_status(
+            # v1.1 statuses stay on tweepy, off the event loop
+            status = await asyncio.to_thread(
+                self.api.get_status,
                 id=tweet_id,
                 tweet_mode=tweet_mode,
                 include_entities=True,
@@ -630,68 +580,15 @@ class TwitterService:
             List of tweets in the conversation
         """
         try:
-            if self.client is None:
+            if self.transport is None:
                 raise Exception("Twitter client is not initialized")
 
             query = f"conversation_id:{conversation_id}"
 
-            response = self.client.search_recent_tweets(
+            response = await self.transport.search_recent_tweets(
                 query=query,
                 max_results=min(max_results, 100),  # API limit
-                tweet_fields=[
-                    "id",
-                    "text",
-                    "created_at",
-                    "author_id",
-                    "conversation_id",
-                    "in_reply_to_user_id",
-                    "referenced_tweets",
-                    "public_metrics",
-                    "entities",
-                    "attachments",
-                    "context_annotations",
-                    "withheld",
-                    "reply_settings",
-                    "lang",
-                ],
-                expansions=[
-                    "author_id",
-                    "referenced_tweets.id",
-                    "referenced_tweets.id.author_id",
-                    "entities.mentions.username",
-                    "attachments.media_keys",
-                    "attachments.poll_ids",
-                    "in_reply_to_user_id",
-                    "geo.place_id",
-                ],
-                user_fields=[
-                    "id",
-                    "name",
-                    "username",
-                    "created_at",
-                    "description",
-                    "entities",
-                    "location",
-                    "pinned_tweet_id",
-                    "profile_image_url",
-                    "protected",
-                    "public_metrics",
-                    "url",
-                    "verified",
-                    "withheld",
-                ],
-                media_fields=[
-                    "duration_ms",
-                    "height",
-                    "media_key",
-                    "preview_image_url",
-                    "type",
-                    "url",
-                    "width",
-                    "public_metrics",
-                    "alt_text",
-                    "variants",
-                ],
+                **TWEET_LOOKUP_PARAMS,
             )
 
             if response and response.data:
@@ -733,7 +630,7 @@ class TwitterService:
             - conversation_id: The conversation ID
         """
         try:
-            if self.client is None:
+            if self.transport is None:
                 raise Exception("Twitter client is not initialized")
 
             # Step 1: Fetch the tweet info
@@ -775,9 +672,11 @@ class TwitterService:
 
                 # Sort replies by creation time
                 replies.sort(
-                    key=lambda x: x.created_at
-                    if hasattr(x, "created_at") and x.created_at
-                    else ""
+                    key=lambda x: (
+                        x.created_at
+                        if hasattr(x, "created_at") and x.created_at
+                        else ""
+                    )
                 )
 
                 return {
@@ -794,8 +693,11 @@ class TwitterService:
                     f"Fetching original tweet and context for reply {tweet_id}"
                 )
 
-                # Get the original tweet
-                original_response = await self.get_tweet_by_id(conversation_id)
+                # Get the original tweet and the conversation concurrently
+                original_response, all_conversation_tweets = await asyncio.gather(
+                    self.get_tweet_by_id(conversation_id),
+                    self.search_tweets_by_conversation_id(conversation_id),
+                )
                 original_tweet = original_response.data if original_response else None
 
                 if not original_tweet:
@@ -809,17 +711,14 @@ class TwitterService:
                         "error": f"Original tweet {conversation_id} not found",
                     }
 
-                # Get all tweets in the conversation
-                all_conversation_tweets = await self.search_tweets_by_conversation_id(
-                    conversation_id
-                )
-
                 # Sort all tweets by creation time
                 all_tweets = [original_tweet] + all_conversation_tweets
                 all_tweets.sort(
-                    key=lambda x: x.created_at
-                    if hasattr(x, "created_at") and x.created_at
-                    else ""
+                    key=lambda x: (
+                        x.created_at
+                        if hasattr(x, "created_at") and x.created_at
+                        else ""
+                    )
                 )
 
                 # Find the position of the target tweet
@@ -925,9 +824,9 @@ class TwitterService:
 
             # Sort by creation time
             replies.sort(
-                key=lambda x: x.created_at
-                if hasattr(x, "created_at") and x.created_at
-                else ""
+                key=lambda x: (
+                    x.created_at if hasattr(x, "created_at") and x.created_at else ""
+                )
             )
 
             logger.info(f"Found {len(replies)} replies to tweet {tweet_id}")
@@ -957,7 +856,7 @@ class TwitterService:
             List of tweets from the user's timeline
         """
         try:
-            if self.client is None:
+            if self.transport is None:
                 raise Exception("Twitter client is not initialized")
 
             # Build the exclude parameter for API v2
@@ -967,64 +866,11 @@ class TwitterService:
             if not include_rts:
                 exclude_list.append("retweets")
 
-            response = self.client.get_users_tweets(
+            response = await self.transport.get_users_tweets(
                 id=user_id,
                 max_results=min(count, 100),  # API limit
                 exclude=exclude_list if exclude_list else None,
-                tweet_fields=[
-                    "id",
-                    "text",
-                    "created_at",
-                    "author_id",
-                    "conversation_id",
-                    "in_reply_to_user_id",
-                    "referenced_tweets",
-                    "public_metrics",
-                    "entities",
-                    "attachments",
-                    "context_annotations",
-                    "withheld",
-                    "reply_settings",
-                    "lang",
-                ],
-                expansions=[
-                    "author_id",
-                    "referenced_tweets.id",
-                    "referenced_tweets.id.author_id",
-                    "entities.mentions.username",
-                    "attachments.media_keys",
-                    "attachments.poll_ids",
-                    "in_reply_to_user_id",
-                    "geo.place_id",
-                ],
-                user_fields=[
-                    "id",
-                    "name",
-                    "username",
-                    "created_at",
-                    "description",
-                    "entities",
-                    "location",
-                    "pinned_tweet_id",
-                    "profile_image_url",
-                    "protected",
-                    "public_metrics",
-                    "url",
-                    "verified",
-                    "withheld",
-                ],
-                media_fields=[
-                    "duration_ms",
-                    "height",
-                    "media_key",
-                    "preview_image_url",
-                    "type",
-                    "url",
-                    "width",
-                    "public_metrics",
-                    "alt_text",
-                    "variants",
-                ],
+                **TWEET_LOOKUP_PARAMS,
             )
 
             if response and response.data:
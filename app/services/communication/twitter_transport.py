@@ -0,0 +1,567 @@
+"""Async transport for the Twitter (X) API.
+
+``TwitterService`` talks to the API through ``TwitterTransport`` instead of
+calling tweepy's synchronous clients from its coroutines, which held up the
+event loop for the whole HTTP round trip. The transport:
+
+- sends every request through one pooled ``httpx.AsyncClient`` per event loop,
+- signs user-context requests with OAuth 1.0a and app-context requests with the
+  bearer token,
+- keeps the rate limit window of each endpoint from the ``x-rate-limit-*``
+  response headers and holds requests until an exhausted window resets, up to
+  ``AIBTC_TWITTER_MAX_RATE_LIMIT_WAIT_SECONDS``; longer waits raise
+  ``tweepy.TooManyRequests`` without calling the API, and
+- splits multi-ID lookups into v2 batch requests of up to 100 IDs.
+
+Responses come back as ``tweepy.Response`` objects and HTTP errors are raised
+as the matching tweepy exceptions, so callers handle them as before.
+
+Point ``AIBTC_TWITTER_API_BASE_URL`` and ``AIBTC_TWITTER_UPLOAD_BASE_URL`` at a
+local fake to run against something other than the real API.
+"""
+
+import asyncio
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+from urllib.parse import quote, urlencode
+
+import httpx
+import requests
+import tweepy
+from oauthlib.oauth1 import Client as OAuth1Client
+from requests.structures import CaseInsensitiveDict
+from tweepy import Media, Place, Poll, Tweet, User
+
+from app.config import config
+from app.lib.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+# Most v2 lookup endpoints accept up to 100 IDs per request
+MAX_IDS_PER_REQUEST = 100
+
+TWEET_FIELDS = [
+    "id",
+    "text",
+    "created_at",
+    "author_id",
+    "conversation_id",
+    "in_reply_to_user_id",
+    "referenced_tweets",
+    "public_metrics",
+    "entities",
+    "attachments",
+    "context_annotations",
+    "withheld",
+    "reply_settings",
+    "lang",
+]
+TWEET_EXPANSIONS = [
+    "author_id",
+    "referenced_tweets.id",
+    "referenced_tweets.id.author_id",
+    "entities.mentions.username",
+    "attachments.media_keys",
+    "attachments.poll_ids",
+    "in_reply_to_user_id",
+    "geo.place_id",
+]
+USER_FIELDS = [
+    "id",
+    "name",
+    "username",
+    "created_at",
+    "description",
+    "entities",
+    "location",
+    "pinned_tweet_id",
+    "profile_image_url",
+    "protected",
+    "public_metrics",
+    "url",
+    "verified",
+    "withheld",
+]
+MEDIA_FIELDS = [
+    "duration_ms",
+    "height",
+    "media_key",
+    "preview_image_url",
+    "type",
+    "url",
+    "width",
+    "public_metrics",
+    "alt_text",
+    "variants",
+]
+PLACE_FIELDS = [
+    "contained_within",
+    "country",
+    "country_code",
+    "full_name",
+    "geo",
+    "id",
+    "name",
+    "place_type",
+]
+POLL_FIELDS = ["duration_minutes", "end_datetime", "id", "options", "voting_status"]
+
+# Fields and expansions requested with every tweet lookup
+TWEET_LOOKUP_PARAMS: Dict[str, List[str]] = {
+    "tweet_fields": TWEET_FIELDS,
+    "expansions": TWEET_EXPANSIONS,
+    "user_fields": USER_FIELDS,
+    "media_fields": MEDIA_FIELDS,
+}
+
+_ERRORS_BY_STATUS: Dict[int, Type[tweepy.HTTPException]] = {
+    400: tweepy.BadRequest,
+    401: tweepy.Unauthorized,
+    403: tweepy.Forbidden,
+    404: tweepy.NotFound,
+    429: tweepy.TooManyRequests,
+}
+
+
+@dataclass
+class RateLimitWindow:
+    """Requests left in an endpoint's current window and when it resets."""
+
+    limit: int
+    remaining: int
+    reset: float
+
+
+class RateLimitScheduler:
+    """Holds requests to endpoints whose rate limit window is exhausted.
+
+    Windows are learned from response headers. Before each request a slot is
+    taken from the endpoint's window, so concurrent callers do not overrun it
+    while their requests are in flight; when no slot is left the caller sleeps
+    until the window resets.
+    """
+
+    def __init__(self, max_wait: float):
+        self.max_wait = max_wait
+        self.windows: Dict[str, RateLimitWindow] = {}
+        self.waits = 0
+
+    async def acquire(self, endpoint: str) -> None:
+        """Wait for a request slot on ``endpoint``.
+
+        Raises:
+            tweepy.TooManyRequests: If the window resets after ``max_wait``
+        """
+        while True:
+            window = self.windows.get(endpoint)
+            now = time.time()
+            if window is None or window.reset <= now:
+                # Unknown or reset window: the response will tell us the new one
+                return
+            if window.remaining > 0:
+                window.remaining -= 1
+                return
+
+            wait = window.reset - now
+            if wait > self.max_wait:
+                raise _rate_limited(endpoint, window.reset)
+            self.waits += 1
+            logger.info(
+                f"Twitter rate limit reached for {endpoint}, waiting {wait:.0f}s"
+            )
+            await asyncio.sleep(wait)
+
+    def update(self, endpoint: str, headers: httpx.Headers) -> None:
+        """Record the window reported by a response to ``endpoint``."""
+        try:
+            limit = int(headers["x-rate-limit-limit"])
+            remaining = int(headers["x-rate-limit-remaining"])
+            reset = float(headers["x-rate-limit-reset"])
+        except (KeyError, ValueError):
+            return
+        window = self.windows.get(endpoint)
+        if window is not None and window.reset == reset:
+            # Responses can arrive out of order; the lowest count is the latest
+            remaining = min(remaining, window.remaining)
+        self.windows[endpoint] = RateLimitWindow(limit, remaining, reset)
+
+    def exhaust(self, endpoint: str, headers: httpx.Headers) -> None:
+        """Mark ``endpoint`` exhausted after a 429 response."""
+        try:
+            reset = float(headers["x-rate-limit-reset"])
+        except (KeyError, ValueError):
+            try:
+                reset = time.time() + float(headers.get("retry-after", ""))
+            except ValueError:
+                reset = time.time() + 15 * 60
+        window = self.windows.get(endpoint)
+        self.windows[endpoint] = RateLimitWindow(
+            window.limit if window else 0, 0, reset
+        )
+
+
+def _rate_limited(endpoint: str, reset: float) -> tweepy.TooManyRequests:
+    """A TooManyRequests error for a request that was never sent."""
+    response = requests.Response()
+    response.status_code = 429
+    response.reason = "Too Many Requests"
+    response.headers = CaseInsensitiveDict(
+        {
+            "Retry-After": str(max(1, int(reset - time.time()) + 1)),
+            "x-rate-limit-reset": str(int(reset)),
+        }
+    )
+    return tweepy.TooManyRequests(
+        response,
+        response_json={"detail": f"Rate limit window for {endpoint} is exhausted"},
+    )
+
+
+def _http_error(response: httpx.Response) -> tweepy.HTTPException:
+    """The tweepy exception for an error response."""
+    converted = requests.Response()
+    converted.status_code = response.status_code
+    converted.reason = response.reason_phrase
+    converted.headers = CaseInsensitiveDict(response.headers)
+    converted.url = str(response.url)
+    converted._content = response.content
+    if response.status_code >= 500:
+        return tweepy.TwitterServerError(converted)
+    error_type = _ERRORS_BY_STATUS.get(response.status_code, tweepy.HTTPException)
+    return error_type(converted)
+
+
+def _query_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """API query parameters from tweepy-style keyword arguments.
+
+    ``tweet_fields`` becomes ``tweet.fields`` and lists are comma-joined.
+    """
+    query = {}
+    for name, value in params.items():
+        if value is None:
+            continue
+        if name.endswith("_fields"):
+            name = name.replace("_", ".", 1)
+        if isinstance(value, (list, tuple)):
+            value = ",".join(map(str, value))
+        query[name] = value
+    return query
+
+
+def _process_includes(includes: Dict[str, Any]) -> Dict[str, Any]:
+    models = {
+        "media": Media,
+        "places": Place,
+        "polls": Poll,
+        "tweets": Tweet,
+        "users": User,
+    }
+    return {
+        key: [models[key](item) for item in items] if key in models else items
+        for key, items in includes.items()
+    }
+
+
+def to_response(payload: Dict[str, Any], data_type: Optional[type]) -> tweepy.Response:
+    """Build a ``tweepy.Response`` from a decoded v2 response body."""
+    data = payload.get("data")
+    if data_type is not None:
+        if isinstance(data, list):
+            data = [data_type(item) for item in data]
+        elif data is not None:
+            data = data_type(data)
+    return tweepy.Response(
+        data,
+        _process_includes(payload.get("includes", {})),
+        payload.get("errors", []),
+        payload.get("meta", {}),
+    )
+
+
+def merge_responses(responses: Iterable[tweepy.Response]) -> tweepy.Response:
+    """Combine the responses of a batched lookup into one."""
+    data: List[Any] = []
+    includes: Dict[str, List[Any]] = {}
+    errors: List[Any] = []
+    for response in responses:
+        data.extend(response.data or [])
+        for key, items in response.includes.items():
+            includes.setdefault(key, []).extend(items)
+        errors.extend(response.errors)
+    return tweepy.Response(data or None, includes, errors, {"result_count": len(data)})
+
+
+def _batches(ids: List[str]) -> List[List[str]]:
+    return [
+        ids[start : start + MAX_IDS_PER_REQUEST]
+        for start in range(0, len(ids), MAX_IDS_PER_REQUEST)
+    ]
+
+
+class TwitterTransport:
+    """Pooled, rate-limit-aware async client for one set of credentials."""
+
+    def __init__(
+        self,
+        consumer_key: str,
+        consumer_secret: str,
+        access_token: str,
+        access_secret: str,
+        bearer_token: Optional[str] = None,
+        *,
+        api_base_url: Optional[str] = None,
+        upload_base_url: Optional[str] = None,
+        max_rate_limit_wait: Optional[float] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.consumer_key = consumer_key
+        self.consumer_secret = consumer_secret
+        self.access_token = access_token
+        self.access_secret = access_secret
+        self.bearer_token = bearer_token
+        self.api_base_url = (api_base_url or config.twitter.api_base_url).rstrip("/")
+        self.upload_base_url = (
+            upload_base_url or config.twitter.upload_base_url
+        ).rstrip("/")
+        self.rate_limits = RateLimitScheduler(
+            config.twitter.max_rate_limit_wait_seconds
+            if max_rate_limit_wait is None
+            else max_rate_limit_wait
+        )
+        # Only used by tests to point the pool at a fake API
+        self._transport = transport
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+    def client(self) -> httpx.AsyncClient:
+        """Pooled client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                transport=self._transport,
+                timeout=config.twitter.timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=config.twitter.max_connections,
+                    max_keepalive_connections=config.twitter.max_connections,
+                ),
+                headers={"User-Agent": "AIBTC Bot/1.0"},
+            )
+            self._clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the client for the running loop."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    @property
+    def authenticated_user_id(self) -> str:
+        """ID of the user the OAuth 1.0a access token belongs to."""
+        return self.access_token.partition("-")[0]
+
+    def _sign(self, method: str, url: str, headers: Dict[str, str]) -> str:
+        """Add an OAuth 1.0a Authorization header; returns the signed URL."""
+        signer = OAuth1Client(
+            self.consumer_key,
+            client_secret=self.consumer_secret,
+            resource_owner_key=self.access_token,
+            resource_owner_secret=self.access_secret,
+        )
+        url, signed_headers, _ = signer.sign(url, method, headers=headers)
+        headers.update(signed_headers)
+        return url
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        endpoint: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Tuple[str, bytes]]] = None,
+        user_auth: bool = False,
+        base_url: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Send one API request and return its decoded body.
+
+        Args:
+            method: HTTP method
+            path: Path below the base URL, with IDs filled in
+            endpoint: Rate limit key, e.g. ``GET /2/tweets/:id``; defaults to
+                the method and path
+            params: tweepy-style query parameters
+            json: JSON body
+            files: Multipart files, as ``{field: (filename, content)}``
+            user_auth: Sign with OAuth 1.0a instead of the bearer token
+            base_url: Base URL to use instead of the API base URL
+
+        Raises:
+            tweepy.HTTPException: For error responses, and TooManyRequests for
+                a rate limit window that resets too far in the future
+        """
+        user_auth = user_auth or not self.bearer_token
+        endpoint = f"{'user' if user_auth else 'app'} {endpoint or f'{method} {path}'}"
+        url = (base_url or self.api_base_url) + path
+        query = _query_params(params or {})
+        if query:
+            # Percent-encode the query ourselves so the signed URL is the sent URL
+            url += "?" + urlencode(query, quote_via=quote)
+
+        headers: Dict[str, str] = {}
+        if user_auth:
+            url = self._sign(method, url, headers)
+        else:
+            headers["Authorization"] = f"Bearer {self.bearer_token}"
+
+        await self.rate_limits.acquire(endpoint)
+        response = await self.client().request(
+            method, url, json=json, files=files, headers=headers
+        )
+        logger.debug(f"Twitter API {method} {path}: {response.status_code}")
+
+        if response.status_code == 429:
+            self.rate_limits.exhaust(endpoint, response.headers)
+        else:
+            self.rate_limits.update(endpoint, response.headers)
+        if not 200 <= response.status_code < 300:
+            raise _http_error(response)
+        return response.json() if response.content else {}
+
+    async def get_tweet(self, id: str, **params: Any) -> tweepy.Response:
+        payload = await self.request(
+            "GET", f"/2/tweets/{id}", endpoint="GET /2/tweets/:id", params=params
+        )
+        return to_response(payload, Tweet)
+
+    async def get_tweets(self, ids: List[str], **params: Any) -> tweepy.Response:
+        """Look up tweets by ID, 100 per request."""
+        responses = await asyncio.gather(
+            *(
+                self.request("GET", "/2/tweets", params={"ids": batch, **params})
+                for batch in _batches(list(dict.fromkeys(map(str, ids))))
+            )
+        )
+        return merge_responses(to_response(payload, Tweet) for payload in responses)
+
+    async def get_user(
+        self, *, id: Optional[str] = None, username: Optional[str] = None, **params: Any
+    ) -> tweepy.Response:
+        if id is not None:
+            path, endpoint = f"/2/users/{id}", "GET /2/users/:id"
+        elif username is not None:
+            path = f"/2/users/by/username/{username}"
+            endpoint = "GET /2/users/by/username/:username"
+        else:
+            raise ValueError("id or username is required")
+        payload = await self.request("GET", path, endpoint=endpoint, params=params)
+        return to_response(payload, User)
+
+    async def get_users(
+        self,
+        *,
+        ids: Optional[List[str]] = None,
+        usernames: Optional[List[str]] = None,
+        **params: Any,
+    ) -> tweepy.Response:
+        """Look up users by ID or username, 100 per request."""
+        if ids is not None:
+            path, key, values = "/2/users", "ids", list(map(str, ids))
+        elif usernames is not None:
+            path, key, values = "/2/users/by", "usernames", list(usernames)
+        else:
+            raise ValueError("ids or usernames is required")
+        responses = await asyncio.gather(
+            *(
+                self.request("GET", path, params={key: batch, **params})
+                for batch in _batches(list(dict.fromkeys(values)))
+            )
+        )
+        return merge_responses(to_response(payload, User) for payload in responses)
+
+    async def get_me(self, **params: Any) -> tweepy.Response:
+        payload = await self.request(
+            "GET", "/2/users/me", params=params, user_auth=True
+        )
+        return to_response(payload, User)
+
+    async def get_users_mentions(self, id: str, **params: Any) -> tweepy.Response:
+        payload = await self.request(
+            "GET",
+            f"/2/users/{id}/mentions",
+            endpoint="GET /2/users/:id/mentions",
+            params=params,
+        )
+        return to_response(payload, Tweet)
+
+    async def get_users_tweets(self, id: str, **params: Any) -> tweepy.Response:
+        payload = await self.request(
+            "GET",
+            f"/2/users/{id}/tweets",
+            endpoint="GET /2/users/:id/tweets",
+            params=params,
+        )
+        return to_response(payload, Tweet)
+
+    async def search_recent_tweets(self, query: str, **params: Any) -> tweepy.Response:
+        payload = await self.request(
+            "GET",
+            "/2/tweets/search/recent",
+            params={"query": query, **params},
+        )
+        return to_response(payload, Tweet)
+
+    async def create_tweet(
+        self,
+        text: str,
+        in_reply_to_tweet_id: Optional[str] = None,
+        media_ids: Optional[List[str]] = None,
+    ) -> tweepy.Response:
+        body: Dict[str, Any] = {"text": text}
+        if in_reply_to_tweet_id:
+            body["reply"] = {"in_reply_to_tweet_id": str(in_reply_to_tweet_id)}
+        if media_ids:
+            body["media"] = {"media_ids": [str(media_id) for media_id in media_ids]}
+        payload = await self.request("POST", "/2/tweets", json=body, user_auth=True)
+        return to_response(payload, None)
+
+    async def follow_user(self, target_user_id: str) -> tweepy.Response:
+        payload = await self.request(
+            "POST",
+            f"/2/users/{self.authenticated_user_id}/following",
+            endpoint="POST /2/users/:id/following",
+            json={"target_user_id": str(target_user_id)},
+            user_auth=True,
+        )
+        return to_response(payload, None)
+
+    async def unfollow_user(self, target_user_id: str) -> tweepy.Response:
+        payload = await self.request(
+            "DELETE",
+            f"/2/users/{self.authenticated_user_id}/following/{target_user_id}",
+            endpoint="DELETE /2/users/:source_user_id/following/:target_user_id",
+            user_auth=True,
+        )
+        return to_response(payload, None)
+
+    async def media_upload(self, filename: str, content: bytes) -> str:
+        """Upload an image with the v1.1 media endpoint; returns its media ID."""
+        payload = await self.request(
+            "POST",
+            "/1.1/media/upload.json",
+            files={"media": (filename, content)},
+            user_auth=True,
+            base_url=self.upload_base_url,
+        )
+        return payload["media_id_string"]
+
+    async def download(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """GET an arbitrary URL (e.g. an image to attach) through the pool."""
+        response = await self.client().get(url, headers=headers, follow_redirects=True)
+        response.raise_for_status()
+        return response
@@ -2,14 +2,15 @@
 
 import asyncio
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Deque, Dict, List, Optional, Set
 from uuid import UUID
 
 from app.backend.factory import backend
-from app.backend.models import QueueMessage, QueueMessageBase, QueueMessageFilter
+from app.backend.models import QueueMessage, QueueMessageBase
 from app.lib.logger import configure_logger
 
 from .base import JobContext, JobType
@@ -47,14 +48,19 @@ class JobExecution:
 
 
 class PriorityQueue:
-    """Priority-based job queue with concurrency control and deduplication."""
+    """Priority-based job queue with concurrency control and deduplication.
+
+    Workers block in next_job() on a condition that is notified only when a
+    job is enqueued or a concurrency slot is released, so there is no polling.
+    """
 
     def __init__(self):
-        self._queues: Dict[JobPriority, asyncio.Queue] = {
-            priority: asyncio.Queue() for priority in JobPriority
+        self._queues: Dict[JobPriority, Deque[JobExecution]] = {
+            priority: deque() for priority in JobPriority
         }
         self._active_jobs: Dict[JobType, Set[UUID]] = {}
-        self._semaphores: Dict[JobType, asyncio.Semaphore] = {}
+        self._concurrency_limits: Dict[JobType, int] = {}
+        self._dispatch = asyncio.Condition()
         self._executions: Dict[UUID, JobExecution] = {}
         # Phase 2: Enhanced job type tracking
         self._pending_jobs_by_type: Dict[JobType, Set[UUID]] = {}
@@ -95,7 +101,9 @@ class PriorityQueue:
 
         self._executions[message.id] = execution
         self._pending_jobs_by_type[job_type].add(message.id)
-        await self._queues[priority].put(execution)
+        async with self._dispatch:
+            self._queues[priority].append(execution)
+            self._dispatch.notify()
 
         logger.debug(
             f"Job enqueued to priority queue: {str(job_type)}",
@@ -107,59 +115,68 @@ class PriorityQueue:
         )
         return message.id
 
-    async def dequeue(self, priority: JobPriority) -> Optional[JobExecution]:
-        """Get next job from priority queue."""
-        try:
-            # Try to get a job without blocking
-            execution = self._queues[priority].get_nowait()
-            return execution
-        except asyncio.QueueEmpty:
-            return None
-
-    async def get_next_job(self) -> Optional[JobExecution]:
-        """Get the next job from highest priority queue with Phase 2 final deduplication check."""
-        # Check queues in priority order (highest first)
+    async def next_job(self) -> JobExecution:
+        """Wait for the highest-priority job that has a free concurrency slot.
+
+        The slot is taken before the job is returned; callers must hand it
+        back with release_slot().
+        """
+        async with self._dispatch:
+            while True:
+                execution = await self._take_dispatchable_job()
+                if execution:
+                    return execution
+                await self._dispatch.wait()
+
+    async def _take_dispatchable_job(self) -> Optional[JobExecution]:
+        """Pop the first runnable job, scanning queues in priority order.
+
+        Jobs whose type is at its concurrency limit keep their place in line,
+        so they neither block other job types nor lose their FIFO position.
+        """
         for priority in reversed(list(JobPriority)):
-            execution = await self.dequeue(priority)
-            if execution:
+            queue = self._queues[priority]
+            index = 0
+            while index < len(queue):
+                execution = queue[index]
                 # Phase 2: Final deduplication check before returning job
-                if await self._final_execution_check(execution):
-                    # Remove from pending tracking since we're about to execute
-                    self._pending_jobs_by_type[execution.job_type].discard(execution.id)
-                    return execution
-                else:
-                    # Skip this job and clean it up
+                if not await self._final_execution_check(execution):
+                    del queue[index]
                     self._cleanup_skipped_job(execution)
                     continue
+                if not self._has_free_slot(execution.job_type):
+                    index += 1
+                    continue
+                del queue[index]
+                # Remove from pending tracking since we're about to execute
+                self._pending_jobs_by_type[execution.job_type].discard(execution.id)
+                self._active_jobs.setdefault(execution.job_type, set()).add(
+                    execution.id
+                )
+                return execution
         return None
 
+    def _has_free_slot(self, job_type: JobType) -> bool:
+        limit = self._concurrency_limits.get(job_type)
+        if limit is None:
+            return True  # No limit set
+        return len(self._active_jobs.get(job_type, ())) < limit
+
     def set_concurrency_limit(self, job_type: JobType, max_concurrent: int) -> None:
         """Set concurrency limit for a job type."""
-        self._semaphores[job_type] = asyncio.Semaphore(max_concurrent)
+        self._concurrency_limits[job_type] = max_concurrent
         self._active_jobs[job_type] = set()
 
-    async def acquire_slot(self, job_type: JobType, job_id: UUID) -> bool:
-        """Acquire a concurrency slot for job execution."""
-        if job_type not in self._semaphores:
-            return True  # No limit set
-
-        semaphore = self._semaphores[job_type]
-        try:
-            await asyncio.wait_for(semaphore.acquire(), timeout=0.1)
-            self._active_jobs[job_type].add(job_id)
-            return True
-        except asyncio.TimeoutError:
-            return False  # No slots available
-
-    def release_slot(self, job_type: JobType, job_id: UUID) -> None:
+    async def release_slot(self, job_type: JobType, job_id: UUID) -> None:
         """Release a concurrency slot and clean up Phase 2 tracking."""
-        if job_type in self._semaphores:
-            self._semaphores[job_type].release()
         if job_type in self._active_jobs:
             self._active_jobs[job_type].discard(job_id)
         # Phase 2: Clean up tracking
         if job_type in self._pending_jobs_by_type:
             self._pending_jobs_by_type[job_type].discard(job_id)
+        # A freed slot can make exactly one more queued job runnable
+        async with self._dispatch:
+            self._dispatch.notify()
 
     def get_execution(self, job_id: UUID) -> Optional[JobExecution]:
         """Get job execution by ID."""
@@ -426,34 +443,17 @@ class JobExecutor:
 
         while self._running:
             try:
-                # Get next job from priority queue
-                execution = await self.priority_queue.get_next_job()
-                if not execution:
-                    await asyncio.sleep(
-                        0.5
-                    )  # Increased pause if no jobs to reduce CPU usage
-                    continue
-
-                # Check if we can acquire a slot for this job type
-                acquired = await self.priority_queue.acquire_slot(
-                    execution.job_type, execution.id
-                )
-                if not acquired:
-                    # Put job back in queue and try later
-                    metadata = JobRegistry.get_metadata(execution.job_type)
-                    if metadata:
-                        await self.priority_queue.enqueue(
-                            execution.metadata["message"], metadata.priority
-                        )
-                    await asyncio.sleep(0.5)
-                    continue
+                # Wait until a job is enqueued or a concurrency slot frees up
+                execution = await self.priority_queue.next_job()
 
                 # Execute the job
                 try:
                     await self._execute_job(execution, worker_name)
                 finally:
                     # Always release the slot
-                    self.priority_queue.release_slot(execution.job_type, execution.id)
+                    await self.priority_queue.release_slot(
+                        execution.job_type, execution.id
+                    )
 
             except Exception as e:
                 logger.error(
@@ -616,49 +616,6 @@ class JobExecutor:
                             },
                         )
 
-    async def enqueue_pending_jobs(self) -> int:
-        """Load pending jobs from database and enqueue them."""
-        enqueued_count = 0
-
-        for job_type, metadata in JobRegistry.list_enabled_jobs().items():
-            try:
-                # Get pending messages for this job type
-                filters = QueueMessageFilter(type=job_type.value, is_processed=False)
-                pending_messages = backend.list_queue_messages(filters=filters)
-
-                # Enqueue each message
-                for message in pending_messages:
-                    await self.priority_queue.enqueue(message, metadata.priority)
-                    enqueued_count += 1
-
-                if pending_messages:
-                    logger.debug(
-                        f"{len(pending_messages)} Pending jobs enqueued: {str(job_type)}",
-                        extra={
-                            "event_type": "pending_jobs_enqueued",
-                        },
-                    )
-
-            except Exception as e:
-                logger.error(
-                    f"Error enqueuing pending jobs: {str(job_type)}",
-                    extra={
-                        "error": str(e),
-                        "event_type": "enqueue_error",
-                    },
-                    exc_info=True,
-                )
-
-        if enqueued_count > 0:
-            logger.info(
-                f"{enqueued_count} Pending jobs enqueue complete",
-                extra={
-                    "event_type": "pending_jobs_complete",
-                },
-            )
-
-        return enqueued_count
-
     def get_stats(self) -> Dict[str, Any]:
         """Get executor statistics including Phase 2 deduplication info."""
         dedup_stats = self.priority_queue.get_deduplication_stats()
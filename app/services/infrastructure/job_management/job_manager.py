@@ -1,13 +1,14 @@
 """Enhanced Job Manager using the new job queue system."""
 
+import asyncio
 import uuid
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-from app.backend.factory import backend
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
+from app.backend.factory import backend
 from app.config import config
 from app.lib.logger import configure_logger
 
@@ -161,16 +162,14 @@ class JobManager:
             # For jobs that process messages, check if there are pending messages first
             # This prevents unnecessary job executions when there's no work
             if job_type in ["tweet", "discord", "stx_transfer"]:
-                from app.backend.models import QueueMessageFilter
-
-                pending_messages = backend.list_queue_messages(
-                    filters=QueueMessageFilter(
-                        type=QueueMessageType.get_or_create(job_type),
-                        is_processed=False,
-                    )
+                # Read-only probe: looks for one unleased message without
+                # loading the backlog or touching leases held by running tasks
+                has_pending = await asyncio.to_thread(
+                    backend.has_claimable_queue_messages,
+                    QueueMessageType.get_or_create(job_type),
                 )
 
-                if not pending_messages:
+                if not has_pending:
                     logger.debug(
                         "Skipping execution - no pending messages",
                         extra={"job_type": job_type, "event_type": "skip_no_work"},
@@ -178,7 +177,7 @@ class JobManager:
                     return
 
                 logger.debug(
-                    f"Found {len(pending_messages)} pending messages: {job_type}",
+                    f"Found claimable pending messages: {job_type}",
                     extra={
                         "event_type": "work_found",
                     },
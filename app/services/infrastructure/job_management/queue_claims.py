@@ -0,0 +1,128 @@
+"""Lease-based claiming of queue messages.
+
+Several worker processes can consume the same queue type without processing a
+message twice: each claim locks a disjoint batch with ``FOR UPDATE SKIP LOCKED``
+and stamps it with a lease (see the ``claim_queue_messages`` SQL function). A
+worker that dies simply lets its leases expire and the messages become
+claimable again.
+"""
+
+import asyncio
+import os
+import socket
+import uuid
+from typing import Iterable, List, Optional, Set
+from uuid import UUID
+
+from app.backend.factory import backend
+from app.backend.models import QueueMessage, QueueMessageType
+from app.config import config
+from app.lib.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+# Identifies this process in queue.claimed_by
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class QueueLease:
+    """Messages of one queue type leased to this worker.
+
+    ``claim()`` leases up to ``limit`` messages; claiming again returns the
+    messages already held plus any newly available ones. While messages are
+    held, a background heartbeat extends their leases every third of the lease
+    period. ``release()`` hands back whatever has not been marked processed.
+    """
+
+    def __init__(
+        self,
+        queue_type: QueueMessageType,
+        limit: Optional[int] = None,
+        lease_seconds: Optional[int] = None,
+        worker_id: str = WORKER_ID,
+    ):
+        self.queue_type = queue_type
+        self.limit = limit or config.scheduler.queue_claim_limit
+        self.lease_seconds = lease_seconds or config.scheduler.queue_lease_seconds
+        self.worker_id = worker_id
+        self._held: Set[UUID] = set()
+        self._heartbeat_task: Optional[asyncio.Task] = None
+
+    @property
+    def held(self) -> Set[UUID]:
+        return set(self._held)
+
+    async def claim(self, limit: Optional[int] = None) -> List[QueueMessage]:
+        """Claim (or re-claim) unprocessed messages for this worker."""
+        messages = await asyncio.to_thread(
+            backend.claim_queue_messages,
+            self.queue_type,
+            self.worker_id,
+            limit or self.limit,
+            self.lease_seconds,
+        )
+        self._held.update(message.id for message in messages)
+        if messages:
+            logger.debug(
+                f"Claimed {len(messages)} {self.queue_type} messages",
+                extra={"worker_id": self.worker_id, "held": len(self._held)},
+            )
+        self._ensure_heartbeat()
+        return messages
+
+    async def release(self, message_ids: Optional[Iterable[UUID]] = None) -> int:
+        """Release the given messages, or everything still held."""
+        ids = list(self._held if message_ids is None else message_ids)
+        self._held.difference_update(ids)
+        if not self._held:
+            await self._stop_heartbeat()
+        if not ids:
+            return 0
+        try:
+            released = await asyncio.to_thread(
+                backend.release_queue_messages, ids, self.worker_id
+            )
+        except Exception as e:
+            # Leases expire on their own; releasing just makes them claimable sooner
+            logger.warning(
+                f"Failed to release {self.queue_type} messages: {str(e)}",
+                extra={"worker_id": self.worker_id, "message_count": len(ids)},
+            )
+            return 0
+        if released:
+            logger.debug(f"Released {released} {self.queue_type} messages")
+        return released
+
+    def _ensure_heartbeat(self) -> None:
+        if self._held and (self._heartbeat_task is None or self._heartbeat_task.done()):
+            self._heartbeat_task = asyncio.create_task(self._heartbeat())
+
+    async def _stop_heartbeat(self) -> None:
+        task, self._heartbeat_task = self._heartbeat_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _heartbeat(self) -> None:
+        interval = max(1.0, self.lease_seconds / 3)
+        while self._held:
+            await asyncio.sleep(interval)
+            held = list(self._held)
+            try:
+                renewed = await asyncio.to_thread(
+                    backend.extend_queue_message_leases,
+                    held,
+                    self.worker_id,
+                    self.lease_seconds,
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to extend {self.queue_type} leases: {str(e)}",
+                    extra={"worker_id": self.worker_id},
+                )
+                continue
+            # Processed messages (and leases lost to expiry) are no longer ours
+            self._held.intersection_update(renewed)
@@ -20,6 +20,7 @@ from app.backend.models import (
     ContractStatus,
 )
 from app.config import config
+from app.lib.address_index import address_index
 from app.lib.logger import configure_logger
 from app.lib.utils import parse_agent_tool_result_strict
 from app.services.infrastructure.job_management.base import (
@@ -458,7 +459,9 @@ class AgentAccountDeployerTask(BaseTask[AgentAccountDeployResult]):
                 try:
                     # Update the agent with the deployed contract address
                     agent_update = AgentBase(account_contract=full_contract_principal)
-                    backend.update_agent(wallet.agent_id, agent_update)
+                    address_index.add_agent(
+                        backend.update_agent(wallet.agent_id, agent_update)
+                    )
                     logger.info(
                         "Updated agent with contract address",
                         extra={
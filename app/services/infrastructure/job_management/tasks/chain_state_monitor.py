@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.backend.factory import backend
 from app.config import config as main_config
@@ -71,6 +71,7 @@ class ChainStateMonitorTask(BaseTask[ChainStateMonitorResult]):
             network=main_config.network.network,
             enable_caching=True,
             cache_ttl=300,  # 5 minute cache
+            cache_dir=main_config.scheduler.chain_state_monitor_cache_dir or None,
             max_concurrent_requests=3,
             enable_hex_decoding=True,
         )
@@ -179,6 +180,7 @@ class ChainStateMonitorTask(BaseTask[ChainStateMonitorResult]):
                 network=main_config.network.network,
                 enable_caching=True,
                 cache_ttl=300,  # 5 minute cache
+                cache_dir=main_config.scheduler.chain_state_monitor_cache_dir or None,
                 max_concurrent_requests=3,
                 enable_hex_decoding=True,
             )
@@ -307,6 +309,88 @@ class ChainStateMonitorTask(BaseTask[ChainStateMonitorResult]):
                 transformation_stage="block_conversion",
             ) from e
 
+    async def _backfill_blocks(
+        self, start_height: int, end_height: int
+    ) -> Tuple[List[int], Optional[int]]:
+        """Apply blocks to the chainhook handlers strictly in height order.
+
+        The adapter prefetches and transforms blocks ahead of the one being
+        handled. BlockStateHandler advances the DB chain state as each block is
+        applied, and that is the checkpoint: the backfill stops at the first
+        block that fails instead of skipping it, so the next run resumes there.
+
+        Args:
+            start_height: First block to apply (inclusive)
+            end_height: Last block to apply (inclusive)
+
+        Returns:
+            Tuple of the heights applied and the height that failed, if any
+        """
+        await self._ensure_adapter_ready()
+        block_state_handler = self.chainhook_service.handler.block_state_handler
+        blocks_processed: List[int] = []
+        # Typed adapter output goes straight to the handlers; no template/JSON round trip
+        blocks = self.chainhook_adapter.iter_block_range_chainhook(
+            start_height,
+            end_height,
+            use_template=False,
+            prefetch=main_config.scheduler.chain_state_monitor_backfill_prefetch,
+        )
+
+        try:
+            async for height, chainhook_data in blocks:
+                logger.info(
+                    "Generated chainhook data for block processing",
+                    extra={
+                        "block_height": height,
+                        "transaction_count": sum(
+                            len(block.transactions) for block in chainhook_data.apply
+                        ),
+                        "chainhook_uuid": chainhook_data.chainhook.uuid,
+                    },
+                )
+
+                result = await self.chainhook_service.process_adapter_data(
+                    chainhook_data
+                )
+
+                checkpoint = block_state_handler.latest_chain_state
+                if checkpoint is None or checkpoint.block_height < height:
+                    logger.error(
+                        "Chain state did not advance to processed block",
+                        extra={"block_height": height, "result": result},
+                    )
+                    return blocks_processed, height
+
+                logger.info(
+                    "Block processed with result",
+                    extra={
+                        "block_height": height,
+                        "result": result,
+                    },
+                )
+                blocks_processed.append(height)
+
+        except Exception as e:
+            failed_height = start_height + len(blocks_processed)
+            logger.error(
+                "Error processing block",
+                extra={
+                    "block_height": failed_height,
+                    "error": str(e),
+                },
+                exc_info=True,
+            )
+            if "client has been closed" in str(e).lower():
+                # Recreated by _ensure_adapter_ready on the next run
+                await self.close_adapter()
+            return blocks_processed, failed_height
+
+        finally:
+            await blocks.aclose()
+
+        return blocks_processed, None
+
     def _should_retry_on_error(self, error: Exception, context: JobContext) -> bool:
         """Determine if error should trigger retry."""
         # Retry on network errors, blockchain RPC issues, and client closed errors
@@ -487,65 +571,24 @@ class ChainStateMonitorTask(BaseTask[ChainStateMonitorResult]):
                         },
                     )
 
-                    blocks_processed = []
-
-                    # Process each missing block
-                    for height in range(
-                        db_block_height + 1, current_api_block_height + 1
-                    ):
-                        logger.info(
-                            "Processing transactions for block height",
+                    # Bound each run; the next run resumes from the DB chain state
+                    end_height = min(
+                        current_api_block_height,
+                        db_block_height
+                        + main_config.scheduler.chain_state_monitor_max_blocks_per_run,
+                    )
+                    blocks_processed, failed_height = await self._backfill_blocks(
+                        db_block_height + 1, end_height
+                    )
+                    if failed_height is not None:
+                        logger.warning(
+                            "Backfill stopped early, next run resumes from failed block",
                             extra={
-                                "block_height": height,
+                                "failed_height": failed_height,
+                                "blocks_processed": len(blocks_processed),
                             },
                         )
 
-                        try:
-                            # Convert block to chainhook format using the adapter
-                            chainhook_data = await self._convert_to_chainhook_format(
-                                height
-                            )
-
-                            logger.info(
-                                "Generated chainhook message for block processing",
-                                extra={
-                                    "block_height": height,
-                                    "transaction_count": len(
-                                        chainhook_data.get("apply", [{}])[0].get(
-                                            "transactions", []
-                                        )
-                                    ),
-                                    "chainhook_uuid": chainhook_data.get(
-                                        "chainhook", {}
-                                    ).get("uuid"),
-                                },
-                            )
-
-                            # Process through chainhook service (simulates full webhook flow: parse + handle)
-                            result = await self.chainhook_service.process(
-                                chainhook_data
-                            )
-                            logger.info(
-                                "Block processed with result",
-                                extra={
-                                    "block_height": height,
-                                    "result": result,
-                                },
-                            )
-
-                            blocks_processed.append(height)
-
-                        except Exception as e:
-                            logger.error(
-                                "Error processing block",
-                                extra={
-                                    "block_height": height,
-                                    "error": str(e),
-                                },
-                                exc_info=True,
-                            )
-                            # Continue with next block instead of failing the entire process
-
                     results.append(
                         ChainStateMonitorResult(
                             success=True,
@@ -0,0 +1,199 @@
+"""Chainhook ingest task implementation.
+
+Drains the chainhook ingest log written by the webhook endpoint (see
+``app.services.integrations.webhooks.chainhook.ingest_log``).
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+from app.backend.factory import backend
+from app.backend.models import QueueMessage, QueueMessageBase
+from app.config import config
+from app.lib.logger import configure_logger
+from app.services.infrastructure.job_management.base import (
+    BaseTask,
+    JobContext,
+    RunnerConfig,
+    RunnerResult,
+)
+from app.services.infrastructure.job_management.decorators import JobPriority, job
+from app.services.infrastructure.job_management.queue_claims import QueueLease
+from app.services.integrations.webhooks.chainhook import ChainhookService
+from app.services.integrations.webhooks.chainhook.ingest_log import (
+    CHAINHOOK_INGEST_TYPE,
+    ChainhookIngestLog,
+    chainhook_ingest_log,
+)
+
+logger = configure_logger(__name__)
+
+# Blocks leased per run; each entry holds a whole block payload
+CLAIM_BATCH_SIZE = 20
+# Seconds between deletions of processed blocks past the retention period
+PRUNE_INTERVAL_SECONDS = 3600
+
+
+@dataclass
+class ChainhookIngestResult(RunnerResult):
+    """Result of draining the chainhook ingest log."""
+
+    blocks_processed: int = 0
+    blocks_failed: int = 0
+    blocks_abandoned: int = 0
+
+
+@job(
+    job_type="chainhook_ingest",
+    name="Chainhook Ingest",
+    description="Processes chainhook webhook blocks from the durable ingest log",
+    interval_seconds=10,
+    priority=JobPriority.HIGH,
+    max_retries=3,
+    retry_delay_seconds=30,
+    timeout_seconds=600,
+    max_concurrent=1,
+    batch_size=CLAIM_BATCH_SIZE,
+    enable_dead_letter_queue=True,
+)
+class ChainhookIngestTask(BaseTask[ChainhookIngestResult]):
+    """Task that handles logged chainhook blocks in height order."""
+
+    QUEUE_TYPE = CHAINHOOK_INGEST_TYPE
+
+    def __init__(self, config: Optional[RunnerConfig] = None):
+        super().__init__(config)
+        self._queue_lease = QueueLease(self.QUEUE_TYPE, limit=CLAIM_BATCH_SIZE)
+        self._service: Optional[ChainhookService] = None
+        self._last_prune: Optional[float] = None
+
+    @property
+    def service(self) -> ChainhookService:
+        if self._service is None:
+            self._service = ChainhookService()
+        return self._service
+
+    async def _validate_task_specific(self, context: JobContext) -> bool:
+        """Only run when there are logged blocks to handle."""
+        try:
+            return bool(await self._queue_lease.claim())
+        except Exception as e:
+            logger.error(
+                f"Error checking chainhook ingest log: {str(e)}", exc_info=True
+            )
+            return False
+
+    async def _process_entry(self, entry: QueueMessage) -> Optional[bool]:
+        """Handle one logged block.
+
+        Returns True when handled, False when it failed and will be retried,
+        and None when it failed for the last time and was given up on.
+        """
+        height = ChainhookIngestLog.block_height(entry)
+        try:
+            # Replay mode: a retried or replayed block may be at or below the
+            # chain state already recorded, and must still reach the handlers
+            result = await self.service.process(
+                ChainhookIngestLog.block_payload(entry), replay=True
+            )
+        except Exception as e:
+            attempts = entry.claim_count or 1
+            abandoned = attempts >= config.scheduler.chainhook_ingest_max_attempts
+            logger.error(
+                f"Error processing chainhook block {height}: {str(e)}",
+                extra={"entry_id": str(entry.id), "attempts": attempts},
+                exc_info=True,
+            )
+            result = {"success": False, "error": str(e), "attempts": attempts}
+            update_data = (
+                QueueMessageBase(is_processed=True, result=result)
+                if abandoned
+                else QueueMessageBase(result=result)
+            )
+            await asyncio.to_thread(backend.update_queue_message, entry.id, update_data)
+            if not abandoned:
+                # Let the next run (on any worker) pick it up again
+                await self._queue_lease.release([entry.id])
+            return None if abandoned else False
+
+        await asyncio.to_thread(
+            backend.update_queue_message,
+            entry.id,
+            QueueMessageBase(is_processed=True, result=result),
+        )
+        return True
+
+    async def _post_execution_cleanup(
+        self, context: JobContext, results: List[ChainhookIngestResult]
+    ) -> None:
+        """Cleanup after task execution."""
+        await self._queue_lease.release()
+        await self._prune_processed()
+        logger.debug("Chainhook ingest task cleanup completed")
+
+    async def _prune_processed(self) -> None:
+        """Delete processed blocks past the retention period, at most hourly."""
+        retention_days = config.scheduler.chainhook_ingest_retention_days
+        now = time.monotonic()
+        if retention_days <= 0 or (
+            self._last_prune is not None
+            and now - self._last_prune < PRUNE_INTERVAL_SECONDS
+        ):
+            return
+        self._last_prune = now
+        try:
+            await chainhook_ingest_log.prune(retention_days)
+        except Exception as e:
+            logger.warning(f"Error pruning chainhook ingest log: {str(e)}")
+
+    async def _execute_impl(self, context: JobContext) -> List[ChainhookIngestResult]:
+        """Handle the leased blocks one at a time, in height order."""
+        entries = await self._queue_lease.claim()
+        if not entries:
+            return [
+                ChainhookIngestResult(
+                    success=True, message="No logged blocks to process"
+                )
+            ]
+
+        entries.sort(
+            key=lambda entry: (ChainhookIngestLog.block_height(entry), entry.created_at)
+        )
+        # One block at a time: the service's handlers hold the current block's
+        # data between awaits, and chain state must advance in height order.
+        # Stop at the first block that will be retried so later heights cannot
+        # overtake it; the rest of the batch is released for the next run.
+        outcomes: List[Optional[bool]] = []
+        for entry in entries:
+            outcome = await self._process_entry(entry)
+            outcomes.append(outcome)
+            if outcome is False:
+                break
+        deferred = len(entries) - len(outcomes)
+        if deferred:
+            await self._queue_lease.release(
+                [entry.id for entry in entries[len(outcomes) :]]
+            )
+        processed = sum(1 for outcome in outcomes if outcome is True)
+        failed = sum(1 for outcome in outcomes if outcome is False)
+        abandoned = sum(1 for outcome in outcomes if outcome is None)
+
+        logger.info(
+            f"Chainhook ingest completed - Processed: {processed}, "
+            f"Failed: {failed}, Abandoned: {abandoned}, Deferred: {deferred}"
+        )
+        return [
+            ChainhookIngestResult(
+                success=failed == 0 and abandoned == 0,
+                message=f"Processed {processed} of {len(entries)} logged blocks",
+                blocks_processed=processed,
+                blocks_failed=failed,
+                blocks_abandoned=abandoned,
+            )
+        ]
+
+
+# Create instance for auto-registration
+chainhook_ingest_task = ChainhookIngestTask()
@@ -9,6 +9,7 @@ from app.backend.factory import backend
 from app.backend.models import Proposal, ProposalBase, ProposalFilter
 from app.config import config
 from app.lib.logger import configure_logger
+from app.services.ai.embeddings.embedding_cache import embedding_cache
 from app.services.ai.simple_workflows.evaluation import create_embedding_model
 from app.services.infrastructure.job_management.base import (
     BaseTask,
@@ -177,10 +178,16 @@ class DAOProposalEmbedderTask(BaseTask[DAOProposalEmbeddingResult]):
         return "\n".join(parts)
 
     async def _get_embeddings(self, texts: List[str]) -> Optional[List[List[float]]]:
-        """Get embeddings for a list of texts using configured embedding model."""
+        """Get embeddings for a list of texts using configured embedding model.
+
+        Goes through the shared embedding cache, so only texts that have not
+        been embedded before reach the provider.
+        """
         try:
             embeddings_model = create_embedding_model()
-            embeddings = await embeddings_model.aembed_documents(texts)
+            embeddings = await embedding_cache.aembed(
+                embeddings_model.model, texts, embeddings_model.aembed_documents
+            )
             return embeddings
         except Exception as e:
             logger.error(
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, List
 from uuid import UUID
 
-from app.backend.factory import backend
+from app.backend.factory import backend, get_async_backend
 from app.backend.models import (
     QueueMessage,
     QueueMessageBase,
@@ -337,6 +337,9 @@ class DAOProposalEvaluationTask(BaseTask[DAOProposalEvaluationResult]):
             },
         )
 
+        # Async backend so concurrent evaluations don't block each other on I/O
+        async_backend = await get_async_backend()
+
         try:
             # Execute the simplified proposal evaluation workflow
             # (handles internal proposal/DAO fetches and validation)
@@ -436,7 +439,7 @@ class DAOProposalEvaluationTask(BaseTask[DAOProposalEvaluationResult]):
                 },
             )
 
-            wallet = backend.get_wallet(wallet_id)
+            wallet = await async_backend.get_wallet(wallet_id)
 
             # Create a vote record with the evaluation results
             vote_data = VoteCreate(
@@ -458,7 +461,7 @@ class DAOProposalEvaluationTask(BaseTask[DAOProposalEvaluationResult]):
             )
 
             # Create the vote record
-            vote = backend.create_vote(vote_data)
+            vote = await async_backend.create_vote(vote_data)
             if not vote:
                 logger.error(
                     "Failed to create vote record (v2)",
@@ -483,7 +486,7 @@ class DAOProposalEvaluationTask(BaseTask[DAOProposalEvaluationResult]):
                     "overall_score": overall_score,
                 },
             )
-            backend.update_queue_message(message_id, update_data)
+            await async_backend.update_queue_message(message_id, update_data)
 
             return {
                 "success": True,
@@ -509,7 +512,7 @@ class DAOProposalEvaluationTask(BaseTask[DAOProposalEvaluationResult]):
                     "error": error_msg,
                 },
             )
-            backend.update_queue_message(message_id, update_data)
+            await async_backend.update_queue_message(message_id, update_data)
 
             return {"success": False, "error": error_msg}
 
@@ -740,7 +743,8 @@ class DAOProposalEvaluationTask(BaseTask[DAOProposalEvaluationResult]):
     async def get_pending_messages(self) -> List[QueueMessage]:
         """Get all unprocessed messages from the queue."""
         filters = QueueMessageFilter(type=self.QUEUE_TYPE, is_processed=False)
-        return backend.list_queue_messages(filters=filters)
+        async_backend = await get_async_backend()
+        return await async_backend.list_queue_messages(filters=filters)
 
     async def process_message_with_semaphore(
         self, semaphore: asyncio.Semaphore, message: QueueMessage
@@ -8,7 +8,6 @@ from app.backend.models import (
     UUID,
     QueueMessage,
     QueueMessageBase,
-    QueueMessageFilter,
     QueueMessageType,
     VoteBase,
     VoteFilter,
@@ -19,9 +18,11 @@ from app.lib.utils import extract_transaction_id_from_tool_result
 from app.services.infrastructure.job_management.base import (
     BaseTask,
     JobContext,
+    RunnerConfig,
     RunnerResult,
 )
 from app.services.infrastructure.job_management.decorators import JobPriority, job
+from app.services.infrastructure.job_management.queue_claims import QueueLease
 from app.tools.agent_account_action_proposals import (
     AgentAccountVoteOnActionProposalTool,
 )
@@ -61,10 +62,13 @@ class DAOProposalVoterTask(BaseTask[DAOProposalVoteResult]):
 
     QUEUE_TYPE = QueueMessageType.get_or_create("dao_proposal_vote")
 
+    def __init__(self, config: Optional[RunnerConfig] = None):
+        super().__init__(config)
+        self._queue_lease = QueueLease(self.QUEUE_TYPE)
+
     async def get_pending_messages(self) -> List[QueueMessage]:
-        """Get all unprocessed DAO proposal vote messages from the queue."""
-        filters = QueueMessageFilter(type=self.QUEUE_TYPE, is_processed=False)
-        return backend.list_queue_messages(filters=filters)
+        """Claim unprocessed DAO proposal vote messages for this worker."""
+        return await self._queue_lease.claim()
 
     async def _validate_config(self, context: JobContext) -> bool:
         """Validate task configuration."""
@@ -680,6 +684,7 @@ class DAOProposalVoterTask(BaseTask[DAOProposalVoteResult]):
         self, context: JobContext, results: List[DAOProposalVoteResult]
     ) -> None:
         """Cleanup after task execution."""
+        await self._queue_lease.release()
         logger.debug(
             "DAO proposal voter task cleanup completed",
         )
@@ -1,21 +1,28 @@
 """DAO token holders monitoring task implementation."""
 
-from dataclasses import dataclass
+import asyncio
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
 
 from app.backend.factory import backend
 from app.backend.models import (
-    HolderBase,
+    Agent,
+    Holder,
     HolderCreate,
     HolderFilter,
     AgentFilter,
-    WalletFilter,
+    TokenBase,
+    Wallet,
+    WalletFilterN,
     ContractStatus,
     ExtensionFilter,
     QueueMessageCreate,
     QueueMessageType,
 )
+from app.config import config
 from app.services.integrations.hiro.hiro_api import HiroApi
 from app.lib.logger import configure_logger
 from app.services.infrastructure.job_management.base import (
@@ -28,12 +35,22 @@ from app.services.infrastructure.job_management.decorators import JobPriority, j
 
 logger = configure_logger(__name__)
 
+# Holders fetched per Hiro API request, and page requests in flight per token
+HOLDERS_PAGE_SIZE = 100
+HOLDERS_PAGE_CONCURRENCY = 4
+# Blocks below the chain tip the Hiro API may not have indexed yet; a token is
+# marked synced this far below the tip so activity in them is picked up
+SYNC_HEIGHT_MARGIN = 6
+# Addresses per batched agent lookup, as they go in the query string
+AGENT_LOOKUP_CHUNK = 100
+
 
 @dataclass
 class DaoTokenHoldersMonitorResult(RunnerResult):
     """Result of DAO token holders monitoring operation."""
 
     tokens_processed: int = 0
+    tokens_skipped: int = 0
     holders_created: int = 0
     holders_updated: int = 0
     holders_removed: int = 0
@@ -46,6 +63,100 @@ class DaoTokenHoldersMonitorResult(RunnerResult):
             self.errors = []
 
 
+@dataclass
+class HolderChanges:
+    """Writes that bring a token's holders in line with the chain."""
+
+    creates: List[HolderCreate] = field(default_factory=list)
+    updates: List[Holder] = field(default_factory=list)
+    deletes: List[Holder] = field(default_factory=list)
+    # Agents that went from no balance to a positive one
+    approvals: List[Tuple[Agent, Optional[Wallet]]] = field(default_factory=list)
+
+
+def diff_holders(
+    token,
+    balances: Dict[str, str],
+    db_holders: List[Holder],
+    agents: Dict[str, Agent],
+    wallets: Dict[UUID, Wallet],
+    now: datetime,
+) -> HolderChanges:
+    """Compare on-chain balances with the stored holders of ``token``.
+
+    Args:
+        token: The token being synced
+        balances: Balance by holder address, from the Hiro API
+        db_holders: The token's holder rows
+        agents: Agents by account contract, for the holder addresses
+        wallets: Wallets by agent id
+        now: Timestamp for changed rows
+
+    Returns:
+        Only the rows whose amount, agent or wallet changed, plus the rows of
+        addresses that no longer hold the token
+    """
+    changes = HolderChanges()
+    db_by_address = {holder.address: holder for holder in db_holders}
+
+    for address, balance in balances.items():
+        agent = agents.get(address)
+        agent_id = agent.id if agent else None
+        wallet = wallets.get(agent_id) if agent_id else None
+        wallet_id = wallet.id if wallet else None
+        existing = db_by_address.get(address)
+
+        if existing is None:
+            changes.creates.append(
+                HolderCreate(
+                    agent_id=agent_id,
+                    wallet_id=wallet_id,
+                    token_id=token.id,
+                    dao_id=token.dao_id,
+                    amount=balance,
+                    updated_at=now,
+                    address=address,
+                )
+            )
+            if agent and float(balance) > 0:
+                changes.approvals.append((agent, wallet))
+            continue
+
+        amount_changed = existing.amount != balance
+        if (
+            not amount_changed
+            and existing.agent_id == agent_id
+            and existing.wallet_id == wallet_id
+        ):
+            continue
+
+        changes.updates.append(
+            existing.model_copy(
+                update={
+                    "amount": balance,
+                    "agent_id": agent_id,
+                    "wallet_id": wallet_id,
+                    "updated_at": now,
+                }
+            )
+        )
+        # First meaningful token receipt for an agent
+        if (
+            agent
+            and amount_changed
+            and float(existing.amount or "0") == 0
+            and float(balance) > 0
+        ):
+            changes.approvals.append((agent, wallet))
+
+    changes.deletes = [
+        holder
+        for holder in db_holders
+        if holder.address and holder.address not in balances
+    ]
+    return changes
+
+
 @job(
     job_type="dao_token_holders_monitor",
     name="DAO Token Holders Monitor",
@@ -66,6 +177,10 @@ class DaoTokenHoldersMonitorTask(BaseTask[DaoTokenHoldersMonitorResult]):
     def __init__(self, config: Optional[RunnerConfig] = None):
         super().__init__(config)
         self.hiro_api = HiroApi()
+        # Hiro token identifier ("{principal}::{symbol}") by contract principal
+        self._token_identifiers: Dict[str, str] = {}
+        # Monotonic time of each token's last sync in this process
+        self._last_synced: Dict[UUID, float] = {}
 
     async def _validate_config(self, context: JobContext) -> bool:
         """Validate task configuration."""
@@ -149,10 +264,11 @@ class DaoTokenHoldersMonitorTask(BaseTask[DaoTokenHoldersMonitorResult]):
             "DAO token holders monitor task cleanup completed",
         )
 
-    def _parse_token_identifier(self, token) -> Optional[str]:
-        """Parse token identifier for Hiro API call.
+    async def _get_token_identifier(self, token) -> Optional[str]:
+        """Token identifier for Hiro API calls: {contract_principal}::{symbol}.
 
-        Constructs the proper token identifier format: {contract_principal}::{symbol}
+        Identifiers built from the token metadata are cached, since a token's
+        symbol never changes.
         """
         if not hasattr(token, "contract_principal") or not token.contract_principal:
             logger.warning(
@@ -162,38 +278,12 @@ class DaoTokenHoldersMonitorTask(BaseTask[DaoTokenHoldersMonitorResult]):
             return None
 
         contract_principal = token.contract_principal
+        cached = self._token_identifiers.get(contract_principal)
+        if cached:
+            return cached
 
         try:
-            # Get token metadata to extract the symbol
-            logger.debug(
-                "Fetching metadata for token",
-                extra={
-                    "contract_principal": contract_principal,
-                },
-            )
-            metadata = self.hiro_api.get_token_metadata(contract_principal)
-
-            # Extract symbol from metadata
-            symbol = metadata.get("symbol")
-            if not symbol:
-                logger.warning(
-                    "No symbol found in metadata for token",
-                    extra={
-                        "contract_principal": contract_principal,
-                    },
-                )
-                return None
-
-            # Construct the proper token identifier format
-            token_identifier = f"{contract_principal}::{symbol}"
-            logger.debug(
-                "Constructed token identifier",
-                extra={
-                    "token_identifier": token_identifier,
-                },
-            )
-            return token_identifier
-
+            metadata = await self.hiro_api.aget_token_metadata(contract_principal)
         except Exception as e:
             logger.error(
                 "Error fetching metadata for token",
@@ -211,38 +301,61 @@ class DaoTokenHoldersMonitorTask(BaseTask[DaoTokenHoldersMonitorResult]):
             )
             return contract_principal
 
-    def _get_agent_for_contract(self, account_contract: str):
-        """Get existing agent for a given account_contract. Returns (agent, wallet) tuple if found, None otherwise."""
-        try:
-            # Try to find existing agent by account_contract
-            agents = backend.list_agents(
-                filters=AgentFilter(account_contract=account_contract)
-            )
-            if agents:
-                agent = agents[0]
-                # Get the wallet for this agent
-                wallets = backend.list_wallets(filters=WalletFilter(agent_id=agent.id))
-                wallet = wallets[0] if wallets else None
-                return agent, wallet
-
-            # If no agent found, return None
-            logger.debug(
-                "No existing agent found for account_contract",
+        symbol = metadata.get("symbol")
+        if not symbol:
+            logger.warning(
+                "No symbol found in metadata for token",
                 extra={
-                    "account_contract": account_contract,
+                    "contract_principal": contract_principal,
                 },
             )
-            return None, None
+            return None
 
-        except Exception as e:
-            logger.error(
-                "Error getting agent for account_contract",
-                extra={
-                    "account_contract": account_contract,
-                    "error": str(e),
-                },
-            )
-            return None, None
+        token_identifier = f"{contract_principal}::{symbol}"
+        self._token_identifiers[contract_principal] = token_identifier
+        return token_identifier
+
+    def _get_agents_for_addresses(
+        self, addresses: List[str]
+    ) -> Tuple[Dict[str, Agent], Dict[UUID, Wallet]]:
+        """Agents by account contract for ``addresses``, and their wallets by agent id."""
+        # Agent accounts are contracts; standard principals cannot match
+        contracts = [address for address in addresses if "." in address]
+        agents: Dict[str, Agent] = {}
+        for start in range(0, len(contracts), AGENT_LOOKUP_CHUNK):
+            chunk = contracts[start : start + AGENT_LOOKUP_CHUNK]
+            for agent in backend.list_agents(
+                filters=AgentFilter(account_contracts=chunk)
+            ):
+                agents.setdefault(agent.account_contract, agent)
+
+        wallets: Dict[UUID, Wallet] = {}
+        agent_ids = [agent.id for agent in agents.values()]
+        for start in range(0, len(agent_ids), AGENT_LOOKUP_CHUNK):
+            chunk = agent_ids[start : start + AGENT_LOOKUP_CHUNK]
+            for wallet in backend.list_wallets_n(
+                filters=WalletFilterN(agent_ids=chunk)
+            ):
+                wallets.setdefault(wallet.agent_id, wallet)
+        return agents, wallets
+
+    def _is_up_to_date(self, token, now: float) -> bool:
+        """Whether ``token`` had no FT activity since its last sync.
+
+        Tokens are still resynced every full resync interval, and once per
+        process, in case the chainhook missed a block.
+        """
+        synced_height = token.holders_synced_height
+        if synced_height is None:
+            return False
+        if (token.holders_activity_height or 0) > synced_height:
+            return False
+        last_synced = self._last_synced.get(token.id)
+        return (
+            last_synced is not None
+            and now - last_synced
+            < config.scheduler.dao_token_holders_monitor_full_resync_seconds
+        )
 
     async def _queue_proposal_approval_for_agent(
         self,
@@ -320,298 +433,122 @@ class DaoTokenHoldersMonitorTask(BaseTask[DaoTokenHoldersMonitorResult]):
             return False
 
     async def _sync_token_holders(
-        self, token, result: DaoTokenHoldersMonitorResult
-    ) -> None:
-        """Sync holders for a specific token."""
-        try:
-            token_identifier = self._parse_token_identifier(token)
-            if not token_identifier:
-                error_msg = "Could not parse token identifier for token"
-                logger.error(
-                    error_msg,
-                    extra={"token_id": token.id},
-                )
-                result.errors.append(error_msg)
-                return
+        self,
+        token,
+        result: DaoTokenHoldersMonitorResult,
+        sync_height: Optional[int] = None,
+    ) -> bool:
+        """Sync holders for a specific token.
 
-            logger.debug(
-                "Syncing holders for token",
-                extra={
-                    "token_name": token.name,
-                    "token_identifier": token_identifier,
-                },
+        Fetches the token's holders, diffs them against the holders table and
+        writes only the changed rows. Returns True if the token was fully
+        synced; its synced height is then set to ``sync_height``.
+        """
+        token_identifier = await self._get_token_identifier(token)
+        if not token_identifier:
+            error_msg = "Could not parse token identifier for token"
+            logger.error(
+                error_msg,
+                extra={"token_id": token.id},
             )
+            result.errors.append(error_msg)
+            return False
 
-            # Get all current holders from Hiro API (with pagination)
-            try:
-                api_holders_response = self.hiro_api.get_all_token_holders(
-                    token_identifier
-                )
-                logger.debug(
-                    "API response for token",
-                    extra={
-                        "token_identifier": token_identifier,
-                        "response": str(api_holders_response),
-                    },
-                )
-            except Exception as e:
-                error_msg = "Error fetching holders from API for token"
-                logger.error(
-                    error_msg,
-                    extra={
-                        "token_identifier": token_identifier,
-                        "error": str(e),
-                    },
-                )
-                result.errors.append(error_msg)
-                return
-
-            # Parse API response
-            api_holders = []
-            if (
-                isinstance(api_holders_response, dict)
-                and "results" in api_holders_response
-            ):
-                api_holders = api_holders_response["results"]
-            elif isinstance(api_holders_response, list):
-                api_holders = api_holders_response
-            else:
-                logger.warning(
-                    "Unexpected API response format for token",
-                    extra={
-                        "token_identifier": token_identifier,
-                    },
-                )
-                return
+        logger.debug(
+            "Syncing holders for token",
+            extra={
+                "token_name": token.name,
+                "token_identifier": token_identifier,
+            },
+        )
 
-            logger.debug(
-                "Found holders from API for token",
+        # Get all current holders from Hiro API, pages fetched concurrently
+        try:
+            api_holders_response = await self.hiro_api.aget_all_token_holders(
+                token_identifier,
+                page_size=HOLDERS_PAGE_SIZE,
+                max_concurrency=HOLDERS_PAGE_CONCURRENCY,
+            )
+        except Exception as e:
+            error_msg = "Error fetching holders from API for token"
+            logger.error(
+                error_msg,
                 extra={
-                    "holder_count": len(api_holders),
-                    "token_name": token.name,
+                    "token_identifier": token_identifier,
+                    "error": str(e),
                 },
             )
+            result.errors.append(error_msg)
+            return False
 
-            # Get current holders from database
-            db_holders = backend.list_holders(HolderFilter(token_id=token.id))
-            logger.debug(
-                "Found existing holders in database for token",
+        # Parse API response
+        if isinstance(api_holders_response, dict) and "results" in api_holders_response:
+            api_holders = api_holders_response["results"]
+        elif isinstance(api_holders_response, list):
+            api_holders = api_holders_response
+        else:
+            logger.warning(
+                "Unexpected API response format for token",
                 extra={
-                    "holder_count": len(db_holders),
-                    "token_name": token.name,
+                    "token_identifier": token_identifier,
                 },
             )
+            return False
 
-            # Create lookup maps by address+token_id (composite key for matching)
-            # This allows the same address to hold tokens for multiple DAOs
-            db_holders_by_address_token = {
-                (holder.address, holder.token_id): holder for holder in db_holders
-            }
-            api_holders_by_contract = {}
-
-            # Process API holders
-            for api_holder in api_holders:
-                try:
-                    # Parse holder data from Hiro API response format
-                    address = api_holder.get("address")
-                    balance = api_holder.get("balance", "0")
-
-                    if not address:
-                        logger.warning(
-                            "No address found in API holder data",
-                            extra={
-                                "api_holder": str(api_holder),
-                            },
-                        )
-                        continue
-
-                    if not balance:
-                        logger.warning(
-                            "No balance found for address, defaulting to 0",
-                            extra={
-                                "address": address,
-                            },
-                        )
-                        balance = "0"
-
-                    api_holders_by_contract[address] = balance
-
-                    # Get existing agent and wallet for this account_contract
-                    agent, wallet = self._get_agent_for_contract(address)
-
-                    # Check if we already have this holder in the database (by address+token_id)
-                    holder_key = (address, token.id)
-                    if holder_key in db_holders_by_address_token:
-                        # Update existing holder
-                        existing_holder = db_holders_by_address_token[holder_key]
-                        needs_update = False
-                        should_trigger_approval = False
+        balances: Dict[str, str] = {}
+        for api_holder in api_holders:
+            address = api_holder.get("address")
+            if not address:
+                logger.warning(
+                    "No address found in API holder data",
+                    extra={
+                        "api_holder": str(api_holder),
+                    },
+                )
+                continue
+            balances[address] = str(api_holder.get("balance") or "0")
 
-                        update_data = HolderBase(
-                            amount=str(balance),
-                            updated_at=datetime.now(),
-                            address=address,
-                        )
+        db_holders = backend.list_holders(HolderFilter(token_id=token.id))
+        agents, wallets = self._get_agents_for_addresses(list(balances))
+        changes = diff_holders(
+            token, balances, db_holders, agents, wallets, datetime.now()
+        )
+        logger.debug(
+            "Diffed holders for token",
+            extra={
+                "token_name": token.name,
+                "api_holders": len(balances),
+                "db_holders": len(db_holders),
+                "creates": len(changes.creates),
+                "updates": len(changes.updates),
+                "deletes": len(changes.deletes),
+            },
+        )
 
-                        # Check if we need to update agent_id
-                        if agent and existing_holder.agent_id != agent.id:
-                            update_data.agent_id = agent.id
-                            needs_update = True
-                        elif not agent and existing_holder.agent_id is not None:
-                            update_data.agent_id = None
-                            needs_update = True
-
-                        # Check if we need to update wallet_id
-                        if wallet and existing_holder.wallet_id != wallet.id:
-                            update_data.wallet_id = wallet.id
-                            needs_update = True
-                        elif not wallet and existing_holder.wallet_id is not None:
-                            update_data.wallet_id = None
-                            needs_update = True
-
-                        # Check if amount changed and if this triggers first meaningful balance
-                        old_balance = float(existing_holder.amount or "0")
-                        new_balance = float(balance)
-
-                        if existing_holder.amount != str(balance):
-                            needs_update = True
-
-                            # Check if this is a first meaningful token receipt for an agent
-                            if agent and old_balance == 0 and new_balance > 0:
-                                should_trigger_approval = True
-                                logger.info(
-                                    "First meaningful token receipt detected for agent during sync - will trigger proposal approval",
-                                    extra={
-                                        "agent_id": agent.id,
-                                    },
-                                )
-
-                        # Check if address changed
-                        if existing_holder.address != address:
-                            needs_update = True
-
-                        if needs_update:
-                            logger.info(
-                                "Updating holder for token",
-                                extra={
-                                    "address": address,
-                                    "token_name": token.name,
-                                    "amount_old": existing_holder.amount,
-                                    "amount_new": balance,
-                                    "agent_id_old": existing_holder.agent_id,
-                                    "agent_id_new": agent.id if agent else None,
-                                    "wallet_id_old": existing_holder.wallet_id,
-                                    "wallet_id_new": wallet.id if wallet else None,
-                                },
-                            )
-                            backend.update_holder(existing_holder.id, update_data)
-                            result.holders_updated += 1
-
-                            # Queue proposal approval if this is a first-time meaningful receipt
-                            if should_trigger_approval:
-                                approval_queued = (
-                                    await self._queue_proposal_approval_for_agent(
-                                        agent, wallet, token.dao_id, token
-                                    )
-                                )
-                                if approval_queued:
-                                    result.approvals_queued += 1
-                    else:
-                        logger.info(
-                            "Creating new holder for token",
-                            extra={
-                                "address": address,
-                                "token_name": token.name,
-                                "balance": balance,
-                                "agent_id": agent.id if agent else None,
-                                "wallet_id": wallet.id if wallet else None,
-                            },
-                        )
-                        holder_create = HolderCreate(
-                            agent_id=agent.id if agent else None,
-                            wallet_id=wallet.id if wallet else None,
-                            token_id=token.id,
-                            dao_id=token.dao_id,
-                            amount=str(balance),
-                            updated_at=datetime.now(),
-                            address=address,
-                        )
-                        backend.create_holder(holder_create)
-                        result.holders_created += 1
-
-                        # Queue proposal approval for new agent holders with positive balance
-                        if agent and float(balance) > 0:
-                            logger.info(
-                                "First token receipt detected for agent during sync - will trigger proposal approval",
-                                extra={
-                                    "agent_id": agent.id,
-                                },
-                            )
-                            approval_queued = (
-                                await self._queue_proposal_approval_for_agent(
-                                    agent, wallet, token.dao_id, token
-                                )
-                            )
-                            if approval_queued:
-                                result.approvals_queued += 1
-
-                except Exception as e:
-                    error_msg = "Error processing API holder"
-                    logger.error(
-                        error_msg,
-                        extra={
-                            "api_holder": str(api_holder),
-                            "error": str(e),
-                        },
-                    )
-                    result.errors.append(error_msg)
-
-            # Check for holders that are no longer in the API response (removed holders)
-            # Only check holders for the current token being processed
-            for db_holder in db_holders:
-                try:
-                    # Only process holders for the current token
-                    if db_holder.token_id != token.id:
-                        continue
-
-                    # Use address for matching since that's what we get from the API
-                    if (
-                        db_holder.address
-                        and db_holder.address not in api_holders_by_contract
-                    ):
-                        # This holder is no longer holding tokens for this specific token, remove from database
-                        logger.info(
-                            "Removing holder for token (no longer holds tokens)",
-                            extra={
-                                "address": db_holder.address,
-                                "token_name": token.name,
-                            },
-                        )
-                        backend.delete_holder(db_holder.id)
-                        result.holders_removed += 1
-                except Exception as e:
-                    logger.error(
-                        "Error processing holder",
-                        extra={
-                            "holder_id": db_holder.id,
-                            "address": db_holder.address,
-                            "token_name": token.name,
-                            "error": str(e),
-                        },
-                    )
-                    continue
+        if changes.creates:
+            backend.create_holders(changes.creates)
+            result.holders_created += len(changes.creates)
+        if changes.updates:
+            backend.upsert_holders(changes.updates)
+            result.holders_updated += len(changes.updates)
+        if changes.deletes:
+            result.holders_removed += backend.delete_holders(
+                [holder.id for holder in changes.deletes]
+            )
 
-        except Exception as e:
-            error_msg = "Error syncing holders for token"
-            logger.error(
-                error_msg,
-                extra={
-                    "token_id": token.id,
-                    "error": str(e),
-                },
-                exc_info=True,
+        for agent, wallet in changes.approvals:
+            logger.info(
+                "First token receipt detected for agent during sync - will trigger proposal approval",
+                extra={"agent_id": agent.id},
             )
-            result.errors.append(error_msg)
+            if await self._queue_proposal_approval_for_agent(
+                agent, wallet, token.dao_id, token
+            ):
+                result.approvals_queued += 1
+
+        if sync_height is not None and sync_height != token.holders_synced_height:
+            backend.update_token(token.id, TokenBase(holders_synced_height=sync_height))
+        return True
 
     async def _execute_impl(
         self, context: JobContext
@@ -639,35 +576,60 @@ class DaoTokenHoldersMonitorTask(BaseTask[DaoTokenHoldersMonitorResult]):
                 result.message = "No tokens found to process"
                 return [result]
 
-            # Process each token
+            # Read the chain height before fetching, so activity after it is
+            # picked up by the next run
+            chain_state = backend.get_latest_chain_state(network=config.network.network)
+            sync_height = (
+                max(0, chain_state.block_height - SYNC_HEIGHT_MARGIN)
+                if chain_state and chain_state.block_height is not None
+                else None
+            )
+
+            now = time.monotonic()
+            tokens = []
             for token in all_tokens:
-                try:
-                    logger.info(
-                        "Processing token",
-                        extra={
-                            "token_name": token.name,
-                            "token_id": token.id,
-                        },
-                    )
-                    await self._sync_token_holders(token, result)
-                    result.tokens_processed += 1
-
-                except Exception as e:
-                    error_msg = "Error processing token"
-                    logger.error(
-                        error_msg,
-                        extra={
-                            "token_id": token.id,
-                            "error": str(e),
-                        },
-                        exc_info=True,
-                    )
-                    result.errors.append(error_msg)
-                    # Continue processing other tokens even if one fails
+                if self._is_up_to_date(token, now):
+                    result.tokens_skipped += 1
+                else:
+                    tokens.append(token)
+
+            semaphore = asyncio.Semaphore(
+                max(1, config.scheduler.dao_token_holders_monitor_concurrency)
+            )
+
+            async def process(token) -> None:
+                async with semaphore:
+                    try:
+                        logger.info(
+                            "Processing token",
+                            extra={
+                                "token_name": token.name,
+                                "token_id": token.id,
+                            },
+                        )
+                        if await self._sync_token_holders(token, result, sync_height):
+                            self._last_synced[token.id] = now
+                        result.tokens_processed += 1
+
+                    except Exception as e:
+                        error_msg = "Error processing token"
+                        logger.error(
+                            error_msg,
+                            extra={
+                                "token_id": token.id,
+                                "error": str(e),
+                            },
+                            exc_info=True,
+                        )
+                        result.errors.append(error_msg)
+                        # Continue processing other tokens even if one fails
+
+            await asyncio.gather(*(process(token) for token in tokens))
 
             # Update result message with summary
             summary = (
-                f"Processed {result.tokens_processed} tokens. "
+                f"Processed {result.tokens_processed} tokens, skipped "
+                f"{result.tokens_skipped} unchanged. "
                 f"Created {result.holders_created}, updated {result.holders_updated}, "
                 f"removed {result.holders_removed} holders. "
                 f"Queued {result.approvals_queued} proposal approvals."
@@ -7,7 +7,6 @@ from app.backend.factory import backend
 from app.backend.models import (
     QueueMessage,
     QueueMessageBase,
-    QueueMessageFilter,
     QueueMessageType,
 )
 from app.config import config
@@ -20,6 +19,7 @@ from app.services.infrastructure.job_management.base import (
     RunnerResult,
 )
 from app.services.infrastructure.job_management.decorators import JobPriority, job
+from app.services.infrastructure.job_management.queue_claims import QueueLease
 from app.tools.wallet import WalletSendSTX
 
 logger = configure_logger(__name__)
@@ -59,6 +59,7 @@ class STXTransferTask(BaseTask[STXTransferResult]):
 
     def __init__(self, config: Optional[RunnerConfig] = None):
         super().__init__(config)
+        self._queue_lease = QueueLease(self.QUEUE_TYPE)
 
     async def _validate_config(self, context: JobContext) -> bool:
         """Validate task configuration."""
@@ -203,7 +204,7 @@ class STXTransferTask(BaseTask[STXTransferResult]):
                 # Use BunScriptRunner directly for STX transfer wallet transfers
                 from app.tools.bun import BunScriptRunner
 
-                transfer_result = BunScriptRunner.bun_run_with_seed_phrase(
+                transfer_result = await BunScriptRunner.abun_run_with_seed_phrase(
                     config.stx_transfer_wallet.seed_phrase,
                     "stacks-wallet",
                     "transfer-my-stx.ts",
@@ -278,9 +279,8 @@ class STXTransferTask(BaseTask[STXTransferResult]):
             return result
 
     async def get_pending_messages(self) -> List[QueueMessage]:
-        """Get all unprocessed messages from the queue."""
-        filters = QueueMessageFilter(type=self.QUEUE_TYPE, is_processed=False)
-        messages = backend.list_queue_messages(filters=filters)
+        """Claim unprocessed messages from the queue for this worker."""
+        messages = await self._queue_lease.claim()
 
         # Log messages for debugging
         for message in messages:
@@ -331,6 +331,7 @@ class STXTransferTask(BaseTask[STXTransferResult]):
         self, context: JobContext, results: List[STXTransferResult]
     ) -> None:
         """Cleanup after task execution."""
+        await self._queue_lease.release()
         logger.debug("STX transfer task cleanup completed")
 
     async def _execute_impl(self, context: JobContext) -> List[STXTransferResult]:
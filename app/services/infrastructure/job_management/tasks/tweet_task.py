@@ -13,7 +13,6 @@ from app.backend.factory import backend
 from app.backend.models import (
     QueueMessage,
     QueueMessageBase,
-    QueueMessageFilter,
     QueueMessageType,
     XCredsFilter,
 )
@@ -34,6 +33,7 @@ from app.services.infrastructure.job_management.decorators import (
     JobRegistry,
     job,
 )
+from app.services.infrastructure.job_management.queue_claims import QueueLease
 
 logger = configure_logger(__name__)
 
@@ -73,6 +73,7 @@ class TweetTask(BaseTask[TweetProcessingResult]):
         self._pending_messages: Optional[List[QueueMessage]] = None
         self._twitter_services: dict[UUID, TwitterService] = {}
         self._rate_limited_this_run = False
+        self._queue_lease = QueueLease(QueueMessageType.get_or_create("tweet"))
 
     async def _get_twitter_service(self, dao_id: UUID) -> Optional[TwitterService]:
         """Get or create Twitter service for a DAO with caching."""
@@ -192,12 +193,8 @@ class TweetTask(BaseTask[TweetProcessingResult]):
                 self._pending_messages = []
                 return False
 
-            # Cache pending messages for later use
-            self._pending_messages = backend.list_queue_messages(
-                filters=QueueMessageFilter(
-                    type=QueueMessageType.get_or_create("tweet"), is_processed=False
-                )
-            )
+            # Claim pending messages for this worker and cache them for later use
+            self._pending_messages = await self._queue_lease.claim()
             logger.debug(
                 f"Found {len(self._pending_messages)} unprocessed tweet messages"
             )
@@ -227,6 +224,10 @@ class TweetTask(BaseTask[TweetProcessingResult]):
                 if len(self._pending_messages) >= max_per_run:
                     break
 
+            # Hand the rest back so other workers can pick them up
+            selected_ids = {msg.id for msg in self._pending_messages}
+            await self._queue_lease.release(self._queue_lease.held - selected_ids)
+
             num_daos_selected = len({msg.dao_id for msg in self._pending_messages})
             logger.info(
                 f"Limited to {len(self._pending_messages)} valid messages across {num_daos_selected} DAOs (max: {max_per_run})"
@@ -742,8 +743,9 @@ class TweetTask(BaseTask[TweetProcessingResult]):
         self, context: JobContext, results: List[TweetProcessingResult]
     ) -> None:
         """Cleanup after task execution."""
-        # Clear cached pending messages
+        # Clear cached pending messages and release any still claimed
         self._pending_messages = None
+        await self._queue_lease.release()
 
         # Reset rate limit flag for next run
         self._rate_limited_this_run = False
@@ -7,6 +7,7 @@ including blockchain operations, chainhook management, and token queries.
 from .hiro_api import HiroApi
 from .models import BlockTransactionsResponse, HiroApiInfo
 from .platform_api import PlatformApi
+from .rate_limiter import HiroRateLimiter
 from .utils import (
     ChainHookBuilder,
     ChainType,
@@ -20,6 +21,7 @@ from .utils import (
 __all__ = [
     "HiroApi",
     "PlatformApi",
+    "HiroRateLimiter",
     "ChainHookBuilder",
     "ChainType",
     "EventScope",
@@ -2,7 +2,7 @@
 
 import time
 from functools import wraps
-from typing import Any, Callable, ClassVar, Dict, List, Mapping, Optional
+from typing import Any, Callable, ClassVar, Dict, Mapping, Optional
 
 import aiohttp
 import httpx
@@ -11,6 +11,7 @@ from cachetools import TTLCache
 from app.config import config
 from app.lib.logger import configure_logger
 
+from .rate_limiter import HiroRateLimiter
 from .utils import HiroApiError, HiroApiRateLimitError, HiroApiTimeoutError
 
 logger = configure_logger(__name__)
@@ -23,11 +24,8 @@ class BaseHiroApi:
     DEFAULT_SECOND_LIMIT: ClassVar[int] = 20
     DEFAULT_MINUTE_LIMIT: ClassVar[int] = 50
 
-    # Rate limit tracking (shared across all instances)
-    _second_limit: ClassVar[int] = DEFAULT_SECOND_LIMIT
-    _minute_limit: ClassVar[int] = DEFAULT_MINUTE_LIMIT
-    _second_requests: ClassVar[List[float]] = []
-    _minute_requests: ClassVar[List[float]] = []
+    # Rate limiters (one per API class, shared across all of its instances)
+    _rate_limiters: ClassVar[Dict[type, HiroRateLimiter]] = {}
 
     # Retry settings
     MAX_RETRIES = 3
@@ -48,26 +46,30 @@ class BaseHiroApi:
         self._session: Optional[aiohttp.ClientSession] = None
         logger.info("Hiro API client initialized", extra={"base_url": self.base_url})
 
+    @classmethod
+    def _rate_limiter(cls) -> HiroRateLimiter:
+        """Get the limiter shared by every instance of this API class."""
+        limiter = BaseHiroApi._rate_limiters.get(cls)
+        if limiter is None:
+            limiter = BaseHiroApi._rate_limiters.setdefault(
+                cls,
+                HiroRateLimiter(cls.DEFAULT_SECOND_LIMIT, cls.DEFAULT_MINUTE_LIMIT),
+            )
+        return limiter
+
+    @classmethod
+    def get_rate_limit_stats(cls) -> Dict[str, Any]:
+        """Get queue depth and wait-time metrics for this API's rate limiter."""
+        return cls._rate_limiter().get_stats()
+
     def _update_rate_limits(self, headers: Mapping[str, str]) -> None:
         """Update rate limit settings from response headers.
 
         Args:
             headers: Response headers containing rate limit information
         """
-        # Update limits if headers are present
-        updated_limits = {}
-        if "x-ratelimit-limit-second" in headers:
-            old_limit = self.__class__._second_limit
-            self.__class__._second_limit = int(headers["x-ratelimit-limit-second"])
-            if old_limit != self.__class__._second_limit:
-                updated_limits["second"] = self.__class__._second_limit
-
-        if "x-ratelimit-limit-minute" in headers:
-            old_limit = self.__class__._minute_limit
-            self.__class__._minute_limit = int(headers["x-ratelimit-limit-minute"])
-            if old_limit != self.__class__._minute_limit:
-                updated_limits["minute"] = self.__class__._minute_limit
-
+        limiter = self._rate_limiter()
+        updated_limits = limiter.update_from_headers(headers)
         if updated_limits:
             logger.info("Rate limits updated", extra={"limits": updated_limits})
 
@@ -81,13 +83,13 @@ class BaseHiroApi:
         if remaining:
             # Only log if we're getting close to limits (< 20% remaining)
             second_pct = (
-                remaining.get("second", 0) / self.__class__._second_limit
-                if self.__class__._second_limit > 0
+                remaining.get("second", 0) / limiter.second_limit
+                if limiter.second_limit > 0
                 else 1
             )
             minute_pct = (
-                remaining.get("minute", 0) / self.__class__._minute_limit
-                if self.__class__._minute_limit > 0
+                remaining.get("minute", 0) / limiter.minute_limit
+                if limiter.minute_limit > 0
                 else 1
             )
 
@@ -97,62 +99,19 @@ class BaseHiroApi:
                     extra={
                         "remaining": remaining,
                         "limits": {
-                            "second": self.__class__._second_limit,
-                            "minute": self.__class__._minute_limit,
+                            "second": limiter.second_limit,
+                            "minute": limiter.minute_limit,
                         },
                     },
                 )
 
     def _rate_limit(self) -> None:
-        """Implement rate limiting for both second and minute windows."""
-        current_time = time.time()
-
-        # Clean up expired requests from tracking windows
-        self.__class__._second_requests = [
-            t for t in self.__class__._second_requests if current_time - t < 1.0
-        ]
-        self.__class__._minute_requests = [
-            t for t in self.__class__._minute_requests if current_time - t < 60.0
-        ]
-
-        # Check and enforce rate limits
-        second_count = len(self.__class__._second_requests)
-        minute_count = len(self.__class__._minute_requests)
-
-        # Check second limit
-        if second_count >= self.__class__._second_limit:
-            sleep_time = self.__class__._second_requests[0] + 1.0 - current_time
-            if sleep_time > 0:
-                logger.warning(
-                    "Rate limit reached, waiting before next request",
-                    extra={
-                        "rate_limit_type": "second",
-                        "current_count": second_count,
-                        "limit": self.__class__._second_limit,
-                        "wait_time_seconds": round(sleep_time, 2),
-                    },
-                )
-                time.sleep(sleep_time)
-                current_time = time.time()
+        """Wait for a request slot in both the second and minute windows."""
+        self._rate_limiter().acquire_blocking()
 
-        # Check minute limit
-        if minute_count >= self.__class__._minute_limit:
-            sleep_time = self.__class__._minute_requests[0] + 60.0 - current_time
-            if sleep_time > 0:
-                logger.warning(
-                    "Rate limit reached, waiting before next request",
-                    extra={
-                        "rate_limit_type": "minute",
-                        "current_count": minute_count,
-                        "limit": self.__class__._minute_limit,
-                        "wait_time_seconds": round(sleep_time, 2),
-                    },
-                )
-                time.sleep(sleep_time)
-
-        # Record the new request
-        self.__class__._second_requests.append(time.time())
-        self.__class__._minute_requests.append(time.time())
+    async def _arate_limit(self) -> None:
+        """Async version of _rate_limit; yields to the event loop while waiting."""
+        await self._rate_limiter().acquire()
 
     @staticmethod
     def _retry_on_error(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -296,7 +255,7 @@ class BaseHiroApi:
             self._session = aiohttp.ClientSession()
 
         try:
-            self._rate_limit()
+            await self._arate_limit()
             url = f"{self.base_url}{endpoint}"
             headers = headers or {}
 
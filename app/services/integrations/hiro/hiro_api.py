@@ -1,7 +1,8 @@
 """Hiro API client for blockchain data queries and operations."""
 
+import asyncio
 import httpx
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from app.config import config
 from app.lib.logger import configure_logger
@@ -138,13 +139,17 @@ class HiroApi(BaseHiroApi):
         )
 
     async def aget_all_token_holders(
-        self, token: str, page_size: int = 20
+        self, token: str, page_size: int = 20, max_concurrency: int = 4
     ) -> Dict[str, Any]:
-        """Async version to get all token holders by paginating through results.
+        """Async version to get all token holders, fetching pages concurrently.
+
+        The first page gives the total; the remaining pages are then fetched
+        at most ``max_concurrency`` at a time and combined in offset order.
 
         Args:
             token: Token identifier (contract principal or symbol)
             page_size: Number of holders per page request (default: 20)
+            max_concurrency: Most page requests in flight at once (default: 4)
 
         Returns:
             Combined response with all holders
@@ -159,30 +164,32 @@ class HiroApi(BaseHiroApi):
         if total_holders <= page_size:
             return first_page
 
-        # Initialize with first page results
-        all_holders = first_page.get("results", []).copy()
-
-        # Paginate through the rest
-        remaining = total_holders - page_size
-        offset = page_size
-
-        while remaining > 0:
-            current_limit = min(page_size, remaining)
-            logger.debug(
-                "Async fetching %d more token holders with offset %d",
-                current_limit,
-                offset,
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def fetch_page(offset: int) -> List[Dict[str, Any]]:
+            current_limit = min(page_size, total_holders - offset)
+            async with semaphore:
+                logger.debug(
+                    "Async fetching %d more token holders with offset %d",
+                    current_limit,
+                    offset,
+                )
+                page = await self.aget_token_holders(
+                    token, limit=current_limit, offset=offset
+                )
+            return page.get("results", [])
+
+        pages = await asyncio.gather(
+            *(
+                fetch_page(offset)
+                for offset in range(page_size, total_holders, page_size)
             )
+        )
 
-            page = await self.aget_token_holders(
-                token, limit=current_limit, offset=offset
-            )
-            page_results = page.get("results", [])
+        all_holders = first_page.get("results", []).copy()
+        for page_results in pages:
             all_holders.extend(page_results)
 
-            offset += current_limit
-            remaining -= current_limit
-
         # Create combined response
         return {
             "total_supply": first_page.get("total_supply"),
@@ -0,0 +1,170 @@
+"""Process-wide token-bucket rate limiter for the Hiro API."""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+from app.lib.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``capacity / period`` tokens per second.
+
+    Tokens may go negative: a caller that finds the bucket empty still takes
+    its token and is told how long to wait, so waiters are served in arrival
+    order instead of racing each other when the bucket refills.
+    """
+
+    def __init__(self, capacity: int, period: float):
+        self.capacity = capacity
+        self.period = period
+        self.tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / self.period
+
+    def refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+
+    def reserve(self) -> float:
+        """Take one token and return the seconds until it is actually available."""
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def set_capacity(self, capacity: int) -> None:
+        if capacity > 0:
+            self.capacity = capacity
+            self.tokens = min(self.tokens, capacity)
+
+    def clamp(self, remaining: int) -> None:
+        """Never believe we have more budget than the server says is left."""
+        self.tokens = min(self.tokens, remaining)
+
+
+class HiroRateLimiter:
+    """Per-second and per-minute budgets shared by every Hiro client in the process.
+
+    Async callers ``await acquire()`` and yield to the event loop while they
+    wait; sync callers use ``acquire_blocking()``. Limits and remaining
+    budget are corrected from the ``x-ratelimit-*`` response headers.
+    """
+
+    def __init__(self, second_limit: int, minute_limit: int):
+        self._lock = threading.Lock()
+        self._second = TokenBucket(second_limit, 1.0)
+        self._minute = TokenBucket(minute_limit, 60.0)
+        self._waiting = 0
+        self._max_waiting = 0
+        self._acquired = 0
+        self._delayed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def second_limit(self) -> int:
+        return self._second.capacity
+
+    @property
+    def minute_limit(self) -> int:
+        return self._minute.capacity
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._second.refill(now)
+            self._minute.refill(now)
+            wait = max(self._second.reserve(), self._minute.reserve())
+            self._acquired += 1
+            if wait > 0:
+                self._delayed += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+                self._waiting += 1
+                self._max_waiting = max(self._max_waiting, self._waiting)
+            return wait
+
+    def _done_waiting(self) -> None:
+        with self._lock:
+            self._waiting -= 1
+
+    def _log_wait(self, wait: float) -> None:
+        logger.warning(
+            "Rate limit reached, waiting before next request",
+            extra={
+                "wait_time_seconds": round(wait, 2),
+                "queue_depth": self._waiting,
+                "limits": {"second": self.second_limit, "minute": self.minute_limit},
+            },
+        )
+
+    async def acquire(self) -> None:
+        """Wait for a request slot without blocking the event loop."""
+        wait = self._reserve()
+        if wait <= 0:
+            return
+        self._log_wait(wait)
+        try:
+            await asyncio.sleep(wait)
+        finally:
+            self._done_waiting()
+
+    def acquire_blocking(self) -> None:
+        """Wait for a request slot, sleeping the current thread."""
+        wait = self._reserve()
+        if wait <= 0:
+            return
+        self._log_wait(wait)
+        try:
+            time.sleep(wait)
+        finally:
+            self._done_waiting()
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> Dict[str, int]:
+        """Apply ``x-ratelimit-*`` headers; returns the limits that changed."""
+        updated: Dict[str, int] = {}
+        with self._lock:
+            now = time.monotonic()
+            for window, bucket in (("second", self._second), ("minute", self._minute)):
+                limit = _int_header(headers, f"x-ratelimit-limit-{window}")
+                if limit is not None and limit != bucket.capacity:
+                    bucket.refill(now)
+                    bucket.set_capacity(limit)
+                    updated[window] = limit
+                remaining = _int_header(headers, f"x-ratelimit-remaining-{window}")
+                if remaining is not None:
+                    bucket.refill(now)
+                    bucket.clamp(remaining)
+        return updated
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth and wait-time metrics for monitoring."""
+        with self._lock:
+            return {
+                "limits": {"second": self.second_limit, "minute": self.minute_limit},
+                "queue_depth": self._waiting,
+                "max_queue_depth": self._max_waiting,
+                "total_requests": self._acquired,
+                "delayed_requests": self._delayed,
+                "total_wait_seconds": round(self._total_wait, 3),
+                "avg_wait_seconds": round(self._total_wait / self._delayed, 3)
+                if self._delayed
+                else 0.0,
+                "max_wait_seconds": round(self._max_wait, 3),
+            }
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> Optional[int]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
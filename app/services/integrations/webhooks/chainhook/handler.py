@@ -16,6 +16,9 @@ from app.services.integrations.webhooks.chainhook.handlers.airdrop_ft_handler im
 from app.services.integrations.webhooks.chainhook.handlers.airdrop_stx_handler import (
     AirdropSTXHandler,
 )
+from app.services.integrations.webhooks.chainhook.handlers.base import (
+    TransactionKey,
+)
 from app.services.integrations.webhooks.chainhook.handlers.block_state_handler import (
     BlockStateHandler,
 )
@@ -40,7 +43,11 @@ from app.services.integrations.webhooks.chainhook.handlers.sell_event_handler im
 from app.services.integrations.webhooks.chainhook.handlers.stx_event_handler import (
     STXEventHandler,
 )
+from app.services.integrations.webhooks.chainhook.handlers.token_activity_handler import (
+    TokenActivityHandler,
+)
 from app.services.integrations.webhooks.chainhook.models import ChainHookData
+from app.services.integrations.webhooks.chainhook.router import TransactionRouter
 
 
 class ChainhookHandler(WebhookHandler):
@@ -73,17 +80,29 @@ class ChainhookHandler(WebhookHandler):
             DAOProposalBurnHeightHandler(),
             DAOVoteHandler(),
             DAOProposalConclusionHandler(),
+            TokenActivityHandler(),
             self.block_state_handler,  # Add to regular handlers list too for post-processing
         ]
+        # Transactions are only offered to handlers whose declared routes match
+        self.router = TransactionRouter(self.handlers)
 
-    async def handle(self, parsed_data: ChainHookData) -> Dict[str, Any]:
+    async def handle(
+        self, parsed_data: ChainHookData, replay: bool = False
+    ) -> Dict[str, Any]:
         """Handle Chainhook webhook data.
 
         Args:
             parsed_data: The parsed webhook data
+            replay: Also hand blocks at or below the recorded chain state to
+                the handlers (ingest log entries, which are delivered at least
+                once); the handlers' own deduplication keeps that idempotent
 
         Returns:
             Dict containing the result of handling the webhook
+
+        Raises:
+            RuntimeError: In replay mode, if a block above the recorded chain
+                state could not be recorded, so the caller can retry it
         """
         try:
             self.logger.info(
@@ -118,18 +137,27 @@ class ChainhookHandler(WebhookHandler):
                 )
 
                 # Additional validation: ensure block is not older than database state
-                if (
-                    current_db_state
+                block_is_old = (
+                    current_db_state is not None
                     and block_height <= current_db_state.block_height
                     and not block_processed_by_state_handler
-                ):
+                )
+                if block_is_old and replay:
+                    self.logger.info(
+                        f"Replaying block {block_height} at or below current DB state "
+                        f"({current_db_state.block_height})."
+                    )
+                elif block_is_old:
                     self.logger.info(
                         f"Block {block_height} is older than or equal to current DB state "
                         f"({current_db_state.block_height}). Skipping processing to prevent duplicate work."
                     )
                     continue  # Skip to the next block
-
-                if not block_processed_by_state_handler:
+                elif not block_processed_by_state_handler and replay:
+                    raise RuntimeError(
+                        f"Chain state was not updated for block {block_height}"
+                    )
+                elif not block_processed_by_state_handler:
                     self.logger.warning(
                         f"Block {block_height} was not processed by BlockStateHandler "
                         f"(failed update or other error). Skipping other handlers for this block."
@@ -157,8 +185,9 @@ class ChainhookHandler(WebhookHandler):
                         f"Processing transaction {transaction.transaction_identifier.hash}"
                     )
 
-                    # Try each handler in turn
-                    for handler in self.handlers:
+                    # Try each candidate handler in turn
+                    key = TransactionKey.from_transaction(transaction)
+                    for handler in self.router.candidates(key):
                         if handler.can_handle_transaction(transaction):
                             self.logger.debug(
                                 f"Using handler {handler.__class__.__name__} for transaction-level processing"
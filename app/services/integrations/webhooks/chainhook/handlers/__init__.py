@@ -36,6 +36,9 @@ from app.services.integrations.webhooks.chainhook.handlers.dao_vote_handler impo
 from app.services.integrations.webhooks.chainhook.handlers.sell_event_handler import (
     SellEventHandler,
 )
+from app.services.integrations.webhooks.chainhook.handlers.token_activity_handler import (
+    TokenActivityHandler,
+)
 
 __all__ = [
     "ChainhookEventHandler",
@@ -49,4 +52,5 @@ __all__ = [
     "DAOVoteHandler",
     "DAOProposalConclusionHandler",
     "BlockStateHandler",
+    "TokenActivityHandler",
 ]
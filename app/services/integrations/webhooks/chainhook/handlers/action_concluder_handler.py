@@ -12,9 +12,12 @@ from app.backend.models import (
     QueueMessageType,
 )
 from app.config import config
+from app.lib.dao_context import dao_context
+from app.lib.proposal_timeline import proposal_timeline
 from app.lib.utils import strip_metadata_section
 from app.services.integrations.webhooks.chainhook.handlers.base import (
     ChainhookEventHandler,
+    TransactionRoute,
 )
 from app.services.integrations.webhooks.chainhook.models import (
     Event,
@@ -30,6 +33,12 @@ class ActionConcluderHandler(ChainhookEventHandler):
     2. Creates appropriate queue messages for further processing (tweets, etc.)
     """
 
+    transaction_routes = (
+        TransactionRoute(
+            kind="ContractCall", methods=frozenset({"conclude-action-proposal"})
+        ),
+    )
+
     def can_handle_transaction(self, transaction: TransactionWithReceipt) -> bool:
         """Check if this handler can handle the given transaction.
 
@@ -196,6 +205,8 @@ class ActionConcluderHandler(ChainhookEventHandler):
         )
 
         updated_proposal = backend.update_proposal(proposal.id, update_data)
+        proposal_timeline.upsert(updated_proposal)
+        dao_context.upsert(updated_proposal)
         return updated_proposal.model_dump() if updated_proposal else None
 
     async def handle_transaction(self, transaction: TransactionWithReceipt) -> None:
@@ -22,10 +22,13 @@ from app.config import config
 from app.services.integrations.webhooks.chainhook.handlers.lottery_utils import (
     LotterySelection,
     QuorumCalculator,
+    WeightedLotterySampler,
     create_wallet_selection_dict,
     extract_wallet_ids_from_selection,
 )
 from app.lib.utils import decode_hex_parameters
+from app.lib.dao_context import dao_context
+from app.lib.proposal_timeline import proposal_timeline
 from app.services.integrations.webhooks.chainhook.handlers.base_proposal_handler import (
     BaseProposalHandler,
 )
@@ -519,7 +522,9 @@ class ActionProposalHandler(BaseProposalHandler):
         seed = hashlib.sha256(bitcoin_block_hash.encode()).hexdigest()
 
         # Conduct weighted lottery until quorum is met or max selections reached
-        remaining_agents = agents_with_tokens.copy()
+        remaining_agents = WeightedLotterySampler(
+            [self._to_safe_int(agent.token_amount) for agent in agents_with_tokens]
+        )
         selected_tokens = Decimal("0")
         quorum_threshold_decimal = Decimal(selection.quorum_threshold)
 
@@ -532,9 +537,9 @@ class ActionProposalHandler(BaseProposalHandler):
             round_number += 1
 
             round_seed = f"{seed}_{round_number}"
-            random.seed(round_seed)
-
-            selected_agent = self._perform_weighted_selection(remaining_agents)
+            selected_agent = agents_with_tokens[
+                remaining_agents.draw(random.Random(round_seed))
+            ]
 
             wallet_dict = create_wallet_selection_dict(
                 selected_agent.wallet_id, selected_agent.token_amount
@@ -563,9 +568,9 @@ class ActionProposalHandler(BaseProposalHandler):
         ):
             round_number += 1
             round_seed = f"{seed}_{round_number}"
-            random.seed(round_seed)
-
-            selected_agent = self._perform_weighted_selection(remaining_agents)
+            selected_agent = agents_with_tokens[
+                remaining_agents.draw(random.Random(round_seed))
+            ]
 
             wallet_dict = create_wallet_selection_dict(
                 selected_agent.wallet_id, selected_agent.token_amount
@@ -588,28 +593,6 @@ class ActionProposalHandler(BaseProposalHandler):
 
         return selection
 
-    def _perform_weighted_selection(
-        self, remaining_agents: List[AgentWithWalletTokenDTO]
-    ) -> AgentWithWalletTokenDTO:
-        """Perform a single round of weighted random agent selection (assumes random is seeded)."""
-        weights = [self._to_safe_int(agent.token_amount) for agent in remaining_agents]
-        if not weights or all(w == 0 for w in weights):
-            self.logger.warning("All remaining weights are zero, using equal weights")
-            weights = [1] * len(remaining_agents)
-
-        total_weight = sum(weights)
-        rand_int = random.randrange(total_weight)
-
-        cumulative = 0
-        selected_idx = 0
-        for idx, weight in enumerate(weights):
-            cumulative += weight
-            if rand_int < cumulative:
-                selected_idx = idx
-                break
-
-        return remaining_agents.pop(selected_idx)
-
     def _ensure_bitcoin_block_data(
         self,
         proposal_id: UUID,
@@ -902,6 +885,8 @@ class ActionProposalHandler(BaseProposalHandler):
                         voting_threshold=proposal_info["voting_threshold"],
                     )
                 )
+                proposal_timeline.upsert(proposal)
+                dao_context.upsert(proposal)
                 self.logger.info(
                     f"Created new {'successful' if tx_success else 'failed'} action proposal record in database: {proposal.id}"
                 )
@@ -987,21 +972,21 @@ class ActionProposalHandler(BaseProposalHandler):
                         f"Creating queue messages for {len(selected_wallet_ids)} selected wallets"
                     )
 
-                    for wallet_id in selected_wallet_ids:
-                        message_data = {
-                            "proposal_id": proposal.id,  # Only pass the proposal UUID
-                        }
-
-                        backend.create_queue_message(
+                    evaluation_type = QueueMessageType.get_or_create(
+                        "dao_proposal_evaluation"
+                    )
+                    backend.create_queue_messages(
+                        [
                             QueueMessageCreate(
-                                type=QueueMessageType.get_or_create(
-                                    "dao_proposal_evaluation"
-                                ),
-                                message=message_data,
+                                type=evaluation_type,
+                                # Only pass the proposal UUID
+                                message={"proposal_id": proposal.id},
                                 dao_id=dao_data["id"],
                                 wallet_id=wallet_id,
                             )
-                        )
+                            for wallet_id in selected_wallet_ids
+                        ]
+                    )
 
                     self.logger.info(
                         f"Created {len(selected_wallet_ids)} evaluation queue messages for proposal {proposal.id}"
@@ -1080,6 +1065,8 @@ class ActionProposalHandler(BaseProposalHandler):
                 updated_proposal = backend.update_proposal(
                     existing_proposal.id, update_data
                 )
+                proposal_timeline.upsert(updated_proposal)
+                dao_context.upsert(updated_proposal)
 
                 self.logger.info(
                     f"Successfully updated action proposal {updated_proposal.id} with chainhook data"
@@ -1192,21 +1179,21 @@ class ActionProposalHandler(BaseProposalHandler):
                         selected_wallet_ids = extract_wallet_ids_from_selection(
                             lottery_selection.selected_wallets
                         )
-                        for wallet_id in selected_wallet_ids:
-                            message_data = {
-                                "proposal_id": updated_proposal.id,  # Only pass the proposal UUID
-                            }
-
-                            backend.create_queue_message(
+                        evaluation_type = QueueMessageType.get_or_create(
+                            "dao_proposal_evaluation"
+                        )
+                        backend.create_queue_messages(
+                            [
                                 QueueMessageCreate(
-                                    type=QueueMessageType.get_or_create(
-                                        "dao_proposal_evaluation"
-                                    ),
-                                    message=message_data,
+                                    type=evaluation_type,
+                                    # Only pass the proposal UUID
+                                    message={"proposal_id": updated_proposal.id},
                                     dao_id=dao_data["id"],
                                     wallet_id=wallet_id,
                                 )
-                            )
+                                for wallet_id in selected_wallet_ids
+                            ]
+                        )
 
                         self.logger.info(
                             f"Created {len(selected_wallet_ids)} evaluation queue messages for updated proposal {updated_proposal.id}"
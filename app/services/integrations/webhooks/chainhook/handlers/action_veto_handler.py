@@ -12,6 +12,7 @@ from app.backend.models import (
 )
 from app.services.integrations.webhooks.chainhook.handlers.base import (
     ChainhookEventHandler,
+    TransactionRoute,
 )
 from app.services.integrations.webhooks.chainhook.models import (
     Event,
@@ -26,6 +27,12 @@ class ActionVetoHandler(ChainhookEventHandler):
     and creates veto records in the database.
     """
 
+    transaction_routes = (
+        TransactionRoute(
+            kind="ContractCall", method_contains=("veto-action-proposal",)
+        ),
+    )
+
     def _find_proposal(
         self, contract_identifier: str, proposal_identifier: int
     ) -> Optional[Dict]:
@@ -7,6 +7,7 @@ from app.backend.factory import backend
 from app.backend.models import AirdropCreate, AirdropFilter
 from app.services.integrations.webhooks.chainhook.handlers.base import (
     ChainhookEventHandler,
+    TransactionRoute,
 )
 from app.services.integrations.webhooks.chainhook.models import (
     Event,
@@ -22,6 +23,14 @@ class AirdropFTHandler(ChainhookEventHandler):
     in the database.
     """
 
+    transaction_routes = (
+        TransactionRoute(
+            kind="ContractCall",
+            methods=frozenset({"send-many"}),
+            contract_contains="faktory",
+        ),
+    )
+
     def can_handle_transaction(self, transaction: TransactionWithReceipt) -> bool:
         """Check if this handler can handle the given transaction.
 
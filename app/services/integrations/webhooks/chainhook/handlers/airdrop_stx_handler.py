@@ -7,6 +7,7 @@ from app.backend.factory import backend
 from app.backend.models import AirdropCreate, AirdropFilter
 from app.services.integrations.webhooks.chainhook.handlers.base import (
     ChainhookEventHandler,
+    TransactionRoute,
 )
 from app.services.integrations.webhooks.chainhook.models import (
     Event,
@@ -31,6 +32,14 @@ class AirdropSTXHandler(ChainhookEventHandler):
     # The specific contract we're monitoring
     TARGET_CONTRACT = "SP3FBR2AGK5H9QBDH3EEN6DF8EK8JY7RX8QJ5SVTE.send-many"
 
+    transaction_routes = (
+        TransactionRoute(
+            kind="ContractCall",
+            methods=frozenset({"send-many"}),
+            contract_contains=TARGET_CONTRACT,
+        ),
+    )
+
     # Business rule constants for basic transaction validation
     MIN_AMOUNT_PER_RECIPIENT = (
         100_000  # 0.1 STX in microSTX (1 STX = 1,000,000 microSTX)
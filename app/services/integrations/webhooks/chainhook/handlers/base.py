@@ -1,7 +1,8 @@
 """Base class for Chainhook event handlers."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, FrozenSet, Optional, Tuple
 
 from app.lib.logger import configure_logger
 from app.services.integrations.webhooks.chainhook.models import (
@@ -11,6 +12,89 @@ from app.services.integrations.webhooks.chainhook.models import (
 )
 
 
+@dataclass(frozen=True, slots=True)
+class TransactionKey:
+    """The fields transaction routing looks at, extracted once per transaction."""
+
+    kind: Optional[str]
+    method: Optional[str]
+    contract_identifier: Optional[str]
+    event_types: FrozenSet[str]
+
+    @classmethod
+    def from_transaction(cls, transaction: TransactionWithReceipt) -> "TransactionKey":
+        metadata = transaction.metadata
+        if isinstance(metadata, dict):
+            kind = metadata.get("kind", {})
+            receipt = metadata.get("receipt")
+        else:
+            kind = metadata.kind
+            receipt = getattr(metadata, "receipt", None)
+
+        if isinstance(kind, dict):
+            kind_type = kind.get("type")
+            data = kind.get("data", {})
+        else:
+            kind_type = getattr(kind, "type", None)
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+
+        # Lazily parsed receipts know their event types without building events
+        event_types = getattr(receipt, "event_types", None)
+        if event_types is None:
+            events = getattr(receipt, "events", None) or []
+            event_types = frozenset([getattr(event, "type", None) for event in events])
+        return cls(
+            kind=kind_type,
+            method=data.get("method"),
+            contract_identifier=data.get("contract_identifier"),
+            event_types=event_types,
+        )
+
+
+@dataclass(frozen=True)
+class TransactionRoute:
+    """A necessary condition for a handler to accept a transaction.
+
+    ChainhookHandler only calls can_handle_transaction on handlers with a
+    matching route, so a route may be looser than that method but never
+    stricter. Unset fields match anything. Substring checks are
+    case-insensitive; exact method names are not.
+
+    Attributes:
+        kind: Transaction kind type, e.g. "ContractCall" or "Coinbase"
+        methods: Exact contract method names
+        method_contains: Substrings of the contract method name
+        contract_contains: Substring of the contract identifier
+        event_type: A receipt event type the transaction must contain
+    """
+
+    kind: Optional[str] = None
+    methods: FrozenSet[str] = frozenset()
+    method_contains: Tuple[str, ...] = ()
+    contract_contains: Optional[str] = None
+    event_type: Optional[str] = None
+
+    def matches(self, key: TransactionKey) -> bool:
+        if self.kind is not None and key.kind != self.kind:
+            return False
+        if self.methods or self.method_contains:
+            method = key.method or ""
+            if method not in self.methods and not any(
+                part.lower() in method.lower() for part in self.method_contains
+            ):
+                return False
+        if self.contract_contains is not None and (
+            self.contract_contains.lower()
+            not in (key.contract_identifier or "").lower()
+        ):
+            return False
+        if self.event_type is not None and self.event_type not in key.event_types:
+            return False
+        return True
+
+
 class ChainhookEventHandler(ABC):
     """Base class for specialized Chainhook event handlers.
 
@@ -23,8 +107,14 @@ class ChainhookEventHandler(ABC):
 
     Most handlers will only need to implement transaction-level handling,
     but some (like BlockStateHandler) may need block-level handling.
+
+    Handlers declare transaction_routes so ChainhookHandler can skip them for
+    transactions they cannot want. None means "always ask"; an empty tuple
+    means the handler never handles transactions.
     """
 
+    transaction_routes: ClassVar[Optional[Tuple[TransactionRoute, ...]]] = None
+
     def __init__(self):
         """Initialize the handler with a logger."""
         self.logger = configure_logger(self.__class__.__name__)
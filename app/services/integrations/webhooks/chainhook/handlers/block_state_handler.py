@@ -20,6 +20,9 @@ class BlockStateHandler(ChainhookEventHandler):
     It tracks the latest block state by processing each block as it arrives.
     """
 
+    # Block-level only: never asked about individual transactions
+    transaction_routes = ()
+
     def __init__(self):
         """Initialize the handler with a logger."""
         super().__init__()
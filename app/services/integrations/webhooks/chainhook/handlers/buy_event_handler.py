@@ -13,9 +13,11 @@ from app.backend.models import (
     TokenFilter,
     WalletFilter,
 )
+from app.lib.address_index import address_index
 from app.lib.logger import configure_logger
 from app.services.integrations.webhooks.chainhook.handlers.base import (
     ChainhookEventHandler,
+    TransactionRoute,
 )
 from app.services.integrations.webhooks.chainhook.models import TransactionWithReceipt
 
@@ -29,6 +31,14 @@ class BuyEventHandler(ChainhookEventHandler):
     3. Any transaction that results in FTTransferEvent events to our wallets or agent accounts
     """
 
+    transaction_routes = (
+        TransactionRoute(
+            kind="ContractCall",
+            method_contains=("buy", "send-many", "transfer", "mint", "airdrop"),
+        ),
+        TransactionRoute(kind="ContractCall", event_type="FTTransferEvent"),
+    )
+
     def __init__(self):
         """Initialize the handler with a logger."""
         super().__init__()
@@ -122,25 +132,29 @@ class BuyEventHandler(ChainhookEventHandler):
 
     def _is_our_wallet_address(self, address: str) -> bool:
         """Check if the given address belongs to one of our wallets."""
-        if not address:
-            return False
-
-        # Check mainnet addresses
-        wallets = backend.list_wallets(WalletFilter(mainnet_address=address))
-        if wallets:
-            return True
-
-        # Check testnet addresses
-        wallets = backend.list_wallets(WalletFilter(testnet_address=address))
-        return bool(wallets)
+        return address_index.is_wallet_address(address)
 
     def _is_our_agent_account(self, address: str) -> bool:
         """Check if the given address is one of our agent account contracts."""
-        if not address:
-            return False
+        return address_index.is_agent_account(address)
+
+    def _get_agent_by_account(self, address: str):
+        """Get our agent with the given account contract, if any."""
+        if not self._is_our_agent_account(address):
+            return None
 
         agents = backend.list_agents(AgentFilter(account_contract=address))
-        return bool(agents)
+        return agents[0] if agents else None
+
+    def _get_wallet_by_address(self, address: str):
+        """Get our wallet with the given mainnet or testnet address, if any."""
+        if not self._is_our_wallet_address(address):
+            return None
+
+        wallets = backend.list_wallets(WalletFilter(mainnet_address=address))
+        if not wallets:
+            wallets = backend.list_wallets(WalletFilter(testnet_address=address))
+        return wallets[0] if wallets else None
 
     async def handle_transaction(self, transaction: TransactionWithReceipt) -> None:
         """Handle token transfer transactions involving our wallets or agent accounts."""
@@ -193,7 +207,20 @@ class BuyEventHandler(ChainhookEventHandler):
             f"asset: {token_asset}"
         )
 
+        # Only transfers TO one of our agent accounts, and purchases by one of
+        # our wallets (sender == recipient), are tracked
+        recipient_agent = self._get_agent_by_account(recipient)
+        wallet = None
+        if not recipient_agent and sender == recipient:
+            wallet = self._get_wallet_by_address(sender)
+        if not recipient_agent and not wallet:
+            self.logger.debug(f"FT transfer in {tx_id} does not involve our accounts")
+            return
+
         # Find the token in our database
+        if not address_index.is_token_contract(token_asset):
+            self.logger.debug(f"Unknown token asset: {token_asset}")
+            return
         tokens = backend.list_tokens(TokenFilter(contract_principal=token_asset))
         if not tokens:
             self.logger.warning(f"Unknown token asset: {token_asset}")
@@ -202,28 +229,15 @@ class BuyEventHandler(ChainhookEventHandler):
         token = tokens[0]
         dao_id = token.dao_id
 
-        # Check if this is a transfer TO one of our agent accounts
-        recipient_agent = None
-        if self._is_our_agent_account(recipient):
-            agents = backend.list_agents(AgentFilter(account_contract=recipient))
-            if agents:
-                recipient_agent = agents[0]
-                self.logger.info(f"Token transfer TO our agent account: {recipient}")
-                await self._handle_agent_account_receipt(
-                    recipient_agent, token, amount, method, dao_id
-                )
-
-        # Check if this is a transfer FROM one of our wallets (existing buy logic)
-        elif self._is_our_wallet_address(sender) and sender == recipient:
+        if recipient_agent:
+            self.logger.info(f"Token transfer TO our agent account: {recipient}")
+            await self._handle_agent_account_receipt(
+                recipient_agent, token, amount, method, dao_id
+            )
+        else:
             # This is the existing buy scenario where our wallet buys tokens
-            wallets = backend.list_wallets(WalletFilter(mainnet_address=sender))
-            if not wallets:
-                wallets = backend.list_wallets(WalletFilter(testnet_address=sender))
-
-            if wallets:
-                wallet = wallets[0]
-                self.logger.info(f"Token purchase by our wallet: {sender}")
-                await self._handle_wallet_purchase(wallet, token, amount, dao_id)
+            self.logger.info(f"Token purchase by our wallet: {sender}")
+            await self._handle_wallet_purchase(wallet, token, amount, dao_id)
 
     async def _handle_agent_account_receipt(
         self, agent, token, amount: str, method: str, dao_id
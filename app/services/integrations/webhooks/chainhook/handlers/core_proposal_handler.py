@@ -9,6 +9,8 @@ from app.backend.models import (
     ProposalFilter,
     ProposalType,
 )
+from app.lib.dao_context import dao_context
+from app.lib.proposal_timeline import proposal_timeline
 from app.services.integrations.webhooks.chainhook.handlers.base_proposal_handler import (
     BaseProposalHandler,
 )
@@ -220,6 +222,8 @@ class CoreProposalHandler(BaseProposalHandler):
                     voting_threshold=proposal_info["voting_threshold"],
                 )
             )
+            proposal_timeline.upsert(proposal)
+            dao_context.upsert(proposal)
             self.logger.info(
                 f"Created new core proposal record in database: {proposal.id}"
             )
@@ -1,20 +1,20 @@
 """Handler for checking burn height against proposal start blocks."""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from uuid import UUID
 
 from app.backend.factory import backend
 from app.backend.models import (
-    ContractStatus,
-    ProposalFilter,
     QueueMessageCreate,
     QueueMessageFilter,
     QueueMessageType,
 )
 from app.config import config
 from app.lib.logger import configure_logger
+from app.lib.proposal_timeline import proposal_timeline
 from app.services.integrations.webhooks.chainhook.handlers.base import (
     ChainhookEventHandler,
+    TransactionRoute,
 )
 from app.services.integrations.webhooks.chainhook.models import (
     ChainHookData,
@@ -31,6 +31,8 @@ class DAOProposalBurnHeightHandler(ChainhookEventHandler):
     for them to evaluate and vote.
     """
 
+    transaction_routes = (TransactionRoute(kind="Coinbase"),)
+
     def __init__(self):
         """Initialize the handler with a logger."""
         super().__init__()
@@ -134,22 +136,36 @@ class DAOProposalBurnHeightHandler(ChainhookEventHandler):
         Returns:
             bool: True if message exists, False otherwise
         """
+        # Checks both processed and unprocessed messages to prevent duplicates
         filters = QueueMessageFilter(
             type=message_type,
             dao_id=dao_id,
-            # Check both processed and unprocessed to prevent duplicates
+            proposal_id=proposal_id,
         )
 
         if wallet_id:
             filters.wallet_id = wallet_id
 
-        existing_messages = backend.list_queue_messages(filters=filters)
+        return bool(backend.list_queue_messages(filters=filters))
+
+    def _queued_vote_wallets(self, proposal_id: UUID, dao_id: UUID) -> Set[UUID]:
+        """Get the wallets that already have a vote message for a proposal.
+
+        Args:
+            proposal_id: The proposal ID
+            dao_id: The DAO ID
 
-        # Check if any existing message is for this specific proposal
-        return any(
-            msg.message and msg.message.get("proposal_id") == str(proposal_id)
-            for msg in existing_messages
+        Returns:
+            Set[UUID]: Wallet IDs of existing (processed or not) vote messages
+        """
+        existing_messages = backend.list_queue_messages(
+            filters=QueueMessageFilter(
+                type=QueueMessageType.get_or_create("dao_proposal_vote"),
+                dao_id=dao_id,
+                proposal_id=proposal_id,
+            )
         )
+        return {msg.wallet_id for msg in existing_messages if msg.wallet_id}
 
     def _discord_message_exists(
         self, proposal_id: UUID, dao_id: UUID, proposal_status: str
@@ -164,30 +180,15 @@ class DAOProposalBurnHeightHandler(ChainhookEventHandler):
         Returns:
             bool: True if message exists, False otherwise
         """
-        filters = QueueMessageFilter(
-            type=QueueMessageType.get_or_create("discord"),
-            dao_id=dao_id,
-            # Check both processed and unprocessed to prevent duplicates
-        )
-
-        existing_messages = backend.list_queue_messages(filters=filters)
-
-        # Create a unique identifier for this specific message type
-        unique_identifier = f"proposal-{proposal_id}-{proposal_status}"
-
-        # Check for existing messages with matching proposal status and proposal reference
-        return any(
-            msg.message
-            and msg.message.get("proposal_status") == proposal_status
-            and (
-                # Check for unique identifier in content
-                unique_identifier in str(msg.message.get("content", ""))
-                or
-                # Fallback: check for proposal ID in content
-                str(proposal_id) in str(msg.message.get("content", ""))
+        existing_messages = backend.list_queue_messages(
+            filters=QueueMessageFilter(
+                type=QueueMessageType.get_or_create("discord"),
+                dao_id=dao_id,
+                proposal_id=proposal_id,
+                proposal_status=proposal_status,
             )
-            for msg in existing_messages
         )
+        return bool(existing_messages)
 
     async def handle_transaction(self, transaction: TransactionWithReceipt) -> None:
         """Handle burn height check transactions.
@@ -222,52 +223,27 @@ class DAOProposalBurnHeightHandler(ChainhookEventHandler):
             # Mark this burn height as being processed
             self._processed_burn_heights.add(burn_height_key)
 
-            # Find proposals that should start at this height
-            proposals = backend.list_proposals(
-                filters=ProposalFilter(
-                    status=ContractStatus.DEPLOYED,
-                )
-            )
-
-            self.logger.info(
-                f"Fetched {len(proposals)} DEPLOYED proposals for burn_height={burn_height}"
-            )
+            # Pop the proposals whose window boundaries this block crosses
+            crossings = proposal_timeline.advance(burn_height)
 
-            # Filter proposals that should start or end at this burn height
             vote_proposals = [
                 p
-                for p in proposals
-                if p.vote_start is not None
-                and p.vote_end is not None
-                and p.vote_start == burn_height
-                and p.content is not None  # Ensure content exists
+                for p in crossings.vote_start
+                if p.vote_end is not None and p.vote_end > burn_height
             ]
 
             end_proposals = [
-                p
-                for p in proposals
-                if p.vote_start is not None
-                and p.exec_start is not None
-                and p.exec_start == burn_height
-                and p.content is not None  # Ensure content exists
+                p for p in crossings.exec_start if p.vote_start is not None
             ]
 
             # Add veto window proposals
             veto_start_proposals = [
                 p
-                for p in proposals
-                if p.vote_end is not None
-                and p.vote_end == burn_height
-                and p.content is not None
+                for p in crossings.vote_end
+                if p.exec_start is None or p.exec_start > burn_height
             ]
 
-            veto_end_proposals = [
-                p
-                for p in proposals
-                if p.exec_start is not None
-                and p.exec_start == burn_height
-                and p.content is not None
-            ]
+            veto_end_proposals = crossings.exec_start
 
             if not (
                 vote_proposals
@@ -307,6 +283,8 @@ class DAOProposalBurnHeightHandler(ChainhookEventHandler):
             # Remove the burn height from processed set on error to allow retry
             if "burn_height_key" in locals():
                 self._processed_burn_heights.discard(burn_height_key)
+            if "crossings" in locals():
+                proposal_timeline.rewind(crossings)
 
     def _process_veto_window_start_notifications(self, veto_start_proposals):
         """Process veto window start notifications."""
@@ -340,7 +318,11 @@ class DAOProposalBurnHeightHandler(ChainhookEventHandler):
             backend.create_queue_message(
                 QueueMessageCreate(
                     type=QueueMessageType.get_or_create("discord"),
-                    message={"content": message, "proposal_status": "veto_window_open"},
+                    message={
+                        "content": message,
+                        "proposal_status": "veto_window_open",
+                        "proposal_id": proposal.id,
+                    },
                     dao_id=dao.id,
                 )
             )
@@ -383,6 +365,7 @@ class DAOProposalBurnHeightHandler(ChainhookEventHandler):
                     message={
                         "content": message,
                         "proposal_status": "veto_window_closed",
+                        "proposal_id": proposal.id,
                     },
                     dao_id=dao.id,
                 )
@@ -448,25 +431,22 @@ class DAOProposalBurnHeightHandler(ChainhookEventHandler):
                 )
                 continue
 
-            # Create vote queue messages for each agent
+            # Create vote queue messages for each agent without one for this proposal
+            queued_wallets = self._queued_vote_wallets(proposal.id, dao.id)
+            new_messages = []
             for agent in agents:
-                # Check if a queue message already exists for this proposal+wallet combination
-                if self._queue_message_exists(
-                    QueueMessageType.get_or_create("dao_proposal_vote"),
-                    proposal.id,
-                    dao.id,
-                    agent["wallet_id"],
-                ):
+                if agent["wallet_id"] in queued_wallets:
                     self.logger.info(
                         f"Skipping duplicate vote_message: proposal={proposal.id}, wallet={agent['wallet_id']}"
                     )
                     continue
+                queued_wallets.add(agent["wallet_id"])
 
                 message_data = {
                     "proposal_id": proposal.id,
                 }
 
-                backend.create_queue_message(
+                new_messages.append(
                     QueueMessageCreate(
                         type=QueueMessageType.get_or_create("dao_proposal_vote"),
                         message=message_data,
@@ -475,7 +455,9 @@ class DAOProposalBurnHeightHandler(ChainhookEventHandler):
                     )
                 )
 
+            if new_messages:
+                backend.create_queue_messages(new_messages)
                 self.logger.info(
-                    f"Created vote queue message for agent {agent['agent_id']} "
-                    f"to vote on proposal {proposal.id}"
+                    f"Created {len(new_messages)} vote queue messages "
+                    f"for proposal {proposal.id}"
                 )
@@ -5,8 +5,11 @@ from typing import Dict, List, Optional
 from app.backend.factory import backend
 from app.backend.models import ProposalBase, ProposalFilter, ProposalType
 from app.lib.logger import configure_logger
+from app.lib.dao_context import dao_context
+from app.lib.proposal_timeline import proposal_timeline
 from app.services.integrations.webhooks.chainhook.handlers.base import (
     ChainhookEventHandler,
+    TransactionRoute,
 )
 from app.services.integrations.webhooks.chainhook.models import (
     Event,
@@ -21,6 +24,10 @@ class DAOProposalConclusionHandler(ChainhookEventHandler):
     and updates proposal records in the database with conclusion data.
     """
 
+    transaction_routes = (
+        TransactionRoute(kind="ContractCall", methods=frozenset({"conclude-proposal"})),
+    )
+
     def __init__(self):
         """Initialize the handler with a logger."""
         super().__init__()
@@ -234,6 +241,8 @@ class DAOProposalConclusionHandler(ChainhookEventHandler):
 
         try:
             updated_proposal = backend.update_proposal(proposal.id, update_data)
+            proposal_timeline.upsert(updated_proposal)
+            dao_context.upsert(updated_proposal)
             if updated_proposal:
                 self.logger.info(
                     f"Successfully updated proposal {proposal.id} with conclusion data"
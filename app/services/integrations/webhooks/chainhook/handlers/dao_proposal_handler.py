@@ -5,6 +5,7 @@ from app.services.integrations.webhooks.chainhook.handlers.action_proposal_handl
 )
 from app.services.integrations.webhooks.chainhook.handlers.base import (
     ChainhookEventHandler,
+    TransactionRoute,
 )
 from app.services.integrations.webhooks.chainhook.handlers.core_proposal_handler import (
     CoreProposalHandler,
@@ -19,6 +20,15 @@ class DAOProposalHandler(ChainhookEventHandler):
     all types of DAO proposals.
     """
 
+    transaction_routes = (
+        TransactionRoute(kind="ContractCall", methods=frozenset({"create-proposal"})),
+        TransactionRoute(
+            kind="ContractCall",
+            methods=frozenset({"create-action-proposal"}),
+            contract_contains="aibtc-acct-",
+        ),
+    )
+
     def __init__(self):
         """Initialize the handler with core and action proposal handlers."""
         super().__init__()
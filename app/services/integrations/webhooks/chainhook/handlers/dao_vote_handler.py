@@ -8,6 +8,7 @@ from app.services.integrations.webhooks.chainhook.handlers.action_vote_handler i
 )
 from app.services.integrations.webhooks.chainhook.handlers.base import (
     ChainhookEventHandler,
+    TransactionRoute,
 )
 from app.services.integrations.webhooks.chainhook.handlers.core_vote_handler import (
     CoreVoteHandler,
@@ -25,6 +26,14 @@ class DAOVoteHandler(ChainhookEventHandler):
     all types of DAO proposal votes.
     """
 
+    transaction_routes = (
+        TransactionRoute(
+            kind="ContractCall",
+            methods=frozenset({"vote-on-proposal"}),
+            method_contains=("vote-on-action-proposal", "vote-on-core-proposal"),
+        ),
+    )
+
     def __init__(self):
         """Initialize the handler with core and action vote handlers."""
         super().__init__()
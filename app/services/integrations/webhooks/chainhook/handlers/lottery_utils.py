@@ -1,7 +1,8 @@
 """Utility functions for the quorum-aware lottery system."""
 
+import random
 from decimal import Decimal, ROUND_UP
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence
 from uuid import UUID
 
 from app.backend.models import AgentWithWalletTokenDTO
@@ -57,6 +58,90 @@ class QuorumCalculator:
             return "0"
 
 
+class WeightedLotterySampler:
+    """Weighted sampling without replacement over Fenwick trees.
+
+    Each draw picks the first remaining item whose cumulative weight exceeds
+    ``rng.randrange(remaining total weight)``, in the items' original order,
+    and removes it. This reproduces drawing from a list and popping the
+    winner, so the same random stream yields the same selections, but a draw
+    costs O(log n) instead of O(n). Zero-weight items are never drawn unless
+    every remaining weight is zero, in which case the remaining items are
+    drawn with equal weights.
+    """
+
+    def __init__(self, weights: Sequence[int]):
+        self._size = len(weights)
+        self._weights = list(weights)
+        self._remaining = self._size
+        self._total_weight = sum(self._weights)
+        self._weight_tree = self._build(self._weights)
+        self._removed = bytearray(self._size)
+        # Only needed once every remaining weight is zero; built on demand
+        self._count_tree: Optional[List[int]] = None
+        self._top_bit = 1 << (self._size.bit_length() - 1) if self._size else 0
+
+    def __len__(self) -> int:
+        return self._remaining
+
+    @property
+    def total_weight(self) -> int:
+        return self._total_weight
+
+    def draw(self, rng: random.Random) -> int:
+        """Draw and remove one item; returns its index in the original weights."""
+        if not self._remaining:
+            raise IndexError("draw from an empty sampler")
+        if self._total_weight > 0:
+            index = self._search(self._weight_tree, rng.randrange(self._total_weight))
+        else:
+            logger.warning("All remaining weights are zero, using equal weights")
+            if self._count_tree is None:
+                self._count_tree = self._build([1 - r for r in self._removed])
+            index = self._search(self._count_tree, rng.randrange(self._remaining))
+        self._remove(index)
+        return index
+
+    @staticmethod
+    def _build(values: Sequence[int]) -> List[int]:
+        tree = [0]
+        tree.extend(values)
+        size = len(tree)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                tree[parent] += tree[i]
+        return tree
+
+    def _search(self, tree: List[int], target: int) -> int:
+        """Smallest index whose prefix sum exceeds ``target`` (0-based)."""
+        position = 0
+        step = self._top_bit
+        while step:
+            following = position + step
+            if following <= self._size and tree[following] <= target:
+                position = following
+                target -= tree[following]
+            step >>= 1
+        return position
+
+    def _remove(self, index: int) -> None:
+        weight = self._weights[index]
+        self._weights[index] = 0
+        self._total_weight -= weight
+        self._remaining -= 1
+        self._removed[index] = 1
+        i = index + 1
+        while i <= self._size:
+            self._weight_tree[i] -= weight
+            i += i & -i
+        if self._count_tree is not None:
+            i = index + 1
+            while i <= self._size:
+                self._count_tree[i] -= 1
+                i += i & -i
+
+
 class LotterySelection:
     """Data class to hold lottery selection results."""
 
@@ -7,9 +7,11 @@ from app.backend.models import (
     TokenFilter,
     WalletFilter,
 )
+from app.lib.address_index import address_index
 from app.lib.logger import configure_logger
 from app.services.integrations.webhooks.chainhook.handlers.base import (
     ChainhookEventHandler,
+    TransactionRoute,
 )
 from app.services.integrations.webhooks.chainhook.models import TransactionWithReceipt
 
@@ -22,6 +24,10 @@ class SellEventHandler(ChainhookEventHandler):
     It updates wallet token balances when tokens are sold.
     """
 
+    transaction_routes = (
+        TransactionRoute(kind="ContractCall", method_contains=("sell",)),
+    )
+
     def __init__(self):
         """Initialize the handler with a logger."""
         super().__init__()
@@ -83,16 +89,18 @@ class SellEventHandler(ChainhookEventHandler):
         )
 
         # Check if the sender is one of our wallets
-        wallets = backend.list_wallets(WalletFilter(mainnet_address=sender))
-        if not wallets:
-            # If not found in mainnet addresses, check testnet addresses
-            wallets = backend.list_wallets(WalletFilter(testnet_address=sender))
+        wallets = []
+        if address_index.is_wallet_address(sender):
+            wallets = backend.list_wallets(WalletFilter(mainnet_address=sender))
             if not wallets:
-                self.logger.info(
-                    f"Sender {sender} is not one of our wallets (checked both mainnet and testnet). "
-                    f"Ignoring event."
-                )
-                return
+                # If not found in mainnet addresses, check testnet addresses
+                wallets = backend.list_wallets(WalletFilter(testnet_address=sender))
+        if not wallets:
+            self.logger.info(
+                f"Sender {sender} is not one of our wallets (checked both mainnet and testnet). "
+                f"Ignoring event."
+            )
+            return
 
         wallet = wallets[0]  # Get the matching wallet
 
@@ -120,6 +128,9 @@ class SellEventHandler(ChainhookEventHandler):
                         continue
 
                     # Find the token in our database
+                    if not address_index.is_token_contract(token_asset):
+                        self.logger.debug(f"Unknown token asset: {token_asset}")
+                        continue
                     tokens = backend.list_tokens(
                         TokenFilter(contract_principal=token_asset)
                     )
@@ -7,6 +7,7 @@ from app.backend.models import (
     WalletBase,
     WalletFilter,
 )
+from app.lib.address_index import address_index
 from app.lib.logger import configure_logger
 from app.services.integrations.webhooks.chainhook.handlers.base import (
     ChainhookEventHandler,
@@ -97,21 +98,11 @@ class STXEventHandler(ChainhookEventHandler):
 
     def _is_our_wallet_address(self, address: str) -> bool:
         """Check if the given address belongs to one of our wallets."""
-        if not address:
-            return False
-
-        # Check mainnet addresses
-        wallets = backend.list_wallets(WalletFilter(mainnet_address=address))
-        if wallets:
-            return True
-
-        # Check testnet addresses
-        wallets = backend.list_wallets(WalletFilter(testnet_address=address))
-        return bool(wallets)
+        return address_index.is_wallet_address(address)
 
     def _get_wallet_by_address(self, address: str):
         """Get wallet by address (mainnet or testnet)."""
-        if not address:
+        if not self._is_our_wallet_address(address):
             return None
 
         # Check mainnet addresses first
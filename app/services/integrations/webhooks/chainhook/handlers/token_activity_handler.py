@@ -0,0 +1,77 @@
+"""Handler for recording which tokens had holder activity in a block."""
+
+from typing import Set
+
+from app.backend.factory import backend
+from app.services.integrations.webhooks.chainhook.models import (
+    Apply,
+    TransactionWithReceipt,
+)
+
+from .base import ChainhookEventHandler, TransactionKey
+
+# Events that can change a token's holders
+FT_EVENT_TYPES = frozenset({"FTTransferEvent", "FTMintEvent", "FTBurnEvent"})
+
+
+class TokenActivityHandler(ChainhookEventHandler):
+    """Handler that raises the holders activity height of tokens.
+
+    For each block it collects the token contracts of every FT transfer, mint
+    and burn and records the block height on those tokens. The DAO token
+    holders monitor skips tokens with no activity since their last sync.
+    """
+
+    # Block-level only: never asked about individual transactions
+    transaction_routes = ()
+
+    def can_handle_transaction(self, transaction: TransactionWithReceipt) -> bool:
+        """This handler does not process individual transactions."""
+        return False
+
+    async def handle_transaction(self, transaction: TransactionWithReceipt) -> None:
+        """This handler does not process individual transactions."""
+        pass
+
+    def can_handle_block(self, block: Apply) -> bool:
+        """Every block may contain FT events."""
+        return True
+
+    def extract_token_contracts(self, block: Apply) -> Set[str]:
+        """Contract principals of the tokens with FT events in ``block``."""
+        contracts: Set[str] = set()
+        for transaction in block.transactions:
+            # Skip transactions without FT events before building their events
+            key = TransactionKey.from_transaction(transaction)
+            if not key.event_types & FT_EVENT_TYPES:
+                continue
+            for event in transaction.metadata.receipt.events:
+                if event.type not in FT_EVENT_TYPES:
+                    continue
+                asset_identifier = (event.data or {}).get("asset_identifier")
+                if asset_identifier:
+                    contracts.add(asset_identifier.split("::", 1)[0])
+        return contracts
+
+    async def handle_block(self, block: Apply) -> None:
+        """Record the block height on the tokens active in the block.
+
+        Args:
+            block: The block to handle
+        """
+        block_height = block.block_identifier.index
+        try:
+            contracts = self.extract_token_contracts(block)
+            if not contracts:
+                return
+            updated = backend.record_token_activity(sorted(contracts), block_height)
+            self.logger.debug(
+                f"Recorded activity of {len(contracts)} token contracts at block "
+                f"{block_height} ({updated} tokens tracked)"
+            )
+        except Exception as e:
+            # The holders monitor still resyncs every token periodically
+            self.logger.error(
+                f"Error recording token activity for block {block_height}: {str(e)}",
+                exc_info=True,
+            )
@@ -0,0 +1,136 @@
+"""Durable ingest log for chainhook webhooks.
+
+The webhook endpoint appends every delivered block to the ``queue`` table
+(type ``chainhook_ingest``) before acknowledging the request, and the
+``chainhook_ingest`` job consumes the entries with claimed leases. A restart of
+either process therefore loses nothing: unacknowledged deliveries are resent
+by chainhook and unfinished entries are claimed again once their lease
+expires.
+
+Entries are unique per chainhook UUID and block hash, so redeliveries are
+dropped when they are appended. Processed entries are kept for
+``chainhook_ingest_retention_days``, which lets ``replay`` feed a range of
+recent blocks through the handlers again; ``prune`` deletes older ones.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.backend.factory import backend
+from app.backend.models import QueueMessage, QueueMessageType
+from app.lib.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+CHAINHOOK_INGEST_TYPE = QueueMessageType.get_or_create("chainhook_ingest")
+
+
+@dataclass
+class IngestResult:
+    """Outcome of appending one webhook payload."""
+
+    appended: int = 0
+    duplicates: int = 0
+
+
+def split_blocks(
+    payload: Dict[str, Any],
+) -> List[Tuple[str, str, int, Dict[str, Any]]]:
+    """Split a webhook payload into one single-block payload per applied block.
+
+    Returns ``(chainhook_uuid, block_hash, block_height, block_payload)``
+    tuples. The rollback list travels with the first block.
+    """
+    chainhook = payload.get("chainhook", {})
+    chainhook_uuid = chainhook.get("uuid", "")
+    blocks = []
+    for i, apply_data in enumerate(payload.get("apply", [])):
+        block_identifier = apply_data.get("block_identifier", {})
+        blocks.append(
+            (
+                chainhook_uuid,
+                block_identifier.get("hash", ""),
+                block_identifier.get("index", 0),
+                {
+                    "apply": [apply_data],
+                    "chainhook": chainhook,
+                    "events": payload.get("events", []),
+                    "rollback": payload.get("rollback", []) if i == 0 else [],
+                },
+            )
+        )
+    return blocks
+
+
+class ChainhookIngestLog:
+    """Append, read back and replay logged chainhook blocks."""
+
+    async def append(self, payload: Dict[str, Any]) -> IngestResult:
+        """Log every block of a webhook payload.
+
+        Raises whatever the backend raises; callers must not acknowledge the
+        delivery unless this returns.
+        """
+        result = IngestResult()
+        for chainhook_uuid, block_hash, block_height, block_payload in split_blocks(
+            payload
+        ):
+            entry_id = await asyncio.to_thread(
+                backend.ingest_chainhook_block,
+                chainhook_uuid,
+                block_hash,
+                block_height,
+                block_payload,
+            )
+            if entry_id is None:
+                result.duplicates += 1
+                logger.debug(
+                    f"Chainhook block {block_height} already logged, skipping",
+                    extra={"chainhook_uuid": chainhook_uuid, "block_hash": block_hash},
+                )
+            else:
+                result.appended += 1
+        return result
+
+    async def replay(self, from_height: int, to_height: Optional[int] = None) -> int:
+        """Queue logged blocks from ``from_height`` (to ``to_height``) again.
+
+        Returns the number of blocks that will be processed again.
+        """
+        replayed = await asyncio.to_thread(
+            backend.replay_chainhook_blocks, from_height, to_height
+        )
+        logger.info(
+            f"Replaying {replayed} chainhook blocks from height {from_height}"
+            + (f" to {to_height}" if to_height is not None else "")
+        )
+        return replayed
+
+    async def prune(self, retention_days: int) -> int:
+        """Delete entries processed more than ``retention_days`` ago.
+
+        Returns the number of entries deleted.
+        """
+        pruned = await asyncio.to_thread(
+            backend.prune_chainhook_blocks, retention_days * 86400
+        )
+        if pruned:
+            logger.info(
+                f"Pruned {pruned} chainhook blocks processed over "
+                f"{retention_days} days ago"
+            )
+        return pruned
+
+    @staticmethod
+    def block_height(entry: QueueMessage) -> int:
+        return int((entry.message or {}).get("block_height") or 0)
+
+    @staticmethod
+    def block_payload(entry: QueueMessage) -> Dict[str, Any]:
+        """The single-block webhook payload stored in a log entry."""
+        return (entry.message or {}).get("payload", {})
+
+
+# Global ingest log instance
+chainhook_ingest_log = ChainhookIngestLog()
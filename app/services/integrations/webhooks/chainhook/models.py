@@ -2,7 +2,7 @@
 
 import logging
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, FrozenSet, List, Optional, Union
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -54,6 +54,49 @@ class Receipt:
     mutated_contracts_radius: List[Any]
 
 
+class LazyReceipt(Receipt):
+    """Receipt that builds its ``Event`` objects on first access.
+
+    Most transactions in a block are never claimed by a handler, so their
+    events are never looked at. ``event_types`` reads the types straight from
+    the payload for routing without building the events.
+    """
+
+    def __init__(self, raw_receipt: Dict[str, Any]):
+        self._raw_events: List[Dict[str, Any]] = raw_receipt.get("events", [])
+        self._events: Optional[List[Event]] = None
+        self.contract_calls_stack = raw_receipt.get("contract_calls_stack", [])
+        self.mutated_assets_radius = raw_receipt.get("mutated_assets_radius", [])
+        self.mutated_contracts_radius = raw_receipt.get("mutated_contracts_radius", [])
+
+    @property
+    def events(self) -> List[Event]:
+        if self._events is None:
+            self._events = [
+                Event(
+                    data=event.get("data", {}),
+                    position=event.get("position", {}),
+                    type=event.get("type", ""),
+                )
+                for event in self._raw_events
+            ]
+        return self._events
+
+    @events.setter
+    def events(self, events: List[Event]) -> None:
+        self._events = events
+
+    @property
+    def event_types(self) -> FrozenSet[str]:
+        if self._events is not None:
+            return frozenset(event.type for event in self._events)
+        return frozenset(event.get("type", "") for event in self._raw_events)
+
+    @property
+    def is_decoded(self) -> bool:
+        return self._events is not None
+
+
 @dataclass
 class TransactionMetadata:
     """Metadata about a transaction including execution cost and kind."""
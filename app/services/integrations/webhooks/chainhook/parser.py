@@ -1,10 +1,14 @@
 """Chainhook webhook parser implementation."""
 
 import json
+import logging
 from typing import Any, Dict
 
 from app.lib.logger import configure_logger
 from app.services.integrations.webhooks.base import WebhookParser
+from app.services.processing.stacks_chainhook_adapter.models import (
+    chainhook as adapter_models,
+)
 from app.services.integrations.webhooks.chainhook.models import (
     Apply,
     BlockIdentifier,
@@ -12,6 +16,7 @@ from app.services.integrations.webhooks.chainhook.models import (
     ChainHookData,
     ChainHookInfo,
     Event,
+    LazyReceipt,
     Operation,
     Predicate,
     Receipt,
@@ -24,9 +29,16 @@ from app.services.integrations.webhooks.chainhook.models import (
 class ChainhookParser(WebhookParser):
     """Parser for Chainhook webhook payloads."""
 
-    def __init__(self):
+    def __init__(self, lazy_events: bool = False):
+        """Initialize the parser.
+
+        Args:
+            lazy_events: Build receipt events on first access (``LazyReceipt``)
+                instead of for every transaction up front
+        """
         super().__init__()
         self.logger = configure_logger(self.__class__.__name__)
+        self.lazy_events = lazy_events
 
     def parse(self, raw_data: Dict[str, Any]) -> ChainHookData:
         """Parse Chainhook webhook data.
@@ -50,176 +62,292 @@ class ChainhookParser(WebhookParser):
             ChainHookData object with structured data
         """
         self.logger.debug("Parsing chainhook payload")
-        self.logger.debug(f"payload: {json.dumps(payload, indent=4)}")
+        # Serializing a whole block is expensive; only do it when it is logged
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"payload: {json.dumps(payload, indent=4)}")
+
+        chainhook = payload.get("chainhook", {})
+        predicate_data = chainhook.get("predicate", {})
         # Parse predicate
         predicate = Predicate(
-            scope=payload.get("chainhook", {}).get("predicate", {}).get("scope", ""),
-            higher_than=payload.get("chainhook", {})
-            .get("predicate", {})
-            .get("higher_than", 0),
+            scope=predicate_data.get("scope", ""),
+            higher_than=predicate_data.get("higher_than", 0),
         )
 
         # Parse chainhook info
         chainhook_info = ChainHookInfo(
-            is_streaming_blocks=payload.get("chainhook", {}).get(
-                "is_streaming_blocks", False
-            ),
+            is_streaming_blocks=chainhook.get("is_streaming_blocks", False),
             predicate=predicate,
-            uuid=payload.get("chainhook", {}).get("uuid", ""),
+            uuid=chainhook.get("uuid", ""),
         )
 
         # Parse apply blocks
-        apply_blocks = []
-        for apply_data in payload.get("apply", []):
-            # i need it pretty print json apply_data
-            # self.logger.debug(f"apply_data: {json.dumps(apply_data, indent=4)}")
-            # Parse block identifier
-            block_id = BlockIdentifier(
-                hash=apply_data.get("block_identifier", {}).get("hash", ""),
-                index=apply_data.get("block_identifier", {}).get("index", 0),
+        apply_blocks = [
+            self._parse_apply_block(apply_data)
+            for apply_data in payload.get("apply", [])
+        ]
+
+        # Create final ChainHookData object
+        return ChainHookData(
+            apply=apply_blocks,
+            chainhook=chainhook_info,
+            events=payload.get("events", []),
+            rollback=payload.get("rollback", []),
+        )
+
+    def _parse_apply_block(self, apply_data: Dict[str, Any]) -> Apply:
+        # Parse block identifier
+        block_identifier = apply_data.get("block_identifier", {})
+        block_id = BlockIdentifier(
+            hash=block_identifier.get("hash", ""),
+            index=block_identifier.get("index", 0),
+        )
+
+        parent_block_id = None
+        if "parent_block_identifier" in apply_data:
+            parent_identifier = apply_data.get("parent_block_identifier", {})
+            parent_block_id = BlockIdentifier(
+                hash=parent_identifier.get("hash", ""),
+                index=parent_identifier.get("index", 0),
             )
 
-            parent_block_id = None
-            if "parent_block_identifier" in apply_data:
-                parent_block_id = BlockIdentifier(
-                    hash=apply_data.get("parent_block_identifier", {}).get("hash", ""),
-                    index=apply_data.get("parent_block_identifier", {}).get("index", 0),
+        # Parse block metadata
+        block_metadata = None
+        if "metadata" in apply_data:
+            metadata = apply_data.get("metadata", {})
+            bitcoin_anchor = None
+            if "bitcoin_anchor_block_identifier" in metadata:
+                anchor = metadata.get("bitcoin_anchor_block_identifier", {})
+                bitcoin_anchor = BlockIdentifier(
+                    hash=anchor.get("hash", ""),
+                    index=anchor.get("index", 0),
                 )
 
-            # Parse block metadata
-            block_metadata = None
-            if "metadata" in apply_data:
-                bitcoin_anchor = None
-                if "bitcoin_anchor_block_identifier" in apply_data.get("metadata", {}):
-                    bitcoin_anchor = BlockIdentifier(
-                        hash=apply_data.get("metadata", {})
-                        .get("bitcoin_anchor_block_identifier", {})
-                        .get("hash", ""),
-                        index=apply_data.get("metadata", {})
-                        .get("bitcoin_anchor_block_identifier", {})
-                        .get("index", 0),
-                    )
-
-                block_metadata = BlockMetadata(
-                    bitcoin_anchor_block_identifier=bitcoin_anchor,
-                    block_time=apply_data.get("metadata", {}).get("block_time"),
-                    confirm_microblock_identifier=apply_data.get("metadata", {}).get(
-                        "confirm_microblock_identifier"
-                    ),
-                    cycle_number=apply_data.get("metadata", {}).get("cycle_number"),
-                    pox_cycle_index=apply_data.get("metadata", {}).get(
-                        "pox_cycle_index"
-                    ),
-                    pox_cycle_length=apply_data.get("metadata", {}).get(
-                        "pox_cycle_length"
-                    ),
-                    pox_cycle_position=apply_data.get("metadata", {}).get(
-                        "pox_cycle_position"
-                    ),
-                    reward_set=apply_data.get("metadata", {}).get("reward_set"),
-                    signer_bitvec=apply_data.get("metadata", {}).get("signer_bitvec"),
-                    signer_public_keys=apply_data.get("metadata", {}).get(
-                        "signer_public_keys"
-                    ),
-                    signer_signature=apply_data.get("metadata", {}).get(
-                        "signer_signature"
-                    ),
-                    stacks_block_hash=apply_data.get("metadata", {}).get(
-                        "stacks_block_hash"
-                    ),
-                    tenure_height=apply_data.get("metadata", {}).get("tenure_height"),
-                )
+            block_metadata = BlockMetadata(
+                bitcoin_anchor_block_identifier=bitcoin_anchor,
+                block_time=metadata.get("block_time"),
+                confirm_microblock_identifier=metadata.get(
+                    "confirm_microblock_identifier"
+                ),
+                cycle_number=metadata.get("cycle_number"),
+                pox_cycle_index=metadata.get("pox_cycle_index"),
+                pox_cycle_length=metadata.get("pox_cycle_length"),
+                pox_cycle_position=metadata.get("pox_cycle_position"),
+                reward_set=metadata.get("reward_set"),
+                signer_bitvec=metadata.get("signer_bitvec"),
+                signer_public_keys=metadata.get("signer_public_keys"),
+                signer_signature=metadata.get("signer_signature"),
+                stacks_block_hash=metadata.get("stacks_block_hash"),
+                tenure_height=metadata.get("tenure_height"),
+            )
 
-            # Parse transactions
-            transactions = []
-            for tx_data in apply_data.get("transactions", []):
-                tx_id = TransactionIdentifier(
-                    hash=tx_data.get("transaction_identifier", {}).get("hash", "")
-                )
+        return Apply(
+            block_identifier=block_id,
+            transactions=[
+                self._parse_transaction(tx_data)
+                for tx_data in apply_data.get("transactions", [])
+            ],
+            metadata=block_metadata,
+            parent_block_identifier=parent_block_id,
+            timestamp=apply_data.get("timestamp"),
+        )
 
-                # Parse operations
-                operations = []
-                for op_data in tx_data.get("operations", []):
-                    operations.append(
-                        Operation(
-                            account=op_data.get("account", {}),
-                            amount=op_data.get("amount", {}),
-                            operation_identifier=op_data.get(
-                                "operation_identifier", {}
-                            ),
-                            status=op_data.get("status", ""),
-                            type=op_data.get("type", ""),
-                            related_operations=op_data.get("related_operations"),
-                        )
-                    )
-
-                # Parse receipt events
-                events = []
-                for event_data in (
-                    tx_data.get("metadata", {}).get("receipt", {}).get("events", [])
-                ):
-                    events.append(
-                        Event(
-                            data=event_data.get("data", {}),
-                            position=event_data.get("position", {}),
-                            type=event_data.get("type", ""),
-                        )
-                    )
-
-                # Parse receipt
-                receipt = Receipt(
-                    contract_calls_stack=tx_data.get("metadata", {})
-                    .get("receipt", {})
-                    .get("contract_calls_stack", []),
-                    events=events,
-                    mutated_assets_radius=tx_data.get("metadata", {})
-                    .get("receipt", {})
-                    .get("mutated_assets_radius", []),
-                    mutated_contracts_radius=tx_data.get("metadata", {})
-                    .get("receipt", {})
-                    .get("mutated_contracts_radius", []),
-                )
+    def _parse_transaction(self, tx_data: Dict[str, Any]) -> TransactionWithReceipt:
+        tx_id = TransactionIdentifier(
+            hash=tx_data.get("transaction_identifier", {}).get("hash", "")
+        )
 
-                # Parse transaction metadata
-                metadata = TransactionMetadata(
-                    description=tx_data.get("metadata", {}).get("description", ""),
-                    execution_cost=tx_data.get("metadata", {}).get(
-                        "execution_cost", {}
-                    ),
-                    fee=tx_data.get("metadata", {}).get("fee", 0),
-                    kind=tx_data.get("metadata", {}).get("kind", {}),
-                    nonce=tx_data.get("metadata", {}).get("nonce", 0),
-                    position=tx_data.get("metadata", {}).get("position", {}),
-                    raw_tx=tx_data.get("metadata", {}).get("raw_tx", ""),
-                    receipt=receipt,
-                    result=tx_data.get("metadata", {}).get("result", ""),
-                    sender=tx_data.get("metadata", {}).get("sender", ""),
-                    sponsor=tx_data.get("metadata", {}).get("sponsor"),
-                    success=tx_data.get("metadata", {}).get("success", False),
-                )
+        # Parse operations
+        operations = [
+            Operation(
+                account=op_data.get("account", {}),
+                amount=op_data.get("amount", {}),
+                operation_identifier=op_data.get("operation_identifier", {}),
+                status=op_data.get("status", ""),
+                type=op_data.get("type", ""),
+                related_operations=op_data.get("related_operations"),
+            )
+            for op_data in tx_data.get("operations", [])
+        ]
 
-                transactions.append(
-                    TransactionWithReceipt(
-                        transaction_identifier=tx_id,
-                        metadata=metadata,
-                        operations=operations,
-                    )
+        metadata = tx_data.get("metadata", {})
+        receipt_data = metadata.get("receipt", {})
+        if self.lazy_events:
+            receipt = LazyReceipt(receipt_data)
+        else:
+            # Parse receipt events
+            events = [
+                Event(
+                    data=event_data.get("data", {}),
+                    position=event_data.get("position", {}),
+                    type=event_data.get("type", ""),
                 )
+                for event_data in receipt_data.get("events", [])
+            ]
 
-            apply_blocks.append(
-                Apply(
-                    block_identifier=block_id,
-                    transactions=transactions,
-                    metadata=block_metadata,
-                    parent_block_identifier=parent_block_id,
-                    timestamp=apply_data.get("timestamp"),
-                )
+            # Parse receipt
+            receipt = Receipt(
+                contract_calls_stack=receipt_data.get("contract_calls_stack", []),
+                events=events,
+                mutated_assets_radius=receipt_data.get("mutated_assets_radius", []),
+                mutated_contracts_radius=receipt_data.get(
+                    "mutated_contracts_radius", []
+                ),
             )
 
-        # Create final ChainHookData object
+        # Parse transaction metadata
+        tx_metadata = TransactionMetadata(
+            description=metadata.get("description", ""),
+            execution_cost=metadata.get("execution_cost", {}),
+            fee=metadata.get("fee", 0),
+            kind=metadata.get("kind", {}),
+            nonce=metadata.get("nonce", 0),
+            position=metadata.get("position", {}),
+            raw_tx=metadata.get("raw_tx", ""),
+            receipt=receipt,
+            result=metadata.get("result", ""),
+            sender=metadata.get("sender", ""),
+            sponsor=metadata.get("sponsor"),
+            success=metadata.get("success", False),
+        )
+
+        return TransactionWithReceipt(
+            transaction_identifier=tx_id,
+            metadata=tx_metadata,
+            operations=operations,
+        )
+
+    def parse_adapter_data(
+        self, chainhook_data: adapter_models.ChainHookData
+    ) -> ChainHookData:
+        """Convert the Stacks chainhook adapter's typed output directly.
+
+        Backfilled blocks arrive from ``StacksChainhookAdapter`` already typed,
+        so there is no need to render them into a webhook template and parse
+        the dict back. Fields map one-to-one; values the adapter could not
+        fill stay as the adapter left them rather than being taken from a
+        sample payload.
+
+        Args:
+            chainhook_data: ``ChainHookData`` from the adapter with
+                ``use_template=False``
+
+        Returns:
+            ChainHookData object with structured data
+        """
+        predicate = chainhook_data.chainhook.predicate
+        higher_than = predicate.higher_than
+        if higher_than is None and predicate.equals is not None:
+            higher_than = predicate.equals - 1
+
         return ChainHookData(
-            apply=apply_blocks,
-            chainhook=chainhook_info,
-            events=payload.get("events", []),
-            rollback=payload.get("rollback", []),
+            apply=[
+                self._convert_adapter_block(block) for block in chainhook_data.apply
+            ],
+            chainhook=ChainHookInfo(
+                is_streaming_blocks=chainhook_data.chainhook.is_streaming_blocks,
+                predicate=Predicate(
+                    scope=predicate.scope, higher_than=higher_than or 0
+                ),
+                uuid=chainhook_data.chainhook.uuid,
+            ),
+            events=list(chainhook_data.events),
+            rollback=list(chainhook_data.rollback),
+        )
+
+    def _convert_adapter_block(self, block: adapter_models.Apply) -> Apply:
+        metadata = block.metadata or {}
+        anchor = metadata.get("bitcoin_anchor_block_identifier")
+        return Apply(
+            block_identifier=BlockIdentifier(
+                hash=block.block_identifier.hash, index=block.block_identifier.index
+            ),
+            transactions=[
+                self._convert_adapter_transaction(tx) for tx in block.transactions
+            ],
+            metadata=BlockMetadata(
+                bitcoin_anchor_block_identifier=BlockIdentifier(
+                    hash=anchor.get("hash", ""), index=anchor.get("index", 0)
+                )
+                if anchor
+                else None,
+                block_time=metadata.get("block_time"),
+                confirm_microblock_identifier=metadata.get(
+                    "confirm_microblock_identifier"
+                ),
+                cycle_number=metadata.get("cycle_number"),
+                pox_cycle_index=metadata.get("pox_cycle_index"),
+                pox_cycle_length=metadata.get("pox_cycle_length"),
+                pox_cycle_position=metadata.get("pox_cycle_position"),
+                reward_set=metadata.get("reward_set"),
+                signer_bitvec=metadata.get("signer_bitvec"),
+                signer_public_keys=metadata.get("signer_public_keys"),
+                signer_signature=metadata.get("signer_signature"),
+                stacks_block_hash=metadata.get("stacks_block_hash"),
+                tenure_height=metadata.get("tenure_height"),
+            ),
+            parent_block_identifier=BlockIdentifier(
+                hash=block.parent_block_identifier.hash,
+                index=block.parent_block_identifier.index,
+            ),
+            timestamp=block.timestamp,
+        )
+
+    @staticmethod
+    def _convert_adapter_transaction(
+        tx: adapter_models.TransactionWithReceipt,
+    ) -> TransactionWithReceipt:
+        metadata = tx.metadata
+        cost = metadata.execution_cost
+        receipt = metadata.receipt
+        return TransactionWithReceipt(
+            transaction_identifier=TransactionIdentifier(
+                hash=tx.transaction_identifier.hash
+            ),
+            metadata=TransactionMetadata(
+                description=metadata.description,
+                execution_cost={
+                    "read_count": cost.read_count,
+                    "read_length": cost.read_length,
+                    "runtime": cost.runtime,
+                    "write_count": cost.write_count,
+                    "write_length": cost.write_length,
+                },
+                fee=metadata.fee,
+                kind={"data": dict(metadata.kind.data), "type": metadata.kind.type},
+                nonce=metadata.nonce,
+                position=dict(metadata.position),
+                raw_tx=metadata.raw_tx,
+                receipt=Receipt(
+                    contract_calls_stack=receipt.contract_calls_stack,
+                    events=[
+                        Event(data=event.data, position=event.position, type=event.type)
+                        for event in receipt.events
+                    ],
+                    mutated_assets_radius=receipt.mutated_assets_radius,
+                    mutated_contracts_radius=receipt.mutated_contracts_radius,
+                ),
+                result=metadata.result,
+                sender=metadata.sender,
+                sponsor=metadata.sponsor,
+                success=metadata.success,
+            ),
+            operations=[
+                Operation(
+                    account={"address": op.account.address},
+                    amount={
+                        "currency": {
+                            "decimals": op.amount.currency.decimals,
+                            "symbol": op.amount.currency.symbol,
+                            "metadata": op.amount.currency.metadata,
+                        },
+                        "value": op.amount.value,
+                    },
+                    operation_identifier={"index": op.operation_identifier.index},
+                    status=op.status,
+                    type=op.type,
+                    related_operations=op.related_operations,
+                )
+                for op in tx.operations
+            ],
         )
@@ -0,0 +1,69 @@
+"""Routing index for chainhook transaction handlers."""
+
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from app.services.integrations.webhooks.chainhook.handlers.base import (
+    ChainhookEventHandler,
+    TransactionKey,
+    TransactionRoute,
+)
+
+IndexedRoute = Tuple[int, TransactionRoute]
+
+
+class TransactionRouter:
+    """Finds the handlers worth asking about a transaction.
+
+    Routes with exact method names are indexed by (kind, method); the rest
+    (substring and event predicates) are scanned per kind. Handlers that do
+    not declare routes are candidates for every transaction. Candidates are
+    returned in registration order, so handlers run in the same order as when
+    every handler was asked.
+
+    Routes are static, so candidate lists are memoized per key; blocks repeat
+    the same few (kind, method, contract) combinations.
+    """
+
+    MAX_CACHED_KEYS = 4096
+
+    def __init__(self, handlers: Sequence[ChainhookEventHandler]):
+        self._handlers = list(handlers)
+        self._always: List[int] = []
+        self._by_method: Dict[Tuple[Optional[str], str], List[IndexedRoute]] = (
+            defaultdict(list)
+        )
+        self._by_kind: Dict[Optional[str], List[IndexedRoute]] = defaultdict(list)
+        self._cache: Dict[TransactionKey, Tuple[ChainhookEventHandler, ...]] = {}
+
+        for index, handler in enumerate(self._handlers):
+            routes = handler.transaction_routes
+            if routes is None:
+                self._always.append(index)
+                continue
+            for route in routes:
+                if route.methods and not route.method_contains:
+                    for method in route.methods:
+                        self._by_method[(route.kind, method)].append((index, route))
+                else:
+                    self._by_kind[route.kind].append((index, route))
+
+    def candidates(self, key: TransactionKey) -> Tuple[ChainhookEventHandler, ...]:
+        """Handlers whose routes match the transaction, in registration order."""
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        selected: Set[int] = set(self._always)
+        for kind in {key.kind, None}:
+            routes = list(self._by_kind.get(kind, ()))
+            if key.method is not None:
+                routes.extend(self._by_method.get((kind, key.method), ()))
+            for index, route in routes:
+                if index not in selected and route.matches(key):
+                    selected.add(index)
+        candidates = tuple(self._handlers[index] for index in sorted(selected))
+        if len(self._cache) >= self.MAX_CACHED_KEYS:
+            self._cache.clear()
+        self._cache[key] = candidates
+        return candidates
@@ -1,9 +1,14 @@
 """Chainhook webhook service implementation."""
 
+from typing import Any, Dict
+
 from app.lib.logger import configure_logger
 from app.services.integrations.webhooks.base import WebhookService
 from app.services.integrations.webhooks.chainhook.handler import ChainhookHandler
 from app.services.integrations.webhooks.chainhook.parser import ChainhookParser
+from app.services.processing.stacks_chainhook_adapter.models import (
+    chainhook as adapter_models,
+)
 
 
 class ChainhookService(WebhookService):
@@ -14,7 +19,48 @@ class ChainhookService(WebhookService):
 
     def __init__(self):
         """Initialize the Chainhook service with parser and handler components."""
-        parser = ChainhookParser()
+        parser = ChainhookParser(lazy_events=True)
         handler = ChainhookHandler()
         super().__init__(parser=parser, handler=handler)
         self.logger = configure_logger(self.__class__.__name__)
+
+    async def process(
+        self, raw_data: Dict[str, Any], replay: bool = False
+    ) -> Dict[str, Any]:
+        """Process a Chainhook webhook payload.
+
+        Args:
+            raw_data: The raw webhook payload
+            replay: Handle blocks at or below the recorded chain state too, as
+                the ingest log does for retried and replayed blocks
+
+        Returns:
+            Dict containing the result of processing the webhook
+        """
+        try:
+            parsed_data = self.parser.parse(raw_data)
+            return await self.handler.handle(parsed_data, replay=replay)
+        except Exception as e:
+            self.logger.error(f"Error processing webhook: {str(e)}", exc_info=True)
+            raise
+
+    async def process_adapter_data(
+        self, chainhook_data: adapter_models.ChainHookData
+    ) -> Dict[str, Any]:
+        """Handle a block produced in-process by the Stacks chainhook adapter.
+
+        Skips the JSON round trip of ``process``: the adapter's typed data is
+        converted straight into the handler models.
+
+        Args:
+            chainhook_data: Untemplated ``ChainHookData`` from the adapter
+
+        Returns:
+            Dict containing the result of handling the block
+        """
+        try:
+            parsed_data = self.parser.parse_adapter_data(chainhook_data)
+            return await self.handler.handle(parsed_data)
+        except Exception as e:
+            self.logger.error(f"Error processing adapter data: {str(e)}", exc_info=True)
+            raise
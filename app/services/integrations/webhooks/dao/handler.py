@@ -12,6 +12,7 @@ from app.backend.models import (
     XCredsCreate,
 )
 from app.config import config
+from app.lib.address_index import address_index
 from app.lib.logger import configure_logger
 from app.services.integrations.webhooks.base import WebhookHandler
 from app.services.integrations.webhooks.dao.models import (
@@ -105,6 +106,7 @@ class DAOHandler(WebhookHandler):
             )
 
             token = self.db.create_token(token_create)
+            address_index.add_token(token)
             self.logger.info(f"Created token with ID: {token.id}")
 
             # Create extensions for DAO extension contracts
@@ -1,7 +1,9 @@
 """Main Stacks to Chainhook adapter implementation."""
 
+import asyncio
 import uuid
-from typing import Any, Dict, List, Optional, Union
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple, Union
 
 from .base import BaseAdapter
 from ..client import StacksAPIClient
@@ -193,18 +195,68 @@ class StacksChainhookAdapter(BaseAdapter):
             f"Fetching chainhook data for blocks {start_height}-{end_height}"
         )
 
-        results = []
-        for height in range(start_height, end_height + 1):
-            try:
-                chainhook_data = await self.get_block_chainhook(
-                    height, filters, use_template
-                )
-                results.append(chainhook_data)
-            except BlockNotFoundError:
-                self.logger.warning(f"Block {height} not found, skipping")
-                continue
+        return [
+            chainhook_data
+            async for _, chainhook_data in self.iter_block_range_chainhook(
+                start_height, end_height, filters, use_template, skip_missing=True
+            )
+        ]
 
-        return results
+    async def iter_block_range_chainhook(
+        self,
+        start_height: int,
+        end_height: int,
+        filters: Optional[List[Any]] = None,
+        use_template: bool = True,
+        prefetch: Optional[int] = None,
+        skip_missing: bool = False,
+    ) -> AsyncIterator[Tuple[int, Union[ChainHookData, Dict[str, Any]]]]:
+        """Yield ``(height, chainhook_data)`` for a range of blocks in height order.
+
+        Up to ``prefetch`` blocks ahead of the consumer are fetched and
+        transformed concurrently; the client's request semaphore still bounds
+        the number of API calls in flight. A failure is raised when its height
+        is reached, so everything before it has already been yielded.
+
+        Args:
+            start_height: Starting block height (inclusive)
+            end_height: Ending block height (inclusive)
+            filters: Optional transaction filters
+            use_template: Whether to use template-based formatting for exact compatibility
+            prefetch: Blocks to fetch ahead (defaults to max_concurrent_requests)
+            skip_missing: Log and skip blocks that are not found instead of raising
+
+        Yields:
+            Tuple[int, Union[ChainHookData, Dict[str, Any]]]: Block height and its
+                chainhook data (typed when ``use_template`` is False)
+        """
+        prefetch = max(1, prefetch or self.config.max_concurrent_requests)
+        pending: Deque[Tuple[int, asyncio.Task]] = deque()
+        next_height = start_height
+
+        try:
+            while pending or next_height <= end_height:
+                while next_height <= end_height and len(pending) < prefetch:
+                    task = asyncio.create_task(
+                        self.get_block_chainhook(next_height, filters, use_template)
+                    )
+                    pending.append((next_height, task))
+                    next_height += 1
+
+                height, task = pending.popleft()
+                try:
+                    chainhook_data = await task
+                except BlockNotFoundError:
+                    if not skip_missing:
+                        raise
+                    self.logger.warning(f"Block {height} not found, skipping")
+                    continue
+                yield height, chainhook_data
+        finally:
+            # Consumer stopped early or a block failed: drop the read-ahead
+            for _, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
 
     async def transform(
         self,
@@ -514,7 +566,7 @@ class StacksChainhookAdapter(BaseAdapter):
         if await self._should_decode_hex_value(raw_value):
             decoded_value = await self._decode_hex_value(raw_value)
             if decoded_value is not None:
-                self.logger.debug("Successfully decoded hex value via API")
+                self.logger.debug("Successfully decoded hex value")
                 return decoded_value
 
         # Fallback to clarity parser
@@ -751,6 +803,15 @@ class StacksChainhookAdapter(BaseAdapter):
                 return False
         return True
 
+    def get_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get the API client's cache counters.
+
+        Returns:
+            Dict[str, Dict[str, int]]: Hits, misses, evictions, expirations,
+                disk hits, disk writes and size by cache namespace
+        """
+        return self.client.get_cache_stats()
+
     async def close(self) -> None:
         """Close the adapter and clean up resources."""
         await self.client.close()
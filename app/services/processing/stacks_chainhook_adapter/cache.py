@@ -0,0 +1,203 @@
+"""Bounded response caches for the Stacks API client."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Returned on a miss, so that falsy values can be cached
+MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """Counters for one cache namespace."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    disk_hits: int = 0
+    disk_writes: int = 0
+
+
+class TTLCache:
+    """LRU cache with an entry limit and a time-to-live per entry.
+
+    Expired entries are dropped when they are looked up or reach the least
+    recently used end, so the cache never holds more than ``maxsize`` entries.
+    A ``maxsize`` of 0 disables the cache.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        """Return the cached value for ``key``, or ``MISSING``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return MISSING
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return MISSING
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+
+        now = self._clock()
+        self._entries[key] = (now + self.ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            _, (expires_at, _) = self._entries.popitem(last=False)
+            if expires_at <= now:
+                self.stats.expirations += 1
+            else:
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class DiskCache:
+    """JSON files under a directory for responses that never change.
+
+    Each entry is one file named after a digest of its key, written
+    atomically, so concurrent processes can share the directory.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+    def _path(self, namespace: str, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, namespace, digest[:2], f"{digest}.json")
+
+    def get(self, namespace: str, key: str) -> Any:
+        """Return the stored value for ``key``, or ``MISSING``."""
+        path = self._path(namespace, key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return MISSING
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache file {path}: {e}")
+            return MISSING
+
+    def set(self, namespace: str, key: str, value: Any) -> bool:
+        """Store ``value``; returns False if it could not be written."""
+        path = self._path(namespace, key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(value, f, separators=(",", ":"))
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write cache file {path}: {e}")
+            return False
+        return True
+
+
+class ResponseCache:
+    """Per-namespace TTL+LRU caches with an optional on-disk tier.
+
+    Namespaces listed in ``persistent`` are also read from and written to
+    ``directory``; use it only for responses that can never change.
+    """
+
+    def __init__(
+        self,
+        namespaces: Dict[str, Tuple[int, float]],
+        directory: Optional[str] = None,
+        persistent: Iterable[str] = (),
+    ) -> None:
+        """Initialize the caches.
+
+        Args:
+            namespaces: ``(maxsize, ttl)`` for each namespace
+            directory: Directory for the on-disk tier; None disables it
+            persistent: Namespaces that use the on-disk tier
+        """
+        self._caches = {
+            namespace: TTLCache(maxsize, ttl)
+            for namespace, (maxsize, ttl) in namespaces.items()
+        }
+        self._disk = DiskCache(directory) if directory else None
+        self._persistent = frozenset(persistent) if directory else frozenset()
+
+    def persists(self, namespace: str) -> bool:
+        """Whether ``namespace`` has an on-disk tier."""
+        return namespace in self._persistent
+
+    def get(self, namespace: str, key: str) -> Any:
+        """Look ``key`` up in memory; returns ``MISSING`` on a miss."""
+        return self._caches[namespace].get(key)
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        self._caches[namespace].set(key, value)
+
+    def load(self, namespace: str, key: str) -> Any:
+        """Look ``key`` up on disk and keep a hit in memory.
+
+        Blocking; returns ``MISSING`` on a miss.
+        """
+        if not self.persists(namespace):
+            return MISSING
+        value = self._disk.get(namespace, key)
+        if value is not MISSING:
+            cache = self._caches[namespace]
+            cache.stats.disk_hits += 1
+            cache.set(key, value)
+        return value
+
+    def store(self, namespace: str, key: str, value: Any) -> None:
+        """Write ``value`` to disk. Blocking."""
+        if self.persists(namespace) and self._disk.set(namespace, key, value):
+            self._caches[namespace].stats.disk_writes += 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Counters and current size of every namespace."""
+        return {
+            namespace: {**asdict(cache.stats), "size": len(cache)}
+            for namespace, cache in self._caches.items()
+        }
+
+    def clear(self) -> None:
+        """Empty the in-memory caches; the on-disk tier is kept."""
+        for cache in self._caches.values():
+            cache.clear()
@@ -62,6 +62,12 @@ def create_parser() -> argparse.ArgumentParser:
         help="Custom Stacks API URL",
     )
 
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        help="Directory for cached finalized blocks; reruns read them from disk",
+    )
+
     parser.add_argument(
         "--pretty",
         action="store_true",
@@ -99,6 +105,7 @@ async def transform_block(
     use_template: bool = False,
     pretty: bool = False,
     quiet: bool = False,
+    cache_dir: Optional[str] = None,
 ) -> bool:
     """
     Transform a single block and save or print the result.
@@ -111,6 +118,7 @@ async def transform_block(
         use_template: Whether to use template-based generation
         pretty: Whether to pretty-print JSON
         quiet: Whether to suppress info messages
+        cache_dir: Directory for the on-disk response cache
 
     Returns:
         True if successful, False otherwise
@@ -120,8 +128,10 @@ async def transform_block(
             print(f"🔍 Transforming block {block_height} on {network}...")
 
         # Get chainhook data
-        if api_url:
-            config = AdapterConfig(network=network, api_url=api_url)
+        if api_url or cache_dir:
+            config = AdapterConfig(
+                network=network, api_url=api_url, cache_dir=cache_dir
+            )
             adapter = StacksChainhookAdapter(config)
             try:
                 chainhook_data = await adapter.get_block_chainhook(
@@ -236,6 +246,7 @@ def main() -> int:
                 use_template=args.template,
                 pretty=args.pretty,
                 quiet=args.quiet,
+                cache_dir=args.cache_dir,
             )
         )
         return 0 if success else 1
@@ -1,11 +1,14 @@
 """Stacks API client with rate limiting and retry logic."""
 
 import asyncio
+import os
 import random
 from typing import Dict, Any, Optional
 import httpx
 
 from app.config import config
+from app.lib.clarity import ClarityDecodeError, decode_clarity_value
+from .cache import MISSING, ResponseCache
 from .config import AdapterConfig
 from .exceptions import APIError, RateLimitError, BlockNotFoundError
 
@@ -19,7 +22,8 @@ class StacksAPIClient:
     - Automatic retry logic for failed requests
     - Comprehensive error handling
     - Support for mainnet and testnet
-    - Caching support (optional)
+    - Bounded TTL+LRU caching per namespace (optional), with an on-disk tier
+      for immutable responses
     - Metrics collection (optional)
     """
 
@@ -46,9 +50,9 @@ class StacksAPIClient:
         # Semaphore for controlling concurrent requests
         self._semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
 
-        # Simple in-memory cache (if enabled)
-        self._cache: Dict[str, Any] = {}
-        self._cache_timestamps: Dict[str, float] = {}
+        # Bounded in-memory caches (if enabled) and the on-disk tier (if a
+        # cache directory is configured)
+        self._cache = self._build_cache()
 
         self.logger.info(
             f"Initialized StacksAPIClient for {self.config.network} ({self.config.api_url})"
@@ -174,31 +178,68 @@ class StacksAPIClient:
         jitter = random.uniform(0, 1)  # Add jitter to prevent thundering herd
         return base_delay + jitter
 
-    def _get_cache_key(self, method: str, *args) -> str:
-        """Generate cache key for method and arguments."""
-        return f"{method}:{':'.join(str(arg) for arg in args)}"
+    def _build_cache(self) -> ResponseCache:
+        """Build the response cache namespaces from the configuration."""
+        enabled = self.config.enable_caching
+        entries = self.config.cache_max_entries if enabled else 0
+        blocks = self.config.cache_max_blocks if enabled else 0
+        cache_dir = self.config.cache_dir
+        return ResponseCache(
+            {
+                "block": (blocks, self.config.cache_ttl),
+                "tx": (entries, self.config.cache_ttl),
+                "signer_info": (entries, self.config.cache_ttl),
+                "hex_decode": (entries, 3600),
+                # The on-disk tier checks the tip before writing each block
+                "latest_height": (1 if enabled or cache_dir else 0, 30),
+                "pox_info": (1 if enabled else 0, self.config.pox_info_cache_ttl),
+                "network_info": (1 if enabled else 0, self.config.cache_ttl),
+            },
+            directory=(
+                os.path.join(cache_dir, self.config.network) if cache_dir else None
+            ),
+            persistent=("block", "signer_info", "hex_decode"),
+        )
 
-    def _is_cache_valid(self, key: str, ttl: int) -> bool:
-        """Check if cached entry is still valid."""
-        if not self.config.enable_caching:
+    def _get_cache_key(self, *args) -> str:
+        """Generate cache key for method arguments."""
+        return ":".join(str(arg) for arg in args)
+
+    async def _cache_get(self, namespace: str, key: str) -> Any:
+        """Look a response up in memory, then on disk; returns MISSING on a miss."""
+        value = self._cache.get(namespace, key)
+        if value is MISSING and self._cache.persists(namespace):
+            value = await asyncio.to_thread(self._cache.load, namespace, key)
+        return value
+
+    async def _cache_set(
+        self, namespace: str, key: str, value: Any, persist: bool = False
+    ) -> None:
+        """Cache a response, and write it to disk if ``persist`` is set."""
+        self._cache.set(namespace, key, value)
+        if persist and self._cache.persists(namespace):
+            await asyncio.to_thread(self._cache.store, namespace, key, value)
+
+    async def _is_block_final(
+        self, block_height: int, block_data: Dict[str, Any]
+    ) -> bool:
+        """Whether a block is deep enough below the tip to never change."""
+        if not self._cache.persists("block") or block_data.get("canonical") is False:
             return False
-
-        if key not in self._cache or key not in self._cache_timestamps:
+        try:
+            latest_height = await self.get_latest_block_height()
+        except APIError as e:
+            self.logger.debug(f"Not caching block {block_height} on disk: {e}")
             return False
+        return block_height <= latest_height - self.config.cache_finality_depth
 
-        import time
+    def get_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get hit, miss and eviction counters for every cache namespace.
 
-        return (time.time() - self._cache_timestamps[key]) < ttl
-
-    def _cache_set(self, key: str, value: Any) -> None:
-        """Set cache entry."""
-        if not self.config.enable_caching:
-            return
-
-        import time
-
-        self._cache[key] = value
-        self._cache_timestamps[key] = time.time()
+        Returns:
+            Dict[str, Dict[str, int]]: Counters and current size by namespace
+        """
+        return self._cache.stats()
 
     async def get_block_by_height(self, block_height: int) -> Dict[str, Any]:
         """Get complete block data by height.
@@ -213,12 +254,13 @@ class StacksAPIClient:
             BlockNotFoundError: If block is not found
             APIError: For other API errors
         """
-        cache_key = self._get_cache_key("block", block_height)
+        cache_key = self._get_cache_key(block_height)
 
         # Check cache first
-        if self._is_cache_valid(cache_key, self.config.cache_ttl):
+        cached = await self._cache_get("block", cache_key)
+        if cached is not MISSING:
             self.logger.debug(f"Cache hit for block {block_height}")
-            return self._cache[cache_key]
+            return cached
 
         try:
             self.logger.debug(
@@ -277,8 +319,13 @@ class StacksAPIClient:
                 f"Block {block_height} retrieved: {len(full_transactions)} full transactions"
             )
 
-            # Cache the result
-            self._cache_set(cache_key, block_data)
+            # Cache the result; finalized blocks also go to the on-disk tier
+            await self._cache_set(
+                "block",
+                cache_key,
+                block_data,
+                persist=await self._is_block_final(block_height, block_data),
+            )
 
             return block_data
 
@@ -296,12 +343,13 @@ class StacksAPIClient:
         Returns:
             Optional[Dict[str, Any]]: Transaction data or None if not found
         """
-        cache_key = self._get_cache_key("tx", tx_id)
+        cache_key = self._get_cache_key(tx_id)
 
         # Check cache first
-        if self._is_cache_valid(cache_key, self.config.cache_ttl):
+        cached = await self._cache_get("tx", cache_key)
+        if cached is not MISSING:
             self.logger.debug(f"Cache hit for transaction {tx_id[:8]}...")
-            return self._cache[cache_key]
+            return cached
 
         try:
             self.logger.debug(f"Fetching transaction {tx_id[:8]}...")
@@ -309,7 +357,7 @@ class StacksAPIClient:
             tx_data = response.json()
 
             # Cache the result
-            self._cache_set(cache_key, tx_data)
+            await self._cache_set("tx", cache_key, tx_data)
 
             return tx_data
 
@@ -329,11 +377,12 @@ class StacksAPIClient:
         Raises:
             APIError: For API errors
         """
-        cache_key = self._get_cache_key("latest_height")
+        cache_key = self._get_cache_key()
 
-        # Use shorter cache TTL for latest height
-        if self._is_cache_valid(cache_key, 30):  # 30 second cache
-            return self._cache[cache_key]
+        # Latest height has a shorter (30 second) cache TTL
+        cached = await self._cache_get("latest_height", cache_key)
+        if cached is not MISSING:
+            return cached
 
         try:
             self.logger.debug("Fetching latest block height...")
@@ -354,7 +403,7 @@ class StacksAPIClient:
             self.logger.debug(f"Latest block height: {height}")
 
             # Cache the result
-            self._cache_set(cache_key, height)
+            await self._cache_set("latest_height", cache_key, height)
 
             return height
 
@@ -367,11 +416,12 @@ class StacksAPIClient:
         Returns:
             Dict[str, Any]: PoX information
         """
-        cache_key = self._get_cache_key("pox_info")
+        cache_key = self._get_cache_key()
 
-        # PoX info changes slowly, use longer cache
-        if self._is_cache_valid(cache_key, self.config.pox_info_cache_ttl):
-            return self._cache[cache_key]
+        # PoX info changes slowly, its namespace has a longer TTL
+        cached = await self._cache_get("pox_info", cache_key)
+        if cached is not MISSING:
+            return cached
 
         try:
             self.logger.debug("Fetching PoX cycle information...")
@@ -383,7 +433,7 @@ class StacksAPIClient:
             )
 
             # Cache the result
-            self._cache_set(cache_key, pox_info)
+            await self._cache_set("pox_info", cache_key, pox_info)
 
             return pox_info
 
@@ -397,10 +447,11 @@ class StacksAPIClient:
         Returns:
             Dict[str, Any]: Network information
         """
-        cache_key = self._get_cache_key("network_info")
+        cache_key = self._get_cache_key()
 
-        if self._is_cache_valid(cache_key, self.config.cache_ttl):
-            return self._cache[cache_key]
+        cached = await self._cache_get("network_info", cache_key)
+        if cached is not MISSING:
+            return cached
 
         try:
             self.logger.debug("Fetching network information...")
@@ -412,7 +463,7 @@ class StacksAPIClient:
             )
 
             # Cache the result
-            self._cache_set(cache_key, network_info)
+            await self._cache_set("network_info", cache_key, network_info)
 
             return network_info
 
@@ -429,10 +480,11 @@ class StacksAPIClient:
         Returns:
             Dict[str, Any]: Signer information if available
         """
-        cache_key = self._get_cache_key("signer_info", block_hash)
+        cache_key = self._get_cache_key(block_hash)
 
-        if self._is_cache_valid(cache_key, self.config.cache_ttl):
-            return self._cache[cache_key]
+        cached = await self._cache_get("signer_info", cache_key)
+        if cached is not MISSING:
+            return cached
 
         try:
             self.logger.debug(
@@ -455,8 +507,8 @@ class StacksAPIClient:
                     f"No signer info available for block {block_hash[:16]}"
                 )
 
-            # Cache the result
-            self._cache_set(cache_key, signer_info)
+            # Cache the result; signer info of a block hash never changes
+            await self._cache_set("signer_info", cache_key, signer_info, persist=True)
 
             return signer_info
 
@@ -475,7 +527,10 @@ class StacksAPIClient:
             return {}
 
     async def decode_clarity_hex(self, hex_value: str) -> Optional[Dict[str, Any]]:
-        """Decode a clarity hex value using external API.
+        """Decode a clarity hex value.
+
+        Values are decoded locally; the external decoder API is only asked
+        about values the local decoder rejects.
 
         Args:
             hex_value: Hex string to decode (with or without 0x prefix)
@@ -491,12 +546,20 @@ class StacksAPIClient:
         if not hex_value.startswith("0x"):
             hex_value = "0x" + hex_value
 
-        cache_key = self._get_cache_key("hex_decode", hex_value)
+        try:
+            return self._process_decoded_value(decode_clarity_value(hex_value))
+        except ClarityDecodeError as e:
+            self.logger.debug(
+                f"Local decoding failed for {hex_value[:20]}..., using decoder API: {e}"
+            )
 
-        # Use shorter cache TTL for hex decoding (decoded values rarely change)
-        if self._is_cache_valid(cache_key, 3600):  # 1 hour cache
+        cache_key = self._get_cache_key(hex_value)
+
+        # Decoding is deterministic, so decoded values are also kept on disk
+        cached = await self._cache_get("hex_decode", cache_key)
+        if cached is not MISSING:
             self.logger.debug(f"Cache hit for hex decode {hex_value[:20]}...")
-            return self._cache[cache_key]
+            return cached
 
         try:
             self.logger.debug(f"Decoding hex value {hex_value[:20]}...")
@@ -527,7 +590,9 @@ class StacksAPIClient:
                     processed_value = self._process_decoded_value(decoded_value)
 
                     # Cache the processed result
-                    self._cache_set(cache_key, processed_value)
+                    await self._cache_set(
+                        "hex_decode", cache_key, processed_value, persist=True
+                    )
 
                     return processed_value
                 else:
@@ -604,8 +669,8 @@ class StacksAPIClient:
     async def close(self) -> None:
         """Close the HTTP client and clean up resources."""
         await self.client.aclose()
+        self.logger.debug(f"Cache stats: {self._cache.stats()}")
         self._cache.clear()
-        self._cache_timestamps.clear()
         self.logger.info("StacksAPIClient closed")
 
     async def __aenter__(self):
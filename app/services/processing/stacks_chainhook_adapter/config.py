@@ -22,6 +22,12 @@ class AdapterConfig:
         max_concurrent_requests: Maximum number of concurrent API requests
         enable_caching: Whether to enable response caching
         cache_ttl: Time-to-live for cached responses in seconds
+        cache_max_entries: Most entries kept per cache namespace
+        cache_max_blocks: Most blocks kept in memory (blocks embed their transactions)
+        cache_dir: Directory for the on-disk cache of immutable responses
+            (finalized blocks, signer info, decoded hex); None disables it
+        cache_finality_depth: Blocks below the chain tip before a block is
+            considered final and written to the on-disk cache
         log_level: Logging level for the adapter
         custom_headers: Additional headers to send with API requests
         rate_limit_delay: Minimum delay between requests in seconds
@@ -46,6 +52,10 @@ class AdapterConfig:
     enable_caching: bool = False
     cache_ttl: int = 300
     pox_info_cache_ttl: int = 3600
+    cache_max_entries: int = 1024
+    cache_max_blocks: int = 64
+    cache_dir: Optional[str] = None
+    cache_finality_depth: int = 1000
 
     # Logging Configuration
     log_level: str = "INFO"
@@ -92,6 +102,14 @@ class AdapterConfig:
         if self.rate_limit_delay < 0:
             raise ValueError("rate_limit_delay must be non-negative")
 
+        if self.cache_max_entries < 0 or self.cache_max_blocks < 0:
+            raise ValueError(
+                "cache_max_entries and cache_max_blocks must be non-negative"
+            )
+
+        if self.cache_finality_depth < 0:
+            raise ValueError("cache_finality_depth must be non-negative")
+
         # Validate log level
         valid_log_levels = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
         if self.log_level.upper() not in valid_log_levels:
@@ -114,6 +132,10 @@ class AdapterConfig:
             STACKS_MAX_CONCURRENT: Maximum concurrent requests
             STACKS_ENABLE_CACHING: Enable caching (true/false)
             STACKS_CACHE_TTL: Cache TTL in seconds
+            STACKS_CACHE_MAX_ENTRIES: Most entries per cache namespace
+            STACKS_CACHE_MAX_BLOCKS: Most blocks kept in memory
+            STACKS_CACHE_DIR: Directory for the on-disk cache
+            STACKS_CACHE_FINALITY_DEPTH: Depth at which blocks are cached on disk
             STACKS_LOG_LEVEL: Logging level
             STACKS_RATE_LIMIT_DELAY: Rate limit delay in seconds
             STACKS_ENABLE_METRICS: Enable metrics collection (true/false)
@@ -136,6 +158,10 @@ class AdapterConfig:
             "STACKS_MAX_CONCURRENT": ("max_concurrent_requests", int),
             "STACKS_ENABLE_CACHING": ("enable_caching", lambda x: x.lower() == "true"),
             "STACKS_CACHE_TTL": ("cache_ttl", int),
+            "STACKS_CACHE_MAX_ENTRIES": ("cache_max_entries", int),
+            "STACKS_CACHE_MAX_BLOCKS": ("cache_max_blocks", int),
+            "STACKS_CACHE_DIR": "cache_dir",
+            "STACKS_CACHE_FINALITY_DEPTH": ("cache_finality_depth", int),
             "STACKS_LOG_LEVEL": "log_level",
             "STACKS_RATE_LIMIT_DELAY": ("rate_limit_delay", float),
             "STACKS_POX_CACHE_TTL": ("pox_info_cache_ttl", int),
@@ -207,6 +233,10 @@ class AdapterConfig:
             "enable_caching": self.enable_caching,
             "cache_ttl": self.cache_ttl,
             "pox_info_cache_ttl": self.pox_info_cache_ttl,
+            "cache_max_entries": self.cache_max_entries,
+            "cache_max_blocks": self.cache_max_blocks,
+            "cache_dir": self.cache_dir,
+            "cache_finality_depth": self.cache_finality_depth,
             "log_level": self.log_level,
             "custom_headers": self.custom_headers.copy(),
             "enable_metrics": self.enable_metrics,
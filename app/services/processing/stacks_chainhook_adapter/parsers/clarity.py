@@ -1,12 +1,65 @@
 """Clarity repr format parser for smart contract events."""
 
 import re
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Pattern, Tuple, Union
 import logging
 
 from .base import BaseParser
 from ..exceptions import ParseError
 
+_NOTIFICATION_PATTERN = re.compile(r'notification "([^"]*)"')
+_MEMO_PATTERN = re.compile(r'memo \(some "([^"]+)"\)')
+_SOME_PATTERN = re.compile(r"\(some (.+)\)")
+
+
+def _parse_repr_bool(value: str) -> bool:
+    return value == "true"
+
+
+def _field(
+    name: str, pattern: str, converter: Callable[[str], Any] = str
+) -> Tuple[str, Pattern[str], Callable[[str], Any]]:
+    return name, re.compile(pattern), converter
+
+
+# Payload fields of notification tuples: (name, compiled pattern, converter)
+_FIELD_EXTRACTORS = [
+    # Contract identifiers - from quote until closing parenthesis
+    _field("action", r"action '([^)]+)\)"),
+    _field("contractCaller", r"contractCaller '([^)]+)\)"),
+    _field("creator", r"creator '([^)]+)\)"),
+    _field("txSender", r"txSender '([^)]+)\)"),
+    # Uint fields (bounded by parentheses)
+    *(
+        _field(name, rf"\({name} u(\d+)\)", int)
+        for name in (
+            "proposalId",
+            "status",
+            "votesFor",
+            "votesAgainst",
+            "bond",
+            "liquidTokens",
+            "vetoVotes",
+        )
+    ),
+    # Boolean fields (bounded by parentheses)
+    *(
+        _field(name, rf"\({name} (true|false)\)", _parse_repr_bool)
+        for name in (
+            "passed",
+            "executed",
+            "expired",
+            "vetoed",
+            "metQuorum",
+            "metThreshold",
+            "vetoExceedsYes",
+            "vetoMetQuorum",
+        )
+    ),
+    # Hex data (bounded by parentheses and space/paren)
+    _field("parameters", r"\(parameters (0x[a-fA-F0-9]+)\)"),
+]
+
 
 class ClarityParser(BaseParser):
     """
@@ -95,74 +148,21 @@ class ClarityParser(BaseParser):
             Dict[str, Any]: Parsed notification and payload
         """
         # Extract notification
-        notification_match = re.search(r'notification "([^"]*)"', repr_str)
+        notification_match = _NOTIFICATION_PATTERN.search(repr_str)
         notification = notification_match.group(1) if notification_match else ""
 
         # Use more precise parsing by looking for tuple elements
         payload = {}
 
         # Extract memo field first (has special "some" wrapper)
-        memo_match = re.search(r'memo \\(some "([^"]+)"\\)', repr_str)
+        memo_match = _MEMO_PATTERN.search(repr_str)
         if memo_match:
             payload["memo"] = memo_match.group(1)
 
-        # Define field extractors with CORRECT boundary patterns (no closing quotes!)
-        field_extractors = [
-            # Contract identifiers - from quote until closing parenthesis
-            ("action", r"action '([^)]+)\\)"),
-            ("contractCaller", r"contractCaller '([^)]+)\\)"),
-            ("creator", r"creator '([^)]+)\\)"),
-            ("txSender", r"txSender '([^)]+)\\)"),
-            # Uint fields (bounded by parentheses)
-            ("proposalId", r"\\(proposalId u(\\d+)\\)"),
-            ("status", r"\\(status u(\\d+)\\)"),
-            ("votesFor", r"\\(votesFor u(\\d+)\\)"),
-            ("votesAgainst", r"\\(votesAgainst u(\\d+)\\)"),
-            ("bond", r"\\(bond u(\\d+)\\)"),
-            ("liquidTokens", r"\\(liquidTokens u(\\d+)\\)"),
-            ("vetoVotes", r"\\(vetoVotes u(\\d+)\\)"),
-            # Boolean fields (bounded by parentheses)
-            ("passed", r"\\(passed (true|false)\\)"),
-            ("executed", r"\\(executed (true|false)\\)"),
-            ("expired", r"\\(expired (true|false)\\)"),
-            ("vetoed", r"\\(vetoed (true|false)\\)"),
-            ("metQuorum", r"\\(metQuorum (true|false)\\)"),
-            ("metThreshold", r"\\(metThreshold (true|false)\\)"),
-            ("vetoExceedsYes", r"\\(vetoExceedsYes (true|false)\\)"),
-            ("vetoMetQuorum", r"\\(vetoMetQuorum (true|false)\\)"),
-            # Hex data (bounded by parentheses and space/paren)
-            ("parameters", r"\\(parameters (0x[a-fA-F0-9]+)\\)"),
-        ]
-
-        for field_name, pattern in field_extractors:
-            match = re.search(pattern, repr_str)
+        for field_name, pattern, converter in _FIELD_EXTRACTORS:
+            match = pattern.search(repr_str)
             if match:
-                value = match.group(1)
-
-                # Convert based on field type
-                if field_name in [
-                    "passed",
-                    "executed",
-                    "expired",
-                    "vetoed",
-                    "metQuorum",
-                    "metThreshold",
-                    "vetoExceedsYes",
-                    "vetoMetQuorum",
-                ]:
-                    payload[field_name] = value == "true"
-                elif field_name in [
-                    "proposalId",
-                    "status",
-                    "votesFor",
-                    "votesAgainst",
-                    "bond",
-                    "liquidTokens",
-                    "vetoVotes",
-                ]:
-                    payload[field_name] = int(value)
-                else:
-                    payload[field_name] = value
+                payload[field_name] = converter(match.group(1))
 
         return {"notification": notification, "payload": payload}
 
@@ -267,7 +267,7 @@ class ClarityParser(BaseParser):
             return None
 
         # Parse (some ...) pattern
-        some_match = re.match(r"\\(some (.+)\\)", value_str)
+        some_match = _SOME_PATTERN.match(value_str)
         if some_match:
             inner_value = some_match.group(1)
             # Recursively parse the inner value
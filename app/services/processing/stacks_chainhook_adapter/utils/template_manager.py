@@ -8,14 +8,127 @@ with Stacks API data, setting null for unavailable values.
 """
 
 import json
+import logging
 import os
 import uuid
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from copy import deepcopy
 
 from ..models.chainhook import ChainHookData
 
+logger = logging.getLogger(__name__)
+
+# Template values populate_template replaces on every well-formed block.
+# Compiled skeletons hand these out uncopied; whatever populate_template
+# leaves in place is copied afterwards (CompiledTemplate.detach).
+_REPLACED_PATHS = (
+    ("apply", "*", "transactions", "*", "metadata", "receipt", "events"),
+    ("apply", "*", "transactions", "*", "metadata", "receipt", "contract_calls_stack"),
+    ("apply", "*", "transactions", "*", "metadata", "receipt", "mutated_assets_radius"),
+    (
+        "apply",
+        "*",
+        "transactions",
+        "*",
+        "metadata",
+        "receipt",
+        "mutated_contracts_radius",
+    ),
+    ("apply", "*", "transactions", "*", "metadata", "kind", "data", "args"),
+    ("apply", "*", "transactions", "*", "operations", "*"),
+)
+
+_CONST, _BUILD, _SHARED = 0, 1, 2
+
+# (container, key, template value) for every value handed out uncopied
+Slots = List[Tuple[Any, Any, Any]]
+
+
+def _compile_entry(
+    key: Any, value: Any, paths: Tuple[Tuple[Any, ...], ...]
+) -> Tuple[Any, int, Any]:
+    child_paths = tuple(path[1:] for path in paths if path[0] in (key, "*"))
+    if () in child_paths:
+        return key, _SHARED, value
+    if not isinstance(value, (dict, list)):
+        return key, _CONST, value
+    return key, _BUILD, _compile_node(value, child_paths)
+
+
+def _compile_node(
+    value: Any, paths: Tuple[Tuple[Any, ...], ...]
+) -> Callable[[Slots], Any]:
+    """Compile a template node into a function that builds a fresh copy."""
+    if isinstance(value, dict):
+        entries = [_compile_entry(k, v, paths) for k, v in value.items()]
+        if all(kind == _CONST for _, kind, _ in entries):
+            return lambda slots: value.copy()
+
+        def build_dict(slots: Slots) -> Dict[str, Any]:
+            node = {}
+            for key, kind, child in entries:
+                if kind == _CONST:
+                    node[key] = child
+                elif kind == _BUILD:
+                    node[key] = child(slots)
+                else:
+                    node[key] = child
+                    slots.append((node, key, child))
+            return node
+
+        return build_dict
+
+    if isinstance(value, list):
+        entries = [_compile_entry(i, v, paths) for i, v in enumerate(value)]
+        if all(kind == _CONST for _, kind, _ in entries):
+            return lambda slots: value.copy()
+
+        def build_list(slots: Slots) -> List[Any]:
+            node = []
+            for index, kind, child in entries:
+                if kind == _CONST:
+                    node.append(child)
+                elif kind == _BUILD:
+                    node.append(child(slots))
+                else:
+                    node.append(child)
+                    slots.append((node, index, child))
+            return node
+
+        return build_list
+
+    return lambda slots: value
+
+
+class CompiledTemplate:
+    """A chainhook template pre-analysed into a skeleton factory.
+
+    ``skeleton()`` builds a document with the template's exact structure and
+    key order without deep-copying it: scalars are shared, containers are
+    rebuilt from precompiled builders, and the large values populate_template
+    always replaces (receipt events, operations, call args) are not copied at
+    all. ``detach()`` copies any of those that were not replaced, so the
+    populated document never shares mutable state with the template.
+    """
+
+    def __init__(self, template: Dict[str, Any]):
+        self._build = _compile_node(template, _REPLACED_PATHS)
+
+    def skeleton(self) -> Tuple[Dict[str, Any], Slots]:
+        slots: Slots = []
+        return self._build(slots), slots
+
+    @staticmethod
+    def detach(slots: Slots) -> None:
+        for container, key, value in slots:
+            try:
+                current = container[key]
+            except (IndexError, KeyError):
+                continue
+            if current is value:
+                container[key] = deepcopy(value)
+
 
 class ChainhookTemplateManager:
     """
@@ -23,12 +136,16 @@ class ChainhookTemplateManager:
     Ensures our adapter output matches the exact structure of real chainhooks.
     """
 
-    def __init__(self, template_directory: str = "chainhook-data"):
+    def __init__(
+        self, template_directory: str = "chainhook-data", compiled: bool = True
+    ):
         """
         Initialize with the directory containing chainhook template files.
 
         Args:
             template_directory: Directory containing chainhook JSON files
+            compiled: Build populated blocks from compiled templates instead of
+                deep copies of the full template documents
         """
         # Find template directory relative to project root
         if not os.path.isabs(template_directory):
@@ -55,26 +172,19 @@ class ChainhookTemplateManager:
         else:
             self.template_directory = Path(template_directory)
 
+        self.compiled = compiled
         self.templates = {}
+        self.compiled_templates: Dict[str, CompiledTemplate] = {}
         self.load_templates()
 
     def load_templates(self):
         """Load all chainhook template files."""
-        print(f"🔍 Looking for templates in: {self.template_directory.absolute()}")
+        logger.debug(f"Looking for templates in: {self.template_directory.absolute()}")
 
         if not self.template_directory.exists():
-            print(f"❌ Template directory not found: {self.template_directory}")
+            logger.warning(f"Template directory not found: {self.template_directory}")
             return
 
-        print(f"✅ Template directory found: {self.template_directory}")
-
-        # List what's actually in the directory
-        try:
-            files_in_dir = list(self.template_directory.glob("*.json"))
-            print(f"📁 JSON files found: {[f.name for f in files_in_dir]}")
-        except Exception as e:
-            print(f"❌ Error listing directory contents: {e}")
-
         template_files = {
             "buy-and-deposit": "buy-and-deposit.json",
             "conclude-action-proposal": "conclude-action-proposal.json",
@@ -92,11 +202,14 @@ class ChainhookTemplateManager:
                     with open(file_path, "r") as f:
                         template_data = json.load(f)
                         self.templates[template_name] = template_data
-                        print(f"✅ Loaded template: {template_name}")
+                        self.compiled_templates[template_name] = CompiledTemplate(
+                            template_data
+                        )
+                        logger.debug(f"Loaded template: {template_name}")
                 except Exception as e:
-                    print(f"❌ Failed to load template {filename}: {e}")
+                    logger.warning(f"Failed to load template {filename}: {e}")
             else:
-                print(f"⚠️  Template file not found: {filename}")
+                logger.debug(f"Template file not found: {filename}")
 
     def get_template_for_transaction_type(
         self, transaction_type: str
@@ -110,6 +223,13 @@ class ChainhookTemplateManager:
         Returns:
             Template dictionary or None if not found
         """
+        template_name = self._template_name_for(transaction_type)
+        if template_name is None:
+            return None
+        return deepcopy(self.templates[template_name])
+
+    def _template_name_for(self, transaction_type: str) -> Optional[str]:
+        """Name of the loaded template used for a transaction type."""
         # Map transaction types to template names
         type_mapping = {
             "buy-and-deposit": "buy-and-deposit",
@@ -125,11 +245,11 @@ class ChainhookTemplateManager:
 
         template_name = type_mapping.get(transaction_type)
         if template_name and template_name in self.templates:
-            return deepcopy(self.templates[template_name])
+            return template_name
 
         # Fallback to a generic template (use conclude-action-proposal as base)
         if "conclude-action-proposal" in self.templates:
-            return deepcopy(self.templates["conclude-action-proposal"])
+            return "conclude-action-proposal"
 
         return None
 
@@ -223,11 +343,7 @@ class ChainhookTemplateManager:
                     template_metadata["bitcoin_anchor_block_identifier"]["hash"] = (
                         bitcoin_anchor["hash"]
                     )
-                    # Use debug logging instead of print
-                    import logging
-
-                    logger = logging.getLogger(__name__)
-                    logger.info(
+                    logger.debug(
                         f"Template manager: Updated bitcoin_anchor_block_identifier to index={bitcoin_anchor['index']}"
                     )
         else:
@@ -492,9 +608,26 @@ class ChainhookTemplateManager:
         Returns:
             Template-based chainhook data matching original structure
         """
+        if self.compiled:
+            template_name = self._template_name_for(transaction_type)
+            if template_name is None:
+                logger.warning(
+                    f"No template found for transaction type: {transaction_type}"
+                )
+                return None
+            compiled = self.compiled_templates[template_name]
+            template, slots = compiled.skeleton()
+            populated_template = self.populate_template(
+                template, chainhook_data, transaction_type
+            )
+            compiled.detach(slots)
+            return populated_template
+
         template = self.get_template_for_transaction_type(transaction_type)
         if not template:
-            print(f"⚠️  No template found for transaction type: {transaction_type}")
+            logger.warning(
+                f"No template found for transaction type: {transaction_type}"
+            )
             return None
 
         populated_template = self.populate_template(
@@ -742,21 +742,35 @@ class TwitterDataService:
                 except (AttributeError, ValueError, TypeError):
                     created_at_twitter = str(tweet_data["created_at"])
 
-            # Handle quoted posts first (store them before the main tweet)
-            quoted_tweet_db_id = None
+            # Quoted and replied-to posts are stored before the main tweet,
+            # in one write, so it can link to them
             quoted_posts = tweet_data.get("quoted_posts", []) or []
+            replied_posts = tweet_data.get("replied_posts", []) or []
+            quoted_ids = [
+                str(quoted_post["data"]["id"])
+                for quoted_post in quoted_posts
+                if "data" in quoted_post
+            ]
+            replied_ids = [str(replied_post["id"]) for replied_post in replied_posts]
+
+            db_ids: Dict[str, UUID] = {}
+            if quoted_ids or replied_ids:
+                db_ids = {
+                    existing.tweet_id: existing.id
+                    for existing in backend.list_x_tweets(
+                        XTweetFilter(tweet_ids=quoted_ids + replied_ids)
+                    )
+                }
+            new_tweets: Dict[str, XTweetCreate] = {}
 
+            # Handle quoted posts
             for quoted_post in quoted_posts:
                 if "data" in quoted_post:
                     quoted_data = quoted_post["data"]
                     quoted_tweet_id = str(quoted_data["id"])
 
                     # Check if quoted tweet already exists
-                    existing_quoted = backend.list_x_tweets(
-                        XTweetFilter(tweet_id=quoted_tweet_id)
-                    )
-                    if existing_quoted:
-                        quoted_tweet_db_id = existing_quoted[0].id
+                    if quoted_tweet_id in db_ids or quoted_tweet_id in new_tweets:
                         logger.debug(f"Quoted tweet {quoted_tweet_id} already exists")
                     else:
                         # Store the quoted tweet first
@@ -780,7 +794,7 @@ class TwitterDataService:
                             except (AttributeError, ValueError, TypeError):
                                 quoted_created_at = str(quoted_data["created_at"])
 
-                        quoted_tweet_create = XTweetCreate(
+                        new_tweets[quoted_tweet_id] = XTweetCreate(
                             message=quoted_data.get("text"),
                             author_id=quoted_author_id,
                             tweet_id=quoted_tweet_id,
@@ -800,23 +814,12 @@ class TwitterDataService:
                             # No quoted_tweet_id for the quoted post itself
                         )
 
-                        quoted_record = backend.create_x_tweet(quoted_tweet_create)
-                        quoted_tweet_db_id = quoted_record.id
-                        logger.info(f"Stored quoted tweet {quoted_tweet_id}")
-
             # Handle replied-to posts (store parent tweet if needed)
-            replied_tweet_db_id = None
-            replied_posts = tweet_data.get("replied_posts", []) or []
-
             for replied_post in replied_posts:
                 replied_tweet_id = str(replied_post["id"])
 
                 # Check if parent tweet already exists
-                existing_replied = backend.list_x_tweets(
-                    XTweetFilter(tweet_id=replied_tweet_id)
-                )
-                if existing_replied:
-                    replied_tweet_db_id = existing_replied[0].id
+                if replied_tweet_id in db_ids or replied_tweet_id in new_tweets:
                     logger.debug(f"Parent tweet {replied_tweet_id} already exists")
                 else:
                     # Fetch and store the parent tweet
@@ -855,7 +858,7 @@ class TwitterDataService:
                                         parent_tweet_data["created_at"]
                                     )
 
-                            parent_tweet_create = XTweetCreate(
+                            new_tweets[replied_tweet_id] = XTweetCreate(
                                 message=parent_tweet_data.get("text"),
                                 author_id=parent_author_id,
                                 tweet_id=replied_tweet_id,
@@ -884,15 +887,27 @@ class TwitterDataService:
                                 else None,
                                 # Don't recursively store parent's parent
                             )
-
-                            parent_record = backend.create_x_tweet(parent_tweet_create)
-                            replied_tweet_db_id = parent_record.id
-                            logger.info(f"Stored parent tweet {replied_tweet_id}")
                     except Exception as e:
                         logger.warning(
                             f"Could not fetch/store parent tweet {replied_tweet_id}: {str(e)}"
                         )
 
+            if new_tweets:
+                for record in backend.create_x_tweets(list(new_tweets.values())):
+                    db_ids[record.tweet_id] = record.id
+                logger.info(
+                    f"Stored {len(new_tweets)} quoted/parent tweets: "
+                    f"{', '.join(new_tweets)}"
+                )
+
+            # Link to the last quoted and replied-to posts that were stored
+            quoted_tweet_db_id = next(
+                (db_ids[t] for t in reversed(quoted_ids) if t in db_ids), None
+            )
+            replied_tweet_db_id = next(
+                (db_ids[t] for t in reversed(replied_ids) if t in db_ids), None
+            )
+
             # Analyze tweet images for Bitcoin faces
             tweet_images_analysis = []
             # TODO: Uncomment this when we have a way to analyze images thats faster than the current implementation
@@ -1030,7 +1045,7 @@ class TwitterDataService:
                 logger.warning(f"No timeline data returned for author {author_id}")
                 return []
 
-            stored_tweet_ids = []
+            timeline_tweets: List[Dict[str, Any]] = []
 
             # Process each tweet in the timeline
             for tweet in timeline_response:
@@ -1077,17 +1092,35 @@ class TwitterDataService:
                         )
                         continue
 
-                    # Check if tweet already exists
-                    existing_tweets = backend.list_x_tweets(
-                        XTweetFilter(tweet_id=tweet_data["id"])
-                    )
-                    if existing_tweets:
-                        logger.debug(
-                            f"Timeline tweet {tweet_data['id']} already exists in database"
+                    timeline_tweets.append(tweet_data)
+
+                except Exception as e:
+                    logger.error(f"Error processing author timeline tweet: {str(e)}")
+                    continue
+
+            # Look up all timeline tweets at once and store the new ones in
+            # a single write
+            db_ids: Dict[str, UUID] = {}
+            if timeline_tweets:
+                db_ids = {
+                    existing.tweet_id: existing.id
+                    for existing in backend.list_x_tweets(
+                        XTweetFilter(
+                            tweet_ids=[
+                                tweet_data["id"] for tweet_data in timeline_tweets
+                            ]
                         )
-                        stored_tweet_ids.append(existing_tweets[0].id)
-                        continue
+                    )
+                }
 
+            new_tweets: Dict[str, XTweetCreate] = {}
+            for tweet_data in timeline_tweets:
+                if tweet_data["id"] in db_ids or tweet_data["id"] in new_tweets:
+                    logger.debug(
+                        f"Timeline tweet {tweet_data['id']} already exists in database"
+                    )
+                    continue
+                try:
                     # Extract images from tweet
                     image_urls = self._extract_images_from_tweet_data(tweet_data)
 
@@ -1108,7 +1141,7 @@ class TwitterDataService:
                             created_at_twitter = str(tweet_data["created_at"])
 
                     # Create tweet record with consistent structure
-                    tweet_create_data = XTweetCreate(
+                    new_tweets[tweet_data["id"]] = XTweetCreate(
                         message=tweet_data.get("text"),
                         author_id=author_db_id,
                         tweet_id=tweet_data["id"],
@@ -1127,16 +1160,23 @@ class TwitterDataService:
                         tweet_images_analysis=[],  # Skip image analysis for author tweets for performance
                     )
 
-                    tweet_record = backend.create_x_tweet(tweet_create_data)
-                    stored_tweet_ids.append(tweet_record.id)
-                    logger.debug(
-                        f"Stored author tweet {tweet_data['id']} with {len(image_urls)} images"
-                    )
-
                 except Exception as e:
                     logger.error(f"Error processing author timeline tweet: {str(e)}")
                     continue
 
+            if new_tweets:
+                for record in backend.create_x_tweets(list(new_tweets.values())):
+                    db_ids[record.tweet_id] = record.id
+                logger.debug(
+                    f"Stored {len(new_tweets)} author tweets: {', '.join(new_tweets)}"
+                )
+
+            stored_tweet_ids = [
+                db_ids[tweet_data["id"]]
+                for tweet_data in timeline_tweets
+                if tweet_data["id"] in db_ids
+            ]
+
             logger.info(
                 f"Successfully stored {len(stored_tweet_ids)} tweets from author {author_username or author_id}"
             )
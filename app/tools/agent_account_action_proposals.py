@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, List, Optional, Type
 from uuid import UUID
 
 from langchain.tools import BaseTool
@@ -66,7 +66,7 @@ class AgentAccountCreateActionProposalTool(BaseTool):
         super().__init__(**kwargs)
         self.wallet_id = wallet_id
 
-    def _run_script(
+    def _script_args(
         self,
         agent_account_contract: str,
         dao_action_proposal_voting_contract: str,
@@ -74,17 +74,11 @@ class AgentAccountCreateActionProposalTool(BaseTool):
         dao_token_contract: str,
         message_to_send: str,
         memo: Optional[str] = None,
-        **kwargs,
-    ) -> Dict[str, Any]:
-        """Execute the tool to create an action proposal through an agent account."""
-        if self.wallet_id is None:
-            return {
-                "success": False,
-                "message": "Wallet ID is required",
-                "data": None,
-            }
-
+    ) -> List[str]:
+        """Script directory, name and arguments to create an action proposal."""
         args = [
+            "aibtc-cohort-0/agent-account/public",
+            "create-action-proposal.ts",
             agent_account_contract,
             dao_action_proposal_voting_contract,
             action_contract_to_execute,
@@ -95,11 +89,36 @@ class AgentAccountCreateActionProposalTool(BaseTool):
         if memo:
             args.append(memo)
 
+        return args
+
+    def _run_script(
+        self,
+        agent_account_contract: str,
+        dao_action_proposal_voting_contract: str,
+        action_contract_to_execute: str,
+        dao_token_contract: str,
+        message_to_send: str,
+        memo: Optional[str] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Execute the tool to create an action proposal through an agent account."""
+        if self.wallet_id is None:
+            return {
+                "success": False,
+                "message": "Wallet ID is required",
+                "data": None,
+            }
+
         return BunScriptRunner.bun_run(
             self.wallet_id,
-            "aibtc-cohort-0/agent-account/public",
-            "create-action-proposal.ts",
-            *args,
+            *self._script_args(
+                agent_account_contract,
+                dao_action_proposal_voting_contract,
+                action_contract_to_execute,
+                dao_token_contract,
+                message_to_send,
+                memo,
+            ),
         )
 
     def _run(
@@ -133,15 +152,24 @@ class AgentAccountCreateActionProposalTool(BaseTool):
         memo: Optional[str] = None,
         **kwargs,
     ) -> Dict[str, Any]:
-        """Async version of the tool."""
-        return self._run_script(
-            agent_account_contract,
-            dao_action_proposal_voting_contract,
-            action_contract_to_execute,
-            dao_token_contract,
-            message_to_send,
-            memo,
-            **kwargs,
+        """Async version of the tool, run on the Bun worker pool."""
+        if self.wallet_id is None:
+            return {
+                "success": False,
+                "message": "Wallet ID is required",
+                "data": None,
+            }
+
+        return await BunScriptRunner.abun_run(
+            self.wallet_id,
+            *self._script_args(
+                agent_account_contract,
+                dao_action_proposal_voting_contract,
+                action_contract_to_execute,
+                dao_token_contract,
+                message_to_send,
+                memo,
+            ),
         )
 
 
@@ -193,6 +221,23 @@ class AgentAccountVoteOnActionProposalTool(BaseTool):
         super().__init__(**kwargs)
         self.wallet_id = wallet_id
 
+    def _script_args(
+        self,
+        agent_account_contract: str,
+        dao_action_proposal_voting_contract: str,
+        proposal_id: int,
+        vote: bool,
+    ) -> List[str]:
+        """Script directory, name and arguments to vote on an action proposal."""
+        return [
+            "aibtc-cohort-0/agent-account/public",
+            "vote-on-action-proposal.ts",
+            agent_account_contract,
+            dao_action_proposal_voting_contract,
+            str(proposal_id),
+            str(vote).lower(),
+        ]
+
     def _run_script(
         self,
         agent_account_contract: str,
@@ -209,18 +254,14 @@ class AgentAccountVoteOnActionProposalTool(BaseTool):
                 "data": None,
             }
 
-        args = [
-            agent_account_contract,
-            dao_action_proposal_voting_contract,
-            str(proposal_id),
-            str(vote).lower(),
-        ]
-
         return BunScriptRunner.bun_run(
             self.wallet_id,
-            "aibtc-cohort-0/agent-account/public",
-            "vote-on-action-proposal.ts",
-            *args,
+            *self._script_args(
+                agent_account_contract,
+                dao_action_proposal_voting_contract,
+                proposal_id,
+                vote,
+            ),
         )
 
     def _run(
@@ -248,13 +289,22 @@ class AgentAccountVoteOnActionProposalTool(BaseTool):
         vote: bool,
         **kwargs,
     ) -> Dict[str, Any]:
-        """Async version of the tool."""
-        return self._run_script(
-            agent_account_contract,
-            dao_action_proposal_voting_contract,
-            proposal_id,
-            vote,
-            **kwargs,
+        """Async version of the tool, run on the Bun worker pool."""
+        if self.wallet_id is None:
+            return {
+                "success": False,
+                "message": "Wallet ID is required",
+                "data": None,
+            }
+
+        return await BunScriptRunner.abun_run(
+            self.wallet_id,
+            *self._script_args(
+                agent_account_contract,
+                dao_action_proposal_voting_contract,
+                proposal_id,
+                vote,
+            ),
         )
 
 
@@ -301,6 +351,21 @@ class AgentAccountVetoActionProposalTool(BaseTool):
         super().__init__(**kwargs)
         self.wallet_id = wallet_id
 
+    def _script_args(
+        self,
+        agent_account_contract: str,
+        dao_action_proposal_voting_contract: str,
+        proposal_id: int,
+    ) -> List[str]:
+        """Script directory, name and arguments to veto an action proposal."""
+        return [
+            "aibtc-cohort-0/agent-account/public",
+            "veto-action-proposal.ts",
+            agent_account_contract,
+            dao_action_proposal_voting_contract,
+            str(proposal_id),
+        ]
+
     def _run_script(
         self,
         agent_account_contract: str,
@@ -316,17 +381,13 @@ class AgentAccountVetoActionProposalTool(BaseTool):
                 "data": None,
             }
 
-        args = [
-            agent_account_contract,
-            dao_action_proposal_voting_contract,
-            str(proposal_id),
-        ]
-
         return BunScriptRunner.bun_run(
             self.wallet_id,
-            "aibtc-cohort-0/agent-account/public",
-            "veto-action-proposal.ts",
-            *args,
+            *self._script_args(
+                agent_account_contract,
+                dao_action_proposal_voting_contract,
+                proposal_id,
+            ),
         )
 
     def _run(
@@ -351,12 +412,21 @@ class AgentAccountVetoActionProposalTool(BaseTool):
         proposal_id: int,
         **kwargs,
     ) -> Dict[str, Any]:
-        """Async version of the tool."""
-        return self._run_script(
-            agent_account_contract,
-            dao_action_proposal_voting_contract,
-            proposal_id,
-            **kwargs,
+        """Async version of the tool, run on the Bun worker pool."""
+        if self.wallet_id is None:
+            return {
+                "success": False,
+                "message": "Wallet ID is required",
+                "data": None,
+            }
+
+        return await BunScriptRunner.abun_run(
+            self.wallet_id,
+            *self._script_args(
+                agent_account_contract,
+                dao_action_proposal_voting_contract,
+                proposal_id,
+            ),
         )
 
 
@@ -415,6 +485,25 @@ class AgentAccountConcludeActionProposalTool(BaseTool):
         super().__init__(**kwargs)
         self.wallet_id = wallet_id
 
+    def _script_args(
+        self,
+        agent_account_contract: str,
+        dao_action_proposal_voting_contract: str,
+        action_contract_to_execute: str,
+        dao_token_contract: str,
+        proposal_id: int,
+    ) -> List[str]:
+        """Script directory, name and arguments to conclude an action proposal."""
+        return [
+            "aibtc-cohort-0/agent-account/public",
+            "conclude-action-proposal.ts",
+            agent_account_contract,
+            dao_action_proposal_voting_contract,
+            action_contract_to_execute,
+            dao_token_contract,
+            str(proposal_id),
+        ]
+
     def _run_script(
         self,
         agent_account_contract: str,
@@ -432,19 +521,15 @@ class AgentAccountConcludeActionProposalTool(BaseTool):
                 "data": None,
             }
 
-        args = [
-            agent_account_contract,
-            dao_action_proposal_voting_contract,
-            action_contract_to_execute,
-            dao_token_contract,
-            str(proposal_id),
-        ]
-
         return BunScriptRunner.bun_run(
             self.wallet_id,
-            "aibtc-cohort-0/agent-account/public",
-            "conclude-action-proposal.ts",
-            *args,
+            *self._script_args(
+                agent_account_contract,
+                dao_action_proposal_voting_contract,
+                action_contract_to_execute,
+                dao_token_contract,
+                proposal_id,
+            ),
         )
 
     def _run(
@@ -475,12 +560,21 @@ class AgentAccountConcludeActionProposalTool(BaseTool):
         proposal_id: int,
         **kwargs,
     ) -> Dict[str, Any]:
-        """Async version of the tool."""
-        return self._run_script(
-            agent_account_contract,
-            dao_action_proposal_voting_contract,
-            action_contract_to_execute,
-            dao_token_contract,
-            proposal_id,
-            **kwargs,
+        """Async version of the tool, run on the Bun worker pool."""
+        if self.wallet_id is None:
+            return {
+                "success": False,
+                "message": "Wallet ID is required",
+                "data": None,
+            }
+
+        return await BunScriptRunner.abun_run(
+            self.wallet_id,
+            *self._script_args(
+                agent_account_contract,
+                dao_action_proposal_voting_contract,
+                action_contract_to_execute,
+                dao_token_contract,
+                proposal_id,
+            ),
         )
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, List, Optional, Type
 from uuid import UUID
 
 from langchain.tools import BaseTool
@@ -60,6 +60,25 @@ class AgentAccountFaktoryBuyAssetTool(BaseTool):
         super().__init__(**kwargs)
         self.wallet_id = wallet_id
 
+    def _script_args(
+        self,
+        agent_account_contract: str,
+        faktory_dex_contract: str,
+        asset_contract: str,
+        amount_to_spend: float,
+        slippage: Optional[int] = 1,
+    ) -> List[str]:
+        """Script directory, name and arguments to buy the asset."""
+        return [
+            "aibtc-cohort-0/agent-account/public",
+            "faktory-buy-asset.ts",
+            agent_account_contract,
+            faktory_dex_contract,
+            asset_contract,
+            str(amount_to_spend),
+            str(slippage),
+        ]
+
     def _run_script(
         self,
         agent_account_contract: str,
@@ -77,19 +96,15 @@ class AgentAccountFaktoryBuyAssetTool(BaseTool):
                 "data": None,
             }
 
-        args = [
-            agent_account_contract,
-            faktory_dex_contract,
-            asset_contract,
-            str(amount_to_spend),
-            str(slippage),
-        ]
-
         return BunScriptRunner.bun_run(
             self.wallet_id,
-            "aibtc-cohort-0/agent-account/public",
-            "faktory-buy-asset.ts",
-            *args,
+            *self._script_args(
+                agent_account_contract,
+                faktory_dex_contract,
+                asset_contract,
+                amount_to_spend,
+                slippage,
+            ),
         )
 
     def _run(
@@ -120,14 +135,23 @@ class AgentAccountFaktoryBuyAssetTool(BaseTool):
         slippage: Optional[int] = 1,
         **kwargs,
     ) -> Dict[str, Any]:
-        """Async version of the tool."""
-        return self._run_script(
-            agent_account_contract,
-            faktory_dex_contract,
-            asset_contract,
-            amount_to_spend,
-            slippage,
-            **kwargs,
+        """Async version of the tool, run on the Bun worker pool."""
+        if self.wallet_id is None:
+            return {
+                "success": False,
+                "message": "Wallet ID is required",
+                "data": None,
+            }
+
+        return await BunScriptRunner.abun_run(
+            self.wallet_id,
+            *self._script_args(
+                agent_account_contract,
+                faktory_dex_contract,
+                asset_contract,
+                amount_to_spend,
+                slippage,
+            ),
         )
 
 
@@ -184,6 +208,25 @@ class AgentAccountFaktorySellAssetTool(BaseTool):
         super().__init__(**kwargs)
         self.wallet_id = wallet_id
 
+    def _script_args(
+        self,
+        agent_account_contract: str,
+        faktory_dex_contract: str,
+        asset_contract: str,
+        amount_to_sell: float,
+        slippage: Optional[int] = 1,
+    ) -> List[str]:
+        """Script directory, name and arguments to sell the asset."""
+        return [
+            "aibtc-cohort-0/agent-account/public",
+            "faktory-sell-asset.ts",
+            agent_account_contract,
+            faktory_dex_contract,
+            asset_contract,
+            str(amount_to_sell),
+            str(slippage),
+        ]
+
     def _run_script(
         self,
         agent_account_contract: str,
@@ -201,19 +244,15 @@ class AgentAccountFaktorySellAssetTool(BaseTool):
                 "data": None,
             }
 
-        args = [
-            agent_account_contract,
-            faktory_dex_contract,
-            asset_contract,
-            str(amount_to_sell),
-            str(slippage),
-        ]
-
         return BunScriptRunner.bun_run(
             self.wallet_id,
-            "aibtc-cohort-0/agent-account/public",
-            "faktory-sell-asset.ts",
-            *args,
+            *self._script_args(
+                agent_account_contract,
+                faktory_dex_contract,
+                asset_contract,
+                amount_to_sell,
+                slippage,
+            ),
         )
 
     def _run(
@@ -244,12 +283,21 @@ class AgentAccountFaktorySellAssetTool(BaseTool):
         slippage: Optional[int] = 1,
         **kwargs,
     ) -> Dict[str, Any]:
-        """Async version of the tool."""
-        return self._run_script(
-            agent_account_contract,
-            faktory_dex_contract,
-            asset_contract,
-            amount_to_sell,
-            slippage,
-            **kwargs,
+        """Async version of the tool, run on the Bun worker pool."""
+        if self.wallet_id is None:
+            return {
+                "success": False,
+                "message": "Wallet ID is required",
+                "data": None,
+            }
+
+        return await BunScriptRunner.abun_run(
+            self.wallet_id,
+            *self._script_args(
+                agent_account_contract,
+                faktory_dex_contract,
+                asset_contract,
+                amount_to_sell,
+                slippage,
+            ),
         )
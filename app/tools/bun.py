@@ -1,15 +1,42 @@
+import asyncio
 import json
 import os
 import subprocess
-from typing import Dict, List, Union
+import weakref
+from typing import Dict, List, Optional, Union
 
-from app.backend.factory import backend
+from app.backend.factory import backend, get_async_backend
 from app.backend.models import UUID
 from app.lib.logger import configure_logger
 from app.lib.utils import parse_ts_script_output
+from app.tools.bun_pool import BunWorkerError, BunWorkerPool, BunWorkerStartError
 
 logger = configure_logger(__name__)
 
+# Worker processes talk to the loop that spawned them, so keep a pool per loop
+_worker_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BunWorkerPool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_bun_worker_pool() -> BunWorkerPool:
+    """Get the Bun worker pool bound to the current event loop."""
+    from app.config import config
+
+    loop = asyncio.get_running_loop()
+    pool = _worker_pools.get(loop)
+    if pool is None:
+        pool = BunWorkerPool(
+            working_dir=BunScriptRunner.WORKING_DIR,
+            max_workers=config.bun.worker_pool_size,
+            max_calls_per_worker=config.bun.worker_max_calls,
+            max_rss_mb=config.bun.worker_max_rss_mb,
+            idle_seconds=config.bun.worker_idle_seconds,
+            call_timeout=config.bun.call_timeout_seconds,
+        )
+        _worker_pools[loop] = pool
+    return pool
+
 
 class BunScriptRunner:
     """Manages TypeScript script execution using Bun runtime."""
@@ -69,6 +96,73 @@ class BunScriptRunner:
             seed_phrase, script_path, script_name, *args
         )
 
+    @staticmethod
+    async def abun_run(
+        wallet_id: UUID, script_path: str, script_name: str, *args: str
+    ) -> Dict[str, Union[str, bool, None]]:
+        """Async version of bun_run that executes on the persistent worker pool."""
+        async_backend = await get_async_backend()
+        wallet = await async_backend.get_wallet(wallet_id)
+        secret = await asyncio.to_thread(backend.get_secret, wallet.secret_id)
+
+        return await BunScriptRunner._aexecute_script(
+            secret.decrypted_secret, script_path, script_name, *args
+        )
+
+    @staticmethod
+    async def abun_run_with_seed_phrase(
+        seed_phrase: str, script_path: str, script_name: str, *args: str
+    ) -> Dict[str, Union[str, bool, None]]:
+        """Async version of bun_run_with_seed_phrase using the worker pool."""
+        return await BunScriptRunner._aexecute_script(
+            seed_phrase, script_path, script_name, *args
+        )
+
+    @staticmethod
+    async def _aexecute_script(
+        mnemonic: str, script_path: str, script_name: str, *args: str
+    ) -> Dict[str, Union[str, bool, None]]:
+        """
+        Execute the script on a pooled Bun worker.
+
+        Falls back to the one-shot subprocess path (off the event loop) when the
+        pool is disabled or a worker cannot be started. A worker that fails or
+        times out mid-call is not retried, since the script may already have
+        broadcast a transaction.
+        """
+        from app.config import config
+
+        if config.bun.worker_pool_enabled:
+            env = {
+                "ACCOUNT_INDEX": "0",
+                "MNEMONIC": mnemonic,
+                "NETWORK": config.network.network,
+            }
+            full_script_path = (
+                f"{BunScriptRunner.SCRIPT_DIR}/{script_path}/{script_name}"
+            )
+            try:
+                logger.info(f"Running script on worker pool: {script_name}")
+                result = await get_bun_worker_pool().run(env, full_script_path, args)
+                return BunScriptRunner._format_result(
+                    script_name, result.exit_code, result.stdout, result.stderr
+                )
+            except BunWorkerStartError as e:
+                logger.warning(
+                    f"Bun worker unavailable, running {script_name} in a new process: {e}"
+                )
+            except asyncio.TimeoutError:
+                error = f"Script timed out after {config.bun.call_timeout_seconds}s"
+                logger.error(f"Script execution failed: {script_name}: {error}")
+                return {"output": "", "error": error, "success": False}
+            except BunWorkerError as e:
+                logger.error(f"Script execution failed: {script_name}: {e}")
+                return {"output": "", "error": str(e), "success": False}
+
+        return await asyncio.to_thread(
+            BunScriptRunner._execute_script, mnemonic, script_path, script_name, *args
+        )
+
     @staticmethod
     def _execute_script(
         mnemonic: str, script_path: str, script_name: str, *args: str
@@ -118,14 +212,34 @@ class BunScriptRunner:
                 env=env,
             )
 
-            output = result.stdout.strip()
+            return BunScriptRunner._format_result(
+                script_name, result.returncode, result.stdout, result.stderr
+            )
+        except subprocess.CalledProcessError as e:
+            return BunScriptRunner._format_result(
+                script_name, e.returncode, e.stdout, e.stderr
+            )
+        except Exception as e:
+            logger.exception(f"Unexpected error running script {script_name}: {str(e)}")
+            return {"output": "", "error": str(e), "success": False}
+
+    @staticmethod
+    def _format_result(
+        script_name: str,
+        return_code: int,
+        stdout: Optional[str],
+        stderr: Optional[str],
+    ) -> Dict[str, Union[str, bool, None]]:
+        """Shape a finished script run into the runner's result dict."""
+        if return_code == 0:
+            output = stdout.strip() if stdout else ""
             logger.debug(f"Script execution output: {output}")
             logger.info(f"Successfully executed script: {script_name}")
 
             return {"output": output, "error": None, "success": True}
-        except subprocess.CalledProcessError as e:
+        else:
             # check if the tool passes an error and exits with non-zero code
-            stdout_output = e.stdout.strip() if e.stdout else None
+            stdout_output = stdout.strip() if stdout else None
             # if we get any stdout output, try to parse it
             if stdout_output:
                 ts_success, ts_message, ts_data = parse_ts_script_output(
@@ -147,16 +261,13 @@ class BunScriptRunner:
                     "success": True,  # Python succeeded, TS script shows error
                 }
             # otherwise, capture stderr
-            error_output = e.stderr.strip() if e.stderr else "Unknown error occurred"
+            error_output = stderr.strip() if stderr else "Unknown error occurred"
             logger.error(
                 f"Script execution failed: {script_name}",
-                extra={"return_code": e.returncode, "stderr": error_output},
+                extra={"return_code": return_code, "stderr": error_output},
             )
             return {
                 "output": stdout_output or "",
                 "error": error_output,
                 "success": False,
             }
-        except Exception as e:
-            logger.exception(f"Unexpected error running script {script_name}: {str(e)}")
-            return {"output": "", "error": str(e), "success": False}
@@ -0,0 +1,305 @@
+"""Persistent Bun worker pool for agent-tools-ts scripts.
+
+Workers run ``bun_worker.ts`` and accept one line-delimited JSON-RPC call at a
+time on stdin. Because agent-tools-ts modules may read MNEMONIC and NETWORK at
+import time, every worker is bound to the environment it was spawned with and
+is only ever reused for that same environment.
+"""
+
+import asyncio
+import hashlib
+import itertools
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from app.lib.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+WORKER_SCRIPT = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "bun_worker.ts"
+)
+
+# Script output can be large (contract sources, balance listings)
+STREAM_LIMIT_BYTES = 16 * 1024 * 1024
+
+
+class BunWorkerError(Exception):
+    """A worker failed while running a call; the script may have partly run."""
+
+
+class BunWorkerStartError(BunWorkerError):
+    """A worker could not be started; nothing was executed."""
+
+
+@dataclass
+class BunCallResult:
+    stdout: str
+    stderr: str
+    exit_code: int
+    rss_bytes: int
+
+
+def environment_key(env: Dict[str, str]) -> str:
+    """Stable key for a worker environment, so secrets never appear as dict keys."""
+    digest = hashlib.sha256()
+    for name in sorted(env):
+        digest.update(f"{name}={env[name]}\0".encode())
+    return digest.hexdigest()
+
+
+class BunWorker:
+    """A single long-lived ``bun run bun_worker.ts`` process."""
+
+    def __init__(self, key: str, env: Dict[str, str], working_dir: str):
+        self.key = key
+        self.env = env
+        self.working_dir = working_dir
+        self.calls = 0
+        self.rss_bytes = 0
+        self.last_used = time.monotonic()
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._stderr_task: Optional[asyncio.Task] = None
+        self._ids = itertools.count(1)
+
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.returncode is None
+
+    async def start(self, timeout: float) -> None:
+        try:
+            self._process = await asyncio.create_subprocess_exec(
+                "bun",
+                "run",
+                WORKER_SCRIPT,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=self.working_dir,
+                env={**os.environ, **self.env},
+                limit=STREAM_LIMIT_BYTES,
+            )
+            self._stderr_task = asyncio.create_task(
+                self._drain_stderr(self._process.stderr)
+            )
+            message = await asyncio.wait_for(self._read_message(), timeout)
+        except Exception as e:
+            await self.close()
+            raise BunWorkerStartError(f"Failed to start Bun worker: {e}") from e
+        if message.get("method") != "ready":
+            await self.close()
+            raise BunWorkerStartError(f"Unexpected worker greeting: {message}")
+
+    async def call(
+        self, script: str, args: Sequence[str], timeout: float
+    ) -> BunCallResult:
+        """Run one script; raises asyncio.TimeoutError or BunWorkerError."""
+        if not self.alive:
+            raise BunWorkerError("Bun worker is not running")
+        call_id = next(self._ids)
+        request = {
+            "jsonrpc": "2.0",
+            "id": call_id,
+            "method": "run",
+            "params": {"script": script, "args": list(args)},
+        }
+        self.calls += 1
+        self.last_used = time.monotonic()
+        try:
+            self._process.stdin.write((json.dumps(request) + "\n").encode())
+            await self._process.stdin.drain()
+            response = await asyncio.wait_for(self._read_response(call_id), timeout)
+        except asyncio.TimeoutError:
+            raise
+        except BunWorkerError:
+            raise
+        except Exception as e:
+            raise BunWorkerError(f"Bun worker call failed: {e}") from e
+
+        if "error" in response:
+            raise BunWorkerError(response["error"].get("message", "Unknown error"))
+        result = response["result"]
+        self.rss_bytes = int(result.get("rss", 0))
+        return BunCallResult(
+            stdout=result.get("stdout", ""),
+            stderr=result.get("stderr", ""),
+            exit_code=int(result.get("exit_code", 0)),
+            rss_bytes=self.rss_bytes,
+        )
+
+    async def close(self) -> None:
+        process, self._process = self._process, None
+        if process is not None and process.returncode is None:
+            try:
+                process.stdin.close()
+                await asyncio.wait_for(process.wait(), 2)
+            except Exception:
+                process.kill()
+                await process.wait()
+        if self._stderr_task is not None:
+            self._stderr_task.cancel()
+            self._stderr_task = None
+
+    async def _read_message(self) -> Dict:
+        while True:
+            line = await self._process.stdout.readline()
+            if not line:
+                raise BunWorkerError("Bun worker exited unexpectedly")
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                # Anything not written by the host itself is not for us
+                continue
+            if isinstance(message, dict) and message.get("jsonrpc") == "2.0":
+                return message
+
+    async def _read_response(self, call_id: int) -> Dict:
+        while True:
+            message = await self._read_message()
+            if message.get("id") == call_id:
+                return message
+
+    async def _drain_stderr(self, stream: asyncio.StreamReader) -> None:
+        while True:
+            line = await stream.readline()
+            if not line:
+                return
+            logger.debug(f"Bun worker stderr: {line.decode(errors='replace').rstrip()}")
+
+
+class BunWorkerPool:
+    """Bounded pool of Bun workers keyed by their script environment.
+
+    Workers are recycled after ``max_calls_per_worker`` calls, once their RSS
+    passes ``max_rss_mb`` or after sitting idle for ``idle_seconds``. A worker
+    that times out or fails mid-call is killed rather than reused.
+    """
+
+    def __init__(
+        self,
+        working_dir: str,
+        max_workers: int = 4,
+        max_calls_per_worker: int = 100,
+        max_rss_mb: int = 512,
+        idle_seconds: float = 300,
+        call_timeout: float = 120,
+        start_timeout: float = 30,
+    ):
+        self.working_dir = working_dir
+        self.max_workers = max_workers
+        self.max_calls_per_worker = max_calls_per_worker
+        self.max_rss_bytes = max_rss_mb * 1024 * 1024
+        self.idle_seconds = idle_seconds
+        self.call_timeout = call_timeout
+        self.start_timeout = start_timeout
+        self._idle: Dict[str, List[BunWorker]] = {}
+        self._size = 0
+        self._condition = asyncio.Condition()
+
+    async def run(
+        self,
+        env: Dict[str, str],
+        script: str,
+        args: Sequence[str] = (),
+        timeout: Optional[float] = None,
+    ) -> BunCallResult:
+        """Run ``script`` (relative to the working dir) on a worker for ``env``."""
+        worker = await self._acquire(env)
+        healthy = False
+        try:
+            result = await worker.call(script, args, timeout or self.call_timeout)
+            healthy = True
+            return result
+        finally:
+            await self._release(worker, healthy)
+
+    async def close(self) -> None:
+        async with self._condition:
+            workers = [w for idle in self._idle.values() for w in idle]
+            self._idle.clear()
+            self._size -= len(workers)
+            self._condition.notify_all()
+        await asyncio.gather(*(w.close() for w in workers))
+
+    async def _acquire(self, env: Dict[str, str]) -> BunWorker:
+        key = environment_key(env)
+        stale: List[BunWorker] = []
+        async with self._condition:
+            while True:
+                stale.extend(self._pop_expired())
+                idle = self._idle.get(key)
+                if idle:
+                    worker = idle.pop()
+                    break
+                victim = None if self._size < self.max_workers else self._pop_oldest()
+                if self._size < self.max_workers or victim is not None:
+                    # Reuse the victim's slot for a worker of the new environment
+                    if victim is not None:
+                        stale.append(victim)
+                    else:
+                        self._size += 1
+                    worker = None
+                    break
+                await self._condition.wait()
+        for old in stale:
+            await old.close()
+        if worker is not None:
+            return worker
+
+        worker = BunWorker(key, env, self.working_dir)
+        try:
+            await worker.start(self.start_timeout)
+        except BunWorkerStartError:
+            async with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        logger.debug(f"Started Bun worker (pool size {self._size})")
+        return worker
+
+    async def _release(self, worker: BunWorker, healthy: bool) -> None:
+        reuse = (
+            healthy
+            and worker.alive
+            and worker.calls < self.max_calls_per_worker
+            and worker.rss_bytes < self.max_rss_bytes
+        )
+        async with self._condition:
+            if reuse:
+                worker.last_used = time.monotonic()
+                self._idle.setdefault(worker.key, []).append(worker)
+            else:
+                self._size -= 1
+            self._condition.notify()
+        if not reuse:
+            logger.debug(
+                f"Recycling Bun worker after {worker.calls} calls "
+                f"(rss {worker.rss_bytes // (1024 * 1024)} MB, healthy={healthy})"
+            )
+            await worker.close()
+
+    def _pop_expired(self) -> List[BunWorker]:
+        cutoff = time.monotonic() - self.idle_seconds
+        expired = []
+        for key in list(self._idle):
+            keep = [w for w in self._idle[key] if w.last_used >= cutoff]
+            expired.extend(w for w in self._idle[key] if w.last_used < cutoff)
+            if keep:
+                self._idle[key] = keep
+            else:
+                del self._idle[key]
+        self._size -= len(expired)
+        return expired
+
+    def _pop_oldest(self) -> Optional[BunWorker]:
+        candidates = [w for idle in self._idle.values() for w in idle]
+        if not candidates:
+            return None
+        oldest = min(candidates, key=lambda w: w.last_used)
+        self._idle[oldest.key].remove(oldest)
+        if not self._idle[oldest.key]:
+            del self._idle[oldest.key]
+        return oldest
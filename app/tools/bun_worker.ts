@@ -0,0 +1,165 @@
+// Persistent worker host for agent-tools-ts scripts, driven by app/tools/bun_pool.py.
+//
+// Protocol: line-delimited JSON-RPC 2.0 over stdin/stdout.
+//   -> {"jsonrpc":"2.0","id":1,"method":"run","params":{"script":"src/x/y.ts","args":["a"]}}
+//   <- {"jsonrpc":"2.0","id":1,"result":{"stdout":"...","stderr":"...","exit_code":0,"rss":123}}
+// On start the host announces itself with {"jsonrpc":"2.0","method":"ready"}.
+//
+// Each call evaluates a fresh copy of the script module while its dependencies
+// stay loaded, which is where the time goes for a cold `bun run`. Dependencies
+// may capture process.env at import time, so a worker is bound to the
+// MNEMONIC/NETWORK/ACCOUNT_INDEX it was spawned with and the Python pool never
+// shares it between wallets.
+//
+// The result line is the end-of-call marker. It is written when the script
+// calls process.exit(), throws, or once the tool's promise resolves: the copy
+// awaits the agent-tools-ts entry statement (`main().then(sendToLLM)...` at the
+// start of a line), so evaluating the module is the whole tool run. Output
+// printed after that point is not part of the call.
+
+import { readFile, unlink, writeFile } from "node:fs/promises";
+import { basename, dirname, resolve } from "node:path";
+import { pathToFileURL } from "node:url";
+
+type RunParams = { script: string; args?: string[] };
+type Call = {
+  id: number | string;
+  stdout: string[];
+  stderr: string[];
+  done: boolean;
+};
+
+// The agent-tools-ts entry statement, awaited in the per-call copy
+const ENTRY_CALL = /^main\(\)/m;
+
+const EXIT_SIGNAL = Symbol("bun-worker-exit");
+const writeOut = process.stdout.write.bind(process.stdout);
+const realExit = process.exit.bind(process);
+// Scripts see the argv of `bun run <script> <args>`: [runtime, script, ...args]
+const runtime = process.argv[0];
+
+let current: Call | null = null;
+
+function send(message: Record<string, unknown>): void {
+  writeOut(JSON.stringify({ jsonrpc: "2.0", ...message }) + "\n");
+}
+
+function format(args: unknown[]): string {
+  return args
+    .map((arg) =>
+      typeof arg === "string"
+        ? arg
+        : arg instanceof Error
+          ? arg.stack ?? String(arg)
+          : JSON.stringify(arg, null, 2)
+    )
+    .join(" ");
+}
+
+function finish(call: Call, exitCode: number): void {
+  if (call.done) return;
+  call.done = true;
+  if (current === call) current = null;
+  send({
+    id: call.id,
+    result: {
+      stdout: call.stdout.join(""),
+      stderr: call.stderr.join(""),
+      exit_code: exitCode,
+      rss: process.memoryUsage().rss,
+    },
+  });
+}
+
+function captureStdout(text: string): void {
+  current?.stdout.push(text);
+}
+
+function captureStderr(text: string): void {
+  current?.stderr.push(text);
+}
+
+console.log = (...args: unknown[]) => captureStdout(format(args) + "\n");
+console.info = console.log;
+console.debug = console.log;
+console.error = (...args: unknown[]) => captureStderr(format(args) + "\n");
+console.warn = console.error;
+process.stdout.write = ((chunk: string | Uint8Array) => {
+  captureStdout(typeof chunk === "string" ? chunk : new TextDecoder().decode(chunk));
+  return true;
+}) as typeof process.stdout.write;
+
+process.exit = ((code?: number) => {
+  if (current) finish(current, code ?? 0);
+  // Unwind the script's synchronous path the way a real exit would
+  throw EXIT_SIGNAL;
+}) as typeof process.exit;
+
+function onStray(error: unknown): void {
+  if (error === EXIT_SIGNAL) return;
+  const call = current;
+  if (!call) return;
+  call.stderr.push(format([error]) + "\n");
+  finish(call, 1);
+}
+
+process.on("uncaughtException", onStray);
+process.on("unhandledRejection", onStray);
+
+// Write the script next to the original (so relative imports resolve) with its
+// entry statement awaited; a new file per call also bypasses the module cache.
+async function prepareScript(id: number | string, script: string): Promise<string> {
+  const path = resolve(process.cwd(), script);
+  const source = await readFile(path, "utf8");
+  const copy = resolve(dirname(path), `.${basename(path)}.${process.pid}-${id}.ts`);
+  await writeFile(copy, source.replace(ENTRY_CALL, "await main()"));
+  return copy;
+}
+
+async function run(id: number | string, params: RunParams): Promise<void> {
+  const call: Call = { id, stdout: [], stderr: [], done: false };
+  current = call;
+  process.argv = [runtime, params.script, ...(params.args ?? [])];
+  let copy: string | null = null;
+  try {
+    copy = await prepareScript(id, params.script);
+    await import(pathToFileURL(copy).href);
+    finish(call, 0);
+  } catch (error) {
+    onStray(error);
+  } finally {
+    if (copy) await unlink(copy).catch(() => undefined);
+  }
+}
+
+let buffer = "";
+process.stdin.setEncoding("utf8");
+process.stdin.on("data", (chunk: string) => {
+  buffer += chunk;
+  let newline: number;
+  while ((newline = buffer.indexOf("\n")) >= 0) {
+    const line = buffer.slice(0, newline).trim();
+    buffer = buffer.slice(newline + 1);
+    if (!line) continue;
+    let request: { id: number | string; method: string; params: RunParams };
+    try {
+      request = JSON.parse(line);
+    } catch {
+      send({ id: null, error: { code: -32700, message: "Parse error" } });
+      continue;
+    }
+    if (request.method !== "run") {
+      send({ id: request.id, error: { code: -32601, message: "Method not found" } });
+      continue;
+    }
+    if (current) {
+      send({ id: request.id, error: { code: -32000, message: "Worker busy" } });
+      continue;
+    }
+    void run(request.id, request.params);
+  }
+});
+// The pool owns this process; exit as soon as it goes away
+process.stdin.on("end", () => realExit(0));
+
+send({ method: "ready" });
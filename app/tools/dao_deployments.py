@@ -13,6 +13,7 @@ from app.backend.models import (
     ProposalCreate,
     TokenBase,
 )
+from app.lib.address_index import address_index
 from app.lib.logger import configure_logger
 from app.services.core.dao_service import (
     TokenServiceError,
@@ -233,13 +234,15 @@ class ContractDAODeployTool(BaseTool):
                     status=ContractStatus.PENDING,
                 )
                 logger.debug(f"Token updates: {token_updates}")
-                if not backend.update_token(token_record.id, token_updates):
+                updated_token = backend.update_token(token_record.id, token_updates)
+                if not updated_token:
                     logger.error("Failed to update token with contract information")
                     return {
                         "output": "",
                         "error": "Failed to update token with contract information",
                         "success": False,
                     }
+                address_index.add_token(updated_token)
 
                 # Create extensions
                 logger.debug("Step 8: Creating extensions...")
@@ -1,4 +1,4 @@
-from typing import Dict, Optional, Type, Union
+from typing import Dict, List, Optional, Type, Union
 
 from langchain.tools import BaseTool
 from pydantic import BaseModel, Field
@@ -30,6 +30,10 @@ class WalletGetMyBalance(BaseTool):
         super().__init__(**kwargs)
         self.wallet_id = wallet_id
 
+    def _script_args(self) -> List[str]:
+        """Script directory and name to get wallet balance."""
+        return ["stacks-wallet", "get-my-wallet-balance.ts"]
+
     def _deploy(self, **kwargs) -> Dict[str, Union[str, bool, None]]:
         """Execute the tool to get wallet balance."""
         if self.wallet_id is None:
@@ -38,17 +42,21 @@ class WalletGetMyBalance(BaseTool):
                 "error": "Wallet ID is required",
                 "output": "",
             }
-        return BunScriptRunner.bun_run(
-            self.wallet_id, "stacks-wallet", "get-my-wallet-balance.ts"
-        )
+        return BunScriptRunner.bun_run(self.wallet_id, *self._script_args())
 
     def _run(self, **kwargs) -> Dict[str, Union[str, bool, None]]:
         """Execute the tool to get wallet balance."""
         return self._deploy(**kwargs)
 
     async def _arun(self, **kwargs) -> Dict[str, Union[str, bool, None]]:
-        """Async version of the tool."""
-        return self._deploy(**kwargs)
+        """Async version of the tool, run on the Bun worker pool."""
+        if self.wallet_id is None:
+            return {
+                "success": False,
+                "error": "Wallet ID is required",
+                "output": "",
+            }
+        return await BunScriptRunner.abun_run(self.wallet_id, *self._script_args())
 
 
 class WalletGetAddressInput(BaseModel):
@@ -70,6 +78,10 @@ class WalletGetMyAddress(BaseTool):
         super().__init__(**kwargs)
         self.wallet_id = wallet_id
 
+    def _script_args(self) -> List[str]:
+        """Script directory and name to get wallet address."""
+        return ["stacks-wallet", "get-my-wallet-address.ts"]
+
     def _deploy(self, **kwargs) -> Dict[str, Union[str, bool, None]]:
         """Execute the tool to get wallet address."""
         if self.wallet_id is None:
@@ -78,17 +90,21 @@ class WalletGetMyAddress(BaseTool):
                 "error": "Wallet ID is required",
                 "output": "",
             }
-        return BunScriptRunner.bun_run(
-            self.wallet_id, "stacks-wallet", "get-my-wallet-address.ts"
-        )
+        return BunScriptRunner.bun_run(self.wallet_id, *self._script_args())
 
     def _run(self, **kwargs) -> Dict[str, Union[str, bool, None]]:
         """Execute the tool to get wallet address."""
         return self._deploy(**kwargs)
 
     async def _arun(self, **kwargs) -> Dict[str, Union[str, bool, None]]:
-        """Async version of the tool."""
-        return self._deploy(**kwargs)
+        """Async version of the tool, run on the Bun worker pool."""
+        if self.wallet_id is None:
+            return {
+                "success": False,
+                "error": "Wallet ID is required",
+                "output": "",
+            }
+        return await BunScriptRunner.abun_run(self.wallet_id, *self._script_args())
 
 
 class WalletFundMyWalletFaucet(BaseTool):
@@ -105,6 +121,10 @@ class WalletFundMyWalletFaucet(BaseTool):
         super().__init__(**kwargs)
         self.wallet_id = wallet_id
 
+    def _script_args(self) -> List[str]:
+        """Script directory and name to fund wallet on testnet."""
+        return ["stacks-wallet", "testnet-stx-faucet-me.ts"]
+
     def _deploy(self, **kwargs) -> Dict[str, Union[str, bool, None]]:
         """Execute the tool to fund wallet on testnet."""
         if self.wallet_id is None:
@@ -113,17 +133,21 @@ class WalletFundMyWalletFaucet(BaseTool):
                 "error": "Wallet ID is required",
                 "output": "",
             }
-        return BunScriptRunner.bun_run(
-            self.wallet_id, "stacks-wallet", "testnet-stx-faucet-me.ts"
-        )
+        return BunScriptRunner.bun_run(self.wallet_id, *self._script_args())
 
     def _run(self, **kwargs) -> Dict[str, Union[str, bool, None]]:
         """Execute the tool to fund wallet on testnet."""
         return self._deploy(**kwargs)
 
     async def _arun(self, **kwargs) -> Dict[str, Union[str, bool, None]]:
-        """Async version of the tool."""
-        return self._deploy(**kwargs)
+        """Async version of the tool, run on the Bun worker pool."""
+        if self.wallet_id is None:
+            return {
+                "success": False,
+                "error": "Wallet ID is required",
+                "output": "",
+            }
+        return await BunScriptRunner.abun_run(self.wallet_id, *self._script_args())
 
 
 class WalletSendSTXInput(BaseModel):
@@ -155,6 +179,23 @@ class WalletSendSTX(BaseTool):
         super().__init__(**kwargs)
         self.wallet_id = wallet_id
 
+    def _script_args(
+        self,
+        recipient: str,
+        amount: int,
+        fee: Optional[int] = 400,
+        memo: Optional[str] = "",
+    ) -> List[str]:
+        """Script directory, name and arguments to send STX tokens."""
+        return [
+            "stacks-wallet",
+            "transfer-my-stx.ts",
+            recipient,
+            str(amount),
+            str(fee),
+            memo or "",
+        ]
+
     def _deploy(
         self,
         recipient: str,
@@ -171,13 +212,7 @@ class WalletSendSTX(BaseTool):
                 "output": "",
             }
         return BunScriptRunner.bun_run(
-            self.wallet_id,
-            "stacks-wallet",
-            "transfer-my-stx.ts",
-            recipient,
-            str(amount),
-            str(fee),
-            memo or "",
+            self.wallet_id, *self._script_args(recipient, amount, fee, memo)
         )
 
     def _run(
@@ -199,8 +234,16 @@ class WalletSendSTX(BaseTool):
         memo: Optional[str] = "",
         **kwargs,
     ) -> Dict[str, Union[str, bool, None]]:
-        """Async version of the tool."""
-        return self._deploy(recipient, amount, fee, memo)
+        """Async version of the tool, run on the Bun worker pool."""
+        if self.wallet_id is None:
+            return {
+                "success": False,
+                "error": "Wallet ID is required",
+                "output": "",
+            }
+        return await BunScriptRunner.abun_run(
+            self.wallet_id, *self._script_args(recipient, amount, fee, memo)
+        )
 
 
 class WalletGetTransactionsInput(BaseModel):
@@ -225,6 +268,10 @@ class WalletGetMyTransactions(BaseTool):
         super().__init__(**kwargs)
         self.wallet_id = wallet_id
 
+    def _script_args(self) -> List[str]:
+        """Script directory and name to get transaction history."""
+        return ["stacks-wallet", "get-my-wallet-transactions.ts"]
+
     def _deploy(self, **kwargs) -> Dict[str, Union[str, bool, None]]:
         """Execute the tool to get transaction history."""
         if self.wallet_id is None:
@@ -233,17 +280,21 @@ class WalletGetMyTransactions(BaseTool):
                 "error": "Wallet ID is required",
                 "output": "",
             }
-        return BunScriptRunner.bun_run(
-            self.wallet_id, "stacks-wallet", "get-my-wallet-transactions.ts"
-        )
+        return BunScriptRunner.bun_run(self.wallet_id, *self._script_args())
 
     def _run(self, **kwargs) -> Dict[str, Union[str, bool, None]]:
         """Execute the tool to get transaction history."""
         return self._deploy(**kwargs)
 
     async def _arun(self, **kwargs) -> Dict[str, Union[str, bool, None]]:
-        """Async version of the tool."""
-        return self._deploy(**kwargs)
+        """Async version of the tool, run on the Bun worker pool."""
+        if self.wallet_id is None:
+            return {
+                "success": False,
+                "error": "Wallet ID is required",
+                "output": "",
+            }
+        return await BunScriptRunner.abun_run(self.wallet_id, *self._script_args())
 
 
 class WalletSIP10SendInput(BaseModel):
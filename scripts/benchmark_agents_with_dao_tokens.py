@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Benchmark SupabaseBackend.get_agents_with_dao_tokens against the previous
+per-holder lookup loop.
+
+Both implementations run against an in-memory PostgREST stand-in that counts
+round trips, so the comparison needs no database. Reported time is the measured
+CPU time plus round_trips * --latency-ms, modelling a remote Supabase instance.
+
+Usage:
+    python scripts/benchmark_agents_with_dao_tokens.py
+    python scripts/benchmark_agents_with_dao_tokens.py --sizes 100 1000 --latency-ms 5
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+# Add the parent directory (root) to the path to import from app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.backend.models import AgentWithWalletTokenDTO, HolderFilter
+from app.backend.supabase import SupabaseBackend
+
+# Embedded resource name -> foreign key column on the parent row
+EMBED_FOREIGN_KEYS = {"wallets": "wallet_id", "tokens": "token_id", "daos": "dao_id"}
+
+
+class FakeResponse:
+    def __init__(self, data: Any):
+        self.data = data
+
+
+class FakeQuery:
+    """Just enough of the PostgREST query builder for the two code paths."""
+
+    def __init__(self, client: "FakePostgrestClient", table: str):
+        self.client = client
+        self.table = table
+        self.columns = "*"
+        self.filters: List[tuple] = []
+        self.row_range: Optional[tuple] = None
+        self.single_row = False
+
+    def select(self, columns: str) -> "FakeQuery":
+        self.columns = columns
+        return self
+
+    def eq(self, column: str, value: Any) -> "FakeQuery":
+        self.filters.append((column, str(value)))
+        return self
+
+    def order(self, *args: Any, **kwargs: Any) -> "FakeQuery":
+        return self
+
+    def range(self, start: int, end: int) -> "FakeQuery":
+        self.row_range = (start, end)
+        return self
+
+    def single(self) -> "FakeQuery":
+        self.single_row = True
+        return self
+
+    def execute(self) -> FakeResponse:
+        self.client.round_trips += 1
+        rows = self._filtered_rows()
+        if self.row_range:
+            rows = rows[self.row_range[0] : self.row_range[1] + 1]
+        rows = [self._project(row) for row in rows]
+        rows = [row for row in rows if row is not None]
+        if self.single_row:
+            return FakeResponse(rows[0] if rows else None)
+        return FakeResponse(rows)
+
+    def _filtered_rows(self) -> List[Dict[str, Any]]:
+        table = self.client.tables[self.table]
+        if self.filters and self.filters[0][0] == "id":
+            row = self.client.indexes[self.table].get(self.filters[0][1])
+            return [row] if row else []
+        return [
+            row
+            for row in table
+            if all(str(row.get(col)) == value for col, value in self.filters)
+        ]
+
+    def _project(self, row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if self.columns == "*":
+            return dict(row)
+        projected = {}
+        for part in _split_columns(self.columns):
+            if "(" not in part:
+                projected[part] = row.get(part)
+                continue
+            relation, inner = part.split("(", 1)
+            name = relation.split("!")[0]
+            child = self.client.indexes[name].get(
+                str(row.get(EMBED_FOREIGN_KEYS[name]))
+            )
+            if child is None:
+                if "!inner" in relation:
+                    return None
+                projected[name] = None
+                continue
+            fields = [field.strip() for field in inner.rstrip(")").split(",")]
+            projected[name] = {field: child.get(field) for field in fields}
+        return projected
+
+
+def _split_columns(columns: str) -> List[str]:
+    parts, depth, current = [], 0, ""
+    for char in columns:
+        if char == "," and depth == 0:
+            parts.append(current.strip())
+            current = ""
+            continue
+        depth += char == "("
+        depth -= char == ")"
+        current += char
+    if current.strip():
+        parts.append(current.strip())
+    return parts
+
+
+class FakePostgrestClient:
+    def __init__(self, tables: Dict[str, List[Dict[str, Any]]]):
+        self.tables = tables
+        self.indexes = {
+            name: {row["id"]: row for row in rows} for name, rows in tables.items()
+        }
+        self.round_trips = 0
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+
+def build_dataset(holder_count: int) -> tuple[str, Dict[str, List[Dict[str, Any]]]]:
+    """Create one DAO whose holders are mostly agent wallets."""
+    now = datetime.now(timezone.utc).isoformat()
+    dao_id = str(uuid.uuid4())
+    token_id = str(uuid.uuid4())
+    tables: Dict[str, List[Dict[str, Any]]] = {
+        "daos": [{"id": dao_id, "created_at": now, "name": "BenchDAO"}],
+        "tokens": [{"id": token_id, "created_at": now, "dao_id": dao_id}],
+        "agents": [],
+        "wallets": [],
+        "holders": [],
+    }
+    for i in range(holder_count):
+        agent_id = str(uuid.uuid4()) if i % 10 else None  # 10% non-agent wallets
+        if agent_id:
+            tables["agents"].append({"id": agent_id, "created_at": now})
+        wallet_id = str(uuid.uuid4())
+        tables["wallets"].append(
+            {
+                "id": wallet_id,
+                "created_at": now,
+                "agent_id": agent_id,
+                "mainnet_address": f"SP{i:038d}",
+                "testnet_address": f"ST{i:038d}",
+            }
+        )
+        tables["holders"].append(
+            {
+                "id": str(uuid.uuid4()),
+                "created_at": now,
+                "dao_id": dao_id,
+                "token_id": token_id,
+                "wallet_id": wallet_id,
+                "amount": str(1_000_000 + i),
+            }
+        )
+    return dao_id, tables
+
+
+def legacy_get_agents_with_dao_tokens(
+    backend: SupabaseBackend, dao_id: str
+) -> List[AgentWithWalletTokenDTO]:
+    """The previous implementation: one wallet/agent/token lookup per holder."""
+    result = []
+    holders = backend.list_holders(HolderFilter(dao_id=dao_id))
+    if not holders:
+        return []
+    dao = backend.get_dao(dao_id)
+    if not dao:
+        return []
+    for holder in holders:
+        if not holder.wallet_id:
+            continue
+        wallet = backend.get_wallet(holder.wallet_id)
+        if not wallet or not wallet.agent_id:
+            continue
+        agent = backend.get_agent(wallet.agent_id)
+        if not agent or not holder.token_id:
+            continue
+        token = backend.get_token(holder.token_id)
+        if not token:
+            continue
+        wallet_address = wallet.mainnet_address or wallet.testnet_address
+        if not wallet_address:
+            continue
+        result.append(
+            AgentWithWalletTokenDTO(
+                agent_id=agent.id,
+                wallet_id=wallet.id,
+                wallet_address=wallet_address,
+                token_id=token.id,
+                token_amount=holder.amount,
+                dao_id=dao_id,
+                dao_name=dao.name,
+            )
+        )
+    return result
+
+
+def run_case(
+    func: Any, tables: Dict[str, Any], dao_id: str, latency_ms: float
+) -> tuple[List[AgentWithWalletTokenDTO], Dict[str, float]]:
+    backend = SupabaseBackend.__new__(SupabaseBackend)
+    backend.client = FakePostgrestClient(tables)
+    start = time.perf_counter()
+    result = func(backend, dao_id)
+    cpu_seconds = time.perf_counter() - start
+    round_trips = backend.client.round_trips
+    return result, {
+        "round_trips": round_trips,
+        "cpu_ms": cpu_seconds * 1000,
+        "modelled_ms": cpu_seconds * 1000 + round_trips * latency_ms,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100, 1000, 10000], help="Holders"
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=2.0,
+        help="Modelled network latency per round trip",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'holders':>8} {'impl':>8} {'round trips':>12} {'cpu ms':>10} "
+        f"{'modelled ms':>12}"
+    )
+    for size in args.sizes:
+        dao_id, tables = build_dataset(size)
+        legacy, legacy_stats = run_case(
+            legacy_get_agents_with_dao_tokens,
+            tables,
+            dao_id,
+            args.latency_ms,
+        )
+        joined, joined_stats = run_case(
+            SupabaseBackend.get_agents_with_dao_tokens,
+            tables,
+            dao_id,
+            args.latency_ms,
+        )
+        if sorted(dto.wallet_id for dto in legacy) != sorted(
+            dto.wallet_id for dto in joined
+        ):
+            raise SystemExit(f"Result mismatch at {size} holders")
+
+        for impl, stats in (("legacy", legacy_stats), ("joined", joined_stats)):
+            print(
+                f"{size:>8} {impl:>8} {stats['round_trips']:>12} "
+                f"{stats['cpu_ms']:>10.1f} {stats['modelled_ms']:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark agent-tools-ts script execution with and without the Bun worker pool.
+
+The one-shot mode starts a fresh `bun run` per call, as BunScriptRunner does
+when the pool is disabled. The pooled mode sends the same calls to a
+BunWorkerPool. Both report per-call latency percentiles and calls per second.
+
+Pick a read-only script: every call really runs it.
+
+Usage:
+    python scripts/benchmark_bun_worker_pool.py
+    python scripts/benchmark_bun_worker_pool.py --calls 50 --concurrency 8 \\
+        --script src/stacks-wallet/get-my-wallet-balance.ts
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import Awaitable, Callable, Dict, List
+
+# Add the parent directory (root) to the path to import from app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.tools.bun_pool import BunWorkerPool
+
+
+async def run_one_shot(
+    working_dir: str, env: Dict[str, str], script: str, args: List[str]
+) -> int:
+    process = await asyncio.create_subprocess_exec(
+        "bun",
+        "run",
+        script,
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=working_dir,
+        env={**os.environ, **env},
+    )
+    await process.communicate()
+    return process.returncode
+
+
+async def measure(
+    call: Callable[[], Awaitable[int]], calls: int, concurrency: int
+) -> Dict[str, float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    failures = 0
+
+    async def timed() -> None:
+        nonlocal failures
+        async with semaphore:
+            start = time.perf_counter()
+            exit_code = await call()
+            latencies.append((time.perf_counter() - start) * 1000)
+            failures += exit_code != 0
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed() for _ in range(calls)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "calls_per_sec": calls / elapsed,
+        "failures": failures,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    env = {
+        "ACCOUNT_INDEX": "0",
+        "MNEMONIC": args.mnemonic,
+        "NETWORK": args.network,
+    }
+    pool = BunWorkerPool(
+        working_dir=args.working_dir,
+        max_workers=args.concurrency,
+        max_calls_per_worker=args.calls + 1,
+    )
+
+    async def pooled() -> int:
+        result = await pool.run(env, args.script, args.script_args)
+        return result.exit_code
+
+    # Spawn the workers up front; startup is paid once per worker, not per call
+    await measure(pooled, args.concurrency, args.concurrency)
+
+    results = {
+        "one-shot": await measure(
+            lambda: run_one_shot(args.working_dir, env, args.script, args.script_args),
+            args.calls,
+            args.concurrency,
+        ),
+        "pooled": await measure(pooled, args.calls, args.concurrency),
+    }
+    await pool.close()
+
+    print(
+        f"{args.calls} calls of {args.script}, concurrency {args.concurrency}\n"
+        f"{'mode':>10} {'p50 ms':>10} {'p95 ms':>10} {'calls/s':>10} {'failed':>8}"
+    )
+    for mode, stats in results.items():
+        print(
+            f"{mode:>10} {stats['p50_ms']:>10.1f} {stats['p95_ms']:>10.1f} "
+            f"{stats['calls_per_sec']:>10.2f} {stats['failures']:>8}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--working-dir", default="./agent-tools-ts/")
+    parser.add_argument(
+        "--script", default="src/stacks-wallet/get-my-wallet-address.ts"
+    )
+    parser.add_argument("--script-args", nargs="*", default=[])
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument(
+        "--mnemonic",
+        default=os.getenv("AIBTC_BACKEND_WALLET_SEED_PHRASE", ""),
+        help="Wallet mnemonic (defaults to AIBTC_BACKEND_WALLET_SEED_PHRASE)",
+    )
+    parser.add_argument("--network", default=os.getenv("NETWORK", "testnet"))
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark ChainhookHandler transaction dispatch: routed candidates vs asking
+every handler.
+
+The sample payloads in chainhook-data/ and examples/chainhook.json are parsed
+once. For each transaction, both strategies pick the handlers whose
+can_handle_transaction returns True. The script checks that they pick the same
+handlers, then reports time per transaction and the can_handle calls and
+backend lookups each strategy makes.
+
+Handlers look up wallets and agents while deciding. Those lookups go to an
+in-memory stand-in that counts them. Reported time adds
+lookups * --latency-ms to model a remote Supabase instance.
+
+Usage:
+    python scripts/benchmark_chainhook_dispatch.py
+    python scripts/benchmark_chainhook_dispatch.py --iterations 500 --latency-ms 5
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+# Add the parent directory (root) to the path to import from app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.integrations.webhooks.chainhook import handlers as handlers_pkg
+from app.services.integrations.webhooks.chainhook.handler import ChainhookHandler
+from app.services.integrations.webhooks.chainhook.handlers.base import (
+    ChainhookEventHandler,
+    TransactionKey,
+)
+from app.services.integrations.webhooks.chainhook.models import (
+    TransactionWithReceipt,
+)
+from app.services.integrations.webhooks.chainhook.parser import ChainhookParser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class CountingBackend:
+    """Answers every lookup with "not ours" and counts the calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __getattr__(self, name: str) -> Callable[..., List[Any]]:
+        def lookup(*args, **kwargs) -> List[Any]:
+            self.calls += 1
+            return []
+
+        return lookup
+
+
+def install_backend(stand_in: CountingBackend) -> None:
+    for module in list(sys.modules.values()):
+        name = getattr(module, "__name__", "")
+        if name.startswith(handlers_pkg.__name__) and hasattr(module, "backend"):
+            module.backend = stand_in
+
+
+def load_transactions() -> List[Tuple[str, TransactionWithReceipt]]:
+    paths = sorted(glob.glob(os.path.join(ROOT, "chainhook-data", "*.json")))
+    paths.append(os.path.join(ROOT, "examples", "chainhook.json"))
+    parser = ChainhookParser()
+    transactions = []
+    for path in paths:
+        with open(path) as f:
+            data = parser.parse(json.load(f))
+        for apply in data.apply:
+            for transaction in apply.transactions:
+                transactions.append((os.path.basename(path), transaction))
+    return transactions
+
+
+def ask_all(
+    handler: ChainhookHandler, transaction: TransactionWithReceipt
+) -> Tuple[List[ChainhookEventHandler], int]:
+    selected = [h for h in handler.handlers if h.can_handle_transaction(transaction)]
+    return selected, len(handler.handlers)
+
+
+def routed(
+    handler: ChainhookHandler, transaction: TransactionWithReceipt
+) -> Tuple[List[ChainhookEventHandler], int]:
+    candidates = handler.router.candidates(TransactionKey.from_transaction(transaction))
+    selected = [h for h in candidates if h.can_handle_transaction(transaction)]
+    return selected, len(candidates)
+
+
+def measure(
+    strategy, handler: ChainhookHandler, transactions, backend: CountingBackend, n: int
+) -> Dict[str, float]:
+    backend.calls = 0
+    asked = 0
+    start = time.perf_counter()
+    for _ in range(n):
+        for _, transaction in transactions:
+            asked += strategy(handler, transaction)[1]
+    elapsed = time.perf_counter() - start
+    total = n * len(transactions)
+    return {
+        "us_per_tx": elapsed / total * 1e6,
+        "asked_per_tx": asked / total,
+        "lookups_per_tx": backend.calls / total,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument(
+        "--latency-ms", type=float, default=2.0, help="Modelled latency per lookup"
+    )
+    args = parser.parse_args()
+
+    backend = CountingBackend()
+    install_backend(backend)
+    handler = ChainhookHandler()
+    transactions = load_transactions()
+
+    mismatches = 0
+    for source, transaction in transactions:
+        expected = [type(h).__name__ for h in ask_all(handler, transaction)[0]]
+        actual = [type(h).__name__ for h in routed(handler, transaction)[0]]
+        if expected != actual:
+            mismatches += 1
+            print(f"MISMATCH {source}: all={expected} routed={actual}")
+    print(
+        f"{len(transactions)} transactions from sample payloads, "
+        f"{mismatches} dispatch mismatches\n"
+        f"{'strategy':>10} {'us/tx':>10} {'asked/tx':>10} {'lookups/tx':>11} "
+        f"{'modelled ms/tx':>15}"
+    )
+    for name, strategy in (("ask-all", ask_all), ("routed", routed)):
+        stats = measure(strategy, handler, transactions, backend, args.iterations)
+        modelled = stats["us_per_tx"] / 1000 + stats["lookups_per_tx"] * args.latency_ms
+        print(
+            f"{name:>10} {stats['us_per_tx']:>10.1f} {stats['asked_per_tx']:>10.1f} "
+            f"{stats['lookups_per_tx']:>11.2f} {modelled:>15.3f}"
+        )
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Benchmark the in-process chainhook path for backfilled blocks: typed adapter
+data handed straight to the handlers vs rendering it into a webhook template
+and parsing the dict back.
+
+The sample payloads in chainhook-data/ and examples/chainhook.json are turned
+into the typed ChainHookData the Stacks chainhook adapter produces. Each block
+then goes through both paths:
+
+- template: template formatting + ChainhookParser.parse (ChainhookService.process)
+- direct:   ChainhookParser.parse_adapter_data (ChainhookService.process_adapter_data)
+
+followed by transaction dispatch (routed handler selection). The script checks
+that both paths give the handlers the same transactions, events, operations
+and block identifiers and pick the same handlers, then reports time per block.
+
+Handler lookups go to an in-memory stand-in, as in
+benchmark_chainhook_dispatch.py.
+
+Usage:
+    python scripts/benchmark_chainhook_inprocess.py [--iterations 200]
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+# Add the parent directory (root) to the path to import from app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.integrations.webhooks.chainhook import handlers as handlers_pkg
+from app.services.integrations.webhooks.chainhook.handler import ChainhookHandler
+from app.services.integrations.webhooks.chainhook.handlers.base import (
+    TransactionKey,
+)
+from app.services.integrations.webhooks.chainhook.models import ChainHookData
+from app.services.integrations.webhooks.chainhook.parser import ChainhookParser
+from app.services.processing.stacks_chainhook_adapter import StacksChainhookAdapter
+from app.services.processing.stacks_chainhook_adapter.models import (
+    chainhook as adapter_models,
+)
+from app.services.processing.stacks_chainhook_adapter.utils.template_manager import (
+    get_template_manager,
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class CountingBackend:
+    """Answers every lookup with "not ours"."""
+
+    def __getattr__(self, name: str) -> Callable[..., List[Any]]:
+        return lambda *args, **kwargs: []
+
+
+def install_backend(stand_in: CountingBackend) -> None:
+    for module in list(sys.modules.values()):
+        name = getattr(module, "__name__", "")
+        if name.startswith(handlers_pkg.__name__) and hasattr(module, "backend"):
+            module.backend = stand_in
+
+
+def adapter_block(payload: Dict[str, Any]) -> adapter_models.ChainHookData:
+    """The typed data the adapter would have produced for a sample payload."""
+    apply = payload["apply"][0]
+    transactions = []
+    for tx in apply["transactions"]:
+        meta = tx["metadata"]
+        receipt = meta["receipt"]
+        operations = [
+            adapter_models.Operation(
+                account=adapter_models.Account(address=op["account"]["address"]),
+                amount=adapter_models.Amount(
+                    currency=adapter_models.Currency(
+                        decimals=op["amount"]["currency"]["decimals"],
+                        metadata=op["amount"]["currency"].get("metadata", {}),
+                        symbol=op["amount"]["currency"]["symbol"],
+                    ),
+                    value=op["amount"]["value"],
+                ),
+                operation_identifier=adapter_models.OperationIdentifier(
+                    index=op["operation_identifier"]["index"]
+                ),
+                related_operations=op.get("related_operations", []),
+                status=op["status"],
+                type=op["type"],
+            )
+            for op in tx.get("operations", [])
+        ]
+        transactions.append(
+            adapter_models.TransactionWithReceipt(
+                metadata=adapter_models.TransactionMetadata(
+                    description=meta["description"],
+                    execution_cost=adapter_models.ExecutionCost(
+                        **meta["execution_cost"]
+                    ),
+                    fee=meta["fee"],
+                    kind=adapter_models.TransactionKind(
+                        data=meta["kind"].get("data", {}), type=meta["kind"]["type"]
+                    ),
+                    nonce=meta["nonce"],
+                    position=meta["position"],
+                    raw_tx=meta["raw_tx"],
+                    receipt=adapter_models.Receipt(
+                        contract_calls_stack=receipt["contract_calls_stack"],
+                        events=[
+                            adapter_models.Event(**event) for event in receipt["events"]
+                        ],
+                        mutated_assets_radius=receipt["mutated_assets_radius"],
+                        mutated_contracts_radius=receipt["mutated_contracts_radius"],
+                    ),
+                    result=meta["result"],
+                    sender=meta["sender"],
+                    sponsor=meta.get("sponsor"),
+                    success=meta["success"],
+                ),
+                operations=operations,
+                transaction_identifier=adapter_models.TransactionIdentifier(
+                    hash=tx["transaction_identifier"]["hash"]
+                ),
+            )
+        )
+    height = apply["block_identifier"]["index"]
+    return adapter_models.ChainHookData(
+        apply=[
+            adapter_models.Apply(
+                block_identifier=adapter_models.BlockIdentifier(
+                    **apply["block_identifier"]
+                ),
+                metadata=apply["metadata"],
+                parent_block_identifier=adapter_models.BlockIdentifier(
+                    **apply["parent_block_identifier"]
+                ),
+                timestamp=apply["timestamp"],
+                transactions=transactions,
+            )
+        ],
+        chainhook=adapter_models.ChainHookInfo(
+            is_streaming_blocks=False,
+            predicate=adapter_models.Predicate(scope="block_height", equals=height),
+            uuid=payload["chainhook"]["uuid"],
+        ),
+        events=[],
+        rollback=[],
+    )
+
+
+def load_blocks() -> List[Tuple[str, adapter_models.ChainHookData]]:
+    paths = sorted(glob.glob(os.path.join(ROOT, "chainhook-data", "*.json")))
+    paths.append(os.path.join(ROOT, "examples", "chainhook.json"))
+    blocks = []
+    for path in paths:
+        with open(path) as f:
+            blocks.append((os.path.basename(path), adapter_block(json.load(f))))
+    return blocks
+
+
+def handler_view(data: ChainHookData) -> List[Any]:
+    """What the handlers read from a block."""
+    view = []
+    for block in data.apply:
+        anchor = block.metadata.bitcoin_anchor_block_identifier
+        view.append(
+            (
+                block.block_identifier,
+                block.parent_block_identifier,
+                block.timestamp,
+                anchor,
+                block.metadata.block_time,
+            )
+        )
+        for tx in block.transactions:
+            meta = tx.metadata
+            key = TransactionKey.from_transaction(tx)
+            kind_data = meta.kind.get("data", {})
+            view.append(
+                (
+                    tx.transaction_identifier.hash,
+                    # Non-contract-call kinds rendered from a contract-call
+                    # template get empty method/contract/args; compare as absent
+                    (key.kind, key.method or None, key.contract_identifier or None),
+                    key.event_types,
+                    kind_data.get("args") or None,
+                    meta.sender,
+                    meta.success,
+                    meta.result,
+                    meta.fee,
+                    meta.nonce,
+                    meta.receipt.events,
+                    tx.operations,
+                )
+            )
+    return view
+
+
+def dispatch(handler: ChainhookHandler, data: ChainHookData) -> List[List[str]]:
+    picked = []
+    for block in data.apply:
+        for tx in block.transactions:
+            candidates = handler.router.candidates(TransactionKey.from_transaction(tx))
+            picked.append(
+                [type(h).__name__ for h in candidates if h.can_handle_transaction(tx)]
+            )
+    return picked
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    install_backend(CountingBackend())
+    handler = ChainhookHandler()
+    chainhook_parser = ChainhookParser()
+    adapter = StacksChainhookAdapter(network="testnet")
+    get_template_manager()  # load templates before timing
+    blocks = load_blocks()
+
+    def template_path(data):
+        return chainhook_parser.parse(adapter._apply_template_formatting(data))
+
+    def direct_path(data):
+        return chainhook_parser.parse_adapter_data(data)
+
+    mismatches = 0
+    for source, data in blocks:
+        templated, direct = template_path(data), direct_path(data)
+        if handler_view(templated) != handler_view(direct):
+            mismatches += 1
+            print(f"MISMATCH {source}: handler-visible fields differ")
+        if dispatch(handler, templated) != dispatch(handler, direct):
+            mismatches += 1
+            print(f"MISMATCH {source}: different handlers selected")
+
+    transactions = sum(len(d.apply[0].transactions) for _, d in blocks)
+    print(
+        f"{len(blocks)} sample blocks ({transactions} transactions), "
+        f"{mismatches} mismatches\n"
+        f"{'path':>10} {'transform us/block':>19} {'+ dispatch us/block':>20}"
+    )
+    for name, path in (("template", template_path), ("direct", direct_path)):
+        transform = total = 0.0
+        for _ in range(args.iterations):
+            for _, data in blocks:
+                start = time.perf_counter()
+                parsed = path(data)
+                middle = time.perf_counter()
+                dispatch(handler, parsed)
+                end = time.perf_counter()
+                transform += middle - start
+                total += end - start
+        n = args.iterations * len(blocks)
+        print(f"{name:>10} {transform / n * 1e6:>19.1f} {total / n * 1e6:>20.1f}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Benchmark chainhook payload parsing: lazily decoded receipt events and guarded
+debug logging vs building every event and pretty-printing the payload.
+
+Each sample payload in chainhook-data/ and examples/chainhook.json is parsed
+with:
+
+- logged: the previous behaviour, json.dumps(payload, indent=4) on every parse
+  (the f-string was built even when DEBUG was off) plus eager events
+- eager:  ChainhookParser(), payload dump skipped unless DEBUG is on
+- lazy:   ChainhookParser(lazy_events=True), as ChainhookService uses it
+
+and then dispatched (routed handler selection, then touching the events of
+every claimed transaction, as a handler would). The script checks that eager
+and lazy parsing give the same data and pick the same handlers, reports time
+per payload and how many receipts the lazy parser actually had to decode.
+
+Handler lookups go to an in-memory stand-in, as in
+benchmark_chainhook_dispatch.py.
+
+Usage:
+    python scripts/benchmark_chainhook_parser.py [--iterations 200]
+"""
+
+import argparse
+import dataclasses
+import glob
+import json
+import logging
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+# Add the parent directory (root) to the path to import from app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.integrations.webhooks.chainhook import handlers as handlers_pkg
+from app.services.integrations.webhooks.chainhook.handler import ChainhookHandler
+from app.services.integrations.webhooks.chainhook.handlers.base import (
+    TransactionKey,
+)
+from app.services.integrations.webhooks.chainhook.models import (
+    ChainHookData,
+    LazyReceipt,
+    Receipt,
+)
+from app.services.integrations.webhooks.chainhook.parser import ChainhookParser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class CountingBackend:
+    """Answers every lookup with "not ours"."""
+
+    def __getattr__(self, name: str) -> Callable[..., List[Any]]:
+        return lambda *args, **kwargs: []
+
+
+def install_backend(stand_in: CountingBackend) -> None:
+    for module in list(sys.modules.values()):
+        name = getattr(module, "__name__", "")
+        if name.startswith(handlers_pkg.__name__) and hasattr(module, "backend"):
+            module.backend = stand_in
+
+
+def load_payloads() -> List[Tuple[str, Dict[str, Any]]]:
+    paths = sorted(glob.glob(os.path.join(ROOT, "chainhook-data", "*.json")))
+    paths.append(os.path.join(ROOT, "examples", "chainhook.json"))
+    payloads = []
+    for path in paths:
+        with open(path) as f:
+            payloads.append((os.path.basename(path), json.load(f)))
+    return payloads
+
+
+def as_plain(data: ChainHookData) -> Dict[str, Any]:
+    """Field-by-field view, with every receipt as a plain ``Receipt``."""
+    for block in data.apply:
+        for tx in block.transactions:
+            receipt = tx.metadata.receipt
+            tx.metadata.receipt = Receipt(
+                contract_calls_stack=receipt.contract_calls_stack,
+                events=receipt.events,
+                mutated_assets_radius=receipt.mutated_assets_radius,
+                mutated_contracts_radius=receipt.mutated_contracts_radius,
+            )
+    return dataclasses.asdict(data)
+
+
+def dispatch(handler: ChainhookHandler, data: ChainHookData) -> List[List[str]]:
+    picked = []
+    for block in data.apply:
+        for tx in block.transactions:
+            candidates = handler.router.candidates(TransactionKey.from_transaction(tx))
+            claimed = [h for h in candidates if h.can_handle_transaction(tx)]
+            if claimed:
+                # What a claiming handler reads
+                [event.data for event in tx.metadata.receipt.events]
+            picked.append([type(h).__name__ for h in claimed])
+    return picked
+
+
+def decoded_receipts(data: ChainHookData) -> Tuple[int, int]:
+    receipts = [tx.metadata.receipt for b in data.apply for tx in b.transactions]
+    lazy = [r for r in receipts if isinstance(r, LazyReceipt)]
+    return sum(r.is_decoded for r in lazy), len(receipts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    install_backend(CountingBackend())
+    handler = ChainhookHandler()
+    eager_parser = ChainhookParser()
+    lazy_parser = ChainhookParser(lazy_events=True)
+    payloads = load_payloads()
+
+    def logged(payload):
+        f"payload: {json.dumps(payload, indent=4)}"
+        return eager_parser.parse(payload)
+
+    mismatches = decoded = receipts = 0
+    for source, payload in payloads:
+        eager, lazy = eager_parser.parse(payload), lazy_parser.parse(payload)
+        if [
+            TransactionKey.from_transaction(tx)
+            for b in eager.apply
+            for tx in b.transactions
+        ] != [
+            TransactionKey.from_transaction(tx)
+            for b in lazy.apply
+            for tx in b.transactions
+        ]:
+            mismatches += 1
+            print(f"MISMATCH {source}: different routing keys")
+        if dispatch(handler, eager) != dispatch(handler, lazy):
+            mismatches += 1
+            print(f"MISMATCH {source}: different handlers selected")
+        counts = decoded_receipts(lazy)
+        decoded, receipts = decoded + counts[0], receipts + counts[1]
+        if as_plain(eager) != as_plain(lazy):
+            mismatches += 1
+            print(f"MISMATCH {source}: parsed data differs")
+
+    print(
+        f"{len(payloads)} sample payloads ({receipts} transactions, "
+        f"{decoded} receipts decoded by the lazy parser), {mismatches} mismatches\n"
+        f"{'parser':>8} {'parse us/payload':>17} {'+ dispatch us/payload':>22}"
+    )
+    for name, parse in (
+        ("logged", logged),
+        ("eager", eager_parser.parse),
+        ("lazy", lazy_parser.parse),
+    ):
+        parse_s = total_s = 0.0
+        for _ in range(args.iterations):
+            for _, payload in payloads:
+                start = time.perf_counter()
+                parsed = parse(payload)
+                middle = time.perf_counter()
+                dispatch(handler, parsed)
+                end = time.perf_counter()
+                parse_s += middle - start
+                total_s += end - start
+        n = args.iterations * len(payloads)
+        print(f"{name:>8} {parse_s / n * 1e6:>17.1f} {total_s / n * 1e6:>22.1f}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    main()
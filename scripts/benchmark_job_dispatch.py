@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Benchmark JobExecutor dispatch: event-driven PriorityQueue vs the previous
+polling workers.
+
+Both dispatchers run the same worker loop shape as JobExecutor._worker with a
+no-op job body, so the numbers isolate queueing overhead:
+
+- enqueue-to-start latency for jobs arriving at random intervals, and
+- process CPU time burned by idle workers.
+
+Usage:
+    python scripts/benchmark_job_dispatch.py
+    python scripts/benchmark_job_dispatch.py --jobs 200 --workers 5 --idle-seconds 10
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# Add the parent directory (root) to the path to import from app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.backend.models import QueueMessage
+from app.services.infrastructure.job_management.base import JobType
+from app.services.infrastructure.job_management.decorators import JobPriority
+from app.services.infrastructure.job_management.executor import (
+    JobExecution,
+    PriorityQueue,
+)
+
+JOB_TYPES = ["bench_fast", "bench_limited"]
+
+
+class LegacyPollingDispatcher:
+    """The previous dispatcher: get_nowait() per priority plus sleep-polling."""
+
+    def __init__(self):
+        self._queues = {priority: asyncio.Queue() for priority in JobPriority}
+        self._semaphores: Dict[JobType, asyncio.Semaphore] = {}
+
+    def set_concurrency_limit(self, job_type: JobType, max_concurrent: int) -> None:
+        self._semaphores[job_type] = asyncio.Semaphore(max_concurrent)
+
+    async def enqueue(self, execution: JobExecution, priority: JobPriority) -> None:
+        await self._queues[priority].put(execution)
+
+    async def get_next_job(self) -> Optional[JobExecution]:
+        for priority in reversed(list(JobPriority)):
+            try:
+                return self._queues[priority].get_nowait()
+            except asyncio.QueueEmpty:
+                continue
+        return None
+
+    async def acquire_slot(self, job_type: JobType) -> bool:
+        try:
+            await asyncio.wait_for(self._semaphores[job_type].acquire(), timeout=0.1)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def worker(self, started: Dict[uuid.UUID, float]) -> None:
+        while True:
+            execution = await self.get_next_job()
+            if not execution:
+                await asyncio.sleep(0.5)
+                continue
+            if not await self.acquire_slot(execution.job_type):
+                await self.enqueue(execution, execution.metadata["priority"])
+                await asyncio.sleep(0.5)
+                continue
+            try:
+                await run_job(execution, started)
+            finally:
+                self._semaphores[execution.job_type].release()
+
+
+class EventDrivenDispatcher:
+    """The current PriorityQueue, driven the way JobExecutor._worker drives it."""
+
+    def __init__(self):
+        self.queue = PriorityQueue()
+
+    def set_concurrency_limit(self, job_type: JobType, max_concurrent: int) -> None:
+        self.queue.set_concurrency_limit(job_type, max_concurrent)
+
+    async def enqueue(self, execution: JobExecution, priority: JobPriority) -> None:
+        await self.queue.enqueue(execution.metadata["message"], priority)
+
+    async def worker(self, started: Dict[uuid.UUID, float]) -> None:
+        while True:
+            execution = await self.queue.next_job()
+            try:
+                await run_job(execution, started)
+            finally:
+                await self.queue.release_slot(execution.job_type, execution.id)
+
+
+async def run_job(execution: JobExecution, started: Dict[uuid.UUID, float]) -> None:
+    started[execution.id] = time.perf_counter()
+    await asyncio.sleep(0.005)  # stand-in for a short task body
+
+
+def make_execution(job_type: JobType, priority: JobPriority) -> JobExecution:
+    message = QueueMessage(
+        id=uuid.uuid4(), created_at=datetime.now(), type=str(job_type)
+    )
+    return JobExecution(
+        id=message.id,
+        job_type=job_type,
+        metadata={"message": message, "priority": priority},
+    )
+
+
+async def run_dispatcher(
+    dispatcher, jobs: int, workers: int, mean_gap_ms: float, idle_seconds: float
+) -> Dict[str, float]:
+    job_types = [JobType.get_or_create(name) for name in JOB_TYPES]
+    dispatcher.set_concurrency_limit(job_types[0], workers)
+    dispatcher.set_concurrency_limit(job_types[1], 1)
+
+    started: Dict[uuid.UUID, float] = {}
+    tasks = [asyncio.create_task(dispatcher.worker(started)) for _ in range(workers)]
+
+    # Idle phase: nothing queued, measure CPU burned by waiting workers
+    cpu_start = time.process_time()
+    await asyncio.sleep(idle_seconds)
+    idle_cpu_ms = (time.process_time() - cpu_start) * 1000
+
+    # Load phase: jobs arrive with exponential gaps
+    rng = random.Random(42)
+    enqueued: Dict[uuid.UUID, float] = {}
+    for i in range(jobs):
+        job_type = job_types[i % len(job_types)]
+        priority = rng.choice(list(JobPriority))
+        execution = make_execution(job_type, priority)
+        enqueued[execution.id] = time.perf_counter()
+        await dispatcher.enqueue(execution, priority)
+        await asyncio.sleep(rng.expovariate(1000 / mean_gap_ms))
+
+    deadline = time.perf_counter() + 60
+    while len(started) < jobs and time.perf_counter() < deadline:
+        await asyncio.sleep(0.01)
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    latencies: List[float] = sorted(
+        (started[job_id] - enqueued[job_id]) * 1000 for job_id in started
+    )
+    return {
+        "started": len(started),
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "max_ms": latencies[-1],
+        "idle_cpu_ms_per_s": idle_cpu_ms / idle_seconds,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--jobs", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=5)
+    parser.add_argument(
+        "--mean-gap-ms", type=float, default=20.0, help="Mean gap between enqueues"
+    )
+    parser.add_argument("--idle-seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    print(
+        f"{args.jobs} jobs, {args.workers} workers, one job type limited to 1 slot\n"
+        f"{'dispatcher':>12} {'started':>8} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'max ms':>8} {'idle cpu ms/s':>14}"
+    )
+    for name, dispatcher in (
+        ("polling", LegacyPollingDispatcher),
+        ("event", EventDrivenDispatcher),
+    ):
+        stats = asyncio.run(
+            run_dispatcher(
+                dispatcher(),
+                args.jobs,
+                args.workers,
+                args.mean_gap_ms,
+                args.idle_seconds,
+            )
+        )
+        print(
+            f"{name:>12} {stats['started']:>8} {stats['p50_ms']:>8.1f} "
+            f"{stats['p95_ms']:>8.1f} {stats['max_ms']:>8.1f} "
+            f"{stats['idle_cpu_ms_per_s']:>14.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
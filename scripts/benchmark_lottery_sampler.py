@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark quorum lottery selection: WeightedLotterySampler vs the previous
+list-based selection.
+
+For each pool size, draws k agents (seeded per round as the handler does) with
+both strategies and reports milliseconds per lottery. The list-based strategy
+rebuilds, sums and scans the weights and pops the winner every round, so it is
+O(n·k); the sampler builds its trees once and draws in O(log n).
+
+Usage:
+    python scripts/benchmark_lottery_sampler.py
+    python scripts/benchmark_lottery_sampler.py --sizes 1000 100000 --draws 10 100
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import sys
+import time
+from typing import Callable, List
+
+# Add the parent directory (root) to the path to import from app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.integrations.webhooks.chainhook.handlers.lottery_utils import (
+    WeightedLotterySampler,
+)
+
+
+def list_lottery(weights: List[int], seed: str, draws: int) -> List[int]:
+    remaining = list(enumerate(weights))
+    selected = []
+    for round_number in range(1, draws + 1):
+        random.seed(f"{seed}_{round_number}")
+        round_weights = [weight for _, weight in remaining]
+        rand_int = random.randrange(sum(round_weights))
+        cumulative = 0
+        selected_idx = 0
+        for idx, weight in enumerate(round_weights):
+            cumulative += weight
+            if rand_int < cumulative:
+                selected_idx = idx
+                break
+        selected.append(remaining.pop(selected_idx)[0])
+    return selected
+
+
+def sampler_lottery(weights: List[int], seed: str, draws: int) -> List[int]:
+    sampler = WeightedLotterySampler(weights)
+    return [
+        sampler.draw(random.Random(f"{seed}_{round_number}"))
+        for round_number in range(1, draws + 1)
+    ]
+
+
+def time_ms(
+    lottery: Callable[[List[int], str, int], List[int]],
+    weights: List[int],
+    seed: str,
+    draws: int,
+) -> float:
+    repeats = max(1, min(50, 200_000 // (len(weights) * draws)))
+    start = time.perf_counter()
+    for _ in range(repeats):
+        lottery(weights, seed, draws)
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--draws", type=int, nargs="+", default=[3, 30, 100])
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    seed = hashlib.sha256(b"benchmark-block").hexdigest()
+    print(
+        f"{'agents':>8} {'draws':>6} {'list ms':>10} {'sampler ms':>11} {'speedup':>8}"
+    )
+    for size in args.sizes:
+        weights = [rng.randint(1, 10**15) for _ in range(size)]
+        for draws in args.draws:
+            draws = min(draws, size)
+            if list_lottery(weights, seed, draws) != sampler_lottery(
+                weights, seed, draws
+            ):
+                print(f"{size:>8} {draws:>6}  ❌ selections differ")
+                sys.exit(1)
+            list_ms = time_ms(list_lottery, weights, seed, draws)
+            sampler_ms = time_ms(sampler_lottery, weights, seed, draws)
+            print(
+                f"{size:>8} {draws:>6} {list_ms:>10.3f} {sampler_ms:>11.3f} "
+                f"{list_ms / sampler_ms:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
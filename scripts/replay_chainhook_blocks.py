@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Replay chainhook blocks from the durable ingest log.
+
+Marks every logged block from --from-height (up to --to-height, if given) as
+unprocessed, so the chainhook_ingest job runs them through the handlers again
+on its next run. Blocks are only replayed if they were delivered to
+/webhooks/chainhook while the ingest log was enabled, and processed blocks
+are deleted after AIBTC_CHAINHOOK_INGEST_RETENTION_DAYS.
+
+Usage:
+    python scripts/replay_chainhook_blocks.py --from-height 3500000 [--to-height 3500100]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+# Add the parent directory (root) to the path to import from app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.integrations.webhooks.chainhook.ingest_log import (
+    chainhook_ingest_log,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay logged chainhook blocks")
+    parser.add_argument("--from-height", type=int, required=True)
+    parser.add_argument("--to-height", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.to_height is not None and args.to_height < args.from_height:
+        parser.error("--to-height must not be below --from-height")
+
+    replayed = asyncio.run(
+        chainhook_ingest_log.replay(args.from_height, args.to_height)
+    )
+    print(f"Queued {replayed} logged blocks for replay")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Owned-Address Index Test
+
+Runs OwnedAddressIndex and BuyEventHandler against an in-memory backend that
+counts queries, and checks that:
+
+- the index loads the owned_addresses view once and answers wallet, agent
+  and token lookups from memory;
+- delta refreshes only ask for rows updated since the watermark (less the
+  overlap), pick up new addresses and drop an owner's replaced address;
+- full reloads drop deleted rows, and create/update hooks take effect
+  immediately;
+- lookups answer True (so handlers fall back to the database) while the
+  index has never loaded;
+- a send-many block of FT transfers to addresses that are not ours costs no
+  wallet/agent/token queries, and transfers to our agent accounts query only
+  the rows that are actually ours.
+
+Usage:
+    python scripts/test_address_index.py [--events 200]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import List, Optional
+
+# Add the parent directory (root) to the path to import from app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.backend.models import Agent, OwnedAddress, Token, Wallet
+from app.lib.address_index import WATERMARK_OVERLAP, OwnedAddressIndex
+from app.services.integrations.webhooks.chainhook.handlers import buy_event_handler
+from app.services.integrations.webhooks.chainhook.handlers.buy_event_handler import (
+    BuyEventHandler,
+)
+from app.services.integrations.webhooks.chainhook.models import Event
+from scripts.testing import check, report
+
+NOW = datetime(2025, 10, 20, 12, 0, 0)
+TOKEN = "SP1DAO.dao-token"
+
+
+class FakeBackend:
+    """Wallets, agents and tokens in memory, with per-method query counts."""
+
+    def __init__(self):
+        self.wallets: List[Wallet] = []
+        self.agents: List[Agent] = []
+        self.tokens: List[Token] = []
+        self.calls: Counter = Counter()
+        self.updated_after: List[Optional[datetime]] = []
+        self.fail = False
+
+    def list_owned_addresses(self, updated_after=None):
+        self.calls["list_owned_addresses"] += 1
+        self.updated_after.append(updated_after)
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        rows = []
+        for w in self.wallets:
+            for address in (w.mainnet_address, w.testnet_address):
+                if address:
+                    rows.append(("wallet", address, w.id, w.updated_at))
+        rows += [
+            ("agent", a.account_contract, a.id, a.updated_at)
+            for a in self.agents
+            if a.account_contract
+        ]
+        rows += [
+            ("token", t.contract_principal, t.id, t.updated_at)
+            for t in self.tokens
+            if t.contract_principal
+        ]
+        return [
+            OwnedAddress(kind=k, address=a, owner_id=o, updated_at=u)
+            for k, a, o, u in rows
+            if updated_after is None or u >= updated_after
+        ]
+
+    def list_wallets(self, filters):
+        self.calls["list_wallets"] += 1
+        return [
+            w
+            for w in self.wallets
+            if (
+                filters.mainnet_address and w.mainnet_address == filters.mainnet_address
+            )
+            or (
+                filters.testnet_address and w.testnet_address == filters.testnet_address
+            )
+            or (filters.agent_id and w.agent_id == filters.agent_id)
+        ]
+
+    def list_agents(self, filters):
+        self.calls["list_agents"] += 1
+        return [
+            a for a in self.agents if a.account_contract == filters.account_contract
+        ]
+
+    def list_tokens(self, filters):
+        self.calls["list_tokens"] += 1
+        return [
+            t for t in self.tokens if t.contract_principal == filters.contract_principal
+        ]
+
+
+class RecordingBuyHandler(BuyEventHandler):
+    """BuyEventHandler that records receipts instead of writing holders."""
+
+    def __init__(self):
+        super().__init__()
+        self.receipts = []
+        self.purchases = []
+
+    async def _handle_agent_account_receipt(self, agent, token, amount, method, dao_id):
+        self.receipts.append(agent.account_contract)
+
+    async def _handle_wallet_purchase(self, wallet, token, amount, dao_id):
+        self.purchases.append(wallet.mainnet_address)
+
+
+def make_wallet(i: int, updated_at: datetime = NOW) -> Wallet:
+    return Wallet(
+        id=uuid.uuid4(),
+        created_at=NOW,
+        updated_at=updated_at,
+        mainnet_address=f"SP{i:04d}WALLET",
+        testnet_address=f"ST{i:04d}WALLET",
+    )
+
+
+def make_agent(i: int, updated_at: datetime = NOW) -> Agent:
+    return Agent(
+        id=uuid.uuid4(),
+        created_at=NOW,
+        updated_at=updated_at,
+        account_contract=f"SP1FACTORY.agent-{i:04d}",
+    )
+
+
+def make_backend(wallets: int = 10, agents: int = 10) -> FakeBackend:
+    db = FakeBackend()
+    db.wallets = [make_wallet(i) for i in range(wallets)]
+    db.agents = [make_agent(i) for i in range(agents)]
+    db.tokens = [
+        Token(
+            id=uuid.uuid4(),
+            created_at=NOW,
+            updated_at=NOW,
+            dao_id=uuid.uuid4(),
+            contract_principal=TOKEN,
+        )
+    ]
+    return db
+
+
+def ft_transfer(sender: str, recipient: str, amount: int = 100) -> Event:
+    return Event(
+        data={
+            "asset_identifier": f"{TOKEN}::dao-token",
+            "amount": str(amount),
+            "sender": sender,
+            "recipient": recipient,
+        },
+        position={"index": 0},
+        type="FTTransferEvent",
+    )
+
+
+def test_index(failures: List[str]) -> None:
+    print("Index")
+    db = make_backend()
+    index = OwnedAddressIndex(db, refresh_seconds=0, full_reload_seconds=3600)
+
+    check(
+        failures,
+        index.is_wallet_address("SP0001WALLET")
+        and index.is_wallet_address("ST0002WALLET")
+        and index.is_agent_account("SP1FACTORY.agent-0003")
+        and index.is_token_contract(TOKEN),
+        "wallet (both networks), agent and token lookups",
+    )
+    check(
+        failures,
+        not index.is_wallet_address("SP9999OTHER")
+        and not index.is_agent_account("SP0001WALLET")
+        and not index.is_token_contract("SP1OTHER.token")
+        and not index.is_wallet_address(None),
+        "addresses that are not ours, or of another kind",
+    )
+    check(
+        failures,
+        index.loads == 1 and db.updated_after[0] is None,
+        "loaded once from the full view",
+    )
+
+    # Deltas: a new wallet and an agent whose account contract moved
+    later = NOW + timedelta(minutes=5)
+    db.wallets.append(make_wallet(50, updated_at=later))
+    moved = db.agents[0]
+    db.agents[0] = moved.model_copy(
+        update={"account_contract": "SP1FACTORY.agent-moved", "updated_at": later}
+    )
+    db.updated_after.clear()
+    check(
+        failures,
+        index.is_wallet_address("SP0050WALLET")
+        and index.is_agent_account("SP1FACTORY.agent-moved")
+        and not index.is_agent_account("SP1FACTORY.agent-0000"),
+        "delta adds new addresses and drops an owner's replaced address",
+    )
+    check(
+        failures,
+        db.updated_after and db.updated_after[0] == NOW - WATERMARK_OVERLAP,
+        "delta asks only for rows updated since the watermark less the overlap",
+    )
+
+    # Deletions only show up on a full reload
+    db.wallets.pop(1)
+    index.refresh()
+    still = index.is_wallet_address("SP0001WALLET")
+    index.refresh(full=True)
+    check(
+        failures,
+        still and not index.is_wallet_address("SP0001WALLET") and index.loads == 2,
+        "deleted wallet kept by deltas, dropped by the full reload",
+    )
+
+    # Hooks take effect before any refresh
+    index.refresh_seconds = 3600
+    calls = db.calls["list_owned_addresses"]
+    index.add_agent(make_agent(77))
+    index.add_token(
+        Token(id=uuid.uuid4(), created_at=NOW, contract_principal="SP1NEW.token")
+    )
+    check(
+        failures,
+        index.is_agent_account("SP1FACTORY.agent-0077")
+        and index.is_token_contract("SP1NEW.token")
+        and db.calls["list_owned_addresses"] == calls,
+        "create/update hooks apply without a query",
+    )
+
+    # Fail open until the first load succeeds
+    db = make_backend()
+    db.fail = True
+    index = OwnedAddressIndex(db, refresh_seconds=3600, full_reload_seconds=3600)
+    answers = [index.is_wallet_address("SP9999OTHER") for _ in range(5)]
+    check(
+        failures,
+        all(answers) and not index.loaded and db.calls["list_owned_addresses"] == 1,
+        "unloaded index answers True and does not retry before refresh_seconds",
+    )
+    db.fail = False
+    index.refresh_seconds = 0
+    check(
+        failures,
+        not index.is_wallet_address("SP9999OTHER") and index.loaded,
+        "failed load retried on a later lookup",
+    )
+
+
+def test_handler(failures: List[str], events: int) -> None:
+    print("BuyEventHandler")
+    db = make_backend(wallets=events, agents=events)
+    index = OwnedAddressIndex(db, refresh_seconds=3600, full_reload_seconds=3600)
+    handler = RecordingBuyHandler()
+    buy_event_handler.backend = db
+    buy_event_handler.address_index = index
+
+    # A send-many block to addresses that are not ours
+    strangers = [ft_transfer("SP1DAO", f"SP{i:04d}STRANGER") for i in range(events)]
+    metadata = SimpleNamespace(receipt=SimpleNamespace(events=strangers))
+    db.calls.clear()
+    relevant = handler._has_relevant_ft_transfer_events(metadata)
+
+    async def process(transfers):
+        for event in transfers:
+            await handler._process_ft_transfer_event(event, "send-many", "0x1")
+
+    asyncio.run(process(strangers))
+    lookups = sum(v for k, v in db.calls.items() if k != "list_owned_addresses")
+    check(
+        failures,
+        not relevant and lookups == 0 and not handler.receipts,
+        f"{events} transfers to strangers: {lookups} wallet/agent/token queries",
+    )
+
+    # The same block to our agent accounts
+    ours = [ft_transfer("SP1DAO", f"SP1FACTORY.agent-{i:04d}") for i in range(events)]
+    metadata = SimpleNamespace(receipt=SimpleNamespace(events=ours))
+    db.calls.clear()
+    relevant = handler._has_relevant_ft_transfer_events(metadata)
+    asyncio.run(process(ours))
+    check(
+        failures,
+        relevant
+        and len(handler.receipts) == events
+        and db.calls["list_agents"] == events
+        and db.calls["list_tokens"] == events
+        and db.calls["list_wallets"] == 0,
+        f"{events} transfers to our agents: {dict(db.calls)}",
+    )
+
+    # A buy by one of our wallets
+    asyncio.run(process([ft_transfer("SP0003WALLET", "SP0003WALLET")]))
+    check(
+        failures,
+        handler.purchases == ["SP0003WALLET"],
+        "buy by our wallet reaches the purchase handler",
+    )
+    print(
+        f"   Without the index the stranger block costs {events * 7} queries "
+        f"(5 per event in the relevance check, 2 per processed event)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test the owned-address index")
+    parser.add_argument("--events", type=int, default=200)
+    args = parser.parse_args()
+    failures: List[str] = []
+
+    test_index(failures)
+    test_handler(failures, args.events)
+
+    report("Owned-address index", failures)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    main()
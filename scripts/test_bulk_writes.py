@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Bulk Write Test
+
+Checks the bulk write methods of SupabaseBackend against an in-process mock
+PostgREST server:
+
+- create_votes, create_x_tweets, create_lottery_results and create_holders
+  each send one request however many rows they write, and rows that leave a
+  field unset get the column default instead of NULL;
+- create_queue_messages and create_queue_message send the whole batch to the
+  enqueue_queue_messages function in one request, which deduplicates against
+  unprocessed messages (simulated here by message content);
+- update_votes sends one upsert per set of updated columns and never writes
+  a column an update did not set;
+- upsert_holders writes complete rows matched on id.
+
+Also compares the request count of the bulk calls with the per-row methods.
+
+Usage:
+    python scripts/test_bulk_writes.py [--rows 50]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List
+
+import httpx
+from postgrest import SyncPostgrestClient
+from sqlalchemy import create_engine
+
+# Add the parent directory (root) to the path to import from app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.backend.models import (
+    Holder,
+    HolderCreate,
+    LotteryResultCreate,
+    QueueMessageCreate,
+    QueueMessageType,
+    VoteBase,
+    VoteCreate,
+    XTweetCreate,
+)
+from app.backend.supabase import SupabaseBackend
+from scripts.testing import check, report
+
+NOW = "2025-10-18T00:00:00+00:00"
+
+
+class MockPostgrest:
+    """Records requests and echoes written rows back with an id."""
+
+    def __init__(self) -> None:
+        self.requests: List[httpx.Request] = []
+        self.queue: Dict[str, Dict[str, Any]] = {}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        rows = json.loads(request.content or b"[]")
+        if request.url.path == "/rpc/enqueue_queue_messages":
+            return httpx.Response(
+                200, json=[self.enqueue(row) for row in rows["p_messages"]]
+            )
+        if isinstance(rows, dict):
+            rows = [rows]
+        return httpx.Response(
+            201,
+            json=[{"id": str(uuid.uuid4()), "created_at": NOW, **row} for row in rows],
+        )
+
+    def enqueue(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """The new row, or the unprocessed row with the same key and content."""
+        key = json.dumps(
+            [row.get(k) for k in ("type", "dao_id", "wallet_id", "message")],
+            sort_keys=True,
+        )
+        if key not in self.queue:
+            self.queue[key] = {"id": str(uuid.uuid4()), "created_at": NOW, **row}
+        return self.queue[key]
+
+    def reset(self) -> None:
+        self.requests.clear()
+
+
+class MockClient:
+    def __init__(self, server: MockPostgrest) -> None:
+        self.postgrest = SyncPostgrestClient(
+            "http://postgrest.local",
+            http_client=httpx.Client(
+                base_url="http://postgrest.local",
+                transport=httpx.MockTransport(server),
+            ),
+        )
+
+    def table(self, name: str):
+        return self.postgrest.from_(name)
+
+    def rpc(self, name: str, params: Dict[str, Any]):
+        return self.postgrest.rpc(name, params)
+
+
+def prefer(request: httpx.Request) -> str:
+    return request.headers.get("prefer", "")
+
+
+def body(request: httpx.Request) -> List[Dict[str, Any]]:
+    return json.loads(request.content)
+
+
+def test_inserts(failures: List[str], backend: SupabaseBackend, server, rows: int):
+    print("Bulk inserts")
+    dao_id = uuid.uuid4()
+    evaluation = QueueMessageType.get_or_create("dao_proposal_evaluation")
+    batches = {
+        "votes": lambda: backend.create_votes(
+            [VoteCreate(dao_id=dao_id, answer=i % 2 == 0) for i in range(rows)]
+        ),
+        "x_tweets": lambda: backend.create_x_tweets(
+            [XTweetCreate(tweet_id=str(i), message="gm") for i in range(rows)]
+        ),
+        "lottery_results": lambda: backend.create_lottery_results(
+            [
+                LotteryResultCreate(proposal_id=uuid.uuid4(), dao_id=dao_id)
+                for _ in range(rows)
+            ]
+        ),
+        "holders": lambda: backend.create_holders(
+            [HolderCreate(dao_id=dao_id, amount=str(i)) for i in range(rows)]
+        ),
+    }
+    for table, create in batches.items():
+        server.reset()
+        created = create()
+        check(
+            failures,
+            len(server.requests) == 1 and len(created) == rows,
+            f"{table}: {rows} rows in {len(server.requests)} request",
+        )
+        request = server.requests[0]
+        check(
+            failures,
+            request.method == "POST"
+            and request.url.path == f"/{table}"
+            and "missing=default" in prefer(request),
+            f"{table}: unset fields take the column default",
+        )
+
+    server.reset()
+    check(failures, backend.create_votes([]) == [], "empty batch returns []")
+    check(failures, not server.requests, "empty batch sends no request")
+
+    print("Queue messages")
+    server.reset()
+    messages = [
+        QueueMessageCreate(
+            type=evaluation,
+            message={"proposal_id": str(uuid.uuid4())},
+            dao_id=dao_id,
+            wallet_id=uuid.uuid4(),
+            # Only some rows set is_processed; the rest keep the default
+            **({"is_processed": False} if i % 2 else {}),
+        )
+        for i in range(rows)
+    ]
+    queued = backend.create_queue_messages(messages)
+    check(
+        failures,
+        len(server.requests) == 1
+        and server.requests[0].url.path == "/rpc/enqueue_queue_messages"
+        and len(queued) == rows,
+        f"queue: {rows} messages in {len(server.requests)} request",
+    )
+    check(
+        failures,
+        [q.message for q in queued] == [m.message for m in messages],
+        "queue: one message per input, in order",
+    )
+    check(
+        failures,
+        all(
+            ("is_processed" in row) == bool(i % 2)
+            for i, row in enumerate(body(server.requests[0])["p_messages"])
+        ),
+        "queue: unset fields left to the database",
+    )
+
+    server.reset()
+    duplicate = backend.create_queue_message(messages[0])
+    check(
+        failures,
+        len(server.requests) == 1 and duplicate.id == queued[0].id,
+        "queue: duplicate returns the pending message in one request",
+    )
+    server.reset()
+    again = backend.create_queue_messages([messages[1], messages[1]])
+    check(
+        failures,
+        len({q.id for q in again}) == 1 and again[0].id == queued[1].id,
+        "queue: duplicates within a batch return the same message",
+    )
+
+
+def test_updates(failures: List[str], backend: SupabaseBackend, server, rows: int):
+    print("Bulk updates")
+    server.reset()
+    updates = [
+        (uuid.uuid4(), VoteBase(tx_id=f"0x{i:04x}", voted=True)) for i in range(rows)
+    ]
+    updates.append((uuid.uuid4(), VoteBase(reasoning="late")))
+    updates.append((uuid.uuid4(), VoteBase()))
+    updated = backend.update_votes(updates)
+
+    check(
+        failures,
+        len(server.requests) == 2,
+        f"{len(updates)} updates over 2 column sets in {len(server.requests)} requests",
+    )
+    check(failures, len(updated) == rows + 1, "updated rows returned")
+    columns = [sorted(body(request)[0]) for request in server.requests]
+    check(
+        failures,
+        columns == [["id", "tx_id", "voted"], ["id", "reasoning"]],
+        f"only set columns written: {columns}",
+    )
+    check(
+        failures,
+        all(
+            "resolution=merge-duplicates" in prefer(request)
+            and request.url.params.get("on_conflict") == "id"
+            for request in server.requests
+        ),
+        "updates are upserts on id",
+    )
+
+    server.reset()
+    holders = [
+        Holder(
+            id=uuid.uuid4(),
+            created_at=datetime.now(),
+            token_id=uuid.uuid4(),
+            address=f"SP{i}",
+            amount=str(i),
+        )
+        for i in range(rows)
+    ]
+    backend.upsert_holders(holders)
+    check(
+        failures,
+        len(server.requests) == 1
+        and {"id", "created_at", "amount", "address"}
+        <= set(body(server.requests[0])[0]),
+        "upsert_holders writes complete rows in one request",
+    )
+
+
+def compare_requests(backend: SupabaseBackend, server, rows: int) -> None:
+    server.reset()
+    for i in range(rows):
+        backend.create_vote(VoteCreate(answer=True))
+    single = len(server.requests)
+    server.reset()
+    backend.create_votes([VoteCreate(answer=True) for _ in range(rows)])
+    print(f"{rows} votes: {single} requests one by one, {len(server.requests)} in bulk")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test the bulk write methods")
+    parser.add_argument("--rows", type=int, default=50)
+    args = parser.parse_args()
+    failures: List[str] = []
+
+    server = MockPostgrest()
+    backend = SupabaseBackend(
+        client=MockClient(server), sqlalchemy_engine=create_engine("sqlite://")
+    )
+    test_inserts(failures, backend, server, args.rows)
+    test_updates(failures, backend, server, args.rows)
+    compare_requests(backend, server, args.rows)
+
+    report("Bulk write", failures)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    main()
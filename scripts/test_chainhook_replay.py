@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Chainhook Replay Test
+
+Runs a sample chainhook block (chainhook-data/coinbase.json) through
+ChainhookService and the chainhook_ingest task with the chain state and queue
+in memory, and checks that:
+
+- webhook processing still skips blocks at or below the recorded chain state;
+- replay mode (used for ingest log entries) hands an already-seen height to
+  the handlers, and fails a newer block whose chain state was not recorded so
+  it is retried rather than dropped;
+- the ingest task handles a batch in height order, stops at the first block
+  that will be retried and releases the later ones.
+
+Usage:
+    python scripts/test_chainhook_replay.py
+"""
+
+import asyncio
+import copy
+import json
+import logging
+import os
+import sys
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from typing import List
+
+# Add the parent directory (root) to the path to import from app
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.backend.models import ChainState, QueueMessage
+from app.services.infrastructure.job_management.tasks import chainhook_ingest
+from app.services.infrastructure.job_management.tasks.chainhook_ingest import (
+    ChainhookIngestTask,
+)
+from app.services.integrations.webhooks.chainhook import ChainhookService
+from app.services.integrations.webhooks.chainhook.handlers import (
+    block_state_handler,
+)
+from app.services.integrations.webhooks.chainhook.handlers.base import (
+    ChainhookEventHandler,
+)
+from app.services.integrations.webhooks.chainhook.router import TransactionRouter
+from scripts.testing import check, report
+
+NOW = datetime(2025, 10, 24)
+
+with open(os.path.join(ROOT, "chainhook-data", "coinbase.json")) as f:
+    SAMPLE = json.load(f)
+HEIGHT = SAMPLE["apply"][0]["block_identifier"]["index"]
+
+
+def block_at(height: int) -> dict:
+    payload = copy.deepcopy(SAMPLE)
+    payload["apply"][0]["block_identifier"]["index"] = height
+    payload["apply"][0]["block_identifier"]["hash"] = f"0x{height:064x}"
+    return payload
+
+
+class FakeChainStates:
+    """The recorded chain state in memory."""
+
+    def __init__(self, height: int):
+        self.state = ChainState(
+            id=uuid.uuid4(),
+            created_at=NOW,
+            block_height=height,
+            block_hash="0x0",
+            network="testnet",
+        )
+        self.fail_updates = False
+
+    def get_latest_chain_state(self, network=None):
+        return self.state
+
+    def update_chain_state(self, chain_state_id, update_data):
+        if self.fail_updates:
+            return None
+        self.state = self.state.model_copy(update=update_data.model_dump())
+        return self.state
+
+
+class RecordingHandler(ChainhookEventHandler):
+    """Records the heights of the blocks it is handed."""
+
+    transaction_routes = ()
+
+    def __init__(self):
+        super().__init__()
+        self.heights: List[int] = []
+
+    def can_handle_transaction(self, transaction) -> bool:
+        return False
+
+    async def handle_transaction(self, transaction) -> None:
+        pass
+
+    def can_handle_block(self, block) -> bool:
+        return True
+
+    async def handle_block(self, block) -> None:
+        self.heights.append(block.block_identifier.index)
+
+
+def make_service(recorder: RecordingHandler) -> ChainhookService:
+    service = ChainhookService()
+    handler = service.handler
+    handler.handlers = [recorder, handler.block_state_handler]
+    handler.router = TransactionRouter(handler.handlers)
+    return service
+
+
+def test_replay_mode(failures: List[str]) -> None:
+    print("Replay mode")
+    states = FakeChainStates(HEIGHT)
+    block_state_handler.backend = states
+    recorder = RecordingHandler()
+    service = make_service(recorder)
+
+    asyncio.run(service.process(block_at(HEIGHT - 10)))
+    check(failures, recorder.heights == [], "webhook skips an already-seen height")
+
+    asyncio.run(service.process(block_at(HEIGHT - 10), replay=True))
+    asyncio.run(service.process(block_at(HEIGHT), replay=True))
+    check(
+        failures,
+        recorder.heights == [HEIGHT - 10, HEIGHT]
+        and states.state.block_height == HEIGHT,
+        "replay hands already-seen heights to the handlers, chain state unchanged",
+    )
+
+    asyncio.run(service.process(block_at(HEIGHT + 1), replay=True))
+    check(
+        failures,
+        recorder.heights[-1] == HEIGHT + 1 and states.state.block_height == HEIGHT + 1,
+        "a new block advances the chain state in replay mode",
+    )
+
+    states.fail_updates = True
+    try:
+        asyncio.run(service.process(block_at(HEIGHT + 2), replay=True))
+        raised = False
+    except RuntimeError:
+        raised = True
+    check(
+        failures,
+        raised and recorder.heights[-1] == HEIGHT + 1,
+        "a new block whose chain state was not recorded fails for a retry",
+    )
+
+
+class FakeLease:
+    """Hands out fixed entries and records releases."""
+
+    def __init__(self, entries: List[QueueMessage]):
+        self.entries = entries
+        self.released: List[uuid.UUID] = []
+
+    async def claim(self):
+        return list(self.entries)
+
+    async def release(self, message_ids=None):
+        self.released.extend(message_ids or [])
+        return len(message_ids or [])
+
+
+def test_ingest_order(failures: List[str]) -> None:
+    print("Ingest task")
+    states = FakeChainStates(HEIGHT)
+    block_state_handler.backend = states
+    recorder = RecordingHandler()
+    service = make_service(recorder)
+    original = service.process
+
+    async def process(payload, replay=False):
+        if payload["apply"][0]["block_identifier"]["index"] == HEIGHT + 2:
+            raise RuntimeError("handler failed")
+        return await original(payload, replay=replay)
+
+    service.process = process
+
+    updates = {}
+    chainhook_ingest.backend = SimpleNamespace(
+        update_queue_message=lambda entry_id, data: updates.__setitem__(
+            entry_id, data.is_processed
+        )
+    )
+    entries = [
+        QueueMessage(
+            id=uuid.uuid4(),
+            created_at=NOW,
+            type="chainhook_ingest",
+            claim_count=1,
+            message={"block_height": height, "payload": block_at(height)},
+        )
+        for height in (HEIGHT + 3, HEIGHT + 1, HEIGHT, HEIGHT + 2)
+    ]
+    by_height = {e.message["block_height"]: e.id for e in entries}
+
+    task = ChainhookIngestTask()
+    task._service = service
+    task._queue_lease = FakeLease(entries)
+    results = asyncio.run(task._execute_impl(None))
+    check(
+        failures,
+        recorder.heights == [HEIGHT, HEIGHT + 1],
+        "blocks handled in height order up to the failure",
+    )
+    check(
+        failures,
+        updates.get(by_height[HEIGHT]) is True
+        and updates.get(by_height[HEIGHT + 2]) is not True
+        and by_height[HEIGHT + 3] not in updates
+        and set(task._queue_lease.released)
+        == {by_height[HEIGHT + 2], by_height[HEIGHT + 3]},
+        "failed block kept for a retry, later block released unprocessed",
+    )
+    check(
+        failures,
+        results[0].blocks_processed == 2 and results[0].blocks_failed == 1,
+        results[0].message,
+    )
+
+
+def main():
+    failures: List[str] = []
+
+    test_replay_mode(failures)
+    test_ingest_order(failures)
+
+    report("Chainhook replay", failures)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    main()
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Clarity Codec Test
+
+Checks app.lib.clarity, the local Clarity value serializer/deserializer:
+
+- known encodings of every Clarity type and a known c32 address;
+- every print event payload in chainhook-data/ (plus examples/chainhook.json)
+  is serialized, then decoded back to exactly the payload the handlers saw,
+  both by decode_clarity_value and through the Stacks chainhook adapter's
+  event value parsing, with the decoder API pointed at a closed port so any
+  remote call would show up as a mismatch;
+- decode_hex_parameters still returns the text of string values.
+
+Also reports the local decoding time per payload.
+
+Usage:
+    python scripts/test_clarity_codec.py [--iterations 2000]
+"""
+
+import argparse
+import asyncio
+import glob
+import json
+import logging
+import os
+import re
+import sys
+import time
+from functools import partial
+from typing import Any, List
+
+# Add the parent directory (root) to the path to import from app
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.lib.clarity import (
+    ClarityDecodeError,
+    ClarityType,
+    ClarityValue,
+    c32_address,
+    c32_address_decode,
+    decode_clarity_value,
+    deserialize,
+    serialize,
+)
+from app.lib.utils import decode_hex_parameters
+from app.services.processing.stacks_chainhook_adapter import (
+    AdapterConfig,
+    StacksChainhookAdapter,
+)
+from scripts import testing
+from scripts.testing import report
+
+PRINCIPAL = re.compile(r"^S[0-9A-Z]{39,40}(\.[a-zA-Z][a-zA-Z0-9\-_]*)?$")
+
+VECTORS = [
+    (ClarityValue(ClarityType.UINT, 1), "0100000000000000000000000000000001", 1),
+    (ClarityValue(ClarityType.INT, -1), "00" + "ff" * 16, -1),
+    (ClarityValue(ClarityType.BUFFER, b"\xde\xad"), "0200000002dead", "0xdead"),
+    (ClarityValue(ClarityType.BOOL_TRUE, True), "03", True),
+    (ClarityValue(ClarityType.BOOL_FALSE, False), "04", False),
+    (
+        ClarityValue(
+            ClarityType.PRINCIPAL_STANDARD, "SP2J6ZY48GV1EZ5V2V5RB9MP66SW86PYKKNRV9EJ7"
+        ),
+        "0516a46ff88886c2ef9762d970b4d2c63678835bd39d",
+        "SP2J6ZY48GV1EZ5V2V5RB9MP66SW86PYKKNRV9EJ7",
+    ),
+    (
+        ClarityValue(
+            ClarityType.PRINCIPAL_CONTRACT,
+            "SP2J6ZY48GV1EZ5V2V5RB9MP66SW86PYKKNRV9EJ7.dao",
+        ),
+        "0616a46ff88886c2ef9762d970b4d2c63678835bd39d0364616f",
+        "SP2J6ZY48GV1EZ5V2V5RB9MP66SW86PYKKNRV9EJ7.dao",
+    ),
+    (
+        ClarityValue(ClarityType.RESPONSE_OK, ClarityValue(ClarityType.BOOL_TRUE)),
+        "0703",
+        True,
+    ),
+    (
+        ClarityValue(ClarityType.RESPONSE_ERR, ClarityValue(ClarityType.UINT, 5)),
+        "08" + "01" + "00" * 15 + "05",
+        5,
+    ),
+    (ClarityValue(ClarityType.OPTIONAL_NONE), "09", None),
+    (
+        ClarityValue(ClarityType.OPTIONAL_SOME, ClarityValue(ClarityType.BOOL_FALSE)),
+        "0a04",
+        False,
+    ),
+    (
+        ClarityValue(ClarityType.LIST, [ClarityValue(ClarityType.BOOL_TRUE)] * 2),
+        "0b000000020303",
+        [True, True],
+    ),
+    (
+        ClarityValue(
+            ClarityType.TUPLE,
+            {
+                "b": ClarityValue(ClarityType.BOOL_TRUE),
+                "a": ClarityValue(ClarityType.OPTIONAL_NONE),
+            },
+        ),
+        "0c00000002016109016203",
+        {"a": None, "b": True},
+    ),
+    (ClarityValue(ClarityType.STRING_ASCII, "hello"), "0d0000000568656c6c6f", "hello"),
+    (ClarityValue(ClarityType.STRING_UTF8, "é"), "0e00000002c3a9", "é"),
+]
+
+
+def typed(value: Any) -> ClarityValue:
+    """The Clarity value a decoded print event payload was serialized from."""
+    if isinstance(value, bool):
+        return ClarityValue(ClarityType.BOOL_TRUE if value else ClarityType.BOOL_FALSE)
+    if isinstance(value, int):
+        return ClarityValue(ClarityType.UINT if value >= 0 else ClarityType.INT, value)
+    if value is None:
+        return ClarityValue(ClarityType.OPTIONAL_NONE)
+    if isinstance(value, dict):
+        return ClarityValue(ClarityType.TUPLE, {k: typed(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return ClarityValue(ClarityType.LIST, [typed(item) for item in value])
+    if PRINCIPAL.match(value):
+        contract = "." in value
+        return ClarityValue(
+            ClarityType.PRINCIPAL_CONTRACT
+            if contract
+            else ClarityType.PRINCIPAL_STANDARD,
+            value,
+        )
+    if re.fullmatch(r"0x([0-9a-f]{2})*", value):
+        return ClarityValue(ClarityType.BUFFER, bytes.fromhex(value[2:]))
+    if value.isascii():
+        return ClarityValue(ClarityType.STRING_ASCII, value)
+    return ClarityValue(ClarityType.STRING_UTF8, value)
+
+
+def sample_payloads() -> List[Any]:
+    files = sorted(glob.glob(os.path.join(ROOT, "chainhook-data", "*.json")))
+    files.append(os.path.join(ROOT, "examples", "chainhook.json"))
+    payloads = []
+    for path in files:
+        if not os.path.exists(path):
+            continue
+        with open(path) as f:
+            data = json.load(f)
+        for block in data.get("apply", []):
+            for tx in block.get("transactions", []):
+                for event in tx["metadata"]["receipt"]["events"]:
+                    value = (event.get("data") or {}).get("value")
+                    if event.get("type") == "SmartContractEvent" and value is not None:
+                        payloads.append(value)
+    return payloads
+
+
+# Hundreds of checks: print only the failures
+check = partial(testing.check, quiet=True)
+
+
+async def check_adapter(failures: List[str], encoded: List[str], payloads: List[Any]):
+    adapter = StacksChainhookAdapter(
+        AdapterConfig(
+            network="testnet",
+            enable_hex_decoding=True,
+            hex_decoder_api_url="http://127.0.0.1:9/decode",
+            hex_decoder_timeout=1.0,
+        )
+    )
+    try:
+        for hex_value, payload in zip(encoded, payloads):
+            parsed = await adapter._parse_event_value({"hex": hex_value, "repr": ""})
+            check(failures, parsed == payload, f"adapter decoded {hex_value[:40]}...")
+    finally:
+        await adapter.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test the Clarity codec")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    failures: List[str] = []
+
+    check(
+        failures,
+        c32_address(22, bytes.fromhex("a46ff88886c2ef9762d970b4d2c63678835bd39d"))
+        == "SP2J6ZY48GV1EZ5V2V5RB9MP66SW86PYKKNRV9EJ7",
+        "c32 address",
+    )
+    for value, expected_hex, expected_plain in VECTORS:
+        name = value.type.name
+        check(failures, serialize(value).hex() == expected_hex, f"{name} encoding")
+        check(
+            failures,
+            decode_clarity_value(expected_hex) == expected_plain,
+            f"{name} decoding",
+        )
+        check(
+            failures,
+            serialize(deserialize(expected_hex)).hex() == expected_hex,
+            f"{name} round trip",
+        )
+    for bad in ("", "01", "0300", "ff", "0d00000001ff", "zz"):
+        try:
+            decode_clarity_value(bad)
+            check(failures, False, f"{bad!r} rejected")
+        except ClarityDecodeError:
+            pass
+    print(f"{len(VECTORS)} type vectors checked")
+
+    payloads = sample_payloads()
+    encoded = ["0x" + serialize(typed(payload)).hex() for payload in payloads]
+    for hex_value, payload in zip(encoded, payloads):
+        check(
+            failures,
+            decode_clarity_value(hex_value) == payload,
+            f"payload {hex_value[:40]}...",
+        )
+        for principal in re.findall(r"S[0-9A-Z]{39,40}", json.dumps(payload)):
+            c32_address_decode(principal)
+    asyncio.run(check_adapter(failures, encoded, payloads))
+    print(f"{len(payloads)} sample print payloads round-tripped")
+
+    string_hex = serialize(
+        ClarityValue(ClarityType.STRING_UTF8, "Proposal: fund ✓")
+    ).hex()
+    check(
+        failures,
+        decode_hex_parameters(string_hex) == "Proposal: fund ✓",
+        "decode_hex_parameters string",
+    )
+    check(
+        failures, decode_hex_parameters("0x6869") == "hi", "decode_hex_parameters raw"
+    )
+
+    start = time.perf_counter()
+    for _ in range(args.iterations):
+        for hex_value in encoded:
+            decode_clarity_value(hex_value)
+    elapsed = time.perf_counter() - start
+    print(
+        f"local decode: {elapsed / (args.iterations * len(encoded)) * 1e6:.1f} us/payload"
+    )
+
+    report("Clarity codec", failures)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+DAO Context Snapshot Test
+
+Runs DAOContextStore and the v2 evaluation's past proposals context against
+an in-memory backend and checks that:
+
+- the context built from a snapshot matches the previous list, filter, sort
+  and render approach for proposals with and without a sender;
+- evaluations of the same proposal list the DAO's proposals once and share
+  the rendered fragments;
+- create/update hooks add proposals and move them between statuses without
+  a reload, and expired snapshots are loaded again;
+- the store keeps at most max_daos snapshots;
+- fetch_dao_proposals reads the snapshot and excludes the current proposal.
+
+Also compares the time to build the context for repeated evaluations with
+the previous approach.
+
+Usage:
+    python scripts/test_dao_context.py [--proposals 2000] [--evaluations 10]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import List
+
+# Add the parent directory (root) to the path to import from app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.backend.models import ContractStatus, Proposal
+from app.lib.dao_context import DAOContextStore
+from app.services.ai.simple_workflows import evaluation, evaluation_openrouter_v2
+from app.services.ai.simple_workflows.evaluation_openrouter_v2 import (
+    _fetch_past_proposals_context,
+    _format_proposals_for_context,
+)
+from scripts.testing import ProposalBackend, check, make_proposal, report
+
+NOW = datetime(2025, 10, 22)
+DAO_ID = uuid.uuid4()
+SENDERS = [f"SP{i}SENDER" for i in range(20)]
+STATUSES = [
+    ContractStatus.DRAFT,
+    ContractStatus.PENDING,
+    ContractStatus.DEPLOYED,
+    ContractStatus.FAILED,
+]
+
+
+def dao_proposal(i: int, **kwargs) -> Proposal:
+    rng = random.Random(i)
+    fields = dict(
+        created_at=NOW - timedelta(hours=i),
+        dao_id=DAO_ID,
+        proposal_id=i,
+        title=f"Proposal {i}",
+        content=f"Fund item {i}",
+        summary=f"Summary of proposal {i}",
+        status=rng.choice(STATUSES),
+        tx_sender=rng.choice(SENDERS),
+        x_url=f"https://x.com/user{i % 7}/status/{i}",
+        created_btc=800000 + i,
+    )
+    return make_proposal(**{**fields, **kwargs})
+
+
+def legacy_context(db: ProposalBackend, proposal: Proposal):
+    """The context as built before snapshots: list, filter, sort, render."""
+    dao_proposals = [
+        p for p in db.proposals if p.dao_id == proposal.dao_id and p.id != proposal.id
+    ]
+    user_past_proposals = []
+    user_text = None
+    if proposal.tx_sender:
+        user_past_proposals = [
+            p for p in dao_proposals if p.tx_sender == proposal.tx_sender
+        ]
+        user_text = _format_proposals_for_context(user_past_proposals)
+    dao_past = [
+        p
+        for p in dao_proposals
+        if not user_past_proposals or p not in user_past_proposals
+    ] or dao_proposals
+    dao_past = sorted(dao_past, key=lambda p: p.created_at, reverse=True)
+    drafts = [p for p in dao_past if p.status == ContractStatus.DRAFT]
+    deployed = [p for p in dao_past if p.status == ContractStatus.DEPLOYED]
+    stats = {
+        "TOTAL_ALL_TIME": len(dao_past),
+        "NOT_SUBMITTED_ONCHAIN": len(drafts),
+        "TRANSACTION_FAILED": len(
+            [p for p in dao_past if p.status == ContractStatus.FAILED]
+        ),
+        "SUBMITTED_ONCHAIN_FOR_EVAL": len(deployed),
+    }
+    return (
+        user_text,
+        stats,
+        _format_proposals_for_context(drafts[:20]),
+        _format_proposals_for_context(deployed[:100]),
+    )
+
+
+def install(db: ProposalBackend, **kwargs) -> DAOContextStore:
+    store = DAOContextStore(db, **{"ttl_seconds": 3600, "max_daos": 16, **kwargs})
+    evaluation_openrouter_v2.dao_context = store
+    evaluation.dao_context = store
+    return store
+
+
+def test_equivalence(failures: List[str]) -> None:
+    print("Context")
+    proposals = [dao_proposal(i) for i in range(300)]
+    db = ProposalBackend(proposals)
+    install(db)
+
+    evaluated = [proposals[0], proposals[150], dao_proposal(999, tx_sender=None)]
+    evaluated.append(dao_proposal(998, tx_sender="SP9LONER"))  # no other proposals
+    same = all(
+        _fetch_past_proposals_context(p) == legacy_context(db, p) for p in evaluated
+    )
+    check(failures, same, "matches the previous context, with and without a sender")
+
+
+def test_sharing(failures: List[str], evaluations: int) -> None:
+    print("Sharing")
+    proposals = [dao_proposal(i) for i in range(300)]
+    db = ProposalBackend(proposals)
+    store = install(db)
+
+    renders = Counter()
+    original = evaluation_openrouter_v2._format_proposals_for_context
+
+    def counting(items):
+        renders["render"] += 1
+        return original(items)
+
+    evaluation_openrouter_v2._format_proposals_for_context = counting
+    try:
+        results = [
+            _fetch_past_proposals_context(proposals[5]) for _ in range(evaluations)
+        ]
+        _fetch_past_proposals_context(proposals[6])
+    finally:
+        evaluation_openrouter_v2._format_proposals_for_context = original
+    check(
+        failures,
+        db.calls["list_proposals"] == 1 and store.loads == 1,
+        f"{evaluations + 1} evaluations, {db.calls['list_proposals']} proposal listing",
+    )
+    check(
+        failures,
+        renders["render"] == 6 and all(r == results[0] for r in results),
+        f"fragments rendered once per evaluated proposal ({renders['render']} renders)",
+    )
+
+
+def test_hooks(failures: List[str]) -> None:
+    print("Hooks")
+    proposals = [
+        dao_proposal(i, status=ContractStatus.DEPLOYED, tx_sender="SP1")
+        for i in range(1, 30)
+    ]
+    db = ProposalBackend(proposals)
+    store = install(db)
+    evaluated = dao_proposal(500, tx_sender="SP2")
+
+    store.get(DAO_ID)
+    draft = dao_proposal(0, status=ContractStatus.DRAFT, tx_sender="SP1")
+    db.proposals.append(draft)
+    store.upsert(draft)
+    _, stats, drafts, _ = _fetch_past_proposals_context(evaluated)
+    check(
+        failures,
+        stats["NOT_SUBMITTED_ONCHAIN"] == 1
+        and "Proposal 0" in drafts
+        and db.calls["list_proposals"] == 1,
+        "created draft shows up without a reload",
+    )
+
+    deployed = draft.model_copy(update={"status": ContractStatus.DEPLOYED})
+    db.proposals[-1] = deployed
+    store.upsert(deployed)
+    _, stats, drafts, _ = _fetch_past_proposals_context(evaluated)
+    check(
+        failures,
+        stats["NOT_SUBMITTED_ONCHAIN"] == 0
+        and stats["SUBMITTED_ONCHAIN_FOR_EVAL"] == 30
+        and drafts == "None Found."
+        and _fetch_past_proposals_context(evaluated) == legacy_context(db, evaluated),
+        "status change moves the proposal to deployed",
+    )
+    check(
+        failures,
+        len(store.get(DAO_ID)) == 30 and db.calls["list_proposals"] == 1,
+        "updated proposal replaced, not duplicated",
+    )
+
+    other = dao_proposal(1, dao_id=uuid.uuid4())
+    store.upsert(other)
+    check(failures, len(store) == 1, "hooks for DAOs not loaded are ignored")
+
+    store.ttl_seconds = 0
+    store.get(DAO_ID)
+    check(failures, db.calls["list_proposals"] == 2, "expired snapshot reloaded")
+
+    store = install(db, max_daos=2)
+    for _ in range(3):
+        store.get(uuid.uuid4())
+    check(failures, len(store) == 2, "at most max_daos snapshots kept")
+
+
+def test_fetch_dao_proposals(failures: List[str]) -> None:
+    print("fetch_dao_proposals")
+    proposals = [dao_proposal(i) for i in range(10)]
+    db = ProposalBackend(proposals)
+    install(db)
+    fetched = asyncio.run(
+        evaluation.fetch_dao_proposals(DAO_ID, exclude_proposal_id=str(proposals[3].id))
+    )
+    check(
+        failures,
+        len(fetched) == 9
+        and proposals[3] not in fetched
+        and fetched == sorted(fetched, key=lambda p: p.created_at, reverse=True),
+        "current proposal excluded, newest first",
+    )
+
+
+def test_speed(proposals: int, evaluations: int) -> None:
+    print("Speed")
+    rows = [dao_proposal(i) for i in range(proposals)]
+    evaluated = rows[proposals // 2]
+    db = ProposalBackend(rows)
+    install(db)
+
+    start = time.perf_counter()
+    for _ in range(evaluations):
+        legacy_context(db, evaluated)
+    legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(evaluations):
+        _fetch_past_proposals_context(evaluated)
+    snapshot = time.perf_counter() - start
+    print(
+        f"   {proposals} proposals, {evaluations} evaluations of one proposal: "
+        f"{legacy * 1e3:.1f} ms rebuilding each time, {snapshot * 1e3:.1f} ms "
+        f"from the snapshot (excluding the list_proposals round trips)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test the DAO context snapshots")
+    parser.add_argument("--proposals", type=int, default=2000)
+    parser.add_argument("--evaluations", type=int, default=10)
+    args = parser.parse_args()
+    failures: List[str] = []
+
+    test_equivalence(failures)
+    test_sharing(failures, args.evaluations)
+    test_hooks(failures)
+    test_fetch_dao_proposals(failures)
+    test_speed(args.proposals, args.evaluations)
+
+    report("DAO context", failures)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    main()
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Embedding Cache Test
+
+Runs EmbeddingCache against a fake provider that counts calls and checks that:
+
+- keys depend on the model and the normalized text (whitespace and Unicode
+  normalization), not on the raw string;
+- a batch sends only its distinct uncached texts to the provider, in one
+  call, and returns one embedding per input in order;
+- concurrent callers embedding the same text share one provider request;
+- the in-memory tier evicts the least recently used entries;
+- the on-disk tier survives a new cache instance (a restart);
+- failed batches are not cached and are retried on the next call.
+
+Also compares provider calls for an embedder run followed by repeated
+evaluations of the same proposals, with and without the cache.
+
+Usage:
+    python scripts/test_embedding_cache.py [--proposals 200] [--evaluations 5]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+from typing import List
+
+# Add the parent directory (root) to the path to import from app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.ai.embeddings.embedding_cache import EmbeddingCache, cache_key
+from scripts.testing import check, report
+
+MODEL = "text-embedding-3-small"
+
+
+class FakeProvider:
+    """Embeds texts as [len, checksum], recording every call."""
+
+    def __init__(self, delay: float = 0.0):
+        self.batches: List[List[str]] = []
+        self.delay = delay
+        self.fail = False
+
+    @property
+    def texts(self) -> int:
+        return sum(len(batch) for batch in self.batches)
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        self.batches.append(list(texts))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("provider unavailable")
+        return [[float(len(t)), float(sum(map(ord, t)) % 9973)] for t in texts]
+
+
+def test_keys(failures: List[str]) -> None:
+    print("Keys")
+    check(
+        failures,
+        cache_key(MODEL, "Fund  the\nthing ") == cache_key(MODEL, "Fund the thing")
+        and cache_key(MODEL, "caf\u00e9") == cache_key(MODEL, "cafe\u0301"),
+        "whitespace runs and Unicode forms map to the same key",
+    )
+    check(
+        failures,
+        cache_key(MODEL, "a") != cache_key("other-model", "a")
+        and cache_key(MODEL, "a") != cache_key(MODEL, "A"),
+        "model and case are part of the key",
+    )
+
+
+def test_batches(failures: List[str]) -> None:
+    print("Batches")
+    provider = FakeProvider()
+    cache = EmbeddingCache(maxsize=100)
+
+    async def run():
+        first = await cache.aembed(MODEL, ["a", "b", "a", "c"], provider.embed)
+        second = await cache.aembed(MODEL, ["c", "d", "b ", "e"], provider.embed)
+        return first, second
+
+    first, second = asyncio.run(run())
+    check(
+        failures,
+        provider.batches == [["a", "b", "c"], ["d", "e"]],
+        f"only distinct misses reach the provider: {provider.batches}",
+    )
+    check(
+        failures,
+        len(first) == 4
+        and first[0] == first[2]
+        and second[0] == first[3]
+        and second[2] == first[1],
+        "one embedding per input, in order",
+    )
+    check(
+        failures,
+        cache.stats.hits == 2 and cache.stats.misses == 5,
+        f"stats: {cache.get_stats()}",
+    )
+
+
+def test_inflight(failures: List[str]) -> None:
+    print("In-flight sharing")
+    provider = FakeProvider(delay=0.05)
+    cache = EmbeddingCache(maxsize=100)
+
+    async def run():
+        return await asyncio.gather(
+            *(
+                cache.aembed(MODEL, ["proposal", "query"], provider.embed)
+                for _ in range(8)
+            )
+        )
+
+    results = asyncio.run(run())
+    check(
+        failures,
+        len(provider.batches) == 1
+        and cache.stats.shared == 14
+        and all(r == results[0] for r in results),
+        f"8 concurrent callers, {len(provider.batches)} provider call",
+    )
+
+    # The owner of a shared request is cancelled: waiters embed it themselves
+    provider = FakeProvider(delay=0.05)
+    cache = EmbeddingCache(maxsize=100)
+
+    async def cancelled():
+        owner = asyncio.create_task(cache.aembed(MODEL, ["x"], provider.embed))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.aembed(MODEL, ["x"], provider.embed))
+        await asyncio.sleep(0.01)
+        owner.cancel()
+        return await waiter
+
+    embedding = asyncio.run(cancelled())
+    check(
+        failures,
+        embedding == [[1.0, float(ord("x"))]] and len(provider.batches) == 2,
+        "waiter retries when the owning caller is cancelled",
+    )
+
+
+def test_eviction(failures: List[str]) -> None:
+    print("Eviction")
+    provider = FakeProvider()
+    cache = EmbeddingCache(maxsize=2)
+
+    async def run():
+        await cache.aembed(MODEL, ["a", "b"], provider.embed)
+        await cache.aembed(MODEL, ["a"], provider.embed)  # a is now most recent
+        await cache.aembed(MODEL, ["c"], provider.embed)  # evicts b
+        await cache.aembed(MODEL, ["a", "b"], provider.embed)
+
+    asyncio.run(run())
+    check(
+        failures,
+        provider.batches == [["a", "b"], ["c"], ["b"]] and len(cache) == 2,
+        f"least recently used entry evicted: {provider.batches}",
+    )
+
+
+def test_disk(failures: List[str]) -> None:
+    print("Disk tier")
+    with tempfile.TemporaryDirectory() as directory:
+        provider = FakeProvider()
+        cache = EmbeddingCache(maxsize=100, directory=directory)
+        first = asyncio.run(cache.aembed(MODEL, ["a", "b"], provider.embed))
+
+        restarted = EmbeddingCache(maxsize=100, directory=directory)
+        again = asyncio.run(restarted.aembed(MODEL, ["b", "a", "c"], provider.embed))
+        check(
+            failures,
+            again[:2] == [first[1], first[0]]
+            and provider.batches == [["a", "b"], ["c"]]
+            and restarted.stats.disk_hits == 2
+            and cache.stats.disk_writes == 2,
+            "embeddings survive a restart; only the new text is requested",
+        )
+
+        other = EmbeddingCache(maxsize=100, directory=directory)
+        asyncio.run(other.aembed("other-model", ["a"], provider.embed))
+        check(
+            failures,
+            other.stats.disk_hits == 0 and provider.batches[-1] == ["a"],
+            "another model does not read these embeddings",
+        )
+
+
+def test_failures(failures: List[str]) -> None:
+    print("Failures")
+    provider = FakeProvider()
+    provider.fail = True
+    cache = EmbeddingCache(maxsize=100)
+    try:
+        asyncio.run(cache.aembed(MODEL, ["a"], provider.embed))
+        raised = False
+    except RuntimeError:
+        raised = True
+    provider.fail = False
+    asyncio.run(cache.aembed(MODEL, ["a"], provider.embed))
+    check(
+        failures,
+        raised and len(provider.batches) == 2 and len(cache) == 1,
+        "failed batch raises, is not cached and is retried",
+    )
+
+    async def short(texts):
+        return [[0.0]]
+
+    try:
+        asyncio.run(EmbeddingCache(maxsize=100).aembed(MODEL, ["a", "b"], short))
+        raised = False
+    except ValueError:
+        raised = True
+    check(failures, raised, "provider returning too few embeddings raises")
+
+
+def test_savings(proposals: int, evaluations: int) -> None:
+    print("Provider calls")
+    texts = [f"DAO Proposal Content: proposal {i}" for i in range(proposals)]
+    queries = [text[:1000] for text in texts]
+
+    uncached = FakeProvider()
+    cached = FakeProvider()
+    cache = EmbeddingCache(maxsize=4 * proposals)
+
+    async def run():
+        await uncached.embed(texts)
+        await cache.aembed(MODEL, texts, cached.embed)
+        for _ in range(evaluations):
+            for query in queries:
+                await uncached.embed([query])
+                await cache.aembed(MODEL, [query], cached.embed)
+        # The embedder runs again over the same proposals
+        await uncached.embed(texts)
+        await cache.aembed(MODEL, texts, cached.embed)
+
+    asyncio.run(run())
+    print(
+        f"   {proposals} proposals, {evaluations} evaluations each: "
+        f"{uncached.texts} texts in {len(uncached.batches)} calls without the "
+        f"cache, {cached.texts} texts in {len(cached.batches)} calls with it"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test the embedding cache")
+    parser.add_argument("--proposals", type=int, default=200)
+    parser.add_argument("--evaluations", type=int, default=5)
+    args = parser.parse_args()
+    failures: List[str] = []
+
+    test_keys(failures)
+    test_batches(failures)
+    test_inflight(failures)
+    test_eviction(failures)
+    test_disk(failures)
+    test_failures(failures)
+    test_savings(args.proposals, args.evaluations)
+
+    report("Embedding cache", failures)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    main()
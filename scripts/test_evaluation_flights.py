@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Evaluation Flights Test
+
+Runs EvaluationFlights, and evaluate_proposal_strict against an in-memory
+backend and a fake OpenRouter call, and checks that:
+
+- concurrent evaluations with the same key share one call, and later ones
+  reuse the kept result until it expires;
+- failed calls are not kept, and callers waiting on one make their own;
+- agents evaluating the same proposal make one LLM call and each get their
+  own copy of the output, with the call's usage on only one of them;
+- a different model, temperature or context (a new past proposal) is a
+  different request.
+
+Usage:
+    python scripts/test_evaluation_flights.py [--agents 10]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import uuid
+from typing import List
+
+# Add the parent directory (root) to the path to import from app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.backend.models import ContractStatus, Proposal
+from app.lib.dao_context import DAOContextStore
+from app.services.ai.simple_workflows import evaluation_openrouter_v2
+from app.services.ai.simple_workflows.evaluation_flights import (
+    EvaluationFlights,
+    evaluation_key,
+)
+from app.services.ai.simple_workflows.orchestrator import evaluate_proposal_strict
+from scripts.testing import ProposalBackend, check, make_proposal, report
+
+DAO_ID = uuid.uuid4()
+CATEGORIES = [
+    "current_order",
+    "mission",
+    "value",
+    "values",
+    "uniqueness",
+    "clarity",
+    "safety",
+    "growth",
+]
+
+
+def dao_proposal(i: int, **kwargs) -> Proposal:
+    fields = dict(
+        dao_id=DAO_ID,
+        proposal_id=i,
+        title=f"Proposal {i}",
+        summary=f"Fund item {i}",
+        tx_sender=f"SP{i}",
+    )
+    return make_proposal(**{**fields, **kwargs})
+
+
+class FakeOpenRouter:
+    """Counts calls and answers with a fixed evaluation."""
+
+    def __init__(self, delay: float = 0.05):
+        self.requests = []
+        self.delay = delay
+
+    async def __call__(self, messages, model=None, temperature=None, **kwargs):
+        self.requests.append((model, temperature))
+        await asyncio.sleep(self.delay)
+        evaluation = {
+            name: {"score": 80, "reason": "ok", "evidence": []} for name in CATEGORIES
+        }
+        evaluation.update(final_score=80, confidence=0.9, decision="APPROVE", failed=[])
+        return {
+            "choices": [{"message": {"content": json.dumps(evaluation)}}],
+            "usage": {"prompt_tokens": 1000, "completion_tokens": 200},
+        }
+
+
+def evaluation(output) -> dict:
+    """An output without its usage fields."""
+    return output.model_dump(exclude=set(evaluation_openrouter_v2.SHARED_USAGE))
+
+
+def test_flights(failures: List[str]) -> None:
+    print("EvaluationFlights")
+    flights = EvaluationFlights(ttl_seconds=3600, maxsize=8)
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return {"decision": "APPROVE"}
+
+    async def run():
+        results = await asyncio.gather(*(flights.run("a", call) for _ in range(10)))
+        later = await flights.run("a", call)
+        other = await flights.run("b", call)
+        return results, later, other
+
+    results, later, other = asyncio.run(run())
+    check(
+        failures,
+        len(calls) == 2
+        and flights.stats.shared == 9
+        and flights.stats.hits == 1
+        and all(r is results[0] for r in results + [later])
+        and other is not results[0],
+        f"10 concurrent + 1 later on one key, 1 on another: {flights.get_stats()}",
+    )
+
+    # Failures: not kept; waiters make their own call
+    flights = EvaluationFlights(ttl_seconds=3600, maxsize=8)
+    outcomes = iter([None, {"ok": 1}, {"ok": 2}])
+
+    async def flaky():
+        await asyncio.sleep(0.02)
+        return next(outcomes)
+
+    async def run_flaky():
+        return await asyncio.gather(flights.run("k", flaky), flights.run("k", flaky))
+
+    first, second = asyncio.run(run_flaky())
+    check(
+        failures,
+        first is None
+        and second == {"ok": 1}
+        and flights.stats.fallbacks == 1
+        and asyncio.run(flights.run("k", flaky)) == {"ok": 1},
+        "failed call not kept; the waiter retried and its result was kept",
+    )
+
+    async def broken():
+        await asyncio.sleep(0.02)
+        raise RuntimeError("provider unavailable")
+
+    async def run_broken():
+        return await asyncio.gather(
+            flights.run("x", broken), flights.run("x", call), return_exceptions=True
+        )
+
+    raised, waited = asyncio.run(run_broken())
+    check(
+        failures,
+        isinstance(raised, RuntimeError) and waited == {"decision": "APPROVE"},
+        "an exception reaches its caller only; the waiter makes its own call",
+    )
+
+    # ttl 0 still shares in-flight calls but keeps nothing
+    flights = EvaluationFlights(ttl_seconds=0, maxsize=8)
+    calls.clear()
+
+    async def run_uncached():
+        await asyncio.gather(*(flights.run("a", call) for _ in range(5)))
+        await flights.run("a", call)
+
+    asyncio.run(run_uncached())
+    check(
+        failures,
+        len(calls) == 2 and len(flights) == 0,
+        "ttl 0 shares in-flight calls only",
+    )
+
+
+def test_evaluation(failures: List[str], agents: int) -> None:
+    print("evaluate_proposal_strict")
+    past = [dao_proposal(i) for i in range(1, 6)]
+    proposal = dao_proposal(10)
+    db = ProposalBackend(past + [proposal])
+    router = FakeOpenRouter()
+    flights = EvaluationFlights(ttl_seconds=3600, maxsize=8)
+    store = DAOContextStore(db, ttl_seconds=3600, max_daos=4)
+    evaluation_openrouter_v2.backend = db
+    evaluation_openrouter_v2.call_openrouter = router
+    evaluation_openrouter_v2.evaluation_flights = flights
+    evaluation_openrouter_v2.dao_context = store
+
+    async def evaluate_all(**kwargs):
+        return await asyncio.gather(
+            *(
+                evaluate_proposal_strict(proposal_id=proposal.id, **kwargs)
+                for _ in range(agents)
+            )
+        )
+
+    outputs = asyncio.run(evaluate_all(temperature=0.2))
+    check(
+        failures,
+        len(router.requests) == 1
+        and all(o is not None and o.decision == "APPROVE" for o in outputs),
+        f"{agents} agents evaluating one proposal: {len(router.requests)} LLM call",
+    )
+    check(
+        failures,
+        len({id(o) for o in outputs}) == agents
+        and all(evaluation(o) == evaluation(outputs[0]) for o in outputs),
+        "each agent gets its own copy of the same output",
+    )
+    check(
+        failures,
+        [o.usage_input_tokens for o in outputs].count("1000") == 1
+        and all(
+            o.usage_est_cost == "0" for o in outputs if o.usage_input_tokens == "0"
+        ),
+        "usage reported once, not once per agent",
+    )
+
+    repeats = asyncio.run(evaluate_all(temperature=0.2))
+    check(
+        failures,
+        len(router.requests) == 1 and all(o.usage_input_tokens == "0" for o in repeats),
+        "repeat evaluations reuse the result without its usage",
+    )
+
+    asyncio.run(evaluate_all(temperature=0.5))
+    asyncio.run(evaluate_all(temperature=0.2, model="other/model"))
+    check(
+        failures,
+        len(router.requests) == 3,
+        "another temperature or model is another request",
+    )
+
+    newer = dao_proposal(11, status=ContractStatus.DRAFT)
+    db.proposals.append(newer)
+    store.upsert(newer)
+    asyncio.run(evaluate_all(temperature=0.2))
+    check(
+        failures,
+        len(router.requests) == 4,
+        "new past proposal in the context is another request",
+    )
+    print(
+        f"   {agents} agents: {len(router.requests)} calls for "
+        f"{agents * 5} evaluations ({flights.get_stats()})"
+    )
+
+
+def test_keys(failures: List[str]) -> None:
+    print("Keys")
+    messages = [{"role": "user", "content": [{"type": "text", "text": "x"}]}]
+    a = evaluation_key("p", model="m", temperature=0.2, messages=messages)
+    b = evaluation_key("p", temperature=0.2, messages=messages, model="m")
+    c = evaluation_key("p", model="m", temperature=0.2, messages=messages + messages)
+    check(failures, a == b and a != c, "key is the request, not argument order")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test evaluation call coalescing")
+    parser.add_argument("--agents", type=int, default=10)
+    args = parser.parse_args()
+    failures: List[str] = []
+
+    test_keys(failures)
+    test_flights(failures)
+    test_evaluation(failures, args.agents)
+
+    report("Evaluation flights", failures)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.ERROR)
+    main()
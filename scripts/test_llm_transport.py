@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+LLM Transport Test Script
+
+Starts a local mock of the OpenRouter API (chat completions, streamed chat
+completions and embeddings) and drives the real callers against it:
+
+- call_openrouter: concurrent calls share a few keep-alive connections and
+  never exceed the per-model concurrency limit,
+- 429/503 responses are retried, and a request that keeps failing raises once
+  retries are exhausted,
+- create_chat_openai and EmbedService send through the same pooled client,
+- per-model metrics count requests, retries and tokens.
+
+For comparison, the same burst is also sent with a new httpx.AsyncClient per
+call, as call_openrouter used to do.
+
+Usage:
+    python scripts/test_llm_transport.py [--calls 32] [--limit 4] [--delay-ms 50]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Set
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+PORT = free_port()
+BASE_URL = f"http://127.0.0.1:{PORT}/api/v1"
+
+parser = argparse.ArgumentParser(description="Test the shared LLM transport")
+parser.add_argument("--calls", type=int, default=32)
+parser.add_argument("--limit", type=int, default=4, help="Concurrency for mock/eval")
+parser.add_argument("--delay-ms", type=float, default=50)
+args = parser.parse_args()
+
+# Point every LLM caller at the mock before the app reads its configuration
+os.environ.update(
+    {
+        "AIBTC_CHAT_API_BASE": BASE_URL,
+        "AIBTC_CHAT_API_KEY": "test-key",
+        "AIBTC_EMBEDDING_API_BASE": BASE_URL,
+        "AIBTC_EMBEDDING_API_KEY": "test-key",
+        "AIBTC_EMBEDDING_DEFAULT_MODEL": "mock/embed",
+        "AIBTC_LLM_MODEL_CONCURRENCY": f"mock/eval={args.limit}",
+        "AIBTC_LLM_MAX_RETRIES": "3",
+        "AIBTC_LLM_BACKOFF_BASE_SECONDS": "0.01",
+    }
+)
+
+# Add the parent directory (root) to the path to import from app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from app.services.ai.embeddings.embed_service import EmbedService
+from app.services.ai.llm_transport import llm_transport
+from app.services.ai.simple_workflows.evaluation_openrouter_v2 import call_openrouter
+from app.services.ai.simple_workflows.llm import create_chat_openai
+
+
+class MockOpenRouter:
+    """Records what the server saw and injects failures per model."""
+
+    def __init__(self):
+        self.delay = args.delay_ms / 1000
+        self.in_flight: Dict[str, int] = defaultdict(int)
+        self.max_in_flight: Dict[str, int] = defaultdict(int)
+        self.connections: Dict[str, Set[int]] = defaultdict(set)
+        self.failures: Dict[str, List[int]] = defaultdict(list)
+        self.requests: Dict[str, int] = defaultdict(int)
+
+    def app(self) -> FastAPI:
+        app = FastAPI()
+        usage = {"prompt_tokens": 11, "completion_tokens": 7, "total_tokens": 18}
+
+        @app.post("/api/v1/chat/completions")
+        async def chat(request: Request):
+            body = await request.json()
+            model = body["model"]
+            self.requests[model] += 1
+            self.connections[model].add(request.client.port)
+            if self.failures[model]:
+                status = self.failures[model].pop(0)
+                return JSONResponse(
+                    {"error": "try again"}, status, headers={"Retry-After": "0"}
+                )
+            self.in_flight[model] += 1
+            self.max_in_flight[model] = max(
+                self.max_in_flight[model], self.in_flight[model]
+            )
+            try:
+                await asyncio.sleep(self.delay)
+            finally:
+                self.in_flight[model] -= 1
+            text = f"echo:{body['messages'][-1]['content']}"
+            if not body.get("stream"):
+                return {
+                    "id": "mock",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": text},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": usage,
+                }
+
+            def chunk(delta, finish=None, with_usage=False):
+                data = {
+                    "id": "mock",
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": []
+                    if with_usage
+                    else [{"index": 0, "delta": delta, "finish_reason": finish}],
+                }
+                if with_usage:
+                    data["usage"] = usage
+                return f"data: {json.dumps(data)}\n\n"
+
+            async def events():
+                yield chunk({"role": "assistant", "content": text[:3]})
+                yield chunk({"content": text[3:]})
+                yield chunk({}, finish="stop")
+                yield chunk({}, with_usage=True)
+                yield "data: [DONE]\n\n"
+
+            return StreamingResponse(events(), media_type="text/event-stream")
+
+        @app.post("/api/v1/embeddings")
+        async def embeddings(request: Request):
+            body = await request.json()
+            model = body["model"]
+            self.requests[model] += 1
+            self.connections[model].add(request.client.port)
+            inputs = (
+                body["input"] if isinstance(body["input"], list) else [body["input"]]
+            )
+            return {
+                "object": "list",
+                "model": model,
+                "data": [
+                    {"object": "embedding", "index": i, "embedding": [0.1, 0.2, 0.3]}
+                    for i in range(len(inputs))
+                ],
+                "usage": {"prompt_tokens": 3 * len(inputs), "total_tokens": 3},
+            }
+
+        return app
+
+
+def start_server(mock: MockOpenRouter) -> uvicorn.Server:
+    server = uvicorn.Server(
+        uvicorn.Config(mock.app(), host="127.0.0.1", port=PORT, log_level="error")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server
+
+
+async def unpooled_call(message: str) -> dict:
+    """What call_openrouter did before: one client per call."""
+    async with httpx.AsyncClient(timeout=120.0) as client:
+        response = await client.post(
+            f"{BASE_URL}/chat/completions",
+            json={
+                "model": "mock/unpooled",
+                "messages": [{"role": "user", "content": message}],
+            },
+        )
+        response.raise_for_status()
+        return response.json()
+
+
+def check(ok: bool, message: str) -> bool:
+    print(f"   {'✅' if ok else '❌'} {message}")
+    return ok
+
+
+async def run(mock: MockOpenRouter) -> bool:
+    results = []
+
+    print(f"🧪 {args.calls} concurrent call_openrouter calls (limit {args.limit})")
+    start = time.perf_counter()
+    responses = await asyncio.gather(
+        *(
+            call_openrouter([{"role": "user", "content": str(i)}], model="mock/eval")
+            for i in range(args.calls)
+        )
+    )
+    pooled_s = time.perf_counter() - start
+    contents = [r["choices"][0]["message"]["content"] for r in responses]
+    results.append(
+        check(contents == [f"echo:{i}" for i in range(args.calls)], "responses correct")
+    )
+    results.append(
+        check(
+            mock.max_in_flight["mock/eval"] <= args.limit,
+            f"server saw at most {mock.max_in_flight['mock/eval']} in flight",
+        )
+    )
+    pooled_connections = len(mock.connections["mock/eval"])
+    results.append(
+        check(
+            pooled_connections <= args.limit,
+            f"{pooled_connections} TCP connections for {args.calls} calls "
+            f"({pooled_s * 1000:.0f} ms)",
+        )
+    )
+
+    start = time.perf_counter()
+    await asyncio.gather(*(unpooled_call(str(i)) for i in range(args.calls)))
+    unpooled_s = time.perf_counter() - start
+    print(
+        f"   • client per call: {len(mock.connections['mock/unpooled'])} TCP "
+        f"connections ({unpooled_s * 1000:.0f} ms, no concurrency limit)"
+    )
+
+    print("🧪 Retries")
+    mock.failures["mock/retry"] = [429, 503]
+    response = await call_openrouter(
+        [{"role": "user", "content": "retry"}], model="mock/retry"
+    )
+    metrics = llm_transport.get_metrics()["mock/retry"]
+    results.append(
+        check(
+            response["choices"][0]["message"]["content"] == "echo:retry"
+            and metrics["retries"] == 2
+            and metrics["rate_limited"] == 1,
+            f"429 then 503 retried ({metrics['retries']} retries)",
+        )
+    )
+    mock.failures["mock/down"] = [503] * 10
+    try:
+        await call_openrouter([{"role": "user", "content": "x"}], model="mock/down")
+        results.append(check(False, "exhausted retries raise"))
+    except httpx.HTTPStatusError as e:
+        results.append(
+            check(
+                e.response.status_code == 503 and mock.requests["mock/down"] == 4,
+                f"gave up after {mock.requests['mock/down']} attempts with "
+                f"{e.response.status_code}",
+            )
+        )
+
+    print("🧪 ChatOpenAI and EmbedService")
+    llm = create_chat_openai(model="mock/chat")
+    message = await llm.ainvoke("hello")
+    chat_metrics = llm_transport.get_metrics().get("mock/chat", {})
+    results.append(
+        check(
+            message.content == "echo:hello"
+            and chat_metrics.get("requests") == 1
+            and chat_metrics.get("completion_tokens") == 7,
+            f"streamed chat via shared client (tokens in/out "
+            f"{chat_metrics.get('prompt_tokens')}/{chat_metrics.get('completion_tokens')})",
+        )
+    )
+    embed_service = EmbedService()
+    # Token-length checks download a tiktoken encoding; the mock doesn't need them
+    embed_service.embeddings_client.check_embedding_ctx_length = False
+    embeddings = await embed_service.embed_documents(["alpha", "beta"])
+    embed_metrics = llm_transport.get_metrics().get("mock/embed", {})
+    results.append(
+        check(
+            embeddings is not None
+            and len(embeddings) == 2
+            and embed_metrics.get("requests", 0) >= 1,
+            f"embeddings via shared client ({embed_metrics.get('requests', 0)} requests)",
+        )
+    )
+
+    print("\nPer-model metrics:")
+    for model, m in sorted(llm_transport.get_metrics().items()):
+        print(
+            f"   {model:<14} requests={m['requests']:<3} retries={m['retries']:<2} "
+            f"failures={m['failures']:<2} avg={m['avg_latency'] * 1000:.0f}ms "
+            f"max={m['max_latency'] * 1000:.0f}ms tokens={m['prompt_tokens']}/"
+            f"{m['completion_tokens']}"
+        )
+    await llm_transport.aclose()
+    return all(results)
+
+
+def main():
+    mock = MockOpenRouter()
+    server = start_server(mock)
+    try:
+        ok = asyncio.run(run(mock))
+    finally:
+        server.should_exit = True
+    print("✅ LLM transport checks passed" if ok else "❌ LLM transport test failed")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Lottery Sampler Equivalence Test
+
+Checks that WeightedLotterySampler picks exactly the agents the previous
+list-based selection picked, given the same seeds. The previous algorithm is
+kept here as the reference: reseed the global random module with
+"{seed}_{round}", draw randrange(total remaining weight), take the first agent
+whose cumulative weight exceeds the draw and pop it (equal weights once every
+remaining weight is zero).
+
+Each case draws every agent, so the full selection order is compared. Cases:
+
+- the agents in test_lottery_selection_agents.json, one seed per block hash,
+- random weight sets with many zero weights and a few all-zero sets.
+
+Usage:
+    python scripts/test_lottery_sampler.py [--seeds 500] [--random-sets 200]
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import random
+import sys
+from typing import List
+
+# Add the parent directory (root) to the path to import from app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.integrations.webhooks.chainhook.handlers.lottery_utils import (
+    WeightedLotterySampler,
+)
+
+AGENTS_JSON = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "test_lottery_selection_agents.json"
+)
+
+
+def reference_order(weights: List[int], seed: str) -> List[int]:
+    """Selection order from the previous list/pop implementation."""
+    remaining = list(enumerate(weights))
+    order = []
+    round_number = 0
+    while remaining:
+        round_number += 1
+        random.seed(f"{seed}_{round_number}")
+        round_weights = [weight for _, weight in remaining]
+        if all(w == 0 for w in round_weights):
+            round_weights = [1] * len(remaining)
+        rand_int = random.randrange(sum(round_weights))
+        cumulative = 0
+        selected_idx = 0
+        for idx, weight in enumerate(round_weights):
+            cumulative += weight
+            if rand_int < cumulative:
+                selected_idx = idx
+                break
+        order.append(remaining.pop(selected_idx)[0])
+    return order
+
+
+def sampler_order(weights: List[int], seed: str) -> List[int]:
+    sampler = WeightedLotterySampler(weights)
+    return [
+        sampler.draw(random.Random(f"{seed}_{round_number}"))
+        for round_number in range(1, len(weights) + 1)
+    ]
+
+
+def block_seed(n: int) -> str:
+    block_hash = hashlib.sha256(f"block-{n}".encode()).hexdigest()
+    return hashlib.sha256(block_hash.encode()).hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test lottery sampler equivalence")
+    parser.add_argument("--seeds", type=int, default=500)
+    parser.add_argument("--random-sets", type=int, default=200)
+    args = parser.parse_args()
+    # The all-zero fallback warns on every draw
+    logging.disable(logging.WARNING)
+
+    with open(AGENTS_JSON) as f:
+        agent_weights = [int(agent["token_amount"] or "0") for agent in json.load(f)]
+
+    cases = [(agent_weights, block_seed(n)) for n in range(args.seeds)]
+    rng = random.Random(0)
+    for n in range(args.random_sets):
+        size = rng.randint(1, 300)
+        if n % 20 == 0:
+            weights = [0] * size
+        else:
+            weights = [
+                0 if rng.random() < 0.3 else rng.randint(1, 10**15) for _ in range(size)
+            ]
+        cases.append((weights, block_seed(args.seeds + n)))
+
+    mismatches = 0
+    for weights, seed in cases:
+        expected = reference_order(weights, seed)
+        actual = sampler_order(weights, seed)
+        if expected != actual:
+            mismatches += 1
+            first = next(i for i, (a, b) in enumerate(zip(expected, actual)) if a != b)
+            print(
+                f"   ❌ {len(weights)} agents, seed {seed[:12]}…: "
+                f"orders differ from round {first + 1}"
+            )
+
+    print(
+        f"{len(cases)} cases ({args.seeds} on {os.path.basename(AGENTS_JSON)}, "
+        f"{args.random_sets} random), {mismatches} mismatches"
+    )
+    print("✅ Selections identical" if not mismatches else "❌ Sampler test failed")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
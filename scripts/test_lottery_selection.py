@@ -43,6 +43,7 @@ from app.config import config
 from app.services.integrations.webhooks.chainhook.handlers.lottery_utils import (
     LotterySelection,
     QuorumCalculator,
+    WeightedLotterySampler,
     create_wallet_selection_dict,
 )
 
@@ -155,7 +156,9 @@ class LotterySimulator:
         seed = hashlib.sha256(bitcoin_block_hash.encode()).hexdigest()
 
         # Conduct weighted lottery until quorum is met or max selections reached
-        remaining_agents = agents_with_tokens.copy()
+        remaining_agents = WeightedLotterySampler(
+            [int(agent.token_amount or "0") for agent in agents_with_tokens]
+        )
         selected_tokens = Decimal("0")
         quorum_threshold_decimal = Decimal(selection.quorum_threshold)
 
@@ -168,9 +171,9 @@ class LotterySimulator:
             round_number += 1
 
             round_seed = f"{seed}_{round_number}"
-            random.seed(round_seed)
-
-            selected_agent = self._perform_weighted_selection(remaining_agents)
+            selected_agent = agents_with_tokens[
+                remaining_agents.draw(random.Random(round_seed))
+            ]
 
             wallet_dict = create_wallet_selection_dict(
                 selected_agent.wallet_id, selected_agent.token_amount
@@ -199,9 +202,9 @@ class LotterySimulator:
         ):
             round_number += 1
             round_seed = f"{seed}_{round_number}"
-            random.seed(round_seed)
-
-            selected_agent = self._perform_weighted_selection(remaining_agents)
+            selected_agent = agents_with_tokens[
+                remaining_agents.draw(random.Random(round_seed))
+            ]
 
             wallet_dict = create_wallet_selection_dict(
                 selected_agent.wallet_id, selected_agent.token_amount
@@ -224,28 +227,6 @@ class LotterySimulator:
 
         return selection
 
-    def _perform_weighted_selection(
-        self, remaining_agents: List[AgentWithWalletTokenDTO]
-    ) -> AgentWithWalletTokenDTO:
-        """Perform a single round of weighted random agent selection (assumes random is seeded)."""
-        weights = [int(agent.token_amount or "0") for agent in remaining_agents]
-        if not weights or all(w == 0 for w in weights):
-            self.logger.warning("All remaining weights are zero, using equal weights")
-            weights = [1] * len(remaining_agents)
-
-        total_weight = sum(weights)
-        rand_int = random.randrange(total_weight)
-
-        cumulative = 0
-        selected_idx = 0
-        for idx, weight in enumerate(weights):
-            cumulative += weight
-            if rand_int < cumulative:
-                selected_idx = idx
-                break
-
-        return remaining_agents.pop(selected_idx)
-
     def print_results(self, selection: LotterySelection):
         """Print detailed results in JSON format for debugging."""
         print("\n" + "=" * 80)
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Proposal Timeline Test
+
+Runs ProposalTimeline and DAOProposalBurnHeightHandler against an in-memory
+backend and checks that:
+
+- the timeline loads the deployed proposals once and each burn block pops
+  only the proposals whose vote_start, vote_end or exec_start it crosses;
+- skipped heights are caught up, without voting on proposals whose voting
+  window has already closed;
+- create/update hooks add proposals, move boundaries and drop proposals
+  that are no longer deployed;
+- rewind puts an advance back so a failed block can be retried;
+- the handler queues vote, conclude and veto window messages once, looking
+  existing messages up by proposal ID instead of scanning message bodies.
+
+Also compares the time per block with the previous list-and-scan approach.
+
+Usage:
+    python scripts/test_proposal_timeline.py [--proposals 5000] [--blocks 2000]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Dict, List
+
+# Add the parent directory (root) to the path to import from app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.backend.models import (
+    AgentWithWalletTokenDTO,
+    ContractStatus,
+    Proposal,
+    QueueMessage,
+)
+from app.lib.proposal_timeline import ProposalTimeline
+from app.services.integrations.webhooks.chainhook.handlers import (
+    dao_proposal_burn_height_handler,
+)
+from app.services.integrations.webhooks.chainhook.handlers.dao_proposal_burn_height_handler import (
+    DAOProposalBurnHeightHandler,
+)
+from scripts.testing import ProposalBackend, check, make_proposal, report
+
+NOW = datetime(2025, 10, 21)
+DAO_ID = uuid.uuid4()
+
+
+def timed_proposal(vote_start: int, voting: int = 10, veto: int = 5, **kwargs):
+    fields = dict(
+        dao_id=DAO_ID,
+        content="Fund the thing",
+        vote_start=vote_start,
+        vote_end=vote_start + voting,
+        exec_start=vote_start + voting + veto,
+    )
+    return make_proposal(**{**fields, **kwargs})
+
+
+class FakeBackend(ProposalBackend):
+    """Proposals and queue messages in memory, with per-method call counts."""
+
+    def __init__(self, proposals: List[Proposal], wallets: int = 3):
+        super().__init__(proposals)
+        self.queue: List[QueueMessage] = []
+        self.holders = [
+            AgentWithWalletTokenDTO(
+                agent_id=uuid.uuid4(),
+                wallet_id=uuid.uuid4(),
+                wallet_address=f"SP{i}",
+                token_id=uuid.uuid4(),
+                token_amount="100",
+                dao_id=DAO_ID,
+                dao_name="Test DAO",
+            )
+            for i in range(wallets)
+        ]
+        self.fail_queue = False
+
+    def get_agents_with_dao_tokens(self, dao_id):
+        return self.holders
+
+    def list_queue_messages(self, filters=None):
+        self.calls["list_queue_messages"] += 1
+        return [
+            m
+            for m in self.queue
+            if m.type == filters.type
+            and m.dao_id == filters.dao_id
+            and (filters.wallet_id is None or m.wallet_id == filters.wallet_id)
+            and (
+                filters.proposal_id is None
+                or m.message.get("proposal_id") == str(filters.proposal_id)
+            )
+            and (
+                filters.proposal_status is None
+                or m.message.get("proposal_status") == filters.proposal_status
+            )
+        ]
+
+    def create_queue_messages(self, messages):
+        self.calls["create_queue_messages"] += 1
+        if self.fail_queue:
+            raise RuntimeError("database unavailable")
+        created = [
+            QueueMessage(id=uuid.uuid4(), created_at=NOW, **m.model_dump(mode="json"))
+            for m in messages
+        ]
+        self.queue.extend(created)
+        return created
+
+    def create_queue_message(self, message):
+        return self.create_queue_messages([message])[0]
+
+
+def ids(proposals: List[Proposal]) -> List[uuid.UUID]:
+    return sorted(p.id for p in proposals)
+
+
+def test_timeline(failures: List[str]) -> None:
+    print("Timeline")
+    past = timed_proposal(85)  # 85 / 95 / 100: only exec_start is ahead
+    a = timed_proposal(100)  # 100 / 110 / 115
+    b = timed_proposal(105)  # 105 / 115 / 120
+    draft = timed_proposal(100, status=ContractStatus.DRAFT)
+    no_content = timed_proposal(100, content=None)
+    db = FakeBackend([past, a, b, draft, no_content])
+    timeline = ProposalTimeline(db, reload_seconds=3600)
+
+    first = timeline.advance(100)
+    check(
+        failures,
+        ids(first.vote_start) == [a.id]
+        and not first.vote_end
+        and ids(first.exec_start) == [past.id]
+        and db.calls["list_proposals"] == 1,
+        "first block pops only boundaries at its own height",
+    )
+    check(
+        failures,
+        not timeline.advance(104) and not timeline.advance(100),
+        "blocks with no crossings, and replayed heights, pop nothing",
+    )
+    caught_up = timeline.advance(112)  # skips 105..111
+    check(
+        failures,
+        ids(caught_up.vote_start) == [b.id] and ids(caught_up.vote_end) == [a.id],
+        "skipped heights are caught up",
+    )
+
+    # Hooks: a new proposal, a moved boundary and a proposal that failed
+    c = timed_proposal(113)
+    timeline.upsert(c)
+    timeline.upsert(b.model_copy(update={"exec_start": 125}))
+    timeline.upsert(a.model_copy(update={"status": ContractStatus.FAILED}))
+    crossed = timeline.advance(121)
+    check(
+        failures,
+        ids(crossed.vote_start) == [c.id]
+        and ids(crossed.vote_end) == [b.id]
+        and crossed.exec_start == [],
+        "hooks add proposals, move boundaries and drop failed ones",
+    )
+    check(
+        failures,
+        [p.id for p in timeline.advance(125).exec_start] == [b.id],
+        "moved boundary pops at its new height",
+    )
+
+    # Rewind
+    d = timed_proposal(130)
+    timeline.upsert(d)
+    crossings = timeline.advance(130)
+    timeline.rewind(crossings)
+    again = timeline.advance(130)
+    check(
+        failures,
+        [p.id for p in again.vote_start] == [d.id] and timeline.height == 130,
+        "rewound block pops the same proposals again",
+    )
+    check(failures, db.calls["list_proposals"] == 1, "no reload between blocks")
+
+
+def make_handler(db: FakeBackend, timeline: ProposalTimeline):
+    dao_proposal_burn_height_handler.backend = db
+    dao_proposal_burn_height_handler.proposal_timeline = timeline
+    return DAOProposalBurnHeightHandler()
+
+
+async def run_block(handler: DAOProposalBurnHeightHandler, height: int) -> None:
+    handler.set_chainhook_data(
+        SimpleNamespace(
+            apply=[
+                SimpleNamespace(
+                    metadata=SimpleNamespace(
+                        bitcoin_anchor_block_identifier=SimpleNamespace(index=height)
+                    )
+                )
+            ]
+        )
+    )
+    transaction = SimpleNamespace(
+        metadata=SimpleNamespace(kind={"type": "Coinbase"}),
+        transaction_identifier=SimpleNamespace(hash=f"0x{height}"),
+    )
+    await handler.handle_transaction(transaction)
+
+
+def queued(db: FakeBackend) -> Dict[str, int]:
+    counts: Counter = Counter()
+    for m in db.queue:
+        key = m.type.value if hasattr(m.type, "value") else str(m.type)
+        status = m.message.get("proposal_status")
+        counts[f"{key}:{status}" if status else key] += 1
+    return dict(counts)
+
+
+def test_handler(failures: List[str]) -> None:
+    print("DAOProposalBurnHeightHandler")
+    proposal = timed_proposal(200)  # 200 / 210 / 215
+    db = FakeBackend([proposal], wallets=3)
+    timeline = ProposalTimeline(db, reload_seconds=3600)
+    handler = make_handler(db, timeline)
+
+    asyncio.run(blocks_for(handler, [200, 210, 215]))
+    expected = {
+        "dao_proposal_vote": 3,
+        "discord:veto_window_open": 1,
+        "dao_proposal_conclude": 1,
+        "discord:veto_window_closed": 1,
+    }
+    check(failures, queued(db) == expected, f"messages queued: {queued(db)}")
+    check(
+        failures,
+        all(m.message.get("proposal_id") == str(proposal.id) for m in db.queue),
+        "every message carries the proposal ID",
+    )
+
+    # A restarted process sees the same heights again: nothing is duplicated
+    restarted = make_handler(db, ProposalTimeline(db, reload_seconds=3600))
+    asyncio.run(run_block(restarted, 200))
+    asyncio.run(run_block(restarted, 210))
+    check(failures, queued(db) == expected, "existing messages are not queued again")
+
+    # A failed block is retried with the same proposals
+    retry = timed_proposal(300)
+    db = FakeBackend([retry], wallets=2)
+    timeline = ProposalTimeline(db, reload_seconds=3600)
+    handler = make_handler(db, timeline)
+    db.fail_queue = True
+    asyncio.run(run_block(handler, 300))
+    db.fail_queue = False
+    asyncio.run(run_block(handler, 300))
+    check(
+        failures,
+        queued(db) == {"dao_proposal_vote": 2},
+        "block retried after a failed enqueue",
+    )
+
+    # After a gap, voting that already closed is not queued
+    late = timed_proposal(400, voting=5, veto=10)  # 400 / 405 / 415
+    db = FakeBackend([late], wallets=2)
+    handler = make_handler(db, ProposalTimeline(db, reload_seconds=3600))
+    asyncio.run(blocks_for(handler, [399, 406]))
+    check(
+        failures,
+        queued(db) == {"discord:veto_window_open": 1},
+        "caught-up block skips closed voting but opens the veto window",
+    )
+
+
+async def blocks_for(handler: DAOProposalBurnHeightHandler, heights) -> None:
+    for height in heights:
+        await run_block(handler, height)
+
+
+def test_speed(proposals: int, blocks: int) -> None:
+    print("Speed")
+    rows = [timed_proposal(1000 + i * blocks // proposals) for i in range(proposals)]
+    heights = range(1000, 1000 + blocks)
+
+    start = time.perf_counter()
+    for height in heights:
+        [p for p in rows if p.vote_start == height and p.content is not None]
+        [p for p in rows if p.exec_start == height and p.content is not None]
+        [p for p in rows if p.vote_end == height and p.content is not None]
+        [p for p in rows if p.exec_start == height and p.content is not None]
+    scan = time.perf_counter() - start
+
+    timeline = ProposalTimeline(FakeBackend(rows), reload_seconds=3600)
+    start = time.perf_counter()
+    popped = 0
+    for height in heights:
+        crossings = timeline.advance(height)
+        popped += len(crossings.vote_start)
+    heap = time.perf_counter() - start
+    print(
+        f"   {proposals} proposals over {blocks} blocks: "
+        f"{scan / blocks * 1e6:.0f} µs/block scanning, "
+        f"{heap / blocks * 1e6:.0f} µs/block with the timeline "
+        f"(excluding the list_proposals round trip per block)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test the proposal timeline")
+    parser.add_argument("--proposals", type=int, default=5000)
+    parser.add_argument("--blocks", type=int, default=2000)
+    args = parser.parse_args()
+    failures: List[str] = []
+
+    test_timeline(failures)
+    test_handler(failures)
+    test_speed(args.proposals, args.blocks)
+
+    report("Proposal timeline", failures)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.ERROR)
+    main()
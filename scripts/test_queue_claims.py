@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Queue Claim Test Script
+
+Seeds a throwaway queue type in the configured database, runs several
+concurrent claimers against it and checks that:
+
+- the read-only probe sees unleased messages and ignores leased ones,
+- no message is handed to two workers,
+- every message is claimed exactly once across the workers, and
+- released messages can be claimed again by another worker.
+
+The seeded messages are deleted afterwards.
+
+Usage:
+    python scripts/test_queue_claims.py [--messages 50] [--workers 5] [--limit 7]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import uuid
+from typing import Dict, List, Set
+from uuid import UUID
+
+# Add the parent directory (root) to the path to import from app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.backend.factory import backend
+from app.backend.models import QueueMessageCreate, QueueMessageType
+
+
+async def claim_until_empty(
+    queue_type: QueueMessageType, worker_id: str, limit: int
+) -> List[UUID]:
+    """Keep claiming until no new messages arrive.
+
+    Claims are re-entrant, so each round asks for the messages already held
+    plus ``limit`` more.
+    """
+    claimed: List[UUID] = []
+    while True:
+        batch = await asyncio.to_thread(
+            backend.claim_queue_messages,
+            queue_type,
+            worker_id,
+            len(claimed) + limit,
+            60,
+        )
+        fresh = [m.id for m in batch if m.id not in claimed]
+        if not fresh:
+            return claimed
+        claimed.extend(fresh)
+
+
+async def run(messages: int, workers: int, limit: int) -> bool:
+    queue_type = QueueMessageType.get_or_create(
+        f"queue_claim_test_{uuid.uuid4().hex[:8]}"
+    )
+    print(f"🧪 Seeding {messages} messages of type {queue_type}")
+    seeded: Set[UUID] = set()
+    for i in range(messages):
+        message = backend.create_queue_message(
+            QueueMessageCreate(type=queue_type, message={"n": i}, is_processed=False)
+        )
+        seeded.add(message.id)
+
+    ok = True
+    try:
+        if not backend.has_claimable_queue_messages(queue_type):
+            ok = False
+            print("   ❌ Probe found no claimable messages before any claim")
+
+        worker_ids = [f"test-worker-{i}" for i in range(workers)]
+        results = await asyncio.gather(
+            *(claim_until_empty(queue_type, w, limit) for w in worker_ids)
+        )
+        by_worker: Dict[str, List[UUID]] = dict(zip(worker_ids, results))
+
+        seen: Set[UUID] = set()
+        for worker_id, claimed in by_worker.items():
+            overlap = seen & set(claimed)
+            if overlap:
+                ok = False
+                print(f"   ❌ {worker_id} got {len(overlap)} messages already claimed")
+            seen.update(claimed)
+            print(f"   • {worker_id}: {len(claimed)} messages")
+
+        missing = seeded - seen
+        if missing:
+            ok = False
+            print(f"   ❌ {len(missing)} messages were never claimed")
+        if backend.has_claimable_queue_messages(queue_type):
+            ok = False
+            print("   ❌ Probe reported leased messages as claimable")
+
+        # Release one worker's batch and make sure another worker can take it
+        donor, taker = worker_ids[0], worker_ids[-1]
+        released = backend.release_queue_messages(by_worker[donor], donor)
+        retaken = await claim_until_empty(queue_type, taker, limit)
+        if released != len(by_worker[donor]) or not set(by_worker[donor]) <= set(
+            retaken
+        ):
+            ok = False
+            print("   ❌ Released messages were not claimable by another worker")
+        else:
+            print(f"   • {released} released messages re-claimed by {taker}")
+    finally:
+        for message_id in seeded:
+            backend.delete_queue_message(message_id)
+
+    print("✅ Claims were disjoint and complete" if ok else "❌ Claim test failed")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test lease-based queue claiming")
+    parser.add_argument("--messages", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=7, help="Messages per claim")
+    args = parser.parse_args()
+    sys.exit(0 if asyncio.run(run(args.messages, args.workers, args.limit)) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Stacks API Client Cache Test
+
+Checks the bounded response cache of StacksAPIClient:
+
+- the per-namespace LRU keeps at most its configured number of entries, drops
+  expired entries and counts hits, misses, evictions and expirations;
+- a backfill over more blocks than the block cache holds stays bounded;
+- with a cache directory, finalized blocks, their signer info and decoded hex
+  values are written to disk, and a second client over the same heights makes
+  no API calls at all, while blocks near the tip are always fetched.
+
+The Stacks API is served by an in-process httpx mock transport, so no network
+access is needed.
+
+Usage:
+    python scripts/test_stacks_client_cache.py [--blocks 200]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+from collections import Counter
+from typing import Callable, List
+
+import httpx
+
+# Add the parent directory (root) to the path to import from app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.processing.stacks_chainhook_adapter.cache import (
+    MISSING,
+    TTLCache,
+)
+from app.services.processing.stacks_chainhook_adapter.client import StacksAPIClient
+from app.services.processing.stacks_chainhook_adapter.config import AdapterConfig
+from scripts.testing import check, report
+
+TIP_HEIGHT = 10_000
+TXS_PER_BLOCK = 3
+
+
+def mock_api(calls: Counter) -> httpx.MockTransport:
+    """A Stacks API with TIP_HEIGHT blocks of TXS_PER_BLOCK transactions."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        parts = path.strip("/").split("/")
+        if path == "/extended/v1/block":
+            calls["latest"] += 1
+            return httpx.Response(200, json={"results": [{"height": TIP_HEIGHT}]})
+        if path.startswith("/extended/v1/block/by_height/"):
+            calls["block_v1"] += 1
+            height = int(parts[-1])
+            return httpx.Response(
+                200,
+                json={"txs": [f"0x{height:08x}{i:02x}" for i in range(TXS_PER_BLOCK)]},
+            )
+        if path.startswith("/extended/v1/tx/"):
+            calls["tx"] += 1
+            return httpx.Response(
+                200, json={"tx_id": parts[-1], "tx_status": "success"}
+            )
+        if path.startswith("/extended/v2/blocks/0x"):
+            calls["signer_info"] += 1
+            return httpx.Response(
+                200, json={"signer_bitvec": "01", "signer_signature": []}
+            )
+        if path.startswith("/extended/v2/blocks/"):
+            calls["block_v2"] += 1
+            height = int(parts[-1])
+            return httpx.Response(
+                200,
+                json={"height": height, "hash": f"0x{height:064x}", "canonical": True},
+            )
+        return httpx.Response(404)
+
+    return httpx.MockTransport(handler)
+
+
+def make_client(calls: Counter, **overrides) -> StacksAPIClient:
+    config = AdapterConfig(
+        rate_limit_delay=0, enable_hex_decoding=False, max_retries=0, **overrides
+    )
+    client = StacksAPIClient(config)
+    client.client = httpx.AsyncClient(
+        base_url=config.api_url, transport=mock_api(calls)
+    )
+    return client
+
+
+def test_ttl_cache(failures: List[str]) -> None:
+    print("TTLCache")
+    now = [0.0]
+    clock: Callable[[], float] = lambda: now[0]  # noqa: E731
+    cache = TTLCache(maxsize=3, ttl=10, clock=clock)
+    for key in "abc":
+        cache.set(key, key.upper())
+    cache.get("a")  # "b" is now least recently used
+    cache.set("d", "D")
+    check(failures, cache.get("b") is MISSING, "least recently used entry evicted")
+    check(failures, cache.get("a") == "A", "recently used entry kept")
+
+    now[0] = 11
+    check(failures, cache.get("c") is MISSING, "expired entry not returned")
+    check(failures, len(cache) == 2, "expired entry removed on lookup")
+    cache.set("e", "E")
+    cache.set("f", "F")
+    stats = cache.stats
+    check(
+        failures,
+        (stats.hits, stats.misses, stats.evictions, stats.expirations) == (2, 2, 1, 2),
+        f"counters {stats}",
+    )
+
+    disabled = TTLCache(maxsize=0, ttl=10)
+    disabled.set("a", 1)
+    check(failures, len(disabled) == 0, "maxsize 0 caches nothing")
+
+
+async def backfill(client: StacksAPIClient, heights: range) -> None:
+    for height in heights:
+        block = await client.get_block_by_height(height)
+        await client.get_block_signer_info(block["hash"])
+
+
+async def test_bounded_backfill(failures: List[str], blocks: int) -> None:
+    print(f"Backfill of {blocks} blocks in memory")
+    calls: Counter = Counter()
+    client = make_client(
+        calls, enable_caching=True, cache_max_blocks=16, cache_max_entries=64
+    )
+    await backfill(client, range(1, blocks + 1))
+    stats = client.get_cache_stats()
+    check(
+        failures, stats["block"]["size"] == 16, f"block cache bounded: {stats['block']}"
+    )
+    check(failures, stats["tx"]["size"] == 64, f"tx cache bounded: {stats['tx']}")
+    check(
+        failures,
+        stats["block"]["evictions"] == blocks - 16,
+        "older blocks evicted",
+    )
+
+    requests = sum(calls.values())
+    await backfill(client, range(blocks - 15, blocks + 1))
+    check(failures, sum(calls.values()) == requests, "recent blocks served from memory")
+    await client.close()
+
+
+async def test_disk_tier(failures: List[str], blocks: int) -> None:
+    print(f"Backfill of {blocks} finalized blocks with a cache directory")
+    final_heights = range(1, blocks + 1)
+    recent_heights = range(TIP_HEIGHT - 5, TIP_HEIGHT + 1)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        first_calls: Counter = Counter()
+        first = make_client(first_calls, cache_dir=cache_dir, cache_finality_depth=100)
+        await backfill(first, final_heights)
+        await backfill(first, recent_heights)
+        stats = first.get_cache_stats()
+        await first.close()
+        check(
+            failures,
+            stats["block"]["disk_writes"] == blocks,
+            f"only finalized blocks written to disk: {stats['block']}",
+        )
+        check(
+            failures,
+            first_calls["latest"] == 1,
+            f"latest height fetched once for the finality check: {dict(first_calls)}",
+        )
+
+        second_calls: Counter = Counter()
+        second = make_client(
+            second_calls, cache_dir=cache_dir, cache_finality_depth=100
+        )
+        await backfill(second, final_heights)
+        stats = second.get_cache_stats()
+        check(
+            failures,
+            not second_calls,
+            f"rerun over finalized blocks makes no API calls: {dict(second_calls)}",
+        )
+        check(
+            failures,
+            stats["block"]["disk_hits"] == blocks
+            and stats["signer_info"]["disk_hits"] == blocks,
+            "blocks and signer info read from disk",
+        )
+
+        await backfill(second, recent_heights)
+        check(
+            failures,
+            second_calls["block_v2"] == len(recent_heights),
+            "blocks near the tip fetched again",
+        )
+        await second.close()
+
+        other_network: Counter = Counter()
+        testnet = make_client(other_network, cache_dir=cache_dir, network="testnet")
+        await testnet.get_block_by_height(1)
+        check(failures, bool(other_network), "disk tier is separate per network")
+        await testnet.close()
+
+
+async def run(blocks: int) -> List[str]:
+    failures: List[str] = []
+    test_ttl_cache(failures)
+    await test_bounded_backfill(failures, blocks)
+    await test_disk_tier(failures, blocks)
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test the Stacks API client cache")
+    parser.add_argument("--blocks", type=int, default=200)
+    args = parser.parse_args()
+
+    failures = asyncio.run(run(args.blocks))
+    report("Client cache", failures)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Compiled Chainhook Template Test
+
+Checks that ChainhookTemplateManager produces byte-for-byte the same JSON from
+compiled templates as from deep-copied ones, then reports time per block for
+both.
+
+Every sample payload in chainhook-data/ (plus examples/chainhook.json) is
+turned into the typed data the Stacks chainhook adapter produces, as in
+benchmark_chainhook_inprocess.py, and rendered with every template. Blocks are
+also rendered with no transactions, with fewer transactions than the template
+and with more (transactions of all samples concatenated), which exercises the
+truncate and extend paths of populate_template.
+
+The chainhook UUID, which is random per block, is seeded identically for both
+paths. The script also checks that compiled output shares no containers with
+the templates.
+
+Usage:
+    python scripts/test_template_compilation.py [--iterations 200]
+"""
+
+import argparse
+import copy
+import json
+import logging
+import os
+import random
+import sys
+import time
+import uuid
+from typing import Any, List, Set, Tuple
+
+# Add the parent directory (root) to the path to import from app, and this
+# directory for the sample block loader
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_chainhook_inprocess import load_blocks
+
+from app.services.processing.stacks_chainhook_adapter.models import (
+    chainhook as adapter_models,
+)
+from app.services.processing.stacks_chainhook_adapter.utils import template_manager
+from app.services.processing.stacks_chainhook_adapter.utils.template_manager import (
+    ChainhookTemplateManager,
+)
+
+TRANSACTION_TYPES = [
+    "buy-and-deposit",
+    "conclude-action-proposal",
+    "create-action-proposal",
+    "send-many-governance-airdrop",
+    "send-many-stx-airdrop",
+    "vote-on-action-proposal",
+    "coinbase",
+    "multi-vote-on-action-proposal",
+    "governance-and-airdrop-multi-tx",
+    "unknown-type",
+]
+
+
+def with_transactions(
+    data: adapter_models.ChainHookData, transactions: List[Any]
+) -> adapter_models.ChainHookData:
+    block = copy.copy(data.apply[0])
+    block.transactions = transactions
+    data = copy.copy(data)
+    data.apply = [block]
+    return data
+
+
+def cases() -> List[Tuple[str, adapter_models.ChainHookData]]:
+    blocks = load_blocks()
+    every_transaction = [tx for _, data in blocks for tx in data.apply[0].transactions]
+    result = []
+    for source, data in blocks:
+        result.append((source, data))
+        result.append((f"{source} (no transactions)", with_transactions(data, [])))
+        result.append(
+            (
+                f"{source} (+{len(every_transaction)} transactions)",
+                with_transactions(data, data.apply[0].transactions + every_transaction),
+            )
+        )
+    return result
+
+
+def render(
+    manager: ChainhookTemplateManager,
+    data: adapter_models.ChainHookData,
+    transaction_type: str,
+) -> str:
+    template_manager.uuid.uuid4 = lambda: uuid.UUID(int=0)
+    return json.dumps(manager.generate_chainhook_from_template(data, transaction_type))
+
+
+def containers(value: Any, found: Set[int]) -> Set[int]:
+    """Ids of every dict and list in a document."""
+    if isinstance(value, (dict, list)):
+        found.add(id(value))
+        for child in value.values() if isinstance(value, dict) else value:
+            containers(child, found)
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test compiled chainhook templates")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    original_uuid4 = uuid.uuid4
+    legacy = ChainhookTemplateManager(compiled=False)
+    compiled = ChainhookTemplateManager(compiled=True)
+    template_containers = containers(compiled.templates, set())
+
+    mismatches = checked = shared = 0
+    for source, data in cases():
+        for transaction_type in TRANSACTION_TYPES:
+            checked += 1
+            expected = render(legacy, data, transaction_type)
+            actual = render(compiled, data, transaction_type)
+            if expected != actual:
+                mismatches += 1
+                print(f"   ❌ {source} as {transaction_type}: output differs")
+            output = compiled.generate_chainhook_from_template(data, transaction_type)
+            if containers(output, set()) & template_containers:
+                shared += 1
+                print(f"   ❌ {source} as {transaction_type}: shares template state")
+    template_manager.uuid.uuid4 = original_uuid4
+
+    print(
+        f"{checked} renders ({len(compiled.templates)} templates), "
+        f"{mismatches} mismatches, {shared} sharing template containers"
+    )
+
+    blocks = load_blocks()
+    rng = random.Random(0)
+    workload: List[Tuple[adapter_models.ChainHookData, str]] = [
+        (data, rng.choice(TRANSACTION_TYPES)) for _, data in blocks
+    ]
+    print(f"{'mode':>9} {'us/block':>9}")
+    for name, manager in (("deepcopy", legacy), ("compiled", compiled)):
+        start = time.perf_counter()
+        for _ in range(args.iterations):
+            for data, transaction_type in workload:
+                manager.generate_chainhook_from_template(data, transaction_type)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>9} {elapsed / (args.iterations * len(workload)) * 1e6:>9.1f}")
+
+    ok = not mismatches and not shared
+    print("✅ Compiled templates identical" if ok else "❌ Template test failed")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    main()
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Token Holders Sync Test
+
+Checks the pieces of the incremental DAO token holders sync that run without
+a database:
+
+- diff_holders creates new holders, updates only rows whose amount, agent or
+  wallet changed, deletes holders that are gone and picks the agents whose
+  first tokens should queue a proposal approval;
+- HiroApi.aget_all_token_holders returns every page in offset order while
+  keeping at most max_concurrency page requests in flight;
+- TokenActivityHandler finds the token contract of every FT event in the
+  sample chainhook payloads (chainhook-data/ and examples/chainhook.json)
+  when the receipts are lazily parsed;
+- tokens with no activity above their synced height are skipped until the
+  full resync interval passes.
+
+Also reports the diff time for a token with many holders.
+
+Usage:
+    python scripts/test_token_holders_sync.py [--holders 20000]
+"""
+
+import argparse
+import asyncio
+import glob
+import json
+import logging
+import os
+import sys
+import time
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from typing import List, Set
+
+# Add the parent directory (root) to the path to import from app
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.backend.models import Agent, Holder, Wallet
+from app.config import config
+from app.services.infrastructure.job_management.tasks.dao_token_holders_monitor import (
+    DaoTokenHoldersMonitorTask,
+    diff_holders,
+)
+from app.services.integrations.hiro.hiro_api import HiroApi
+from app.services.integrations.webhooks.chainhook.handlers.token_activity_handler import (
+    FT_EVENT_TYPES,
+    TokenActivityHandler,
+)
+from app.services.integrations.webhooks.chainhook.parser import ChainhookParser
+from scripts.testing import check, report
+
+NOW = datetime(2025, 10, 18)
+
+
+def make_token():
+    return SimpleNamespace(id=uuid.uuid4(), dao_id=uuid.uuid4(), name="TEST")
+
+
+def make_holder(token, address: str, amount: str, agent=None, wallet=None) -> Holder:
+    return Holder(
+        id=uuid.uuid4(),
+        created_at=NOW,
+        token_id=token.id,
+        dao_id=token.dao_id,
+        address=address,
+        amount=amount,
+        agent_id=agent.id if agent else None,
+        wallet_id=wallet.id if wallet else None,
+        updated_at=NOW,
+    )
+
+
+def make_agent(address: str) -> Agent:
+    return Agent(id=uuid.uuid4(), created_at=NOW, account_contract=address)
+
+
+def make_wallet(agent: Agent) -> Wallet:
+    return Wallet(id=uuid.uuid4(), created_at=NOW, agent_id=agent.id)
+
+
+def test_diff(failures: List[str]) -> None:
+    print("diff_holders")
+    token = make_token()
+    funded = make_agent("SP1.agent-funded")
+    new_agent = make_agent("SP1.agent-new")
+    linked = make_agent("SP1.agent-linked")
+    agents = {a.account_contract: a for a in (funded, new_agent, linked)}
+    wallets = {a.id: make_wallet(a) for a in agents.values()}
+
+    db_holders = [
+        make_holder(token, "SP1UNCHANGED", "100"),
+        make_holder(token, "SP1CHANGED", "100"),
+        make_holder(token, "SP1GONE", "5"),
+        make_holder(token, "SP1.agent-funded", "0", funded, wallets[funded.id]),
+        make_holder(token, "SP1.agent-linked", "7"),
+    ]
+    balances = {
+        "SP1UNCHANGED": "100",
+        "SP1CHANGED": "150",
+        "SP1NEW": "3",
+        "SP1.agent-funded": "10",
+        "SP1.agent-new": "20",
+        "SP1.agent-linked": "7",
+    }
+    changes = diff_holders(token, balances, db_holders, agents, wallets, NOW)
+
+    check(
+        failures,
+        [h.address for h in changes.creates] == ["SP1NEW", "SP1.agent-new"],
+        "new addresses created",
+    )
+    check(
+        failures,
+        changes.creates[1].agent_id == new_agent.id
+        and changes.creates[1].wallet_id == wallets[new_agent.id].id,
+        "new agent holder linked to its agent and wallet",
+    )
+    updated = {h.address: h for h in changes.updates}
+    check(
+        failures,
+        set(updated) == {"SP1CHANGED", "SP1.agent-funded", "SP1.agent-linked"},
+        f"only changed rows updated: {sorted(updated)}",
+    )
+    check(
+        failures,
+        updated["SP1CHANGED"].amount == "150"
+        and updated["SP1CHANGED"].id == db_holders[1].id,
+        "updated row keeps its id and takes the new amount",
+    )
+    check(
+        failures,
+        updated["SP1.agent-linked"].agent_id == linked.id,
+        "existing holder linked to its agent",
+    )
+    check(
+        failures,
+        [h.address for h in changes.deletes] == ["SP1GONE"],
+        "holders no longer on chain deleted",
+    )
+    check(
+        failures,
+        sorted(agent.account_contract for agent, _ in changes.approvals)
+        == ["SP1.agent-funded", "SP1.agent-new"],
+        "approvals for agents receiving their first tokens",
+    )
+
+    again = diff_holders(
+        token,
+        balances,
+        [
+            make_holder(
+                token,
+                address,
+                amount,
+                agents.get(address),
+                wallets.get(agents[address].id) if address in agents else None,
+            )
+            for address, amount in balances.items()
+        ],
+        agents,
+        wallets,
+        NOW,
+    )
+    check(
+        failures,
+        not (again.creates or again.updates or again.deletes or again.approvals),
+        "no writes when the table matches the chain",
+    )
+
+
+async def test_paging(failures: List[str]) -> None:
+    print("aget_all_token_holders")
+    total, page_size, max_concurrency = 1050, 100, 4
+    in_flight = peak = 0
+    api = HiroApi()
+
+    async def fake_page(token: str, limit: int = 20, offset: int = 0):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        count = min(limit, total - offset)
+        return {
+            "total": total,
+            "total_supply": "1",
+            "results": [
+                {"address": f"SP{offset + i}", "balance": "1"} for i in range(count)
+            ],
+        }
+
+    api.aget_token_holders = fake_page
+    start = time.perf_counter()
+    response = await api.aget_all_token_holders(
+        "SP1.token::TOKEN", page_size=page_size, max_concurrency=max_concurrency
+    )
+    elapsed = time.perf_counter() - start
+    addresses = [holder["address"] for holder in response["results"]]
+    check(
+        failures,
+        addresses == [f"SP{i}" for i in range(total)],
+        "all holders returned in offset order",
+    )
+    check(
+        failures,
+        peak == max_concurrency,
+        f"at most {max_concurrency} page requests in flight (peak {peak})",
+    )
+    print(f"   {total // page_size + 1} pages fetched in {elapsed * 1000:.0f} ms")
+
+
+def raw_token_contracts(block) -> Set[str]:
+    contracts = set()
+    for tx in block.get("transactions", []):
+        for event in tx["metadata"]["receipt"]["events"]:
+            if event.get("type") in FT_EVENT_TYPES:
+                contracts.add(event["data"]["asset_identifier"].split("::")[0])
+    return contracts
+
+
+def test_activity_handler(failures: List[str]) -> None:
+    print("TokenActivityHandler")
+    files = sorted(glob.glob(os.path.join(ROOT, "chainhook-data", "*.json")))
+    files.append(os.path.join(ROOT, "examples", "chainhook.json"))
+    handler = TokenActivityHandler()
+    parser = ChainhookParser(lazy_events=True)
+    blocks = found = 0
+    for path in files:
+        if not os.path.exists(path):
+            continue
+        with open(path) as f:
+            payload = json.load(f)
+        parsed = parser.parse(payload)
+        for raw_block, block in zip(payload.get("apply", []), parsed.apply):
+            expected = raw_token_contracts(raw_block)
+            contracts = handler.extract_token_contracts(block)
+            check(
+                failures,
+                contracts == expected,
+                f"{os.path.basename(path)} block {block.block_identifier.index}: "
+                f"{sorted(contracts)}",
+            )
+            blocks += 1
+            found += len(contracts)
+    print(f"   {found} token contracts found in {blocks} sample blocks")
+
+
+def test_skip(failures: List[str]) -> None:
+    print("Watermark skip")
+    task = DaoTokenHoldersMonitorTask()
+    interval = config.scheduler.dao_token_holders_monitor_full_resync_seconds
+    token = SimpleNamespace(
+        id=uuid.uuid4(), holders_synced_height=100, holders_activity_height=90
+    )
+    check(failures, not task._is_up_to_date(token, 0.0), "synced once per process")
+    task._last_synced[token.id] = 0.0
+    check(failures, task._is_up_to_date(token, 1.0), "no activity since sync skipped")
+    token.holders_activity_height = 101
+    check(failures, not task._is_up_to_date(token, 1.0), "new activity resynced")
+    token.holders_activity_height = None
+    check(
+        failures,
+        not task._is_up_to_date(token, float(interval)),
+        "resynced after the full resync interval",
+    )
+    token.holders_synced_height = None
+    check(failures, not task._is_up_to_date(token, 1.0), "never synced token synced")
+
+
+def benchmark_diff(holders: int) -> None:
+    token = make_token()
+    db_holders = [make_holder(token, f"SP{i}", str(i)) for i in range(holders)]
+    # One percent of the balances change
+    balances = {f"SP{i}": str(i + 1 if i % 100 == 0 else i) for i in range(holders)}
+    start = time.perf_counter()
+    changes = diff_holders(token, balances, db_holders, {}, {}, NOW)
+    elapsed = time.perf_counter() - start
+    print(
+        f"diff of {holders} holders: {elapsed * 1000:.1f} ms, "
+        f"{len(changes.updates)} rows to write"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test the token holders sync")
+    parser.add_argument("--holders", type=int, default=20000)
+    args = parser.parse_args()
+    failures: List[str] = []
+
+    test_diff(failures)
+    asyncio.run(test_paging(failures))
+    test_activity_handler(failures)
+    test_skip(failures)
+    benchmark_diff(args.holders)
+
+    report("Token holders sync", failures)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    main()
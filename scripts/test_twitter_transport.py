@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Twitter Transport Test
+
+Runs TwitterService against a local fake of the Twitter API (an httpx mock
+transport) and checks that:
+
+- tweet, timeline, search and user lookups come back as tweepy objects, with
+  app-context requests sent with the bearer token and tweets posted with an
+  OAuth 1.0a signature;
+- multi-ID lookups are split into v2 batch requests of at most 100 IDs;
+- post_tweet_with_media downloads, uploads and posts through the pool;
+- requests to an endpoint whose rate limit window is exhausted wait for the
+  window to reset, and fail with tweepy.TooManyRequests (carrying
+  Retry-After) when it resets too far ahead;
+- the event loop keeps running while requests are in flight.
+
+Usage:
+    python scripts/test_twitter_transport.py [--latency 0.2]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import re
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+from urllib.parse import parse_qs
+
+import httpx
+import tweepy
+
+# Add the parent directory (root) to the path to import from app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.communication.twitter_service import TwitterService
+from app.services.communication.twitter_transport import TwitterTransport
+from scripts.testing import check, report
+
+API = "http://twitter.local"
+UPLOAD = "http://upload.twitter.local"
+PNG = b"\x89PNG\r\n\x1a\n" + b"\0" * 64
+
+
+class FakeTwitterAPI:
+    """Minimal Twitter API with per-endpoint rate limit windows."""
+
+    def __init__(self, latency: float, limit: int = 1000, window: float = 900):
+        self.latency = latency
+        self.limit = limit
+        self.window = window
+        self.requests: List[httpx.Request] = []
+        self.windows: Dict[str, List[float]] = {}
+        self.rejected = 0
+
+    def tweet(self, tweet_id: str) -> Dict[str, Any]:
+        return {
+            "id": tweet_id,
+            "text": f"gm {tweet_id}",
+            "author_id": "42",
+            "conversation_id": tweet_id,
+            "created_at": "2025-10-18T00:00:00.000Z",
+            "edit_history_tweet_ids": [tweet_id],
+        }
+
+    def take(self, endpoint: str) -> Tuple[bool, Dict[str, str]]:
+        """Take a request from the endpoint's window; False when exhausted."""
+        now = time.time()
+        window = self.windows.get(endpoint)
+        if window is None or window[1] <= now:
+            window = self.windows[endpoint] = [self.limit, now + self.window]
+        allowed = window[0] > 0
+        if allowed:
+            window[0] -= 1
+        else:
+            self.rejected += 1
+        return allowed, {
+            "x-rate-limit-limit": str(self.limit),
+            "x-rate-limit-remaining": str(int(window[0])),
+            "x-rate-limit-reset": str(window[1]),
+        }
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        await asyncio.sleep(self.latency)
+        path = request.url.path
+        query = {k: v[0] for k, v in parse_qs(request.url.query.decode()).items()}
+
+        if request.url.host == "images.local":
+            return httpx.Response(
+                200, content=PNG, headers={"content-type": "image/png"}
+            )
+        if path == "/1.1/media/upload.json":
+            return httpx.Response(200, json={"media_id_string": "777"})
+
+        route = re.sub(r"/\d+", "/:id", path)
+        allowed, headers = self.take(f"{request.method} {route}")
+        if not allowed:
+            return httpx.Response(
+                429,
+                json={"title": "Too Many Requests", "detail": "Too Many Requests"},
+                headers=headers,
+            )
+
+        if request.method == "POST" and path == "/2/tweets":
+            body = json.loads(request.content)
+            return httpx.Response(
+                201, json={"data": {"id": "999", "text": body["text"]}}, headers=headers
+            )
+        if path == "/2/tweets":
+            ids = query["ids"].split(",")
+            return httpx.Response(
+                200,
+                json={
+                    "data": [self.tweet(i) for i in ids],
+                    "includes": {"users": [{"id": "42", "name": "A", "username": "a"}]},
+                },
+                headers=headers,
+            )
+        if path.startswith("/2/tweets/search/recent"):
+            return httpx.Response(
+                200,
+                json={"data": [self.tweet("11"), self.tweet("12")]},
+                headers=headers,
+            )
+        if path.startswith("/2/tweets/"):
+            tweet_id = path.rsplit("/", 1)[1]
+            return httpx.Response(
+                200,
+                json={
+                    "data": self.tweet(tweet_id),
+                    "includes": {"users": [{"id": "42", "name": "A", "username": "a"}]},
+                },
+                headers=headers,
+            )
+        if path.endswith("/tweets"):
+            return httpx.Response(
+                200, json={"data": [self.tweet("21")]}, headers=headers
+            )
+        if path == "/2/users":
+            return httpx.Response(
+                200,
+                json={
+                    "data": [
+                        {"id": i, "name": i, "username": f"u{i}"}
+                        for i in query["ids"].split(",")
+                    ]
+                },
+                headers=headers,
+            )
+        return httpx.Response(404, json={"detail": "Not Found"}, headers=headers)
+
+
+def make_service(
+    api: FakeTwitterAPI, max_rate_limit_wait: float = 60
+) -> TwitterService:
+    service = TwitterService(
+        consumer_key="ck",
+        consumer_secret="cs",
+        access_token="1234-at",
+        access_secret="as",
+        client_id="",
+        client_secret="",
+        bearer_token="bt",
+    )
+    service.initialize()
+    service.transport = TwitterTransport(
+        "ck",
+        "cs",
+        "1234-at",
+        "as",
+        "bt",
+        api_base_url=API,
+        upload_base_url=UPLOAD,
+        max_rate_limit_wait=max_rate_limit_wait,
+        transport=httpx.MockTransport(api),
+    )
+    return service
+
+
+async def test_lookups(failures: List[str], latency: float) -> None:
+    print("Lookups")
+    api = FakeTwitterAPI(latency)
+    service = make_service(api)
+
+    response = await service.get_tweet_by_id("100")
+    check(
+        failures,
+        isinstance(response.data, tweepy.Tweet)
+        and response.data.id == 100
+        and isinstance(response.includes["users"][0], tweepy.User),
+        "get_tweet_by_id returns a tweepy Response with includes",
+    )
+    request = api.requests[-1]
+    check(
+        failures,
+        request.headers["authorization"] == "Bearer bt"
+        and "tweet.fields" in request.url.params,
+        "lookup sent with the bearer token and tweet.fields",
+    )
+
+    timeline = await service.get_user_timeline("42", count=5)
+    replies = await service.search_tweets_by_conversation_id("11")
+    check(
+        failures,
+        [t.id for t in timeline] == [21] and [t.id for t in replies] == [11, 12],
+        "timeline and conversation search",
+    )
+    search = api.requests[-1]
+    check(
+        failures,
+        search.url.params["query"] == "conversation_id:11",
+        "search query sent intact",
+    )
+
+    api.requests.clear()
+    ids = [str(1000 + i) for i in range(250)]
+    batch = await service.get_tweets_by_ids(ids)
+    sizes = sorted(len(r.url.params["ids"].split(",")) for r in api.requests)
+    check(
+        failures,
+        sizes == [50, 100, 100] and [str(t.id) for t in batch.data] == ids,
+        f"250 tweets in {len(api.requests)} batch requests {sizes}",
+    )
+    users = await service.get_users_by_ids([str(i) for i in range(120)])
+    check(failures, len(users) == 120, "120 users in batches")
+
+    api.requests.clear()
+    posted = await service.post_tweet_with_media("http://images.local/a.png", "gm")
+    upload, create = api.requests[1], api.requests[2]
+    check(
+        failures,
+        posted.data["id"] == "999"
+        and upload.url.host == "upload.twitter.local"
+        and json.loads(create.content)["media"]["media_ids"] == ["777"],
+        "post_tweet_with_media downloads, uploads and posts",
+    )
+    check(
+        failures,
+        all(r.headers["authorization"].startswith("OAuth ") for r in (upload, create)),
+        "uploads and posts signed with OAuth 1.0a",
+    )
+
+    # Sequential vs concurrent single lookups on a slow API
+    start = time.perf_counter()
+    for i in range(5):
+        await service.get_tweet_by_id(str(i + 1))
+    sequential = time.perf_counter() - start
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    await asyncio.gather(*(service.get_tweet_by_id(str(i + 1)) for i in range(5)))
+    concurrent = time.perf_counter() - start
+    task.cancel()
+    check(
+        failures,
+        ticks >= int(concurrent / 0.01) // 2,
+        f"event loop kept running during requests ({ticks} ticks)",
+    )
+    print(
+        f"   5 lookups at {latency * 1000:.0f} ms latency: "
+        f"{sequential * 1000:.0f} ms sequential, {concurrent * 1000:.0f} ms concurrent"
+    )
+    await service.aclose()
+
+
+async def test_rate_limits(failures: List[str]) -> None:
+    print("Rate limits")
+    api = FakeTwitterAPI(latency=0.0, limit=3, window=1.0)
+    service = make_service(api)
+    await service.get_user_timeline("42")
+    start = time.perf_counter()
+    results = await asyncio.gather(*(service.get_user_timeline("42") for _ in range(4)))
+    elapsed = time.perf_counter() - start
+    check(
+        failures,
+        all(results) and service.transport.rate_limits.waits >= 1 and elapsed >= 0.5,
+        f"requests over the window waited for the reset ({elapsed:.2f}s)",
+    )
+    check(failures, api.rejected == 0, "no request sent into an exhausted window")
+
+    api = FakeTwitterAPI(latency=0.0, limit=1, window=600)
+    service = make_service(api, max_rate_limit_wait=1)
+    await service.transport.create_tweet("first")
+    sent = len(api.requests)
+    try:
+        await service.transport.create_tweet("second")
+        check(failures, False, "long reset raises TooManyRequests")
+    except tweepy.TooManyRequests as e:
+        check(
+            failures,
+            len(api.requests) == sent and int(e.response.headers["Retry-After"]) > 500,
+            "long reset raises TooManyRequests with Retry-After, without a request",
+        )
+
+    api = FakeTwitterAPI(latency=0.0, limit=0, window=600)
+    service = make_service(api)
+    try:
+        await service.post_tweet("hello")
+        check(failures, False, "429 raises TooManyRequests")
+    except tweepy.TooManyRequests as e:
+        check(
+            failures,
+            e.response.status_code == 429 and "Too Many Requests" in str(e),
+            "429 response raises tweepy.TooManyRequests",
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test the Twitter transport")
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+    failures: List[str] = []
+
+    asyncio.run(test_lookups(failures, args.latency))
+    asyncio.run(test_rate_limits(failures))
+
+    report("Twitter transport", failures)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    main()
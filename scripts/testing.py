@@ -0,0 +1,76 @@
+"""
+Shared helpers for the test scripts in this folder.
+
+Each script collects failed checks in a list, prints ✅/❌ per check and
+exits non-zero if any failed:
+
+    failures: List[str] = []
+    check(failures, result == expected, "result matches")
+    report("Example", failures)
+
+Also provides a Proposal factory and an in-memory backend holding proposals
+for scripts that exercise evaluation and chainhook code without a database.
+"""
+
+import sys
+import uuid
+from collections import Counter
+from datetime import datetime
+from typing import List
+
+from app.backend.models import DAO, ContractStatus, Proposal
+
+NOW = datetime(2025, 10, 20, 12, 0, 0)
+
+
+def check(
+    failures: List[str], condition: bool, message: str, quiet: bool = False
+) -> None:
+    """Print the outcome of one check (only failures if quiet) and record it."""
+    if not condition or not quiet:
+        print(f"   {'✅' if condition else '❌'} {message}")
+    if not condition:
+        failures.append(message)
+
+
+def report(name: str, failures: List[str]) -> None:
+    """Print the overall outcome and exit with its status."""
+    print(f"✅ {name} test passed" if not failures else f"❌ {name} test failed")
+    sys.exit(0 if not failures else 1)
+
+
+def make_proposal(**fields) -> Proposal:
+    """A deployed proposal of a new DAO, with ``fields`` overriding defaults."""
+    defaults = dict(
+        id=uuid.uuid4(),
+        created_at=NOW,
+        dao_id=uuid.uuid4(),
+        status=ContractStatus.DEPLOYED,
+    )
+    return Proposal(**{**defaults, **fields})
+
+
+class ProposalBackend:
+    """Proposals in memory, counting calls per method.
+
+    ``list_proposals`` honours the ``dao_id`` and ``status`` filters.
+    """
+
+    def __init__(self, proposals: List[Proposal]):
+        self.proposals = proposals
+        self.calls: Counter = Counter()
+
+    def get_proposal(self, proposal_id):
+        return next((p for p in self.proposals if p.id == proposal_id), None)
+
+    def get_dao(self, dao_id):
+        return DAO(id=dao_id, created_at=NOW, name="Test DAO", mission="Test")
+
+    def list_proposals(self, filters=None):
+        self.calls["list_proposals"] += 1
+        return [
+            p
+            for p in self.proposals
+            if (filters.dao_id is None or p.dao_id == filters.dao_id)
+            and (filters.status is None or p.status == filters.status)
+        ]
@@ -0,0 +1,91 @@
+-- Claim-based queue consumption so several worker processes can pull
+-- disjoint batches of unprocessed messages.
+--
+-- A worker claims rows with claim_queue_messages(), which locks candidates
+-- with FOR UPDATE SKIP LOCKED and stamps them with a lease. Rows whose lease
+-- has expired (crashed worker) become claimable again. Long-running work
+-- keeps its lease alive with extend_queue_message_leases() and hands back
+-- unfinished rows with release_queue_messages().
+
+ALTER TABLE public.queue
+ADD COLUMN IF NOT EXISTS claimed_by TEXT,
+ADD COLUMN IF NOT EXISTS claimed_until TIMESTAMP WITH TIME ZONE,
+ADD COLUMN IF NOT EXISTS claim_count INTEGER DEFAULT 0 NOT NULL;
+
+-- Claim scans walk unprocessed rows of one type in arrival order
+CREATE INDEX IF NOT EXISTS idx_queue_claimable
+ON public.queue (type, created_at)
+WHERE is_processed = false;
+
+COMMENT ON COLUMN public.queue.claimed_by IS 'Worker currently holding the lease on this message';
+COMMENT ON COLUMN public.queue.claimed_until IS 'Lease expiry; the message is claimable again after this time';
+COMMENT ON COLUMN public.queue.claim_count IS 'Number of times the message has been claimed';
+
+-- Claim up to p_limit unprocessed messages of p_type for p_worker_id.
+-- Rows already leased to the same worker are returned again (and their lease
+-- renewed), so a worker re-reading its own batch never loses it.
+CREATE OR REPLACE FUNCTION public.claim_queue_messages(
+    p_type TEXT,
+    p_worker_id TEXT,
+    p_limit INTEGER DEFAULT 100,
+    p_lease_seconds INTEGER DEFAULT 300
+)
+RETURNS SETOF public.queue AS $$
+    WITH candidates AS (
+        SELECT q.id
+        FROM public.queue q
+        WHERE q.type = p_type
+          AND q.is_processed = false
+          AND (
+              q.claimed_until IS NULL
+              OR q.claimed_until < NOW()
+              OR q.claimed_by = p_worker_id
+          )
+        ORDER BY q.created_at, q.id
+        LIMIT p_limit
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE public.queue q
+    SET claimed_by = p_worker_id,
+        claimed_until = NOW() + make_interval(secs => p_lease_seconds),
+        claim_count = q.claim_count
+            + CASE WHEN q.claimed_by IS DISTINCT FROM p_worker_id THEN 1 ELSE 0 END
+    FROM candidates c
+    WHERE q.id = c.id
+    RETURNING q.*;
+$$ LANGUAGE sql;
+
+-- Heartbeat: extend the lease on messages this worker still holds.
+-- Returns the ids whose lease was extended.
+CREATE OR REPLACE FUNCTION public.extend_queue_message_leases(
+    p_ids UUID[],
+    p_worker_id TEXT,
+    p_lease_seconds INTEGER DEFAULT 300
+)
+RETURNS TABLE (id UUID) AS $$
+    UPDATE public.queue q
+    SET claimed_until = NOW() + make_interval(secs => p_lease_seconds)
+    WHERE q.id = ANY(p_ids)
+      AND q.claimed_by = p_worker_id
+      AND q.is_processed = false
+    RETURNING q.id;
+$$ LANGUAGE sql;
+
+-- Give back unprocessed messages so another worker can claim them right away.
+-- Returns the number of messages released.
+CREATE OR REPLACE FUNCTION public.release_queue_messages(
+    p_ids UUID[],
+    p_worker_id TEXT
+)
+RETURNS INTEGER AS $$
+    WITH released AS (
+        UPDATE public.queue q
+        SET claimed_by = NULL,
+            claimed_until = NULL
+        WHERE q.id = ANY(p_ids)
+          AND q.claimed_by = p_worker_id
+          AND q.is_processed = false
+        RETURNING q.id
+    )
+    SELECT COUNT(*)::INTEGER FROM released;
+$$ LANGUAGE sql;
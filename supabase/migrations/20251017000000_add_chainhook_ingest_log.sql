@@ -0,0 +1,82 @@
+-- Durable ingest log for chainhook webhooks.
+--
+-- The webhook endpoint appends one queue row per block (type
+-- 'chainhook_ingest') before acknowledging the request; the worker consumes
+-- them through the usual claim/lease functions. Processed rows are kept for
+-- a retention period (see prune_chainhook_blocks) so recent blocks can be
+-- replayed from a height.
+
+-- One entry per (chainhook, block), processed or not
+CREATE UNIQUE INDEX IF NOT EXISTS idx_queue_chainhook_ingest_block
+ON public.queue ((message->>'chainhook_uuid'), (message->>'block_hash'))
+WHERE type = 'chainhook_ingest';
+
+-- Replay walks entries by height
+CREATE INDEX IF NOT EXISTS idx_queue_chainhook_ingest_height
+ON public.queue (((message->>'block_height')::BIGINT))
+WHERE type = 'chainhook_ingest';
+
+COMMENT ON INDEX public.idx_queue_chainhook_ingest_block IS 'Deduplicates chainhook deliveries by chainhook UUID and block hash';
+
+-- Append a block to the ingest log. Returns the new entry id, or NULL when
+-- the block was already logged for this chainhook (a redelivery).
+CREATE OR REPLACE FUNCTION public.ingest_chainhook_block(
+    p_chainhook_uuid TEXT,
+    p_block_hash TEXT,
+    p_block_height BIGINT,
+    p_payload JSONB
+)
+RETURNS UUID AS $$
+    INSERT INTO public.queue (type, message, is_processed)
+    VALUES (
+        'chainhook_ingest',
+        json_build_object(
+            'chainhook_uuid', p_chainhook_uuid,
+            'block_hash', p_block_hash,
+            'block_height', p_block_height,
+            'payload', p_payload
+        ),
+        false
+    )
+    ON CONFLICT DO NOTHING
+    RETURNING id;
+$$ LANGUAGE sql;
+
+-- Mark logged blocks from p_from_height (up to p_to_height, if given) as
+-- unprocessed again so the worker handles them once more, with a fresh
+-- attempt count. Returns the number of entries queued for replay.
+CREATE OR REPLACE FUNCTION public.replay_chainhook_blocks(
+    p_from_height BIGINT,
+    p_to_height BIGINT DEFAULT NULL
+)
+RETURNS INTEGER AS $$
+    WITH replayed AS (
+        UPDATE public.queue q
+        SET is_processed = false,
+            result = NULL,
+            claimed_by = NULL,
+            claimed_until = NULL,
+            claim_count = 0
+        WHERE q.type = 'chainhook_ingest'
+          AND (q.message->>'block_height')::BIGINT >= p_from_height
+          AND (p_to_height IS NULL OR (q.message->>'block_height')::BIGINT <= p_to_height)
+        RETURNING q.id
+    )
+    SELECT COUNT(*)::INTEGER FROM replayed;
+$$ LANGUAGE sql;
+
+-- Delete processed entries last updated more than p_older_than_seconds ago;
+-- each one holds a whole block payload. Returns the number deleted.
+CREATE OR REPLACE FUNCTION public.prune_chainhook_blocks(
+    p_older_than_seconds INTEGER
+)
+RETURNS INTEGER AS $$
+    WITH pruned AS (
+        DELETE FROM public.queue q
+        WHERE q.type = 'chainhook_ingest'
+          AND q.is_processed = true
+          AND q.updated_at < NOW() - make_interval(secs => p_older_than_seconds)
+        RETURNING q.id
+    )
+    SELECT COUNT(*)::INTEGER FROM pruned;
+$$ LANGUAGE sql;
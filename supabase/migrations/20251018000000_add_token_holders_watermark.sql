@@ -0,0 +1,32 @@
+-- Per-token watermarks for the DAO token holders monitor.
+--
+-- holders_activity_height is the highest block in which the chainhook saw an
+-- FT event of the token; holders_synced_height is the chain height the
+-- holders table was last fully synced at. A token whose activity is not
+-- above its synced height has no holder changes to pick up.
+ALTER TABLE public.tokens
+ADD COLUMN IF NOT EXISTS holders_activity_height BIGINT,
+ADD COLUMN IF NOT EXISTS holders_synced_height BIGINT;
+
+CREATE INDEX IF NOT EXISTS idx_tokens_contract_principal
+ON public.tokens (contract_principal);
+
+COMMENT ON COLUMN public.tokens.holders_activity_height IS 'Highest block with an FT event of this token seen by the chainhook';
+COMMENT ON COLUMN public.tokens.holders_synced_height IS 'Chain height at which the token holders were last synced';
+
+-- Raise the activity height of the tokens with the given contract principals
+-- to p_block_height. Returns the number of tokens whose height moved.
+CREATE OR REPLACE FUNCTION public.record_token_activity(
+    p_contract_principals TEXT[],
+    p_block_height BIGINT
+)
+RETURNS INTEGER AS $$
+    WITH recorded AS (
+        UPDATE public.tokens t
+        SET holders_activity_height = p_block_height
+        WHERE t.contract_principal = ANY(p_contract_principals)
+          AND (t.holders_activity_height IS NULL OR t.holders_activity_height < p_block_height)
+        RETURNING 1
+    )
+    SELECT count(*)::INTEGER FROM recorded;
+$$ LANGUAGE sql;
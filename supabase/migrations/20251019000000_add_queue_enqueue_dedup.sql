@@ -0,0 +1,92 @@
+-- Set-based deduplication of queue messages.
+--
+-- message_hash used to hash the raw json text, so the same message with
+-- different key order or whitespace hashed differently. It now hashes the
+-- jsonb form, which is canonical. The unique index treats a NULL wallet_id
+-- as a value, so messages without a wallet are deduplicated too, and only
+-- covers messages with a DAO, as the old application-side check did.
+--
+-- enqueue_queue_messages() inserts a batch with ON CONFLICT DO NOTHING and
+-- returns, for every input message in order, either the new row or the
+-- unprocessed row it duplicates.
+
+-- Dropping the column also drops the indexes built on it
+ALTER TABLE public.queue DROP COLUMN IF EXISTS message_hash;
+
+ALTER TABLE public.queue
+ADD COLUMN message_hash TEXT
+GENERATED ALWAYS AS (md5((message::jsonb)::text)) STORED;
+
+COMMENT ON COLUMN public.queue.message_hash IS 'MD5 hash of the canonical (jsonb) message content for deduplication';
+
+-- Messages that become duplicates under the canonical hash keep the oldest
+-- unprocessed copy; the others are closed so the unique index can be built
+WITH ranked AS (
+    SELECT
+        q.id,
+        first_value(q.id) OVER w AS kept_id,
+        row_number() OVER w AS position
+    FROM public.queue q
+    WHERE q.is_processed = false
+      AND q.dao_id IS NOT NULL
+    WINDOW w AS (
+        PARTITION BY q.type, q.dao_id, q.wallet_id, q.message_hash
+        ORDER BY q.created_at, q.id
+    )
+)
+UPDATE public.queue q
+SET is_processed = true,
+    result = jsonb_build_object(
+        'success', false,
+        'message', 'Duplicate of queue message ' || r.kept_id
+    )
+FROM ranked r
+WHERE q.id = r.id
+  AND r.position > 1;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_queue_unique_unprocessed_message
+ON public.queue (type, dao_id, wallet_id, message_hash) NULLS NOT DISTINCT
+WHERE is_processed = false AND dao_id IS NOT NULL;
+
+COMMENT ON INDEX public.idx_queue_unique_unprocessed_message IS 'Prevents duplicate unprocessed messages with same type, DAO, wallet, and content';
+
+-- Insert p_messages (a JSON array of queue rows) skipping duplicates of
+-- unprocessed messages. Returns one row per input message, in input order.
+CREATE OR REPLACE FUNCTION public.enqueue_queue_messages(p_messages JSONB)
+RETURNS SETOF public.queue AS $$
+DECLARE
+    m RECORD;
+    queued public.queue;
+BEGIN
+    FOR m IN
+        SELECT *
+        FROM jsonb_to_recordset(p_messages) AS x(
+            type TEXT,
+            message JSON,
+            is_processed BOOLEAN,
+            dao_id UUID,
+            wallet_id UUID,
+            result JSONB
+        )
+    LOOP
+        INSERT INTO public.queue (type, message, is_processed, dao_id, wallet_id, result)
+        VALUES (m.type, m.message, COALESCE(m.is_processed, false), m.dao_id, m.wallet_id, m.result)
+        ON CONFLICT (type, dao_id, wallet_id, message_hash)
+            WHERE is_processed = false AND dao_id IS NOT NULL
+        DO NOTHING
+        RETURNING * INTO queued;
+
+        IF NOT FOUND THEN
+            SELECT * INTO queued
+            FROM public.queue q
+            WHERE q.type IS NOT DISTINCT FROM m.type
+              AND q.dao_id = m.dao_id
+              AND q.wallet_id IS NOT DISTINCT FROM m.wallet_id
+              AND q.message_hash IS NOT DISTINCT FROM md5((m.message::jsonb)::text)
+              AND q.is_processed = false;
+        END IF;
+
+        RETURN NEXT queued;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
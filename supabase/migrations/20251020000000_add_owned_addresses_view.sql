@@ -0,0 +1,61 @@
+-- Addresses that belong to us, for the in-memory owned-address index used by
+-- the chainhook handlers (app/lib/address_index.py).
+--
+-- The index loads owned_addresses once and then only reads rows whose
+-- updated_at moved past its watermark, so wallets and tokens get an
+-- updated_at column and wallets, agents and tokens a trigger keeping it
+-- current.
+
+ALTER TABLE public.wallets
+ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL;
+
+ALTER TABLE public.tokens
+ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL;
+
+CREATE OR REPLACE FUNCTION public.handle_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS handle_wallets_updated_at ON public.wallets;
+CREATE TRIGGER handle_wallets_updated_at
+BEFORE UPDATE ON public.wallets
+FOR EACH ROW EXECUTE FUNCTION public.handle_updated_at();
+
+DROP TRIGGER IF EXISTS handle_agents_updated_at ON public.agents;
+CREATE TRIGGER handle_agents_updated_at
+BEFORE UPDATE ON public.agents
+FOR EACH ROW EXECUTE FUNCTION public.handle_updated_at();
+
+DROP TRIGGER IF EXISTS handle_tokens_updated_at ON public.tokens;
+CREATE TRIGGER handle_tokens_updated_at
+BEFORE UPDATE ON public.tokens
+FOR EACH ROW EXECUTE FUNCTION public.handle_updated_at();
+
+CREATE INDEX IF NOT EXISTS idx_wallets_updated_at ON public.wallets (updated_at);
+CREATE INDEX IF NOT EXISTS idx_agents_updated_at ON public.agents (updated_at);
+CREATE INDEX IF NOT EXISTS idx_tokens_updated_at ON public.tokens (updated_at);
+
+-- One row per owned address: wallet addresses on both networks, agent
+-- account contracts and token contract principals
+CREATE OR REPLACE VIEW public.owned_addresses AS
+SELECT 'wallet'::TEXT AS kind, w.mainnet_address AS address, w.id AS owner_id, w.updated_at
+FROM public.wallets w
+WHERE w.mainnet_address IS NOT NULL
+UNION ALL
+SELECT 'wallet'::TEXT, w.testnet_address, w.id, w.updated_at
+FROM public.wallets w
+WHERE w.testnet_address IS NOT NULL
+UNION ALL
+SELECT 'agent'::TEXT, a.account_contract, a.id, a.updated_at
+FROM public.agents a
+WHERE a.account_contract IS NOT NULL
+UNION ALL
+SELECT 'token'::TEXT, t.contract_principal, t.id, t.updated_at
+FROM public.tokens t
+WHERE t.contract_principal IS NOT NULL;
+
+COMMENT ON VIEW public.owned_addresses IS 'Wallet addresses, agent account contracts and token contract principals that belong to us';
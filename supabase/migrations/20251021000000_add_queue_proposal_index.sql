@@ -0,0 +1,28 @@
+-- Indexed lookup of queue messages by the proposal they are about.
+--
+-- The burn height handler used to list every queue message of a type for a
+-- DAO and search the message bodies for a proposal ID before queueing vote,
+-- conclude and veto window messages. It now filters on
+-- message->>'proposal_id' (and message->>'proposal_status' for Discord
+-- notifications), served by the expression index below.
+
+-- Discord veto window notifications only carried the proposal ID inside
+-- their content ("<!-- proposal-<id>-<status> -->"); copy it into the
+-- message so existing notifications are found by the new lookup
+UPDATE public.queue
+SET message = (
+    message::jsonb || jsonb_build_object(
+        'proposal_id',
+        substring(message->>'content' FROM 'proposal-([0-9a-f-]{36})-')
+    )
+)::json
+WHERE type = 'discord'
+  AND message->>'proposal_status' IS NOT NULL
+  AND message->>'proposal_id' IS NULL
+  AND message->>'content' ~ 'proposal-[0-9a-f-]{36}-';
+
+CREATE INDEX IF NOT EXISTS idx_queue_proposal_messages
+ON public.queue (type, dao_id, (message->>'proposal_id'))
+WHERE message->>'proposal_id' IS NOT NULL;
+
+COMMENT ON INDEX public.idx_queue_proposal_messages IS 'Finds queue messages for a proposal without scanning message bodies';